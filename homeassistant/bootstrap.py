@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from collections import defaultdict
+from collections.abc import Generator
 import contextlib
 from functools import partial
 from itertools import chain
@@ -79,6 +80,7 @@ from .helpers import (
     entity,
     entity_registry,
     floor_registry,
+    integration_snapshot,
     issue_registry,
     label_registry,
     recorder,
@@ -105,6 +107,7 @@ from .util.async_ import create_eager_task
 from .util.hass_dict import HassKey
 from .util.logging import async_activate_log_queue_handler
 from .util.package import async_get_user_site, is_docker_env, is_virtual_env
+from .util.startup_trace import StartupTrace
 
 with contextlib.suppress(ImportError):
     # Ensure anyio backend is imported to avoid it being imported in the event loop
@@ -130,6 +133,7 @@ SLOW_STARTUP_CHECK_INTERVAL = 1
 STAGE_1_TIMEOUT = 120
 STAGE_2_TIMEOUT = 300
 WRAP_UP_TIMEOUT = 300
+IMPORT_INTEGRATIONS_TIMEOUT = 60
 COOLDOWN_TIME = 60
 
 
@@ -262,6 +266,7 @@ async def async_setup_hass(
     async def create_hass() -> core.HomeAssistant:
         """Create the hass object and do basic setup."""
         hass = core.HomeAssistant(runtime_config.config_dir)
+        hass.startup_trace = StartupTrace()
         loader.async_setup(hass)
 
         await async_enable_logging(
@@ -434,6 +439,7 @@ async def async_load_base_functionality(hass: core.HomeAssistant) -> None:
         create_eager_task(label_registry.async_load(hass)),
         hass.async_add_executor_job(_init_blocking_io_modules_in_executor),
         create_eager_task(template.async_load_custom_templates(hass)),
+        create_eager_task(template.async_load_bytecode_cache(hass)),
         create_eager_task(restore_state.async_load(hass)),
         create_eager_task(hass.config_entries.async_initialize()),
         create_eager_task(async_get_system_info(hass)),
@@ -806,6 +812,10 @@ async def _async_resolve_domains_to_setup(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> tuple[set[str], dict[str, loader.Integration]]:
     """Resolve all dependencies and return list of domains to set up."""
+    # Restore the integrations resolved during the previous start so the
+    # manifests and dependencies below do not have to be loaded again
+    # when nothing was installed or upgraded since.
+    await integration_snapshot.async_load(hass)
     domains_to_setup = _get_domains(hass, config)
     needed_requirements: set[str] = set()
     platform_integrations = conf_util.extract_platform_integrations(
@@ -966,6 +976,64 @@ async def _async_resolve_domains_to_setup(
     return domains_to_setup, integration_cache
 
 
+async def _async_import_integrations(
+    hass: core.HomeAssistant,
+    config: dict[str, Any],
+    integrations: list[loader.Integration],
+) -> None:
+    """Import the integrations we are going to set up ahead of setup.
+
+    This runs alongside the setup so the import executor imports the
+    integrations of later stages while the earlier stages are set up.
+    The platforms referenced by the configuration are imported as well.
+    Integrations with requirements are only imported once the requirements
+    are known to be installed.
+    """
+    platforms: defaultdict[str, set[str]] = defaultdict(set)
+    for base_platform, domains in conf_util.extract_platform_integrations(
+        config, BASE_PLATFORMS
+    ).items():
+        for domain in domains:
+            platforms[domain].add(base_platform)
+
+    try:
+        async with asyncio.timeout(IMPORT_INTEGRATIONS_TIMEOUT):
+            with _trace_stage(hass, "import integrations"):
+                await requirements.async_load_installed_versions(
+                    hass,
+                    {
+                        req
+                        for integration in integrations
+                        for req in integration.requirements
+                    },
+                )
+                import_times = await loader.async_import_integrations(
+                    hass,
+                    integrations,
+                    platforms,
+                    requirements.async_get_installed_requirements(hass),
+                )
+    except TimeoutError:
+        _LOGGER.debug("Timed out importing integrations ahead of setup")
+        return
+    if import_times and _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug(
+            "Integration import times: %s",
+            dict(sorted(import_times.items(), key=itemgetter(1), reverse=True)),
+        )
+
+
+@contextlib.contextmanager
+def _trace_stage(hass: core.HomeAssistant, name: str) -> Generator[None]:
+    """Record a stage of the startup in the startup trace."""
+    started = monotonic()
+    try:
+        yield
+    finally:
+        if hass.startup_trace is not None:
+            hass.startup_trace.add_async(name, "bootstrap", started, monotonic())
+
+
 async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> None:
@@ -973,9 +1041,10 @@ async def _async_set_up_integrations(
     watcher = _WatchPendingSetups(hass, _setup_started(hass))
     watcher.async_start()
 
-    domains_to_setup, integration_cache = await _async_resolve_domains_to_setup(
-        hass, config
-    )
+    with _trace_stage(hass, "resolve domains"):
+        domains_to_setup, integration_cache = await _async_resolve_domains_to_setup(
+            hass, config
+        )
 
     # Initialize recorder
     if "recorder" in domains_to_setup:
@@ -1009,6 +1078,27 @@ async def _async_set_up_integrations(
 
     stage_2_domains = domains_to_setup - stage_1_domains
 
+    # Import in the order the stages are set up so the import executor
+    # stays ahead of the setup
+    hass.async_create_background_task(
+        _async_import_integrations(
+            hass,
+            config,
+            [
+                integration_cache[domain]
+                for stage in (
+                    *(domain_group for _, domain_group in pre_stage_domains),
+                    stage_1_domains,
+                    stage_2_domains,
+                )
+                for domain in sorted(stage)
+                if domain in integration_cache
+            ],
+        ),
+        "import integrations",
+        eager_start=True,
+    )
+
     for name, domain_group in pre_stage_domains:
         if domain_group:
             stage_2_domains -= domain_group
@@ -1021,7 +1111,8 @@ async def _async_set_up_integrations(
                 for dep in integration.all_dependencies
             )
             async_set_domains_to_be_loaded(hass, to_be_loaded)
-            await async_setup_multi_components(hass, domain_group, config)
+            with _trace_stage(hass, name):
+                await async_setup_multi_components(hass, domain_group, config)
 
     # Enables after dependencies when setting up stage 1 domains
     async_set_domains_to_be_loaded(hass, stage_1_domains)
@@ -1030,10 +1121,11 @@ async def _async_set_up_integrations(
     if stage_1_domains:
         _LOGGER.info("Setting up stage 1: %s", stage_1_domains)
         try:
-            async with hass.timeout.async_timeout(
-                STAGE_1_TIMEOUT, cool_down=COOLDOWN_TIME
-            ):
-                await async_setup_multi_components(hass, stage_1_domains, config)
+            with _trace_stage(hass, "stage 1"):
+                async with hass.timeout.async_timeout(
+                    STAGE_1_TIMEOUT, cool_down=COOLDOWN_TIME
+                ):
+                    await async_setup_multi_components(hass, stage_1_domains, config)
         except TimeoutError:
             _LOGGER.warning(
                 "Setup timed out for stage 1 waiting on %s - moving forward",
@@ -1046,10 +1138,11 @@ async def _async_set_up_integrations(
     if stage_2_domains:
         _LOGGER.info("Setting up stage 2: %s", stage_2_domains)
         try:
-            async with hass.timeout.async_timeout(
-                STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME
-            ):
-                await async_setup_multi_components(hass, stage_2_domains, config)
+            with _trace_stage(hass, "stage 2"):
+                async with hass.timeout.async_timeout(
+                    STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME
+                ):
+                    await async_setup_multi_components(hass, stage_2_domains, config)
         except TimeoutError:
             _LOGGER.warning(
                 "Setup timed out for stage 2 waiting on %s - moving forward",
@@ -1059,8 +1152,11 @@ async def _async_set_up_integrations(
     # Wrap up startup
     _LOGGER.debug("Waiting for startup to wrap up")
     try:
-        async with hass.timeout.async_timeout(WRAP_UP_TIMEOUT, cool_down=COOLDOWN_TIME):
-            await hass.async_block_till_done()
+        with _trace_stage(hass, "wrap up"):
+            async with hass.timeout.async_timeout(
+                WRAP_UP_TIMEOUT, cool_down=COOLDOWN_TIME
+            ):
+                await hass.async_block_till_done()
     except TimeoutError:
         _LOGGER.warning(
             "Setup timed out for bootstrap waiting on %s - moving forward",
@@ -1068,6 +1164,9 @@ async def _async_set_up_integrations(
         )
 
     watcher.async_stop()
+    integration_snapshot.async_schedule_save(hass)
+    if hass.startup_trace is not None:
+        hass.startup_trace.stop()
 
     if _LOGGER.isEnabledFor(logging.DEBUG):
         setup_time = async_get_setup_timings(hass)
@@ -7,6 +7,7 @@ from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from datetime import datetime as dt, timedelta
 import logging
+import threading
 from typing import Any, cast
 
 import voluptuous as vol
@@ -73,6 +74,7 @@ def _ws_get_significant_states(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    max_points: int | None,
 ) -> bytes:
     """Fetch history significant_states and convert them to json in the executor."""
     return json_bytes(
@@ -89,11 +91,65 @@ def _ws_get_significant_states(
                 minimal_response,
                 no_attributes,
                 True,
+                max_points,
             ),
         )
     )
 
 
+def _ws_stream_significant_states(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg_id: int,
+    cancel: threading.Event,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+) -> None:
+    """Send history significant_states as JSON chunks as they are fetched.
+
+    Runs in the executor.
+    """
+    send_message = connection.send_message
+    call_soon_threadsafe = hass.loop.call_soon_threadsafe
+    for states in history.stream_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        True,
+    ):
+        if cancel.is_set():
+            return
+        call_soon_threadsafe(
+            send_message,
+            json_bytes(messages.event_message(msg_id, {"states": states})),
+        )
+    call_soon_threadsafe(
+        send_message, json_bytes(messages.event_message(msg_id, {"done": True}))
+    )
+
+
+@callback
+def _async_send_history_result(
+    connection: ActiveConnection, msg_id: int, chunked: bool
+) -> None:
+    """Send an empty history response."""
+    if not chunked:
+        connection.send_result(msg_id, {})
+        return
+    connection.send_result(msg_id)
+    connection.send_message(messages.event_message(msg_id, {"done": True}))
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "history/history_during_period",
@@ -104,13 +160,24 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("chunked", default=False): bool,
+        vol.Optional("max_points"): vol.All(int, vol.Range(min=4)),
     }
 )
 @websocket_api.async_response
 async def ws_get_history_during_period(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
 ) -> None:
-    """Handle history during period websocket command."""
+    """Handle history during period websocket command.
+
+    With chunked set, the result is sent empty and the states follow as
+    events with a chunk of the states of one or more entities, the states
+    of an entity may be split over consecutive events. An event with done
+    set is sent after the last chunk.
+
+    With max_points, the states of each entity are downsampled to about
+    max_points states keeping the peaks. It can not be combined with chunked.
+    """
     start_time_str = msg["start_time"]
     end_time_str = msg.get("end_time")
 
@@ -129,8 +196,16 @@ async def ws_get_history_during_period(
     else:
         end_time = None
 
+    chunked = msg["chunked"]
+    max_points: int | None = msg.get("max_points")
+    if chunked and max_points is not None:
+        connection.send_error(
+            msg["id"], "invalid_max_points", "max_points can not be used with chunked"
+        )
+        return
+
     if start_time > dt_util.utcnow():
-        connection.send_result(msg["id"], {})
+        _async_send_history_result(connection, msg["id"], chunked)
         return
 
     entity_ids: list[str] = msg["entity_ids"]
@@ -150,14 +225,35 @@ async def ws_get_history_during_period(
             hass, entity_ids, start_time, no_attributes
         )
     ):
-        connection.send_result(msg["id"], {})
+        _async_send_history_result(connection, msg["id"], chunked)
         return
 
     significant_changes_only = msg["significant_changes_only"]
     minimal_response = msg["minimal_response"]
 
+    if chunked:
+        cancel = threading.Event()
+        connection.subscriptions[msg["id"]] = cancel.set
+        connection.send_result(msg["id"])
+        await get_instance(hass).async_add_read_executor_job(
+            _ws_stream_significant_states,
+            hass,
+            connection,
+            msg["id"],
+            cancel,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+        )
+        connection.subscriptions.pop(msg["id"], None)
+        return
+
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_executor_job(
             _ws_get_significant_states,
             hass,
             msg["id"],
@@ -168,6 +264,7 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            max_points,
         )
     )
 
@@ -280,7 +377,7 @@ async def _async_send_historical_states(
 ) -> dt | None:
     """Fetch history significant_states and send them to the client."""
     instance = get_instance(hass)
-    last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
+    last_time_ts, last_time_dt, payload = await instance.async_add_read_executor_job(
         _generate_historical_response,
         hass,
         msg_id,
@@ -27,6 +27,7 @@ from homeassistant.core import (
     HomeAssistant,
     ServiceCall,
     ServiceResponse,
+    SupportsResponse,
     callback,
     split_entity_id,
 )
@@ -67,6 +68,7 @@ SERVICE_CHECK_CONFIG = "check_config"
 SERVICE_UPDATE_ENTITY = "update_entity"
 SERVICE_SET_LOCATION = "set_location"
 SERVICE_RELOAD_ALL = "reload_all"
+SERVICE_DUMP_STARTUP_TRACE = "dump_startup_trace"
 SCHEMA_UPDATE_ENTITY = vol.Schema({ATTR_ENTITY_ID: cv.entity_ids})
 SCHEMA_RELOAD_CONFIG_ENTRY = vol.All(
     vol.Schema(
@@ -381,6 +383,22 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:  # noqa:
         hass, DOMAIN, SERVICE_RELOAD_ALL, async_handle_reload_all
     )
 
+    async def async_handle_dump_startup_trace(call: ServiceCall) -> ServiceResponse:
+        """Service handler to return the startup trace."""
+        if (trace := hass.startup_trace) is None:
+            raise HomeAssistantError(
+                translation_domain=DOMAIN, translation_key="no_startup_trace"
+            )
+        return trace.as_chrome_trace()
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_DUMP_STARTUP_TRACE,
+        async_handle_dump_startup_trace,
+        supports_response=SupportsResponse.ONLY,
+    )
+
     exposed_entities = ExposedEntities(hass)
     await exposed_entities.async_initialize()
     hass.data[DATA_EXPOSED_ENTITIES] = exposed_entities
@@ -43,6 +43,10 @@ LOGBOOK_ENTRY_NAME = "name"
 LOGBOOK_ENTRY_STATE = "state"
 LOGBOOK_ENTRY_WHEN = "when"
 
+# The number of contexts kept per user between requests so pages and live
+# streams can be linked to contexts started outside of their query
+CONTEXT_INDEX_SIZE = 4096
+
 # Automation events that can affect an entity_id or device_id
 AUTOMATION_EVENTS = {EVENT_AUTOMATION_TRIGGERED, EVENT_SCRIPT_STARTED}
 
@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Mapping
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import cached_property
 from typing import TYPE_CHECKING, Any, cast
 
+from lru import LRU
 from sqlalchemy.engine.row import Row
 
 from homeassistant.components.recorder.filters import Filters
@@ -22,6 +23,8 @@ from homeassistant.util.event_type import EventType
 from homeassistant.util.json import json_loads
 from homeassistant.util.ulid import ulid_to_bytes
 
+from .const import CONTEXT_INDEX_SIZE
+
 
 @dataclass(slots=True)
 class LogbookConfig:
@@ -33,6 +36,17 @@ class LogbookConfig:
     ]
     sqlalchemy_filter: Filters | None = None
     entity_filter: Callable[[str], bool] | None = None
+    # The first row of the recently seen contexts by user id, shared by
+    # the requests and live streams of the user
+    context_indexes: dict[str, LRU[bytes, Row | EventAsRow]] = field(
+        default_factory=dict
+    )
+
+    def context_index(self, user_id: str) -> LRU[bytes, Row | EventAsRow]:
+        """Return the context index of a user."""
+        if (context_index := self.context_indexes.get(user_id)) is None:
+            context_index = self.context_indexes[user_id] = LRU(CONTEXT_INDEX_SIZE)
+        return context_index
 
 
 class LazyEventPartialState:
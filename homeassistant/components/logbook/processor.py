@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Generator, Sequence
+from collections.abc import Callable, Generator, Iterable, Sequence
 from contextlib import suppress
 from dataclasses import dataclass
-from datetime import datetime as dt
+from datetime import datetime as dt, timedelta
 import logging
 from typing import Any
 
+from lru import LRU
 from sqlalchemy.engine import Result
 from sqlalchemy.engine.row import Row
+from sqlalchemy.orm import Session
 
 from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.filters import Filters
@@ -84,6 +86,8 @@ class LogbookRun:
     include_entity_name: bool
     format_time: Callable[[Row | EventAsRow], Any]
     memoize_new_contexts: bool = True
+    # The first row of the contexts seen by the user across requests
+    context_index: LRU[bytes, Row | EventAsRow] | None = None
 
 
 class EventProcessor:
@@ -98,8 +102,14 @@ class EventProcessor:
         context_id: str | None = None,
         timestamp: bool = False,
         include_entity_name: bool = True,
+        user_id: str | None = None,
     ) -> None:
-        """Init the event stream."""
+        """Init the event stream.
+
+        With a user_id, the contexts seen are kept in the context index of
+        the user, so later requests and live streams of the user can link
+        to contexts which started before their query.
+        """
         assert not (
             context_id and (entity_ids or device_ids)
         ), "can't pass in both context_id and (entity_ids or device_ids)"
@@ -121,6 +131,9 @@ class EventProcessor:
             entity_name_cache=EntityNameCache(self.hass),
             include_entity_name=include_entity_name,
             format_time=format_time,
+            context_index=(
+                logbook_config.context_index(user_id) if user_id is not None else None
+            ),
         )
         self.context_augmenter = ContextAugmenter(self.logbook_run)
 
@@ -145,32 +158,86 @@ class EventProcessor:
     ) -> list[dict[str, Any]]:
         """Get events for a period of time."""
         with session_scope(hass=self.hass, read_only=True) as session:
-            metadata_ids: list[int] | None = None
-            instance = get_instance(self.hass)
-            if self.entity_ids:
-                metadata_ids = extract_metadata_ids(
-                    instance.states_meta_manager.get_many(
-                        self.entity_ids, session, False
-                    )
-                )
-            event_type_ids = tuple(
-                extract_event_type_ids(
-                    instance.event_type_manager.get_many(self.event_types, session)
-                )
+            return self.humanify(self._execute_events_stmt(session, start_day, end_day))
+
+    def get_events_page(
+        self,
+        start_day: dt,
+        end_day: dt,
+        limit: int,
+        cursor: tuple[float, int] | None = None,
+    ) -> tuple[list[dict[str, Any]], tuple[float, int] | None]:
+        """Get at most limit events for a period of time.
+
+        The cursor is the time fired timestamp of the last event and the
+        number of events with that timestamp that have been returned. The
+        cursor to get the next page is returned with the events, or None if
+        there are no more events.
+
+        The query of a page starts at the cursor. Events on later pages are
+        linked to contexts started on earlier pages through the context
+        index of the user.
+        """
+        cursor_ts, skip = cursor or (0.0, 0)
+        if cursor:
+            # The queries only include events fired after the start
+            start_day = dt_util.utc_from_timestamp(cursor_ts) - timedelta(
+                microseconds=1
             )
-            stmt = statement_for_request(
-                start_day,
-                end_day,
-                event_type_ids,
-                self.entity_ids,
-                metadata_ids,
-                self.device_ids,
-                self.filters,
-                self.context_id,
+        events: list[dict[str, Any]] = []
+        next_cursor: tuple[float, int] | None = None
+        last_ts, last_ts_count = cursor_ts, skip
+        with session_scope(hass=self.hass, read_only=True) as session:
+            rows = _PageRows(
+                self._execute_events_stmt(session, start_day, end_day), cursor_ts
             )
-            return self.humanify(
-                execute_stmt_lambda_element(session, stmt, orm_rows=False)
+            for event in _humanify(
+                self.hass,
+                rows,
+                self.ent_reg,
+                self.logbook_run,
+                self.context_augmenter,
+            ):
+                time_fired_ts = rows.time_fired_ts
+                if skip and time_fired_ts == cursor_ts:
+                    skip -= 1
+                    continue
+                if len(events) == limit:
+                    next_cursor = (last_ts, last_ts_count)
+                    break
+                events.append(event)
+                if time_fired_ts == last_ts:
+                    last_ts_count += 1
+                else:
+                    last_ts, last_ts_count = time_fired_ts, 1
+        return events, next_cursor
+
+    def _execute_events_stmt(
+        self, session: Session, start_day: dt, end_day: dt
+    ) -> Sequence[Row] | Result:
+        """Execute the logbook statement for a period of time."""
+        metadata_ids: list[int] | None = None
+        instance = get_instance(self.hass)
+        if self.entity_ids:
+            metadata_ids = extract_metadata_ids(
+                instance.states_meta_manager.get_many(self.entity_ids, session, False)
             )
+        event_type_ids = tuple(
+            extract_event_type_ids(
+                instance.event_type_manager.get_many(self.event_types, session)
+            )
+        )
+        stmt = statement_for_request(
+            start_day,
+            end_day,
+            event_type_ids,
+            self.entity_ids,
+            metadata_ids,
+            self.device_ids,
+            self.filters,
+            self.context_id,
+        )
+        return execute_stmt_lambda_element(session, stmt, orm_rows=False)
 
     def humanify(
         self, rows: Generator[EventAsRow] | Sequence[Row] | Result
@@ -189,7 +256,7 @@ class EventProcessor:
 
 def _humanify(
     hass: HomeAssistant,
-    rows: Generator[EventAsRow] | Sequence[Row] | Result,
+    rows: Generator[EventAsRow] | Iterable[Row] | Result,
     ent_reg: er.EntityRegistry,
     logbook_run: LogbookRun,
     context_augmenter: ContextAugmenter,
@@ -204,12 +271,23 @@ def _humanify(
     include_entity_name = logbook_run.include_entity_name
     format_time = logbook_run.format_time
     memoize_new_contexts = logbook_run.memoize_new_contexts
+    context_index = logbook_run.context_index
 
     # Process rows
     for row in rows:
         context_id_bin: bytes = row.context_id_bin
         if memoize_new_contexts and context_id_bin not in context_lookup:
-            context_lookup[context_id_bin] = row
+            context_lookup[context_id_bin] = (
+                row
+                if context_index is None or context_id_bin is None
+                else _remember_context_row(context_index, context_id_bin, row)
+            )
+        elif (
+            context_index is not None
+            and not memoize_new_contexts
+            and context_id_bin is not None
+        ):
+            _remember_context_row(context_index, context_id_bin, row)
         if row.context_only:
             continue
         event_type = row.event_type
@@ -275,12 +353,51 @@ def _humanify(
             yield data
 
 
+def _remember_context_row(
+    context_index: LRU[bytes, Row | EventAsRow],
+    context_id_bin: bytes,
+    row: Row | EventAsRow,
+) -> Row | EventAsRow:
+    """Return the first row of a context and keep it in the context index."""
+    if (
+        indexed_row := context_index.get(context_id_bin)
+    ) is not None and indexed_row.time_fired_ts <= row.time_fired_ts:
+        return indexed_row
+    context_index[context_id_bin] = row
+    return row
+
+
+class _PageRows:
+    """Iterate the rows of a page and track the time fired of the last row.
+
+    The rows before the cursor were sent on earlier pages.
+    """
+
+    __slots__ = ("_cursor_ts", "_rows", "time_fired_ts")
+
+    def __init__(self, rows: Sequence[Row] | Result, cursor_ts: float) -> None:
+        """Init the page rows."""
+        self._rows = rows
+        self._cursor_ts = cursor_ts
+        self.time_fired_ts: float = 0.0
+
+    def __iter__(self) -> Generator[Row]:
+        """Iterate the rows from the cursor."""
+        cursor_ts = self._cursor_ts
+        for row in self._rows:
+            if (time_fired_ts := row.time_fired_ts) < cursor_ts:
+                continue
+            self.time_fired_ts = time_fired_ts
+            yield row
+
+
 class ContextAugmenter:
     """Augment data with context trace."""
 
     def __init__(self, logbook_run: LogbookRun) -> None:
         """Init the augmenter."""
         self.context_lookup = logbook_run.context_lookup
+        self.context_index = logbook_run.context_index
         self.entity_name_cache = logbook_run.entity_name_cache
         self.external_events = logbook_run.external_events
         self.event_cache = logbook_run.event_cache
@@ -291,7 +408,11 @@ class ContextAugmenter:
     ) -> Row | EventAsRow | None:
         """Get the context row from the id or row context."""
         if context_id_bin is not None and (
-            context_row := self.context_lookup.get(context_id_bin)
+            (context_row := self.context_lookup.get(context_id_bin))
+            or (
+                self.context_index is not None
+                and (context_row := self.context_index.get(context_id_bin))
+            )
         ):
             return context_row
         if (context := getattr(row, "context", None)) is not None and (
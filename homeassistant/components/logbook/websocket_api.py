@@ -55,6 +55,7 @@ class LogbookLiveStream:
 def async_setup(hass: HomeAssistant) -> None:
     """Set up the logbook websocket API."""
     websocket_api.async_register_command(hass, ws_get_events)
+    websocket_api.async_register_command(hass, ws_get_events_page)
     websocket_api.async_register_command(hass, ws_event_stream)
 
 
@@ -169,7 +170,7 @@ async def _async_get_ws_stream_events(
     partial: bool,
 ) -> tuple[bytes, dt | None]:
     """Async wrapper around _ws_formatted_get_events."""
-    return await get_instance(hass).async_add_executor_job(
+    return await get_instance(hass).async_add_read_executor_job(
         _ws_stream_get_events,
         msg_id,
         start_time,
@@ -305,6 +306,7 @@ async def ws_event_stream(
         None,
         timestamp=True,
         include_entity_name=False,
+        user_id=connection.user.id,
     )
 
     if end_time and end_time <= utc_now:
@@ -452,21 +454,52 @@ def _ws_formatted_get_events(
     )
 
 
-@websocket_api.websocket_command(
-    {
-        vol.Required("type"): "logbook/get_events",
-        vol.Required("start_time"): str,
-        vol.Optional("end_time"): str,
-        vol.Optional("entity_ids"): [str],
-        vol.Optional("device_ids"): [str],
-        vol.Optional("context_id"): str,
-    }
-)
-@websocket_api.async_response
-async def ws_get_events(
+def _ws_formatted_get_events_page(
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    event_processor: EventProcessor,
+    limit: int,
+    cursor: tuple[float, int] | None,
+) -> bytes:
+    """Fetch a page of events and convert them to json in the executor."""
+    events, next_cursor = event_processor.get_events_page(
+        start_time, end_time, limit, cursor
+    )
+    return json_bytes(
+        messages.result_message(
+            msg_id,
+            {
+                "events": events,
+                "cursor": _cursor_to_str(next_cursor) if next_cursor else None,
+            },
+        )
+    )
+
+
+def _cursor_to_str(cursor: tuple[float, int]) -> str:
+    """Convert a logbook page cursor to a string."""
+    return f"{cursor[0]!r}:{cursor[1]}"
+
+
+def _str_to_cursor(cursor: str) -> tuple[float, int] | None:
+    """Convert a string to a logbook page cursor."""
+    time_fired_ts, _, count = cursor.partition(":")
+    try:
+        return float(time_fired_ts), int(count)
+    except ValueError:
+        return None
+
+
+@callback
+def _async_get_events_request(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
-) -> None:
-    """Handle logbook get events websocket command."""
+) -> tuple[dt, dt, EventProcessor | None] | None:
+    """Parse a get events request.
+
+    Returns None if an error was sent, the event processor is None if
+    there can not be any events.
+    """
     start_time_str = msg["start_time"]
     end_time_str = msg.get("end_time")
     utc_now = dt_util.utcnow()
@@ -475,7 +508,7 @@ async def ws_get_events(
         start_time = dt_util.as_utc(start_time)
     else:
         connection.send_error(msg["id"], "invalid_start_time", "Invalid start_time")
-        return
+        return None
 
     if not end_time_str:
         end_time = utc_now
@@ -483,11 +516,10 @@ async def ws_get_events(
         end_time = dt_util.as_utc(parsed_end_time)
     else:
         connection.send_error(msg["id"], "invalid_end_time", "Invalid end_time")
-        return
+        return None
 
     if start_time > utc_now:
-        connection.send_result(msg["id"], [])
-        return
+        return start_time, end_time, None
 
     device_ids = msg.get("device_ids")
     entity_ids = msg.get("entity_ids")
@@ -496,8 +528,7 @@ async def ws_get_events(
         entity_ids = async_filter_entities(hass, entity_ids)
         if not entity_ids and not device_ids:
             # Everything has been filtered away
-            connection.send_result(msg["id"], [])
-            return
+            return start_time, end_time, None
 
     event_types = async_determine_event_types(hass, entity_ids, device_ids)
 
@@ -509,10 +540,35 @@ async def ws_get_events(
         context_id,
         timestamp=True,
         include_entity_name=False,
+        user_id=connection.user.id,
     )
+    return start_time, end_time, event_processor
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "logbook/get_events",
+        vol.Required("start_time"): str,
+        vol.Optional("end_time"): str,
+        vol.Optional("entity_ids"): [str],
+        vol.Optional("device_ids"): [str],
+        vol.Optional("context_id"): str,
+    }
+)
+@websocket_api.async_response
+async def ws_get_events(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle logbook get events websocket command."""
+    if (request := _async_get_events_request(hass, connection, msg)) is None:
+        return
+    start_time, end_time, event_processor = request
+    if event_processor is None:
+        connection.send_result(msg["id"], [])
+        return
 
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_executor_job(
             _ws_formatted_get_events,
             msg["id"],
             start_time,
@@ -520,3 +576,51 @@ async def ws_get_events(
             event_processor,
         )
     )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "logbook/get_events_page",
+        vol.Required("start_time"): str,
+        vol.Optional("end_time"): str,
+        vol.Optional("entity_ids"): [str],
+        vol.Optional("device_ids"): [str],
+        vol.Optional("context_id"): str,
+        vol.Required("limit"): vol.All(int, vol.Range(min=1)),
+        vol.Optional("cursor"): str,
+    }
+)
+@websocket_api.async_response
+async def ws_get_events_page(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle logbook get events page websocket command.
+
+    At most limit events are returned with the cursor to pass to get the
+    next page, the cursor is None on the last page.
+    """
+    cursor: tuple[float, int] | None = None
+    if (cursor_str := msg.get("cursor")) is not None and (
+        cursor := _str_to_cursor(cursor_str)
+    ) is None:
+        connection.send_error(msg["id"], "invalid_cursor", "Invalid cursor")
+        return
+
+    if (request := _async_get_events_request(hass, connection, msg)) is None:
+        return
+    start_time, end_time, event_processor = request
+    if event_processor is None:
+        connection.send_result(msg["id"], {"events": [], "cursor": None})
+        return
+
+    connection.send_message(
+        await get_instance(hass).async_add_read_executor_job(
+            _ws_formatted_get_events_page,
+            msg["id"],
+            start_time,
+            end_time,
+            event_processor,
+            msg["limit"],
+            cursor,
+        )
+    )
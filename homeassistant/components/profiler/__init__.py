@@ -20,7 +20,7 @@ import voluptuous as vol
 from homeassistant.components import persistent_notification
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
-from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.core import HomeAssistant, ServiceCall, State, callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.event import async_track_time_interval
@@ -40,6 +40,8 @@ SERVICE_LOG_THREAD_FRAMES = "log_thread_frames"
 SERVICE_LOG_EVENT_LOOP_SCHEDULED = "log_event_loop_scheduled"
 SERVICE_SET_ASYNCIO_DEBUG = "set_asyncio_debug"
 SERVICE_LOG_CURRENT_TASKS = "log_current_tasks"
+SERVICE_LOG_STATE_MEMORY = "log_state_memory"
+SERVICE_SET_STATE_ATTRIBUTE_SHARING = "set_state_attribute_sharing"
 
 _LRU_CACHE_WRAPPER_OBJECT = _lru_cache_wrapper.__name__
 _SQLALCHEMY_LRU_OBJECT = "LRUCache"
@@ -63,6 +65,8 @@ SERVICES = (
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
     SERVICE_SET_ASYNCIO_DEBUG,
     SERVICE_LOG_CURRENT_TASKS,
+    SERVICE_LOG_STATE_MEMORY,
+    SERVICE_SET_STATE_ATTRIBUTE_SHARING,
 )
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
@@ -273,6 +277,34 @@ async def async_setup_entry(  # noqa: C901
             base_logger.setLevel(logging.INFO)
         hass.loop.set_debug(enabled)
 
+    @callback
+    def _async_log_state_memory(call: ServiceCall) -> None:
+        """Log the estimated memory used by the states per domain."""
+        domain_memory = _state_memory_by_domain(hass.states.async_all())
+        total_states = 0
+        total_bytes = 0
+        for domain, (count, size) in sorted(
+            domain_memory.items(), key=lambda item: item[1][1], reverse=True
+        ):
+            total_states += count
+            total_bytes += size
+            _LOGGER.critical(
+                "State memory for domain %s: %s states using %s bytes",
+                domain,
+                count,
+                size,
+            )
+        _LOGGER.critical(
+            "State memory total: %s states using %s bytes", total_states, total_bytes
+        )
+
+    @callback
+    def _async_set_state_attribute_sharing(call: ServiceCall) -> None:
+        """Enable or disable sharing identical attributes between states."""
+        enabled = call.data[CONF_ENABLED]
+        _LOGGER.critical("Setting state attribute sharing to %s", enabled)
+        hass.states.async_set_intern_attributes(enabled)
+
     async_register_admin_service(
         hass,
         DOMAIN,
@@ -382,6 +414,21 @@ async def async_setup_entry(  # noqa: C901
         _async_dump_current_tasks,
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_LOG_STATE_MEMORY,
+        _async_log_state_memory,
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_SET_STATE_ATTRIBUTE_SHARING,
+        _async_set_state_attribute_sharing,
+        schema=vol.Schema({vol.Optional(CONF_ENABLED, default=True): cv.boolean}),
+    )
+
     return True
 
 
@@ -391,6 +438,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass.services.async_remove(domain=DOMAIN, service=service)
     if LOG_INTERVAL_SUB in hass.data[DOMAIN]:
         hass.data[DOMAIN][LOG_INTERVAL_SUB]()
+    hass.states.async_set_intern_attributes(False)
     hass.data.pop(DOMAIN)
     return True
 
@@ -585,6 +633,40 @@ def _log_object_sources(
         _LOGGER.critical("No new object growth found")
 
 
+def _state_memory_by_domain(states: list[State]) -> dict[str, tuple[int, int]]:
+    """Estimate the memory used by states per domain.
+
+    Returns a dict of domain to a tuple of the number of states and
+    the estimated bytes. Objects shared between states, such as shared
+    attributes, are only counted once.
+    """
+    seen: set[int] = set()
+    domain_memory: dict[str, tuple[int, int]] = {}
+
+    def _sizeof(obj: Any) -> int:
+        if (obj_id := id(obj)) in seen:
+            return 0
+        seen.add(obj_id)
+        size = sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            for key, value in obj.items():
+                size += _sizeof(key) + _sizeof(value)
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            for value in obj:
+                size += _sizeof(value)
+        return size
+
+    for state in states:
+        count, size = domain_memory.get(state.domain, (0, 0))
+        # The instance dict holds the datetimes, context and the cached
+        # dict and JSON representations of the state
+        domain_memory[state.domain] = (
+            count + 1,
+            size + sys.getsizeof(state) + _sizeof(state.__dict__),
+        )
+    return domain_memory
+
+
 @contextlib.contextmanager
 def _increase_repr_limit() -> Generator[None]:
     """Increase the repr limit."""
@@ -0,0 +1,153 @@
+"""Write pending recorder rows with multi-row inserts."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import Table, update
+from sqlalchemy.orm.session import Session
+
+from .db_schema import (
+    TABLE_EVENT_DATA,
+    TABLE_EVENT_TYPES,
+    TABLE_EVENTS,
+    TABLE_STATE_ATTRIBUTES,
+    TABLE_STATES,
+    TABLE_STATES_META,
+)
+
+type _Relationships = tuple[tuple[str, str, str], ...]
+
+# The tables the bulk writer handles with their primary key and the
+# (relationship, foreign key, related primary key) of the relationships
+# that are resolved to ids. Tables are inserted in this order so the ids
+# of the related rows are known before the rows referencing them are inserted.
+_BULK_TABLES: dict[str, tuple[str, _Relationships]] = {
+    TABLE_EVENT_TYPES: ("event_type_id", ()),
+    TABLE_EVENT_DATA: ("data_id", ()),
+    TABLE_EVENTS: (
+        "event_id",
+        (
+            ("event_type_rel", "event_type_id", "event_type_id"),
+            ("event_data_rel", "data_id", "data_id"),
+        ),
+    ),
+    TABLE_STATES_META: ("metadata_id", ()),
+    TABLE_STATE_ATTRIBUTES: ("attributes_id", ()),
+    TABLE_STATES: (
+        "state_id",
+        (
+            ("states_meta_rel", "metadata_id", "metadata_id"),
+            ("state_attributes", "attributes_id", "attributes_id"),
+        ),
+    ),
+}
+_INSERT_ORDER = {table_name: idx for idx, table_name in enumerate(_BULK_TABLES)}
+
+
+@dataclass(slots=True, frozen=True)
+class _BulkTable:
+    """Describe how to insert the rows of a model."""
+
+    table: Table
+    primary_key: str
+    columns: tuple[str, ...]
+    relationships: _Relationships
+
+
+def _bulk_table(model: type[Any]) -> _BulkTable:
+    """Build the insert description for a model.
+
+    The description is built from the model instead of the current
+    schema so older schemas used during migration are written correctly.
+    """
+    table: Table = model.__table__
+    primary_key, relationships = _BULK_TABLES[table.name]
+    return _BulkTable(
+        table,
+        primary_key,
+        tuple(column.key for column in table.columns if column.key != primary_key),
+        relationships,
+    )
+
+
+class BulkWriter:
+    """Collect new rows and write them with one multi-row insert per table.
+
+    The objects added to the writer are never added to the session, which
+    avoids the cost of the unit of work flush. Instead the column values
+    are read from each object at commit time and inserted with a single
+    INSERT ... RETURNING statement per table. The returned primary keys are
+    set back on the objects so the table managers can move them from
+    pending to committed like they do for objects written by the session.
+
+    Only dialects that can return the primary keys of a multi-row insert
+    in parameter order can use the writer.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the bulk writer."""
+        self._pending: dict[type[Any], list[Any]] = {}
+        self._tables: dict[type[Any], _BulkTable] = {}
+
+    def add(self, obj: Any) -> None:
+        """Add an object to be inserted at the next write."""
+        if (objs := self._pending.get(model := type(obj))) is None:
+            objs = self._pending[model] = []
+        objs.append(obj)
+
+    def write(self, session: Session) -> None:
+        """Insert all pending rows in the session transaction.
+
+        The pending rows are kept until clear is called after the
+        transaction has been committed so they can be written again
+        if the commit has to be retried.
+        """
+        for model, objs in sorted(
+            self._pending.items(),
+            key=lambda item: _INSERT_ORDER[item[0].__tablename__],
+        ):
+            if (bulk_table := self._tables.get(model)) is None:
+                bulk_table = self._tables[model] = _bulk_table(model)
+            self._insert(session, bulk_table, objs)
+            if model.__tablename__ != TABLE_STATES:
+                continue
+            # A state that replaced a state from the same batch
+            # can only be linked once both have a state_id
+            if old_state_ids := [
+                {"state_id": db_state.state_id, "old_state_id": old_state.state_id}
+                for db_state in objs
+                if (old_state := db_state.__dict__.get("old_state")) is not None
+            ]:
+                session.execute(update(model), old_state_ids)
+
+    def _insert(
+        self, session: Session, bulk_table: _BulkTable, objs: list[Any]
+    ) -> None:
+        """Insert the rows for one table and set the primary keys on the objects."""
+        columns = bulk_table.columns
+        relationships = bulk_table.relationships
+        rows: list[dict[str, Any]] = []
+        for obj in objs:
+            values = obj.__dict__
+            row = {column: values.get(column) for column in columns}
+            for relationship, foreign_key, related_primary_key in relationships:
+                if (related := values.get(relationship)) is not None:
+                    row[foreign_key] = getattr(related, related_primary_key)
+            rows.append(row)
+
+        table = bulk_table.table
+        primary_key = bulk_table.primary_key
+        result = session.execute(
+            table.insert().returning(
+                table.c[primary_key], sort_by_parameter_order=True
+            ),
+            rows,
+        )
+        for obj, row_id in zip(objs, result.scalars(), strict=True):
+            setattr(obj, primary_key, row_id)
+
+    def clear(self) -> None:
+        """Clear the pending rows after they have been committed or discarded."""
+        self._pending.clear()
@@ -45,6 +45,11 @@ SQLITE_MODERN_MAX_BIND_VARS = 4000
 DEFAULT_MAX_BIND_VARS = 4000
 
 DB_WORKER_PREFIX = "DbWorker"
+DB_READER_PREFIX = "DbReader"
+
+# Read only SQLite connections map up to this much of the database
+# into memory so reads are served from the page cache of the OS
+SQLITE_READER_MMAP_SIZE = 256 * 1024**2
 
 ALL_DOMAIN_EXCLUDE_ATTRS = {ATTR_ATTRIBUTION, ATTR_RESTORED, ATTR_SUPPORTED_FEATURES}
 
@@ -59,6 +64,7 @@ CONTEXT_ID_AS_BINARY_SCHEMA_VERSION = 36
 EVENT_TYPE_IDS_SCHEMA_VERSION = 37
 STATES_META_SCHEMA_VERSION = 38
 LAST_REPORTED_SCHEMA_VERSION = 43
+STATISTICS_ROLLUPS_SCHEMA_VERSION = 46
 
 LEGACY_STATES_EVENT_ID_INDEX_SCHEMA_VERSION = 28
 
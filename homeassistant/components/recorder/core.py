@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Mapping, Sequence
 from concurrent.futures import CancelledError
 import contextlib
 from datetime import datetime, timedelta
@@ -16,12 +16,20 @@ import time
 from typing import TYPE_CHECKING, Any, cast
 
 import psutil_home_assistant as ha_psutil
-from sqlalchemy import create_engine, event as sqlalchemy_event, exc, select, update
+from sqlalchemy import (
+    create_engine,
+    event as sqlalchemy_event,
+    exc,
+    select,
+    text,
+    update,
+)
 from sqlalchemy.engine import Engine
 from sqlalchemy.engine.interfaces import DBAPIConnection
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import scoped_session, sessionmaker
 from sqlalchemy.orm.session import Session
+from sqlalchemy.pool import QueuePool
 
 from homeassistant.components import persistent_notification
 from homeassistant.const import (
@@ -48,9 +56,12 @@ from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 import homeassistant.util.dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 from homeassistant.util.event_type import EventType
+from homeassistant.util.executor import InterruptibleThreadPoolExecutor
 
 from . import migration, statistics
+from .bulk_writer import BulkWriter
 from .const import (
+    DB_READER_PREFIX,
     DB_WORKER_PREFIX,
     DOMAIN,
     KEEPALIVE_TIME,
@@ -85,9 +96,11 @@ from .migration import (
     EventsContextIDMigration,
     EventTypeIDMigration,
     StatesContextIDMigration,
+    StatisticsRollupsMigration,
 )
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
 from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .purge import PurgeProgress
 from .queries import get_migration_changes
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
@@ -104,6 +117,7 @@ from .tasks import (
     CommitTask,
     CompileMissingStatisticsTask,
     DatabaseLockTask,
+    ImportStatisticsColumnsTask,
     ImportStatisticsTask,
     KeepAliveTask,
     PerodicCleanupTask,
@@ -126,6 +140,7 @@ from .util import (
     move_away_broken_database,
     session_scope,
     setup_connection_for_dialect,
+    setup_read_only_connection,
     validate_or_move_away_sqlite_database,
     write_lock_db_sqlite,
 )
@@ -172,6 +187,7 @@ class Recorder(threading.Thread):
         uri: str,
         db_max_retries: int,
         db_retry_wait: int,
+        db_readers: int,
         entity_filter: Callable[[str], bool] | None,
         exclude_event_types: set[EventType[Any] | str],
     ) -> None:
@@ -191,6 +207,7 @@ class Recorder(threading.Thread):
         self.db_url = uri
         self.db_max_retries = db_max_retries
         self.db_retry_wait = db_retry_wait
+        self.db_readers = db_readers
         self.database_engine: DatabaseEngine | None = None
         # Database connection is ready, but non-live migration may be in progress
         db_connected: asyncio.Future[bool] = hass.data[DOMAIN].db_connected
@@ -201,6 +218,13 @@ class Recorder(threading.Thread):
         self.async_recorder_ready = asyncio.Event()
         self._queue_watch = threading.Event()
         self.engine: Engine | None = None
+        # Read only connections to a SQLite database in WAL mode
+        # which history, logbook and statistics queries use so
+        # they do not compete with the recorder for connections
+        self.read_engine: Engine | None = None
+        # Marks the reader threads, the mark goes away with the thread
+        # unlike a thread ident which may be reused by a later thread
+        self._reader_thread = threading.local()
         self.max_backlog: int = MAX_QUEUE_BACKLOG_MIN_VALUE
         self._psutil: ha_psutil.PsutilWrapper | None = None
 
@@ -213,6 +237,7 @@ class Recorder(threading.Thread):
         self.schema_version = 0
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
+        self._bulk_writer: BulkWriter | None = None
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
@@ -224,13 +249,17 @@ class Recorder(threading.Thread):
 
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
+        self._get_read_session: Callable[[], Session] | None = None
         self._completed_first_database_setup: bool | None = None
         self.async_migration_event = asyncio.Event()
         self.migration_in_progress = False
         self.migration_is_live = False
         self.use_legacy_events_index = False
+        self.purge_progress: PurgeProgress | None = None
+        self.statistics_rollups_active = False
         self._database_lock_task: DatabaseLockTask | None = None
         self._db_executor: DBInterruptibleThreadPoolExecutor | None = None
+        self._read_executor: InterruptibleThreadPoolExecutor | None = None
 
         self._event_listener: CALLBACK_TYPE | None = None
         self._queue_watcher: CALLBACK_TYPE | None = None
@@ -271,7 +300,14 @@ class Recorder(threading.Thread):
         return self._event_listener is not None
 
     def get_session(self) -> Session:
-        """Get a new sqlalchemy session."""
+        """Get a new sqlalchemy session.
+
+        Sessions requested from a reader thread use a read only connection.
+        """
+        if self._get_read_session is not None and getattr(
+            self._reader_thread, "reader", False
+        ):
+            return self._get_read_session()
         if self._get_session is None:
             raise RuntimeError("The database connection has not been established")
         return self._get_session()
@@ -294,6 +330,17 @@ class Recorder(threading.Thread):
             shutdown_hook=self._shutdown_pool,
         )
 
+        if self._get_read_session is not None:
+            self._read_executor = InterruptibleThreadPoolExecutor(
+                thread_name_prefix=DB_READER_PREFIX,
+                max_workers=self.db_readers,
+                initializer=self._register_reader_thread,
+            )
+
+    def _register_reader_thread(self) -> None:
+        """Register a reader thread so it gets read only sessions."""
+        self._reader_thread.reader = True
+
     def _shutdown_pool(self) -> None:
         """Close the dbpool connections in the current thread."""
         if self.engine and hasattr(self.engine.pool, "shutdown"):
@@ -367,8 +414,23 @@ class Recorder(threading.Thread):
         """Add an executor job from within the event loop."""
         return self.hass.loop.run_in_executor(self._db_executor, target, *args)
 
+    def async_add_read_executor_job[_T](
+        self, target: Callable[..., _T], *args: Any
+    ) -> asyncio.Future[_T]:
+        """Add a read only executor job from within the event loop.
+
+        The job runs on a reader thread when the database has read only
+        connections and on the database executor otherwise.
+        """
+        if self._read_executor is None:
+            return self.async_add_executor_job(target, *args)
+        return self.hass.loop.run_in_executor(self._read_executor, target, *args)
+
     def _stop_executor(self) -> None:
         """Stop the executor."""
+        if self._read_executor is not None:
+            self._read_executor.shutdown()
+            self._read_executor = None
         if self._db_executor is None:
             return
         self._db_executor.shutdown()
@@ -632,6 +694,16 @@ class Recorder(threading.Thread):
         """Schedule import of statistics."""
         self.queue_task(ImportStatisticsTask(metadata, stats, table))
 
+    @callback
+    def async_import_statistics_columns(
+        self,
+        metadata: StatisticMetaData,
+        columns: Mapping[str, Sequence[float | None]],
+        table: type[Statistics | StatisticsShortTerm],
+    ) -> None:
+        """Schedule import of statistics given as columns."""
+        self.queue_task(ImportStatisticsColumnsTask(metadata, columns, table))
+
     @callback
     def _async_setup_periodic_tasks(self) -> None:
         """Prepare periodic tasks."""
@@ -701,9 +773,17 @@ class Recorder(threading.Thread):
             self._shutdown()
 
     def _add_to_session(self, session: Session, obj: object) -> None:
-        """Add an object to the session."""
+        """Add an object to the session.
+
+        When the database supports it, the object is handed to the bulk
+        writer instead and inserted with the other pending rows of the
+        same table at commit time.
+        """
         self._event_session_has_pending_writes = True
-        session.add(obj)
+        if (bulk_writer := self._bulk_writer) is not None:
+            bulk_writer.add(obj)
+        else:
+            session.add(obj)
 
     def _notify_migration_failed(self) -> None:
         """Notify the user schema migration failed."""
@@ -820,6 +900,7 @@ class Recorder(threading.Thread):
                 EventTypeIDMigration,
                 EntityIDMigration,
                 EventIDPostMigration,
+                StatisticsRollupsMigration,
             ):
                 migrator = migrator_cls(schema_status.start_version, migration_changes)
                 migrator.do_migrate(self, session)
@@ -1237,7 +1318,17 @@ class Recorder(threading.Thread):
                         for state_id, last_reported_timestamp in pending_last_reported.items()
                     ],
                 )
+        if (bulk_writer := self._bulk_writer) is not None:
+            try:
+                bulk_writer.write(session)
+            except SQLAlchemyError:
+                # Discard the rows that were already inserted so
+                # a retry does not insert them a second time
+                session.rollback()
+                raise
         session.commit()
+        if bulk_writer is not None:
+            bulk_writer.clear()
 
         self._event_session_has_pending_writes = False
         # We just committed the state attributes to the database
@@ -1277,6 +1368,8 @@ class Recorder(threading.Thread):
         self.event_type_manager.reset()
         self.states_meta_manager.reset()
         self.statistics_meta_manager.reset()
+        if self._bulk_writer is not None:
+            self._bulk_writer.clear()
 
         if not self.event_session:
             return
@@ -1447,11 +1540,57 @@ class Recorder(threading.Thread):
 
         migration.pre_migrate_schema(self.engine)
         Base.metadata.create_all(self.engine)
+        # Rows are only written in bulk when the primary keys of a multi-row
+        # insert can be matched back to the pending objects, which the dialect
+        # only knows once it has connected and detected the server version
+        self._bulk_writer = (
+            BulkWriter()
+            if self.engine.dialect.insert_executemany_returning_sort_by_parameter_order
+            else None
+        )
         self._get_session = scoped_session(sessionmaker(bind=self.engine, future=True))
+        self._setup_read_connection()
         _LOGGER.debug("Connected to recorder database")
 
+    def _setup_read_connection(self) -> None:
+        """Set up the read only connections if the database supports them.
+
+        Readers only run concurrently with the recorder when SQLite is in
+        WAL mode, otherwise every read would block the next commit.
+        """
+        assert self.engine is not None
+        if (
+            not self.db_readers
+            or not self._using_file_sqlite
+            or ":memory:" in self.db_url
+        ):
+            return
+        with self.engine.connect() as connection:
+            journal_mode = connection.execute(text("PRAGMA journal_mode")).scalar()
+        if journal_mode != "wal":
+            _LOGGER.debug(
+                "Not using read only connections with journal mode %s", journal_mode
+            )
+            return
+        self.read_engine = create_engine(
+            self.db_url,
+            connect_args={"check_same_thread": False},
+            poolclass=QueuePool,
+            pool_size=self.db_readers,
+            max_overflow=0,
+            future=True,
+        )
+        sqlalchemy_event.listen(self.read_engine, "connect", setup_read_only_connection)
+        self._get_read_session = scoped_session(
+            sessionmaker(bind=self.read_engine, future=True)
+        )
+
     def _close_connection(self) -> None:
         """Close the connection."""
+        if self.read_engine:
+            self.read_engine.dispose()
+            self.read_engine = None
+        self._get_read_session = None
         if self.engine:
             self.engine.dispose()
             self.engine = None
@@ -21,6 +21,7 @@ from sqlalchemy import (
 )
 from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
 from homeassistant.core import HomeAssistant, State, split_entity_id
@@ -45,6 +46,8 @@ from .const import (
     STATE_KEY,
 )
 
+DEFAULT_STREAM_STATES_ROWS = 4096
+
 _FIELD_MAP = {
     "metadata_id": 0,
     "state": 1,
@@ -117,6 +120,7 @@ def get_significant_states(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    max_points: int | None = None,
 ) -> dict[str, list[State | dict[str, Any]]]:
     """Wrap get_significant_states_with_session with an sql session."""
     with session_scope(hass=hass, read_only=True) as session:
@@ -132,6 +136,7 @@ def get_significant_states(
             minimal_response,
             no_attributes,
             compressed_state_format,
+            max_points,
         )
 
 
@@ -213,11 +218,15 @@ def get_significant_states_with_session(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    max_points: int | None = None,
 ) -> dict[str, list[State | dict[str, Any]]]:
     """Return states changes during UTC period start_time - end_time.
 
     entity_ids is an optional iterable of entities to include in the results.
 
+    max_points is an optional number of states to reduce the states of each
+    entity to, keeping the minimum and maximum of each part of the period.
+
     filters is an optional SQLAlchemy filter which will be applied to the database
     queries unless entity_ids is given, in which case its ignored.
 
@@ -229,6 +238,101 @@ def get_significant_states_with_session(
         raise NotImplementedError("Filters are no longer supported")
     if not entity_ids:
         raise ValueError("entity_ids must be provided")
+    if not (
+        prepared := _prepare_significant_states_stmt(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ):
+        return {}
+    stmt, entity_id_to_metadata_id, start_time_ts = prepared
+    return _sorted_states_to_dict(
+        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
+        start_time_ts,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes=no_attributes,
+        max_points=max_points,
+    )
+
+
+def stream_significant_states(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    compressed_state_format: bool = False,
+    chunk_size: int = DEFAULT_STREAM_STATES_ROWS,
+) -> Iterator[dict[str, list[State | dict[str, Any]]]]:
+    """Yield the significant states during a time period in chunks.
+
+    The rows are fetched from a server side cursor and at most chunk_size
+    rows are converted at a time, so memory use does not depend on the
+    length of the period. The states of an entity may be split over
+    consecutive chunks, concatenating the chunks gives the same result as
+    get_significant_states.
+    """
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    with session_scope(hass=hass, read_only=True) as session:
+        if not (
+            prepared := _prepare_significant_states_stmt(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                no_attributes,
+            )
+        ):
+            return
+        stmt, entity_id_to_metadata_id, start_time_ts = prepared
+        last_states: dict[str, str | None] = {}
+        result = session.connection().execute(
+            stmt, execution_options={"yield_per": chunk_size}
+        )
+        for rows in result.partitions():
+            if chunk := _sorted_states_to_dict(
+                rows,
+                start_time_ts,
+                entity_ids,
+                entity_id_to_metadata_id,
+                minimal_response,
+                compressed_state_format,
+                no_attributes=no_attributes,
+                last_states=last_states,
+            ):
+                yield chunk
+
+
+def _prepare_significant_states_stmt(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+) -> tuple[StatementLambdaElement, dict[str, int | None], float | None] | None:
+    """Return the significant states statement, the metadata ids and start time.
+
+    Returns None if none of the entities have been recorded.
+    """
     entity_id_to_metadata_id: dict[str, int | None] | None = None
     metadata_ids_in_significant_domains: list[int] = []
     instance = recorder.get_instance(hass)
@@ -237,7 +341,7 @@ def get_significant_states_with_session(
             entity_ids, session, False
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
-        return {}
+        return None
     metadata_ids = possible_metadata_ids
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
@@ -275,14 +379,10 @@ def get_significant_states_with_session(
             include_start_time_state,
         ],
     )
-    return _sorted_states_to_dict(
-        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
-        start_time_ts if include_start_time_state else None,
-        entity_ids,
+    return (
+        stmt,
         entity_id_to_metadata_id,
-        minimal_response,
-        compressed_state_format,
-        no_attributes=no_attributes,
+        start_time_ts if include_start_time_state else None,
     )
 
 
@@ -680,6 +780,8 @@ def _sorted_states_to_dict(
     compressed_state_format: bool = False,
     descending: bool = False,
     no_attributes: bool = False,
+    last_states: dict[str, str | None] | None = None,
+    max_points: int | None = None,
 ) -> dict[str, list[State | dict[str, Any]]]:
     """Convert SQL results into JSON friendly data structure.
 
@@ -691,6 +793,13 @@ def _sorted_states_to_dict(
     We also need to go back and create a synthetic zero data point for
     each list of states, otherwise our graphs won't start on the Y
     axis correctly.
+
+    When the rows are converted in chunks, last_states tracks the last
+    state of each entity with minimal_response so an entity continuing
+    from a previous chunk does not get a full first state again.
+
+    With max_points, the states of each entity are downsampled before they
+    are converted.
     """
     field_map = _FIELD_MAP
     state_class: Callable[
@@ -733,6 +842,8 @@ def _sorted_states_to_dict(
         entity_id = metadata_id_to_entity_id[metadata_id]
         attr_cache: dict[str, dict[str, Any]] = {}
         ent_results = result[entity_id]
+        if max_points is not None:
+            group = iter(_downsample_rows(list(group), max_points, state_idx))
         if (
             not minimal_response
             or split_entity_id(entity_id)[0] in NEED_ATTRIBUTE_DOMAINS
@@ -758,7 +869,9 @@ def _sorted_states_to_dict(
         # State for the first and last response. All the states
         # in-between only provide the "state" and the
         # "last_changed".
-        if not ent_results:
+        if last_states is not None and entity_id in last_states:
+            prev_state = last_states[entity_id]
+        elif not ent_results:
             if (first_state := next(group, None)) is None:
                 continue
             prev_state = first_state[state_idx]
@@ -793,22 +906,23 @@ def _sorted_states_to_dict(
                     if (state := row[state_idx]) != prev_state
                 ]
             )
-            continue
-
-        # Non-compressed state format returns an ISO formatted string
-        _utc_from_timestamp = dt_util.utc_from_timestamp
-        ent_results.extend(
-            [
-                {
-                    attr_state: (prev_state := state),
-                    attr_time: _utc_from_timestamp(
-                        row[last_updated_ts_idx]
-                    ).isoformat(),
-                }
-                for row in group
-                if (state := row[state_idx]) != prev_state
-            ]
-        )
+        else:
+            # Non-compressed state format returns an ISO formatted string
+            _utc_from_timestamp = dt_util.utc_from_timestamp
+            ent_results.extend(
+                [
+                    {
+                        attr_state: (prev_state := state),
+                        attr_time: _utc_from_timestamp(
+                            row[last_updated_ts_idx]
+                        ).isoformat(),
+                    }
+                    for row in group
+                    if (state := row[state_idx]) != prev_state
+                ]
+            )
+        if last_states is not None:
+            last_states[entity_id] = prev_state
 
     if descending:
         for ent_results in result.values():
@@ -816,3 +930,54 @@ def _sorted_states_to_dict(
 
     # Filter out the empty lists if some states had 0 results.
     return {key: val for key, val in result.items() if val}
+
+
+def _downsample_rows(rows: list[Row], max_points: int, state_idx: int) -> list[Row]:
+    """Reduce the rows of an entity to at most max_points rows.
+
+    The first and last rows are kept and the rows in between are split in
+    buckets of equal size keeping two rows of each bucket in their original
+    order: the rows with the minimum and maximum state, so peaks still show
+    up in graphs. If a bucket has a state that is not a number, like
+    unavailable, the first such row replaces the minimum since it is a gap
+    in the graph, and for entities without numeric states the first change
+    to another state is kept with it.
+    """
+    if (row_count := len(rows)) <= max_points:
+        return rows
+    values: list[float | None] = []
+    for row in rows:
+        try:
+            values.append(float(row[state_idx]))
+        except (TypeError, ValueError):
+            values.append(None)
+    bucket_count = max(1, (max_points - 2) // 2)
+    bucket_size = (row_count - 2) / bucket_count
+    keep: list[int] = [0]
+    for bucket in range(bucket_count):
+        min_idx = max_idx = gap_idx = change_idx = -1
+        min_value = max_value = 0.0
+        for idx in range(
+            1 + int(bucket * bucket_size), 1 + int((bucket + 1) * bucket_size)
+        ):
+            if (value := values[idx]) is None:
+                if gap_idx == -1:
+                    gap_idx = idx
+                elif (
+                    change_idx == -1
+                    and rows[idx][state_idx] != rows[gap_idx][state_idx]
+                ):
+                    change_idx = idx
+                continue
+            if min_idx == -1 or value < min_value:
+                min_idx, min_value = idx, value
+            if max_idx == -1 or value > max_value:
+                max_idx, max_value = idx, value
+        if gap_idx != -1:
+            bucket_keep = {gap_idx, max_idx if max_idx != -1 else change_idx}
+        else:
+            bucket_keep = {min_idx, max_idx}
+        bucket_keep.discard(-1)
+        keep.extend(sorted(bucket_keep))
+    keep.append(row_count - 1)
+    return [rows[idx] for idx in keep]
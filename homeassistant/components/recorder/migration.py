@@ -13,7 +13,7 @@ from typing import TYPE_CHECKING, Any, cast, final
 from uuid import UUID
 
 import sqlalchemy
-from sqlalchemy import ForeignKeyConstraint, MetaData, Table, func, text, update
+from sqlalchemy import ForeignKeyConstraint, MetaData, Table, func, select, text, update
 from sqlalchemy.engine import CursorResult, Engine
 from sqlalchemy.engine.interfaces import ReflectedForeignKeyConstraint
 from sqlalchemy.exc import (
@@ -54,6 +54,7 @@ from .const import (
     EVENT_TYPE_IDS_SCHEMA_VERSION,
     LEGACY_STATES_EVENT_ID_INDEX_SCHEMA_VERSION,
     STATES_META_SCHEMA_VERSION,
+    STATISTICS_ROLLUPS_SCHEMA_VERSION,
     SupportedDialect,
 )
 from .db_schema import (
@@ -76,7 +77,9 @@ from .db_schema import (
     States,
     StatesMeta,
     Statistics,
+    StatisticsDaily,
     StatisticsMeta,
+    StatisticsMonthly,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -100,7 +103,12 @@ from .queries import (
     migrate_single_short_term_statistics_row_to_timestamp,
     migrate_single_statistics_row_to_timestamp,
 )
-from .statistics import get_start_time
+from .statistics import (
+    backfill_statistics_rollups,
+    clear_statistics_rollups,
+    get_start_time,
+    statistics_rollups_match_time_zone,
+)
 from .tasks import (
     CommitTask,
     EntityIDPostMigrationTask,
@@ -1705,6 +1713,19 @@ class _SchemaVersion45Migrator(_SchemaVersionMigrator, target_version=45):
         )
 
 
+class _SchemaVersion46Migrator(_SchemaVersionMigrator, target_version=46):
+    def _apply_update(self) -> None:
+        """Version specific update method."""
+        # The rollups are computed by StatisticsRollupsMigration
+        Base.metadata.create_all(
+            self.engine,
+            (
+                cast(Table, StatisticsDaily.__table__),
+                cast(Table, StatisticsMonthly.__table__),
+            ),
+        )
+
+
 def _migrate_statistics_columns_to_timestamp_removing_duplicates(
     hass: HomeAssistant,
     instance: Recorder,
@@ -2641,6 +2662,55 @@ class EventIDPostMigration(BaseRunTimeMigration):
         return NeedsMigrateResult(needs_migrate=False, migration_done=True)
 
 
+class StatisticsRollupsMigration(BaseRunTimeMigration):
+    """Migration to compute the daily and monthly statistics rollups."""
+
+    required_schema_version = STATISTICS_ROLLUPS_SCHEMA_VERSION
+    migration_id = "statistics_rollups"
+
+    @staticmethod
+    @retryable_database_job("compute statistics rollups")
+    def migrate_data(instance: Recorder) -> bool:
+        """Compute the rollups of one month, return True if completed."""
+        with session_scope(session=instance.get_session()) as session:
+            if not statistics_rollups_match_time_zone(session):
+                clear_statistics_rollups(session)
+            if is_done := backfill_statistics_rollups(session):
+                _mark_migration_done(session, StatisticsRollupsMigration)
+
+        _LOGGER.debug("Computing statistics rollups done=%s", is_done)
+        return is_done
+
+    def migration_done(self, instance: Recorder, session: Session | None) -> None:
+        """Will be called after migrate returns True."""
+        _LOGGER.debug("Activating statistics rollups as all months are computed")
+        instance.statistics_rollups_active = True
+
+    def needs_migrate(self, instance: Recorder, session: Session) -> bool:
+        """Return if the migration needs to run.
+
+        The rollups are computed for local days and months, they have to be
+        computed again if the time zone was changed since they were computed.
+        """
+        if super().needs_migrate(instance, session):
+            return True
+        if statistics_rollups_match_time_zone(session):
+            return False
+        _LOGGER.warning(
+            "The time zone has changed, the statistics rollups will be computed again"
+        )
+        return True
+
+    def needs_migrate_impl(
+        self, instance: Recorder, session: Session
+    ) -> NeedsMigrateResult:
+        """Return if the migration needs to run."""
+        needs_migrate = session.execute(select(Statistics.id).limit(1)).first()
+        return NeedsMigrateResult(
+            needs_migrate=bool(needs_migrate), migration_done=not needs_migrate
+        )
+
+
 def _mark_migration_done(
     session: Session, migration: type[BaseRunTimeMigration]
 ) -> None:
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
 from datetime import datetime
 from itertools import zip_longest
 import logging
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.orm.session import Session
 
@@ -37,6 +38,10 @@ from .queries import (
     find_legacy_detached_states_and_attributes_to_purge,
     find_legacy_event_state_and_attributes_and_data_ids_to_purge,
     find_legacy_row,
+    find_newest_event_id_to_purge,
+    find_newest_state_id_to_purge,
+    find_oldest_event_id,
+    find_oldest_state_id,
     find_short_term_statistics_to_purge,
     find_states_to_purge,
     find_statistics_runs_to_purge,
@@ -53,6 +58,48 @@ _LOGGER = logging.getLogger(__name__)
 DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
 
+# The time in seconds a purge run may keep the recorder thread busy
+# before it stops starting new batches and reschedules itself behind
+# the events that were queued while it was running
+PURGE_TIME_BUDGET = 1.0
+
+
+@dataclass(slots=True)
+class PurgeProgress:
+    """Progress of the purge that is running.
+
+    The number of rows to purge is estimated from the range of
+    ids to purge so it can be found without counting the rows.
+    """
+
+    purge_before: datetime
+    estimated_rows: int
+    rows_purged: int = 0
+    started: float = field(default_factory=time.monotonic)
+
+    @property
+    def rows_remaining(self) -> int:
+        """Return the estimated number of rows left to purge."""
+        return max(self.estimated_rows - self.rows_purged, 0)
+
+    @property
+    def eta(self) -> float | None:
+        """Return the estimated number of seconds until the purge is done."""
+        if not self.rows_purged:
+            return None
+        elapsed = time.monotonic() - self.started
+        return self.rows_remaining * elapsed / self.rows_purged
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the progress as a dict."""
+        eta = self.eta
+        return {
+            "purge_before": self.purge_before.isoformat(),
+            "rows_purged": self.rows_purged,
+            "rows_remaining": self.rows_remaining,
+            "eta": None if eta is None else round(eta),
+        }
+
 
 @retryable_database_job("purge")
 def purge_old_data(
@@ -66,12 +113,20 @@ def purge_old_data(
     """Purge events and states older than purge_before.
 
     Cleans up an timeframe of an hour, based on the oldest record.
+    Stops starting new batches once PURGE_TIME_BUDGET is spent so
+    the rest of the purge runs after the queued events are written.
     """
     _LOGGER.debug(
         "Purging states and events before target %s",
         purge_before.isoformat(sep=" ", timespec="seconds"),
     )
+    deadline = time.monotonic() + PURGE_TIME_BUDGET
     with session_scope(session=instance.get_session()) as session:
+        progress = instance.purge_progress
+        if progress is None or progress.purge_before != purge_before:
+            progress = instance.purge_progress = PurgeProgress(
+                purge_before, _estimate_rows_to_purge(session, purge_before)
+            )
         # Purge a max of max_bind_vars, based on the oldest states or events record
         has_more_to_purge = False
         if instance.use_legacy_events_index and _purging_legacy_format(session):
@@ -87,10 +142,10 @@ def purge_old_data(
             )
             # Once we are done purging legacy rows, we use the new method
             has_more_to_purge |= _purge_states_and_attributes_ids(
-                instance, session, states_batch_size, purge_before
+                instance, session, states_batch_size, purge_before, deadline, progress
             )
             has_more_to_purge |= _purge_events_and_data_ids(
-                instance, session, events_batch_size, purge_before
+                instance, session, events_batch_size, purge_before, deadline, progress
             )
 
         statistics_runs = _select_statistics_runs_to_purge(
@@ -128,6 +183,26 @@ def purge_old_data(
     return True
 
 
+def _estimate_rows_to_purge(session: Session, purge_before: datetime) -> int:
+    """Estimate the number of states and events rows to purge.
+
+    The ids are assigned in time order, so the difference between the
+    oldest id and the newest id to purge is a close upper bound that
+    only needs a primary key and a timestamp index lookup per table.
+    """
+    purge_before_ts = purge_before.timestamp()
+    estimated_rows = 0
+    for oldest_stmt, newest_stmt in (
+        (find_oldest_state_id(), find_newest_state_id_to_purge(purge_before_ts)),
+        (find_oldest_event_id(), find_newest_event_id_to_purge(purge_before_ts)),
+    ):
+        oldest_id = session.execute(oldest_stmt).scalar()
+        newest_id = session.execute(newest_stmt).scalar()
+        if oldest_id is not None and newest_id is not None:
+            estimated_rows += max(newest_id - oldest_id + 1, 0)
+    return estimated_rows
+
+
 def _purging_legacy_format(session: Session) -> bool:
     """Check if there are any legacy event_id linked states rows remaining."""
     return bool(session.execute(find_legacy_row()).scalar())
@@ -178,6 +253,8 @@ def _purge_states_and_attributes_ids(
     session: Session,
     states_batch_size: int,
     purge_before: datetime,
+    deadline: float,
+    progress: PurgeProgress,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -192,7 +269,10 @@ def _purge_states_and_attributes_ids(
     # max_bind_vars
     attributes_ids_batch: set[int] = set()
     max_bind_vars = instance.max_bind_vars
-    for _ in range(states_batch_size):
+    for batch in range(states_batch_size):
+        if batch and time.monotonic() > deadline:
+            _LOGGER.debug("Purge time budget spent after %s states batches", batch)
+            break
         state_ids, attributes_ids = _select_state_attributes_ids_to_purge(
             session, purge_before, max_bind_vars
         )
@@ -200,6 +280,7 @@ def _purge_states_and_attributes_ids(
             has_remaining_state_ids_to_purge = False
             break
         _purge_state_ids(instance, session, state_ids)
+        progress.rows_purged += len(state_ids)
         attributes_ids_batch = attributes_ids_batch | attributes_ids
 
     _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
@@ -215,6 +296,8 @@ def _purge_events_and_data_ids(
     session: Session,
     events_batch_size: int,
     purge_before: datetime,
+    deadline: float,
+    progress: PurgeProgress,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -227,7 +310,10 @@ def _purge_events_and_data_ids(
     # max_bind_vars
     data_ids_batch: set[int] = set()
     max_bind_vars = instance.max_bind_vars
-    for _ in range(events_batch_size):
+    for batch in range(events_batch_size):
+        if batch and time.monotonic() > deadline:
+            _LOGGER.debug("Purge time budget spent after %s events batches", batch)
+            break
         event_ids, data_ids = _select_event_data_ids_to_purge(
             session, purge_before, max_bind_vars
         )
@@ -235,6 +321,7 @@ def _purge_events_and_data_ids(
             has_remaining_event_ids_to_purge = False
             break
         _purge_event_ids(session, event_ids)
+        progress.rows_purged += len(event_ids)
         data_ids_batch = data_ids_batch | data_ids
 
     _purge_unused_data_ids(instance, session, data_ids_batch)
@@ -640,7 +727,7 @@ def _purge_filtered_data(instance: Recorder, session: Session) -> bool:
     # Check if excluded entity_ids are in database
     entity_filter = instance.entity_filter
     has_more_states_to_purge = False
-    excluded_metadata_ids: list[str] = [
+    excluded_metadata_ids: list[int] = [
         metadata_id
         for (metadata_id, entity_id) in session.query(
             StatesMeta.metadata_id, StatesMeta.entity_id
@@ -676,7 +763,7 @@ def _purge_filtered_data(instance: Recorder, session: Session) -> bool:
 def _purge_filtered_states(
     instance: Recorder,
     session: Session,
-    metadata_ids_to_purge: list[str],
+    metadata_ids_to_purge: list[int],
     database_engine: DatabaseEngine,
     purge_before_timestamp: float,
 ) -> bool:
@@ -768,34 +855,52 @@ def purge_entity_data(
     instance: Recorder,
     entity_filter: Callable[[str], bool] | None,
     purge_before: datetime,
+    entity_ids: Iterable[str] | None = None,
 ) -> bool:
-    """Purge states and events of specified entities."""
+    """Purge states and events of specified entities.
+
+    When the entity_ids are known they are resolved to metadata_ids
+    directly instead of matching the filter against every entity_id
+    in the database.
+    """
     database_engine = instance.database_engine
     assert database_engine is not None
     purge_before_timestamp = purge_before.timestamp()
+    deadline = time.monotonic() + PURGE_TIME_BUDGET
     with session_scope(session=instance.get_session()) as session:
-        selected_metadata_ids: list[str] = [
-            metadata_id
-            for (metadata_id, entity_id) in session.query(
-                StatesMeta.metadata_id, StatesMeta.entity_id
-            ).all()
-            if entity_filter and entity_filter(entity_id)
-        ]
+        selected_metadata_ids: list[int]
+        if entity_ids is not None:
+            selected_metadata_ids = [
+                metadata_id
+                for metadata_id in instance.states_meta_manager.get_many(
+                    entity_ids, session, False
+                ).values()
+                if metadata_id is not None
+            ]
+        else:
+            selected_metadata_ids = [
+                metadata_id
+                for (metadata_id, entity_id) in session.query(
+                    StatesMeta.metadata_id, StatesMeta.entity_id
+                ).all()
+                if entity_filter and entity_filter(entity_id)
+            ]
         _LOGGER.debug("Purging entity data for %s", selected_metadata_ids)
         if not selected_metadata_ids:
             return True
 
-        # Purge a max of max_bind_vars, based on the oldest states
-        # or events record.
-        if not _purge_filtered_states(
+        # Purge a max of max_bind_vars per batch, based on the oldest
+        # states or events record, until the time budget is spent.
+        while not _purge_filtered_states(
             instance,
             session,
             selected_metadata_ids,
             database_engine,
             purge_before_timestamp,
         ):
-            _LOGGER.debug("Purging entity data hasn't fully completed yet")
-            return False
+            if time.monotonic() > deadline:
+                _LOGGER.debug("Purging entity data hasn't fully completed yet")
+                return False
 
         _purge_old_entity_ids(instance, session)
 
@@ -659,6 +659,36 @@ def find_statistics_runs_to_purge(
     )
 
 
+def find_oldest_state_id() -> StatementLambdaElement:
+    """Find the oldest state_id."""
+    return lambda_stmt(lambda: select(func.min(States.state_id)))
+
+
+def find_newest_state_id_to_purge(purge_before: float) -> StatementLambdaElement:
+    """Find the newest state_id to purge using the last_updated_ts index."""
+    return lambda_stmt(
+        lambda: select(States.state_id)
+        .filter(States.last_updated_ts < purge_before)
+        .order_by(States.last_updated_ts.desc())
+        .limit(1)
+    )
+
+
+def find_oldest_event_id() -> StatementLambdaElement:
+    """Find the oldest event_id."""
+    return lambda_stmt(lambda: select(func.min(Events.event_id)))
+
+
+def find_newest_event_id_to_purge(purge_before: float) -> StatementLambdaElement:
+    """Find the newest event_id to purge using the time_fired_ts index."""
+    return lambda_stmt(
+        lambda: select(Events.event_id)
+        .filter(Events.time_fired_ts < purge_before)
+        .order_by(Events.time_fired_ts.desc())
+        .limit(1)
+    )
+
+
 def find_latest_statistics_runs_run_id() -> StatementLambdaElement:
     """Find the latest statistics_runs run_id."""
     return lambda_stmt(lambda: select(func.max(StatisticsRuns.run_id)))
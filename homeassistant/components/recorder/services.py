@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
-from typing import cast
+from datetime import datetime, timedelta
+from typing import Literal, cast
 
 import voluptuous as vol
 
 from homeassistant.const import ATTR_ENTITY_ID
-from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entityfilter import generate_filter
 from homeassistant.helpers.service import (
@@ -19,12 +25,14 @@ import homeassistant.util.dt as dt_util
 
 from .const import ATTR_APPLY_FILTER, ATTR_KEEP_DAYS, ATTR_REPACK, DOMAIN
 from .core import Recorder
+from .statistics import export_statistics_columns
 from .tasks import PurgeEntitiesTask, PurgeTask
 
 SERVICE_PURGE = "purge"
 SERVICE_PURGE_ENTITIES = "purge_entities"
 SERVICE_ENABLE = "enable"
 SERVICE_DISABLE = "disable"
+SERVICE_EXPORT_STATISTICS = "export_statistics"
 
 SERVICE_PURGE_SCHEMA = vol.Schema(
     {
@@ -60,6 +68,29 @@ SERVICE_PURGE_ENTITIES_SCHEMA = vol.All(
     ),
 )
 
+ATTR_STATISTIC_IDS = "statistic_ids"
+ATTR_START_TIME = "start_time"
+ATTR_END_TIME = "end_time"
+ATTR_PERIOD = "period"
+ATTR_TYPES = "types"
+
+SERVICE_EXPORT_STATISTICS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_STATISTIC_IDS): vol.All(
+            cv.ensure_list, [cv.string], vol.Length(min=1)
+        ),
+        vol.Required(ATTR_START_TIME): cv.datetime,
+        vol.Optional(ATTR_END_TIME): cv.datetime,
+        vol.Optional(ATTR_PERIOD, default="hour"): vol.In(["5minute", "hour"]),
+        vol.Optional(
+            ATTR_TYPES, default=["last_reset", "max", "mean", "min", "state", "sum"]
+        ): vol.All(
+            cv.ensure_list,
+            [vol.In(["last_reset", "max", "mean", "min", "state", "sum"])],
+        ),
+    }
+)
+
 SERVICE_ENABLE_SCHEMA = vol.Schema({})
 SERVICE_DISABLE_SCHEMA = vol.Schema({})
 
@@ -96,7 +127,15 @@ def _async_register_purge_entities_service(
         entity_globs = service.data.get(ATTR_ENTITY_GLOBS, [])
         entity_filter = generate_filter(domains, list(entity_ids), [], [], entity_globs)
         purge_before = dt_util.utcnow() - timedelta(days=keep_days)
-        instance.queue_task(PurgeEntitiesTask(entity_filter, purge_before))
+        instance.queue_task(
+            PurgeEntitiesTask(
+                entity_filter,
+                purge_before,
+                # Only entity_ids were selected so they can be looked up
+                # directly instead of filtering every entity_id
+                None if domains or entity_globs else frozenset(entity_ids),
+            )
+        )
 
     async_register_admin_service(
         hass,
@@ -107,6 +146,57 @@ def _async_register_purge_entities_service(
     )
 
 
+def _export_statistics(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    statistic_ids: set[str],
+    period: Literal["5minute", "hour"],
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, dict[str, list[float | None]]]:
+    """Export statistics as one set of columns per statistic_id."""
+    result: dict[str, dict[str, list[float | None]]] = {}
+    for statistic_id, columns in export_statistics_columns(
+        hass, start_time, end_time, statistic_ids, period, types
+    ):
+        if (statistic_columns := result.get(statistic_id)) is None:
+            result[statistic_id] = columns
+            continue
+        for key, column in columns.items():
+            statistic_columns[key].extend(column)
+    return result
+
+
+@callback
+def _async_register_export_statistics_service(
+    hass: HomeAssistant, instance: Recorder
+) -> None:
+    async def async_handle_export_statistics_service(
+        service: ServiceCall,
+    ) -> ServiceResponse:
+        """Handle calls to the export statistics service."""
+        end_time = service.data.get(ATTR_END_TIME)
+        statistics = await instance.async_add_read_executor_job(
+            _export_statistics,
+            hass,
+            dt_util.as_utc(service.data[ATTR_START_TIME]),
+            end_time and dt_util.as_utc(end_time),
+            set(service.data[ATTR_STATISTIC_IDS]),
+            service.data[ATTR_PERIOD],
+            set(service.data[ATTR_TYPES]),
+        )
+        return {"statistics": statistics}  # type: ignore[dict-item]
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_EXPORT_STATISTICS,
+        async_handle_export_statistics_service,
+        schema=SERVICE_EXPORT_STATISTICS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+
 @callback
 def _async_register_enable_service(hass: HomeAssistant, instance: Recorder) -> None:
     async def async_handle_enable_service(service: ServiceCall) -> None:
@@ -142,3 +232,4 @@ def async_register_services(hass: HomeAssistant, instance: Recorder) -> None:
     _async_register_purge_entities_service(hass, instance)
     _async_register_enable_service(hass, instance)
     _async_register_disable_service(hass, instance)
+    _async_register_export_statistics_service(hass, instance)
@@ -3,20 +3,34 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Callable, Iterable, Sequence
+from collections.abc import Callable, Collection, Generator, Iterable, Mapping, Sequence
 import dataclasses
 from datetime import datetime, timedelta
 from functools import lru_cache, partial
-from itertools import chain, groupby
+from itertools import chain, groupby, repeat
 import logging
-from operator import itemgetter
+from operator import attrgetter, itemgetter
 import re
+import time
 from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
 
-from sqlalchemy import Select, and_, bindparam, func, lambda_stmt, select, text
+from sqlalchemy import (
+    Select,
+    and_,
+    bindparam,
+    delete,
+    func,
+    insert,
+    lambda_stmt,
+    literal,
+    select,
+    text,
+    update,
+)
 from sqlalchemy.engine.row import Row
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.elements import ColumnElement
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 import voluptuous as vol
 
@@ -59,6 +73,8 @@ from .db_schema import (
     STATISTICS_TABLES,
     Statistics,
     StatisticsBase,
+    StatisticsDaily,
+    StatisticsMonthly,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -82,6 +98,10 @@ from .util import (
 if TYPE_CHECKING:
     from . import Recorder
 
+# The number of rows fetched from the database at a time
+# when exporting statistics
+STATISTICS_EXPORT_CHUNK_SIZE = 10000
+
 QUERY_STATISTICS = (
     Statistics.metadata_id,
     Statistics.start_ts,
@@ -445,6 +465,206 @@ def _compile_hourly_statistics(session: Session, start: datetime) -> None:
     )
 
 
+def _update_statistics_rollup(
+    session: Session,
+    table: type[StatisticsDaily | StatisticsMonthly],
+    start_ts: float,
+    end_ts: float,
+    metadata_ids: Collection[int] | None,
+) -> None:
+    """Recompute the rollups of one day or month.
+
+    Daily rollups are computed from the hourly statistics and monthly rollups
+    from the daily rollups. The daily means are weighted by the number of
+    hourly means they were computed from so the monthly mean is the mean of
+    the hourly means, just like when reducing the hourly statistics.
+    """
+    source: type[Statistics | StatisticsDaily]
+    mean: ColumnElement[float | None]
+    mean_weight: ColumnElement[Any]
+    if table is StatisticsDaily:
+        source = Statistics
+        mean = func.avg(source.mean)
+        mean_weight = func.count(source.mean)
+    else:
+        source = StatisticsDaily
+        mean = func.sum(source.mean * source.mean_weight) / func.nullif(
+            func.sum(source.mean_weight), 0
+        )
+        mean_weight = func.sum(source.mean_weight)
+    summary = (
+        select(
+            source.metadata_id,
+            mean.label("mean"),
+            mean_weight.label("mean_weight"),
+            func.min(source.min).label("min"),
+            func.max(source.max).label("max"),
+            func.max(source.start_ts).label("last_start_ts"),
+        )
+        .where(source.start_ts >= start_ts)
+        .where(source.start_ts < end_ts)
+        .group_by(source.metadata_id)
+    )
+    delete_stmt = delete(table).where(table.start_ts == start_ts)
+    if metadata_ids is not None:
+        summary = summary.where(source.metadata_id.in_(metadata_ids))
+        delete_stmt = delete_stmt.where(table.metadata_id.in_(metadata_ids))
+    subquery = summary.subquery()
+    # last_reset, state and sum are taken from the last row of the period
+    rollup = (
+        select(
+            literal(time.time()),
+            subquery.c.metadata_id,
+            literal(start_ts),
+            subquery.c.mean,
+            subquery.c.mean_weight,
+            subquery.c.min,
+            subquery.c.max,
+            source.last_reset_ts,
+            source.state,
+            source.sum,
+        )
+        .select_from(subquery)
+        .join(
+            source,
+            (source.metadata_id == subquery.c.metadata_id)
+            & (source.start_ts == subquery.c.last_start_ts),
+        )
+    )
+    session.execute(delete_stmt)
+    session.execute(
+        insert(table).from_select(
+            [
+                "created_ts",
+                "metadata_id",
+                "start_ts",
+                "mean",
+                "mean_weight",
+                "min",
+                "max",
+                "last_reset_ts",
+                "state",
+                "sum",
+            ],
+            rollup,
+        )
+    )
+
+
+def _update_statistics_rollups(
+    session: Session,
+    start_ts: float,
+    end_ts: float,
+    metadata_ids: Collection[int] | None,
+) -> None:
+    """Recompute the daily and monthly rollups overlapping start_ts - end_ts."""
+    _, day_start_end = reduce_day_ts_factory()
+    _, month_start_end = reduce_month_ts_factory()
+    day_start_ts, day_end_ts = day_start_end(start_ts)
+    while day_start_ts < end_ts:
+        _update_statistics_rollup(
+            session, StatisticsDaily, day_start_ts, day_end_ts, metadata_ids
+        )
+        day_start_ts, day_end_ts = day_start_end(day_end_ts)
+    month_start_ts, month_end_ts = month_start_end(start_ts)
+    while month_start_ts < end_ts:
+        _update_statistics_rollup(
+            session, StatisticsMonthly, month_start_ts, month_end_ts, metadata_ids
+        )
+        month_start_ts, month_end_ts = month_start_end(month_end_ts)
+
+
+def _newest_statistics_rollup_month_end_ts(session: Session) -> float | None:
+    """Return the end of the newest month which has rollups."""
+    if (
+        newest_ts := session.execute(select(func.max(StatisticsMonthly.start_ts)))
+        .scalars()
+        .one()
+    ) is None:
+        return None
+    _, month_start_end = reduce_month_ts_factory()
+    return month_start_end(newest_ts)[1]
+
+
+def update_statistics_rollups(
+    instance: Recorder,
+    start_ts: float,
+    end_ts: float,
+    statistic_id: str | None = None,
+) -> None:
+    """Update the rollups after the hourly statistics in start_ts - end_ts changed.
+
+    This is called after the hourly statistics have been committed so a
+    failure to write them, like a duplicated row, can't leave the rollups
+    out of sync.
+
+    Until the rollups migration is done only the months it has already
+    computed are updated, the migration computes the remaining months.
+    """
+    with session_scope(session=instance.get_session()) as session:
+        metadata_ids: tuple[int, ...] | None = None
+        if statistic_id is not None:
+            if not (
+                metadata := instance.statistics_meta_manager.get(session, statistic_id)
+            ):
+                return
+            metadata_ids = (metadata[0],)
+        if not instance.statistics_rollups_active:
+            if (
+                backfilled_end_ts := _newest_statistics_rollup_month_end_ts(session)
+            ) is None:
+                return
+            end_ts = min(end_ts, backfilled_end_ts)
+            if start_ts >= end_ts:
+                return
+        _update_statistics_rollups(session, start_ts, end_ts, metadata_ids)
+
+
+def backfill_statistics_rollups(session: Session) -> bool:
+    """Compute the rollups for the oldest month which does not have them yet.
+
+    Returns False if there are more months to compute.
+    Returns True if the rollups have been computed for all months.
+    """
+    stmt = select(func.min(Statistics.start_ts))
+    if (
+        backfilled_end_ts := _newest_statistics_rollup_month_end_ts(session)
+    ) is not None:
+        stmt = stmt.where(Statistics.start_ts >= backfilled_end_ts)
+    if (start_ts := session.execute(stmt).scalars().one()) is None:
+        return True
+    _, month_start_end = reduce_month_ts_factory()
+    month_start_ts, month_end_ts = month_start_end(start_ts)
+    _LOGGER.debug(
+        "Computing statistics rollups for %s",
+        dt_util.utc_from_timestamp(month_start_ts),
+    )
+    _update_statistics_rollups(session, month_start_ts, month_end_ts, None)
+    return False
+
+
+def statistics_rollups_match_time_zone(session: Session) -> bool:
+    """Return if the rollups were computed for the days of the current time zone.
+
+    The oldest rollup is checked since rollups of the current day may
+    already have been updated for the new time zone.
+    """
+    if (
+        oldest_ts := session.execute(select(func.min(StatisticsDaily.start_ts)))
+        .scalars()
+        .one()
+    ) is None:
+        return True
+    _, day_start_end = reduce_day_ts_factory()
+    return day_start_end(oldest_ts)[0] == oldest_ts
+
+
+def clear_statistics_rollups(session: Session) -> None:
+    """Delete all rollups so they can be computed again."""
+    session.execute(delete(StatisticsDaily))
+    session.execute(delete(StatisticsMonthly))
+
+
 @retryable_database_job("compile missing statistics")
 def compile_missing_statistics(instance: Recorder) -> bool:
     """Compile missing statistics."""
@@ -468,6 +688,7 @@ def compile_missing_statistics(instance: Recorder) -> bool:
             start = max(
                 start, process_timestamp(last_run) + StatisticsShortTerm.duration
             )
+        first_start = start
 
         periods_without_commit = 0
         while start < last_period:
@@ -483,6 +704,11 @@ def compile_missing_statistics(instance: Recorder) -> bool:
                 periods_without_commit = 0
             start = end
 
+    if first_start < last_period:
+        update_statistics_rollups(
+            instance, first_start.timestamp(), last_period.timestamp()
+        )
+
     return True
 
 
@@ -509,6 +735,15 @@ def compile_statistics(instance: Recorder, start: datetime, fire_events: bool) -
             instance, session, start, fire_events
         )
 
+    if start.minute == 55:
+        # A full hour was summarized, update the rollups of its day and month
+        hour_start = start.replace(minute=0)
+        update_statistics_rollups(
+            instance,
+            hour_start.timestamp(),
+            (hour_start + Statistics.duration).timestamp(),
+        )
+
     if modified_statistic_ids:
         # In the rare case that we have modified statistic_ids, we reload the modified
         # statistics meta data into the cache in a fresh session to ensure that the
@@ -1757,6 +1992,65 @@ def _statistics_during_period_with_session(
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
     )
+    result: dict[str, list[StatisticsRow]] | None = None
+    if (
+        period in ("day", "week", "month")
+        and get_instance(hass).statistics_rollups_active
+    ):
+        result = _statistics_rollups_during_period(
+            hass,
+            session,
+            start_time,
+            end_time,
+            statistic_ids,
+            metadata_ids,
+            metadata,
+            period,
+            units,
+            types,
+        )
+
+    if result is None:
+        result = _reduce_statistics_during_period(
+            hass,
+            session,
+            start_time,
+            end_time,
+            statistic_ids,
+            metadata_ids,
+            metadata,
+            period,
+            table,
+            units,
+            types,
+        )
+
+    if not result:
+        return {}
+
+    if "change" in _types:
+        _augment_result_with_change(
+            hass, session, start_time, units, _types, table, metadata, result
+        )
+
+    # Return statistics combined with metadata
+    return result
+
+
+def _reduce_statistics_during_period(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    statistic_ids: set[str] | None,
+    metadata_ids: list[int] | None,
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+    period: Literal["5minute", "day", "hour", "week", "month"],
+    table: type[Statistics | StatisticsShortTerm],
+    units: dict[str, str] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]]:
+    """Return statistics reduced from the rows of table."""
     stmt = _generate_statistics_during_period_stmt(
         start_time, end_time, metadata_ids, table, types
     )
@@ -1779,20 +2073,201 @@ def _statistics_during_period_with_session(
     )
 
     if period == "day":
-        result = _reduce_statistics_per_day(result, types)
+        return _reduce_statistics_per_day(result, types)
 
     if period == "week":
-        result = _reduce_statistics_per_week(result, types)
+        return _reduce_statistics_per_week(result, types)
 
     if period == "month":
-        result = _reduce_statistics_per_month(result, types)
+        return _reduce_statistics_per_month(result, types)
 
-    if "change" in _types:
-        _augment_result_with_change(
-            hass, session, start_time, units, _types, table, metadata, result
+    return result
+
+
+def _statistics_rollups_during_period(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    statistic_ids: set[str] | None,
+    metadata_ids: list[int] | None,
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+    period: Literal["5minute", "day", "hour", "week", "month"],
+    units: dict[str, str] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]] | None:
+    """Return day, week or month statistics from the rollups.
+
+    The rollups are only used for the periods the request covers
+    completely, the hourly statistics of the partial periods at each
+    end are reduced like before.
+
+    Returns None if the rollups were computed for another time zone, the
+    caller then reduces the hourly statistics instead.
+    """
+    table: type[StatisticsDaily | StatisticsMonthly]
+    if period == "month":
+        table = StatisticsMonthly
+        _, rollup_start_end = reduce_month_ts_factory()
+    else:
+        table = StatisticsDaily
+        _, rollup_start_end = reduce_day_ts_factory()
+    if period == "week":
+        _, period_start_end = reduce_week_ts_factory()
+    else:
+        period_start_end = rollup_start_end
+
+    start_ts = start_time.timestamp()
+    if (rollups_start_ts := period_start_end(start_ts)[0]) != start_ts:
+        rollups_start_ts = period_start_end(start_ts)[1]
+    rollups_end_ts: float | None = None
+    if end_time is not None:
+        rollups_end_ts = period_start_end(end_time.timestamp())[0]
+    if rollups_end_ts is not None and rollups_start_ts >= rollups_end_ts:
+        # No period is covered completely
+        return None
+
+    rollups_start = dt_util.utc_from_timestamp(rollups_start_ts)
+    rollups_end = (
+        None if rollups_end_ts is None else dt_util.utc_from_timestamp(rollups_end_ts)
+    )
+    stmt = _generate_statistics_during_period_stmt(
+        rollups_start, rollups_end, metadata_ids, table, types
+    )
+    if with_weights := period == "week" and "mean" in types:
+        stmt += lambda q: q.add_columns(StatisticsDaily.mean_weight)
+    stats = cast(
+        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+    )
+
+    if any(
+        rollup_start_end(row_start_ts)[0] != row_start_ts
+        for row_start_ts in {row.start_ts for row in stats}
+    ):
+        _LOGGER.debug("Statistics rollups do not match the time zone, ignoring them")
+        return None
+
+    weights: dict[str, list[int | None]] | None = None
+    if with_weights:
+        statistic_id_by_metadata_id = {
+            metadata_id: statistic_id
+            for statistic_id, (metadata_id, _) in metadata.items()
+        }
+        weights = {
+            statistic_id_by_metadata_id[metadata_id]: [row.mean_weight for row in rows]
+            for metadata_id, rows in groupby(stats, attrgetter("metadata_id"))
+        }
+    rollups = _reduce_statistics_rollups(
+        _sorted_statistics_to_dict(
+            hass, stats, statistic_ids, metadata, True, table, units, types
         )
+        if stats
+        else {},
+        weights,
+        period_start_end,
+        types,
+    )
 
-    # Return statistics combined with metadata
+    # The partial periods before and after the rollups
+    parts: list[dict[str, list[StatisticsRow]]] = []
+    if start_ts < rollups_start_ts:
+        parts.append(
+            _reduce_statistics_during_period(
+                hass,
+                session,
+                start_time,
+                rollups_start,
+                statistic_ids,
+                metadata_ids,
+                metadata,
+                period,
+                Statistics,
+                units,
+                types,
+            )
+        )
+    parts.append(rollups)
+    if rollups_end is not None and end_time is not None and rollups_end < end_time:
+        parts.append(
+            _reduce_statistics_during_period(
+                hass,
+                session,
+                rollups_end,
+                end_time,
+                statistic_ids,
+                metadata_ids,
+                metadata,
+                period,
+                Statistics,
+                units,
+                types,
+            )
+        )
+    result: dict[str, list[StatisticsRow]] = {}
+    for part in parts:
+        for statistic_id, rows in part.items():
+            result.setdefault(statistic_id, []).extend(rows)
+    return result
+
+
+def _reduce_statistics_rollups(
+    stats: dict[str, list[StatisticsRow]],
+    weights: dict[str, list[int | None]] | None,
+    period_start_end: Callable[[float], tuple[float, float]],
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]]:
+    """Reduce daily or monthly rollups to statistics of the period.
+
+    The rollups are grouped by the period they start in instead of ending
+    a period at the start of the next rollup, so a period which is longer
+    than usual because of a DST change is not cut short.
+
+    If weights are given the means are weighted by the number of hourly
+    means each rollup was computed from, to get the mean of the hourly
+    means of the period.
+    """
+    result: dict[str, list[StatisticsRow]] = {}
+    for statistic_id, stat_list in stats.items():
+        stat_weights: Iterable[int | None] = (
+            weights[statistic_id] if weights is not None else repeat(1)
+        )
+        rows = result[statistic_id] = []
+        for (start, end), group in groupby(
+            zip(stat_list, stat_weights, strict=False),
+            key=lambda item: period_start_end(item[0]["start"]),
+        ):
+            period_stats = list(group)
+            last_stat = period_stats[-1][0]
+            row: StatisticsRow = {"start": start, "end": end}
+            if "mean" in types:
+                weighted_sum = 0.0
+                total_weight = 0
+                for stat, weight in period_stats:
+                    if (_mean := stat.get("mean")) is not None and weight:
+                        weighted_sum += _mean * weight
+                        total_weight += weight
+                row["mean"] = weighted_sum / total_weight if total_weight else None
+            if "min" in types:
+                mins = [
+                    _min
+                    for stat, _ in period_stats
+                    if (_min := stat.get("min")) is not None
+                ]
+                row["min"] = min(mins) if mins else None
+            if "max" in types:
+                maxes = [
+                    _max
+                    for stat, _ in period_stats
+                    if (_max := stat.get("max")) is not None
+                ]
+                row["max"] = max(maxes) if maxes else None
+            if "last_reset" in types:
+                row["last_reset"] = last_stat.get("last_reset")
+            if "state" in types:
+                row["state"] = last_stat.get("state")
+            if "sum" in types:
+                row["sum"] = last_stat["sum"]
+            rows.append(row)
     return result
 
 
@@ -1823,6 +2298,56 @@ def statistics_during_period(
         )
 
 
+def export_statistics_columns(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    statistic_ids: set[str],
+    period: Literal["5minute", "hour"],
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> Generator[tuple[str, dict[str, list[float | None]]]]:
+    """Yield statistic data points during UTC period start_time - end_time as columns.
+
+    The rows are streamed from the database STATISTICS_EXPORT_CHUNK_SIZE rows
+    at a time and each chunk is yielded as the start timestamps and the values
+    of the requested types of each statistic_id in it, so the memory used does
+    not depend on the length of the period. The rows are not converted to
+    dicts, reduced, or converted to another unit.
+    """
+    types = set(types)
+    with session_scope(hass=hass, read_only=True) as session:
+        metadata = get_instance(hass).statistics_meta_manager.get_many(
+            session, statistic_ids=statistic_ids
+        )
+        if not metadata:
+            return
+        metadata_ids = _extract_metadata_and_discard_impossible_columns(metadata, types)
+        metadata_id_to_statistic_id = {
+            metadata_id: statistic_id
+            for statistic_id, (metadata_id, _) in metadata.items()
+        }
+        table: type[Statistics | StatisticsShortTerm] = (
+            Statistics if period == "hour" else StatisticsShortTerm
+        )
+        stmt = _generate_statistics_during_period_stmt(
+            start_time, end_time, metadata_ids, table, types
+        )
+        column_names = [
+            "start",
+            *(stat_type for stat_type in _type_column_mapping if stat_type in types),
+        ]
+        result = session.execute(
+            stmt, execution_options={"yield_per": STATISTICS_EXPORT_CHUNK_SIZE}
+        )
+        for rows in result.partitions():
+            for metadata_id, group in groupby(rows, itemgetter(0)):
+                _, *columns = zip(*group, strict=True)
+                yield (
+                    metadata_id_to_statistic_id[metadata_id],
+                    dict(zip(column_names, map(list, columns), strict=True)),
+                )
+
+
 def _get_last_statistics_stmt(
     metadata_id: int,
     number_of_stats: int,
@@ -2447,9 +2972,139 @@ def import_statistics(
             instance, "statistic"
         ),
     ) as session:
-        return _import_statistics_with_session(
-            instance, session, metadata, statistics, table
+        _import_statistics_with_session(instance, session, metadata, statistics, table)
+
+    if table == Statistics and (
+        starts := [stat["start"].timestamp() for stat in statistics]
+    ):
+        update_statistics_rollups(
+            instance,
+            min(starts),
+            max(starts) + table.duration.total_seconds(),
+            metadata["statistic_id"],
+        )
+
+    return True
+
+
+@callback
+def async_import_statistics_columns(
+    hass: HomeAssistant,
+    metadata: StatisticMetaData,
+    columns: Mapping[str, Sequence[float | None]],
+) -> None:
+    """Import hourly statistics given as columns of timestamps and values.
+
+    The statistics are internal statistics if the statistic_id is an entity_id
+    and external statistics otherwise. The columns are keyed by "start" and the
+    statistic types, with the start and last_reset as UTC timestamps.
+
+    This inserts an import_statistics_columns job in the recorder's queue.
+    """
+    statistic_id = metadata["statistic_id"]
+    if valid_entity_id(statistic_id):
+        source = DOMAIN
+    elif valid_statistic_id(statistic_id):
+        source = split_statistic_id(statistic_id)[0]
+    else:
+        raise HomeAssistantError("Invalid statistic_id")
+
+    if metadata["source"] != source:
+        raise HomeAssistantError("Invalid source")
+
+    starts = columns["start"]
+    for key, column in columns.items():
+        if key != "start" and key not in _type_column_mapping:
+            raise HomeAssistantError(f"Invalid column {key}")
+        if len(column) != len(starts):
+            raise HomeAssistantError("All columns must have the same length")
+    if any(start is None or start % 3600 for start in starts):
+        raise HomeAssistantError(
+            "Invalid timestamp: timestamps must be from the top of the hour (minutes and seconds = 0)"
+        )
+
+    get_instance(hass).async_import_statistics_columns(metadata, columns, Statistics)
+
+
+@retryable_database_job("statistics")
+def import_statistics_columns(
+    instance: Recorder,
+    metadata: StatisticMetaData,
+    columns: Mapping[str, Sequence[float | None]],
+    table: type[StatisticsBase],
+) -> bool:
+    """Process an import_statistics_columns job.
+
+    The existing rows are found with a single query for the imported period
+    and the rows are written with one multi-row insert and one multi-row
+    update instead of looking up and writing each row on its own.
+    """
+    with session_scope(
+        session=instance.get_session(),
+        exception_filter=filter_unique_constraint_integrity_error(
+            instance, "statistic"
+        ),
+    ) as session:
+        statistics_meta_manager = instance.statistics_meta_manager
+        old_metadata_dict = statistics_meta_manager.get_many(
+            session, statistic_ids={metadata["statistic_id"]}
         )
+        _, metadata_id = statistics_meta_manager.update_or_add(
+            session, metadata, old_metadata_dict
+        )
+        # The start column was validated to not have missing values
+        if not (starts := cast(Sequence[float], columns["start"])):
+            return True
+
+        existing_ids: dict[float | None, int] = dict(
+            session.execute(
+                select(table.start_ts, table.id).filter(
+                    (table.metadata_id == metadata_id)
+                    & (table.start_ts >= min(starts))
+                    & (table.start_ts <= max(starts))
+                )
+            )
+            .tuples()
+            .all()
+        )
+        value_columns = list(_type_column_mapping.values())
+        values = [
+            columns.get(stat_type) or [None] * len(starts)
+            for stat_type in _type_column_mapping
+        ]
+        created_ts = time.time()
+        inserts: list[dict[str, Any]] = []
+        updates: list[dict[str, Any]] = []
+        for start_ts, *row_values in zip(starts, *values, strict=True):
+            row = dict(zip(value_columns, row_values, strict=True))
+            if (stat_id := existing_ids.get(start_ts)) is not None:
+                row["id"] = stat_id
+                updates.append(row)
+            else:
+                row["metadata_id"] = metadata_id
+                row["created_ts"] = created_ts
+                row["start_ts"] = start_ts
+                inserts.append(row)
+        if inserts:
+            session.execute(insert(table), inserts)
+        if updates:
+            session.execute(update(table), updates)
+
+        if table == StatisticsShortTerm:
+            run_cache = get_short_term_statistics_run_cache(instance.hass)
+            cache_latest_short_term_statistic_id_for_metadata_id(
+                run_cache, session, metadata_id
+            )
+
+    if table == Statistics:
+        update_statistics_rollups(
+            instance,
+            min(starts),
+            max(starts) + table.duration.total_seconds(),
+            metadata["statistic_id"],
+        )
+
+    return True
 
 
 @retryable_database_job("adjust_statistics")
@@ -2491,6 +3146,31 @@ def adjust_statistics(
             sum_adjustment,
         )
 
+        # The sums of the rollups after the day and month the adjustment
+        # starts in are adjusted, the rollups of the day and month are
+        # computed again once the adjusted statistics are committed
+        hour_start_ts = start_time.replace(minute=0).timestamp()
+        _, day_start_end = reduce_day_ts_factory()
+        _, month_start_end = reduce_month_ts_factory()
+        for table, end_ts in (
+            (StatisticsDaily, day_start_end(hour_start_ts)[1]),
+            (StatisticsMonthly, month_start_end(hour_start_ts)[1]),
+        ):
+            _adjust_sum_statistics(
+                session,
+                table,
+                metadata[statistic_id][0],
+                dt_util.utc_from_timestamp(end_ts),
+                sum_adjustment,
+            )
+
+    update_statistics_rollups(
+        instance,
+        hour_start_ts,
+        hour_start_ts + Statistics.duration.total_seconds(),
+        statistic_id,
+    )
+
     return True
 
 
@@ -2551,6 +3231,8 @@ def change_statistics_unit(
         tables: tuple[type[StatisticsBase], ...] = (
             Statistics,
             StatisticsShortTerm,
+            StatisticsDaily,
+            StatisticsMonthly,
         )
         for table in tables:
             _change_statistics_unit_for_table(session, table, metadata_id, convert)
@@ -55,6 +55,30 @@ def _async_get_db_engine_info(instance: Recorder) -> dict[str, Any]:
     return db_engine_info
 
 
+@callback
+def _async_get_purge_info(instance: Recorder) -> dict[str, Any]:
+    """Get the progress of a running purge."""
+    if (purge_progress := instance.purge_progress) is None:
+        return {}
+    purge_info = f"{purge_progress.rows_remaining} rows left"
+    if (eta := purge_progress.eta) is not None:
+        purge_info += f", about {eta/60:.0f} minutes remaining"
+    return {"purge_progress": purge_info}
+
+
+@callback
+def _async_get_attributes_cache_info(instance: Recorder) -> dict[str, Any]:
+    """Get the memory use and hit rate of the state attributes cache."""
+    manager = instance.state_attributes_manager
+    if (hit_rate := manager.stats.hit_rate) is None:
+        return {}
+    return {
+        "attributes_cache": (
+            f"{manager.cached_bytes/1024/1024:.2f} MiB, {hit_rate:.1%} hit rate"
+        )
+    }
+
+
 async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
     """Get info for the info page."""
     instance = get_instance(hass)
@@ -72,4 +96,10 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
             "oldest_recorder_run": recorder_runs_manager.first.start,
             "current_recorder_run": recorder_runs_manager.current.start,
         }
-    return db_runs | db_stats | db_engine_info
+    return (
+        db_runs
+        | db_stats
+        | db_engine_info
+        | _async_get_purge_info(instance)
+        | _async_get_attributes_cache_info(instance)
+    )
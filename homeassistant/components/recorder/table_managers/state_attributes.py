@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 from collections.abc import Collection, Iterable
+from dataclasses import dataclass
 import logging
+import sys
 from typing import TYPE_CHECKING, cast
 
+from lru import LRU
 from sqlalchemy.orm.session import Session
 
 from homeassistant.core import Event, EventStateChangedData
@@ -15,28 +18,133 @@ from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
 from ..db_schema import StateAttributes
 from ..queries import get_shared_attributes
 from ..util import execute_stmt_lambda_element
-from . import BaseLRUTableManager
+from . import BaseTableManager
 
 if TYPE_CHECKING:
     from ..core import Recorder
 
-# The number of attribute ids to cache in memory
+# The memory to use for caching attribute ids
+#
+# The cache is sized by memory instead of the number of attributes
+# since the size of attributes varies a lot (a binary sensor vs a
+# weather forecast).
 #
 # Based on:
 # - The number of overlapping attributes
 # - How frequently states with overlapping attributes will change
 # - How much memory our low end hardware has
-CACHE_SIZE = 2048
+CACHE_SIZE_BYTES = 2 * 1024 * 1024
+
+# The memory to use per cache entry when the cache is sized
+# by the number of entities
+CACHE_BYTES_PER_ENTRY = 1024
+
+# An estimate of the memory used by a cache entry besides the
+# shared attributes string (the LRU node and the attributes id)
+CACHE_ENTRY_OVERHEAD = 100
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
+@dataclass(slots=True)
+class StateAttributesCacheStats:
+    """Statistics of the state attributes cache."""
+
+    hits: int = 0
+    misses: int = 0
+    db_lookups: int = 0
+    db_hits: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float | None:
+        """Return the share of lookups resolved from the cache."""
+        if not (lookups := self.hits + self.misses):
+            return None
+        return self.hits / lookups
+
+
+class StateAttributesManager(BaseTableManager[StateAttributes]):
     """Manage the StateAttributes table."""
 
     def __init__(self, recorder: Recorder) -> None:
-        """Initialize the event type manager."""
-        super().__init__(recorder, CACHE_SIZE)
+        """Initialize the state attributes manager.
+
+        The shared_attrs to attributes_id cache evicts the least recently
+        used attributes when the memory used by the cached attributes
+        exceeds max_bytes.
+        """
+        super().__init__(recorder)
+        self.max_bytes = CACHE_SIZE_BYTES
+        self.cached_bytes = 0
+        self.stats = StateAttributesCacheStats()
+        # Every entry uses at least CACHE_ENTRY_OVERHEAD bytes so the LRU
+        # never evicts by itself, the entries are evicted by memory use
+        self._id_map = LRU(self._max_entries())
+
+    def _max_entries(self) -> int:
+        """Return the maximum number of entries that fit in max_bytes."""
+        return max(1, self.max_bytes // CACHE_ENTRY_OVERHEAD)
+
+    def get_from_cache(self, data: str) -> int | None:
+        """Resolve shared_attrs to the attributes_id without accessing the database.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if (attributes_id := self._id_map.get(data)) is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        return attributes_id
+
+    def adjust_lru_size(self, new_size: int) -> None:
+        """Adjust the cache to hold about new_size attributes.
+
+        The cache is only ever increased and new_size is converted to
+        memory at CACHE_BYTES_PER_ENTRY.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if (max_bytes := new_size * CACHE_BYTES_PER_ENTRY) > self.max_bytes:
+            self.max_bytes = max_bytes
+            self._id_map.set_size(self._max_entries())
+
+    def _cache(self, shared_attrs: str, attributes_id: int) -> None:
+        """Cache the attributes_id and evict attributes if the cache is full.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        id_map = self._id_map
+        if shared_attrs not in id_map:
+            self.cached_bytes += sys.getsizeof(shared_attrs) + CACHE_ENTRY_OVERHEAD
+        id_map[shared_attrs] = attributes_id
+        while self.cached_bytes > self.max_bytes and len(id_map) > 1:
+            evicted_shared_attrs, _ = id_map.popitem()
+            self.cached_bytes -= (
+                sys.getsizeof(evicted_shared_attrs) + CACHE_ENTRY_OVERHEAD
+            )
+            self.stats.evictions += 1
+
+    def _uncache(self, shared_attrs: str) -> None:
+        """Remove the attributes from the cache.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if self._id_map.pop(shared_attrs, None) is not None:
+            self.cached_bytes -= sys.getsizeof(shared_attrs) + CACHE_ENTRY_OVERHEAD
+
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        super().reset()
+        self.cached_bytes = 0
 
     def serialize_from_event(self, event: Event[EventStateChangedData]) -> bytes | None:
         """Serialize event data."""
@@ -105,15 +213,15 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         recorder thread.
         """
         results: dict[str, int | None] = {}
+        self.stats.db_lookups += len(hashes)
         with session.no_autoflush:
             for hashs_chunk in chunked_or_all(hashes, self.recorder.max_bind_vars):
                 for attributes_id, shared_attrs in execute_stmt_lambda_element(
                     session, get_shared_attributes(hashs_chunk), orm_rows=False
                 ):
-                    results[shared_attrs] = self._id_map[shared_attrs] = cast(
-                        int, attributes_id
-                    )
-
+                    results[shared_attrs] = cast(int, attributes_id)
+                    self._cache(shared_attrs, cast(int, attributes_id))
+        self.stats.db_hits += len(results)
         return results
 
     def add_pending(self, db_state_attributes: StateAttributes) -> None:
@@ -133,7 +241,7 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         recorder thread.
         """
         for shared_attrs, db_state_attributes in self._pending.items():
-            self._id_map[shared_attrs] = db_state_attributes.attributes_id
+            self._cache(cast(str, shared_attrs), db_state_attributes.attributes_id)
         self._pending.clear()
 
     def evict_purged(self, attributes_ids: set[int]) -> None:
@@ -151,4 +259,6 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         for purged_attributes_id in attributes_ids.intersection(
             state_attributes_ids_reversed
         ):
-            id_map.pop(state_attributes_ids_reversed[purged_attributes_id], None)
+            self._uncache(
+                cast(str, state_attributes_ids_reversed[purged_attributes_id])
+            )
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import abc
 import asyncio
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Mapping, Sequence
 from dataclasses import dataclass
 from datetime import datetime
 import logging
@@ -111,9 +111,16 @@ class PurgeTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Purge the database."""
-        if purge.purge_old_data(
-            instance, self.purge_before, self.repack, self.apply_filter
-        ):
+        finished = True
+        try:
+            finished = purge.purge_old_data(
+                instance, self.purge_before, self.repack, self.apply_filter
+            )
+        finally:
+            # A purge that finished or failed is no longer in progress
+            if finished:
+                instance.purge_progress = None
+        if finished:
             with instance.get_session() as session:
                 instance.recorder_runs_manager.load_from_db(session)
             # We always need to do the db cleanups after a purge
@@ -133,13 +140,18 @@ class PurgeEntitiesTask(RecorderTask):
 
     entity_filter: Callable[[str], bool]
     purge_before: datetime
+    entity_ids: frozenset[str] | None = None
 
     def run(self, instance: Recorder) -> None:
         """Purge entities from the database."""
-        if purge.purge_entity_data(instance, self.entity_filter, self.purge_before):
+        if purge.purge_entity_data(
+            instance, self.entity_filter, self.purge_before, self.entity_ids
+        ):
             return
         # Schedule a new purge task if this one didn't finish
-        instance.queue_task(PurgeEntitiesTask(self.entity_filter, self.purge_before))
+        instance.queue_task(
+            PurgeEntitiesTask(self.entity_filter, self.purge_before, self.entity_ids)
+        )
 
 
 @dataclass(slots=True)
@@ -201,6 +213,26 @@ class ImportStatisticsTask(RecorderTask):
         )
 
 
+@dataclass(slots=True)
+class ImportStatisticsColumnsTask(RecorderTask):
+    """An object to insert into the recorder queue to import statistics columns."""
+
+    metadata: StatisticMetaData
+    columns: Mapping[str, Sequence[float | None]]
+    table: type[Statistics | StatisticsShortTerm]
+
+    def run(self, instance: Recorder) -> None:
+        """Run statistics task."""
+        if statistics.import_statistics_columns(
+            instance, self.metadata, self.columns, self.table
+        ):
+            return
+        # Schedule a new statistics task if this one didn't finish
+        instance.queue_task(
+            ImportStatisticsColumnsTask(self.metadata, self.columns, self.table)
+        )
+
+
 @dataclass(slots=True)
 class AdjustStatisticsTask(RecorderTask):
     """An object to insert into the recorder queue to run an adjust statistics task."""
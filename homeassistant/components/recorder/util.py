@@ -41,6 +41,7 @@ from .const import (
     DOMAIN,
     SQLITE_MAX_BIND_VARS,
     SQLITE_MODERN_MAX_BIND_VARS,
+    SQLITE_READER_MMAP_SIZE,
     SQLITE_URL_PREFIX,
     SupportedDialect,
 )
@@ -334,6 +335,22 @@ def execute_on_connection(dbapi_connection: DBAPIConnection, statement: str) ->
     cursor.close()
 
 
+def setup_read_only_connection(
+    dbapi_connection: DBAPIConnection, connection_record: Any
+) -> None:
+    """Execute statements needed for a read only SQLite connection.
+
+    query_only makes any attempt to write with a reader connection fail
+    instead of taking the write lock away from the recorder.
+    """
+    execute_on_connection(dbapi_connection, "PRAGMA query_only=ON")
+    execute_on_connection(
+        dbapi_connection, f"PRAGMA mmap_size={SQLITE_READER_MMAP_SIZE}"
+    )
+    # The upper bound on the cache size is approximately 16MiB of memory
+    execute_on_connection(dbapi_connection, "PRAGMA cache_size = -16384")
+
+
 def query_on_connection(dbapi_connection: DBAPIConnection, statement: str) -> Any:
     """Execute a single statement with a dbapi connection and return the result."""
     cursor = dbapi_connection.cursor()
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime as dt
+import threading
 from typing import Any, Literal, cast
 
 import voluptuous as vol
@@ -38,7 +40,9 @@ from .statistics import (
     async_add_external_statistics,
     async_change_statistics_unit,
     async_import_statistics,
+    async_import_statistics_columns,
     async_list_statistic_ids,
+    export_statistics_columns,
     list_statistic_ids,
     statistic_during_period,
     statistics_during_period,
@@ -46,6 +50,11 @@ from .statistics import (
 )
 from .util import PERIOD_SCHEMA, get_instance, resolve_period
 
+# The export waits for the client to read the chunks once this many
+# messages are pending on the connection
+EXPORT_MAX_PENDING_MESSAGES = 4
+EXPORT_DRAIN_INTERVAL = 0.05
+
 UNIT_SCHEMA = vol.Schema(
     {
         vol.Optional("conductivity"): vol.In(DataRateConverter.VALID_UNITS),
@@ -74,11 +83,13 @@ def async_setup(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, ws_adjust_sum_statistics)
     websocket_api.async_register_command(hass, ws_change_statistics_unit)
     websocket_api.async_register_command(hass, ws_clear_statistics)
+    websocket_api.async_register_command(hass, ws_export_statistics)
     websocket_api.async_register_command(hass, ws_get_statistic_during_period)
     websocket_api.async_register_command(hass, ws_get_statistics_during_period)
     websocket_api.async_register_command(hass, ws_get_statistics_metadata)
     websocket_api.async_register_command(hass, ws_list_statistic_ids)
     websocket_api.async_register_command(hass, ws_import_statistics)
+    websocket_api.async_register_command(hass, ws_import_statistics_columns)
     websocket_api.async_register_command(hass, ws_update_statistics_metadata)
     websocket_api.async_register_command(hass, ws_validate_statistics)
 
@@ -127,7 +138,7 @@ async def ws_get_statistic_during_period(
     start_time, end_time = resolve_period(cast(StatisticPeriod, msg))
 
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_executor_job(
             _ws_get_statistic_during_period,
             hass,
             msg["id"],
@@ -195,7 +206,7 @@ async def ws_handle_get_statistics_during_period(
     if (types := msg.get("types")) is None:
         types = {"change", "last_reset", "max", "mean", "min", "state", "sum"}
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_executor_job(
             _ws_get_statistics_during_period,
             hass,
             msg["id"],
@@ -231,6 +242,112 @@ async def ws_get_statistics_during_period(
     await ws_handle_get_statistics_during_period(hass, connection, msg)
 
 
+async def _async_send_export_chunk(
+    connection: websocket_api.ActiveConnection, cancel: threading.Event, message: bytes
+) -> None:
+    """Send a chunk of an export and wait until the client keeps up with it."""
+    connection.send_message(message)
+    stats = connection.stats
+    while stats.pending > EXPORT_MAX_PENDING_MESSAGES and not cancel.is_set():
+        await asyncio.sleep(EXPORT_DRAIN_INTERVAL)
+
+
+def _ws_export_statistics(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg_id: int,
+    cancel: threading.Event,
+    start_time: dt,
+    end_time: dt | None,
+    statistic_ids: set[str],
+    period: Literal["5minute", "hour"],
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> None:
+    """Send the statistics as JSON chunks of columns as they are fetched.
+
+    The next chunk is only fetched once the client has read most of the
+    sent ones, so a slow client does not make the export pile up in memory.
+
+    Runs in the executor.
+    """
+    loop = hass.loop
+    for statistic_id, columns in export_statistics_columns(
+        hass, start_time, end_time, statistic_ids, period, types
+    ):
+        if cancel.is_set():
+            return
+        message = json_bytes(
+            messages.event_message(
+                msg_id, {"statistic_id": statistic_id, "columns": columns}
+            )
+        )
+        asyncio.run_coroutine_threadsafe(
+            _async_send_export_chunk(connection, cancel, message), loop
+        ).result()
+    loop.call_soon_threadsafe(
+        connection.send_message,
+        json_bytes(messages.event_message(msg_id, {"done": True})),
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "recorder/export_statistics",
+        vol.Required("start_time"): str,
+        vol.Optional("end_time"): str,
+        vol.Required("statistic_ids"): vol.All([str], vol.Length(min=1)),
+        vol.Optional("period", default="hour"): vol.Any("5minute", "hour"),
+        vol.Optional("types"): vol.All(
+            [vol.Any("last_reset", "max", "mean", "min", "state", "sum")],
+            vol.Coerce(set),
+        ),
+    }
+)
+@websocket_api.async_response
+async def ws_export_statistics(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Stream statistics as columns.
+
+    The statistics are sent as events with the statistic_id and the columns of
+    a chunk of rows. The start and last_reset columns are UTC timestamps. An
+    event with done set is sent after the last chunk.
+    """
+    if start_time := dt_util.parse_datetime(msg["start_time"]):
+        start_time = dt_util.as_utc(start_time)
+    else:
+        connection.send_error(msg["id"], "invalid_start_time", "Invalid start_time")
+        return
+
+    if end_time_str := msg.get("end_time"):
+        if end_time := dt_util.parse_datetime(end_time_str):
+            end_time = dt_util.as_utc(end_time)
+        else:
+            connection.send_error(msg["id"], "invalid_end_time", "Invalid end_time")
+            return
+    else:
+        end_time = None
+
+    if (types := msg.get("types")) is None:
+        types = {"last_reset", "max", "mean", "min", "state", "sum"}
+    cancel = threading.Event()
+    connection.subscriptions[msg["id"]] = cancel.set
+    connection.send_result(msg["id"])
+    await get_instance(hass).async_add_read_executor_job(
+        _ws_export_statistics,
+        hass,
+        connection,
+        msg["id"],
+        cancel,
+        start_time,
+        end_time,
+        set(msg["statistic_ids"]),
+        msg["period"],
+        types,
+    )
+    connection.subscriptions.pop(msg["id"], None)
+
+
 def _ws_get_list_statistic_ids(
     hass: HomeAssistant,
     msg_id: int,
@@ -474,3 +591,38 @@ def ws_import_statistics(
     else:
         async_add_external_statistics(hass, metadata, stats)
     connection.send_result(msg["id"])
+
+
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "recorder/import_statistics_columns",
+        vol.Required("metadata"): {
+            vol.Required("has_mean"): bool,
+            vol.Required("has_sum"): bool,
+            vol.Required("name"): vol.Any(str, None),
+            vol.Required("source"): str,
+            vol.Required("statistic_id"): str,
+            vol.Required("unit_of_measurement"): vol.Any(str, None),
+        },
+        vol.Required("columns"): {
+            vol.Required("start"): [vol.Any(float, int)],
+            vol.Optional("mean"): [vol.Any(float, int, None)],
+            vol.Optional("min"): [vol.Any(float, int, None)],
+            vol.Optional("max"): [vol.Any(float, int, None)],
+            vol.Optional("last_reset"): [vol.Any(float, int, None)],
+            vol.Optional("state"): [vol.Any(float, int, None)],
+            vol.Optional("sum"): [vol.Any(float, int, None)],
+        },
+    }
+)
+@callback
+def ws_import_statistics_columns(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Import statistics given as columns.
+
+    The start and last_reset columns are UTC timestamps.
+    """
+    async_import_statistics_columns(hass, msg["metadata"], msg["columns"])
+    connection.send_result(msg["id"])
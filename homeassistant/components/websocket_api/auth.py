@@ -16,6 +16,7 @@ from homeassistant.helpers.json import json_bytes
 from homeassistant.util.json import JsonValueType
 
 from .connection import ActiveConnection
+from .const import ENCODING_DEFLATE, ENCODING_JSON
 from .error import Disconnect
 
 if TYPE_CHECKING:
@@ -32,6 +33,8 @@ AUTH_MESSAGE_SCHEMA: Final = vol.Schema(
         vol.Required("type"): TYPE_AUTH,
         vol.Exclusive("api_password", "auth"): str,
         vol.Exclusive("access_token", "auth"): str,
+        vol.Optional("encoding"): vol.In([ENCODING_JSON, ENCODING_DEFLATE]),
+        vol.Optional("compress_threshold"): vol.All(int, vol.Range(min=0)),
     }
 )
 
@@ -90,6 +93,10 @@ class AuthPhase:
                 refresh_token.user,
                 refresh_token,
             )
+            if "encoding" in valid_msg:
+                conn.encoding = valid_msg["encoding"]
+            if "compress_threshold" in valid_msg:
+                conn.compress_threshold = valid_msg["compress_threshold"]
             conn.subscriptions["auth"] = (
                 self._hass.auth.async_register_revoke_token_callback(
                     refresh_token.id, self._cancel_ws
@@ -0,0 +1,222 @@
+"""Fan out state changes to the websocket connections subscribed to them."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Final
+
+from homeassistant.auth.permissions.const import POLICY_READ
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.util.hass_dict import HassKey
+
+from . import messages
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .connection import ActiveConnection
+
+DATA_STATE_BROADCASTER: HassKey[StateBroadcaster] = HassKey(
+    f"{DOMAIN}.state_broadcaster"
+)
+
+_NOTHING_TO_SEND: Final = b""
+
+
+class _EntityChangeBuffer:
+    """Merge the changes of each entity made within a window into one diff."""
+
+    __slots__ = (
+        "_attributes",
+        "_connection",
+        "_hass",
+        "_msg_id",
+        "_pending",
+        "_timer",
+        "_window",
+    )
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        connection: ActiveConnection,
+        msg_id: int,
+        attributes: frozenset[str] | None,
+        window: float,
+    ) -> None:
+        """Initialize the buffer."""
+        self._hass = hass
+        self._connection = connection
+        self._msg_id = msg_id
+        self._attributes = attributes
+        self._window = window
+        self._pending: dict[str, tuple[State | None, State | None]] = {}
+        self._timer: asyncio.TimerHandle | None = None
+
+    @callback
+    def async_add(self, event: Event[EventStateChangedData]) -> None:
+        """Add a state change to the buffer."""
+        data = event.data
+        entity_id = data["entity_id"]
+        if (pending := self._pending.get(entity_id)) is None:
+            self._pending[entity_id] = (data["old_state"], data["new_state"])
+        else:
+            # Keep the state the subscriber last saw
+            self._pending[entity_id] = (pending[0], data["new_state"])
+        if self._timer is None:
+            self._timer = self._hass.loop.call_later(self._window, self._async_flush)
+
+    @callback
+    def _async_flush(self) -> None:
+        """Send the merged changes."""
+        self._timer = None
+        pending = self._pending
+        self._pending = {}
+        if diff_event := messages.merged_state_diff_event(pending, self._attributes):
+            self._connection.send_message(
+                messages.event_message(self._msg_id, diff_event)
+            )
+
+    @callback
+    def async_cancel(self) -> None:
+        """Drop the pending changes."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._pending.clear()
+
+
+@dataclass(slots=True, eq=False)
+class _Subscriber:
+    """A subscription to state changes."""
+
+    connection: ActiveConnection
+    message_id_as_bytes: bytes
+    entity_ids: set[str]
+    domains: set[str]
+    attributes: frozenset[str] | None
+    buffer: _EntityChangeBuffer | None = field(default=None)
+
+
+class StateBroadcaster:
+    """Send state changes to all subscribed connections.
+
+    A single state changed listener serves all subscriptions. The message
+    for each event is serialized once per subscription id and attribute
+    filter, so connections that subscribed with the same id are sent
+    the same bytes.
+    """
+
+    __slots__ = ("_hass", "_subscribers", "_unsub")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the broadcaster."""
+        self._hass = hass
+        self._subscribers: dict[_Subscriber, None] = {}
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_subscribe(
+        self,
+        connection: ActiveConnection,
+        msg_id: int,
+        entity_ids: set[str],
+        domains: set[str],
+        attributes: frozenset[str] | None,
+        coalesce_window: float | None = None,
+    ) -> CALLBACK_TYPE:
+        """Subscribe a connection to state changes.
+
+        With a coalesce_window the changes made within the window are
+        merged and sent as one message.
+        """
+        subscriber = _Subscriber(
+            connection, str(msg_id).encode(), entity_ids, domains, attributes
+        )
+        if coalesce_window:
+            subscriber.buffer = _EntityChangeBuffer(
+                self._hass, connection, msg_id, attributes, coalesce_window
+            )
+        self._subscribers[subscriber] = None
+        if self._unsub is None:
+            self._unsub = self._hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_broadcast
+            )
+
+        @callback
+        def _async_unsubscribe() -> None:
+            del self._subscribers[subscriber]
+            if subscriber.buffer is not None:
+                subscriber.buffer.async_cancel()
+            if not self._subscribers and self._unsub is not None:
+                self._unsub()
+                self._unsub = None
+
+        return _async_unsubscribe
+
+    @callback
+    def _async_broadcast(self, event: Event[EventStateChangedData]) -> None:
+        """Send a state change to the subscribed connections."""
+        entity_id = event.data["entity_id"]
+        domain = entity_id.partition(".")[0]
+        serialized: dict[tuple[bytes, frozenset[str] | None], bytes] = {}
+        # Sending can close a connection which unsubscribes it
+        for subscriber in list(self._subscribers):
+            if subscriber.domains:
+                if (
+                    entity_id not in subscriber.entity_ids
+                    and domain not in subscriber.domains
+                ):
+                    continue
+            elif subscriber.entity_ids and entity_id not in subscriber.entity_ids:
+                continue
+            # We have to lookup the permissions again because the user might
+            # have changed since the subscription was created.
+            user = subscriber.connection.user
+            permissions = user.permissions
+            if (
+                not user.is_admin
+                and not permissions.access_all_entities(POLICY_READ)
+                and not permissions.check_entity(entity_id, POLICY_READ)
+            ):
+                continue
+            if subscriber.buffer is not None:
+                subscriber.buffer.async_add(event)
+                continue
+            key = (subscriber.message_id_as_bytes, subscriber.attributes)
+            if (message := serialized.get(key)) is None:
+                message = serialized[key] = _serialize(event, *key)
+            if message:
+                subscriber.connection.send_message(message)
+
+
+def _serialize(
+    event: Event[EventStateChangedData],
+    message_id_as_bytes: bytes,
+    attributes: frozenset[str] | None,
+) -> bytes:
+    """Serialize the message of a state change for a subscription."""
+    if attributes is None:
+        return messages.cached_state_diff_message(message_id_as_bytes, event)
+    return (
+        messages.cached_filtered_state_diff_message(
+            message_id_as_bytes, event, attributes
+        )
+        or _NOTHING_TO_SEND
+    )
+
+
+@callback
+def async_get_state_broadcaster(hass: HomeAssistant) -> StateBroadcaster:
+    """Return the state broadcaster."""
+    if (broadcaster := hass.data.get(DATA_STATE_BROADCASTER)) is None:
+        broadcaster = hass.data[DATA_STATE_BROADCASTER] = StateBroadcaster(hass)
+    return broadcaster
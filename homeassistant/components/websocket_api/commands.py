@@ -59,6 +59,7 @@ from homeassistant.setup import async_get_loaded_integrations, async_get_setup_t
 from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
+from .broadcast import async_get_state_broadcaster
 from .connection import ActiveConnection
 from .messages import construct_result_message
 
@@ -82,6 +83,8 @@ def async_register_commands(
     async_reg(hass, handle_get_states)
     async_reg(hass, handle_manifest_get)
     async_reg(hass, handle_integration_setup_info)
+    async_reg(hass, handle_integration_startup_trace)
+    async_reg(hass, handle_connection_stats)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
@@ -363,28 +366,19 @@ def _send_handle_get_states_response(
     )
 
 
-@callback
-def _forward_entity_changes(
-    send_message: Callable[[str | bytes | dict[str, Any]], None],
-    entity_ids: set[str],
-    user: User,
-    message_id_as_bytes: bytes,
-    event: Event[EventStateChangedData],
-) -> None:
-    """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if entity_ids and entity_id not in entity_ids:
-        return
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if (
-        not user.is_admin
-        and not permissions.access_all_entities(POLICY_READ)
-        and not permissions.check_entity(event.data["entity_id"], POLICY_READ)
-    ):
-        return
-    send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
+def _filtered_compressed_state_json(
+    state: State, attributes: frozenset[str] | None
+) -> bytes:
+    """Return the compressed state JSON with only the allowed attributes."""
+    if attributes is None:
+        return state.as_compressed_state_json
+    return json_bytes(
+        {
+            state.entity_id: messages.filter_compressed_state(
+                state.as_compressed_state, attributes
+            )
+        }
+    )[1:-1]
 
 
 @callback
@@ -392,27 +386,46 @@ def _forward_entity_changes(
     {
         vol.Required("type"): "subscribe_entities",
         vol.Optional("entity_ids"): cv.entity_ids,
+        vol.Optional("domains"): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional("attributes"): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional("coalesce_ms"): vol.All(int, vol.Range(min=1, max=60000)),
     }
 )
 def handle_subscribe_entities(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
-    """Handle subscribe entities command."""
+    """Handle subscribe entities command.
+
+    The subscription can be limited to entity_ids and domains, in which
+    case entities matching either are sent, and to the attributes with
+    the given keys. With coalesce_ms all changes made within the window
+    are merged and sent as one message.
+    """
     entity_ids = set(msg.get("entity_ids", []))
+    domains = set(msg.get("domains", []))
+    attributes: frozenset[str] | None = (
+        frozenset(msg["attributes"]) if "attributes" in msg else None
+    )
     # We must never await between sending the states and listening for
     # state changed events or we will introduce a race condition
     # where some states are missed
     states = _async_get_allowed_states(hass, connection)
-    message_id_as_bytes = str(msg["id"]).encode()
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
-            _forward_entity_changes,
-            connection.send_message,
-            entity_ids,
-            connection.user,
-            message_id_as_bytes,
-        ),
+    if entity_ids or domains:
+        states = [
+            state
+            for state in states
+            if state.entity_id in entity_ids or state.domain in domains
+        ]
+    coalesce_ms = msg.get("coalesce_ms")
+    connection.subscriptions[msg["id"]] = async_get_state_broadcaster(
+        hass
+    ).async_subscribe(
+        connection,
+        msg["id"],
+        entity_ids,
+        domains,
+        attributes,
+        coalesce_ms / 1000 if coalesce_ms else None,
     )
     connection.send_result(msg["id"])
 
@@ -421,9 +434,7 @@ def handle_subscribe_entities(
     # to succeed for the UI to show.
     try:
         serialized_states = [
-            state.as_compressed_state_json
-            for state in states
-            if not entity_ids or state.entity_id in entity_ids
+            _filtered_compressed_state_json(state, attributes) for state in states
         ]
     except (ValueError, TypeError):
         pass
@@ -434,7 +445,7 @@ def handle_subscribe_entities(
     serialized_states = []
     for state in states:
         try:
-            serialized_states.append(state.as_compressed_state_json)
+            serialized_states.append(_filtered_compressed_state_json(state, attributes))
         except (ValueError, TypeError):
             connection.logger.error(
                 "Unable to serialize to JSON. Bad data found at %s",
@@ -547,6 +558,42 @@ def handle_integration_setup_info(
     )
 
 
+@callback
+@decorators.require_admin
+@decorators.websocket_command({vol.Required("type"): "integration/startup_trace"})
+def handle_integration_startup_trace(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle startup trace command."""
+    if (trace := hass.startup_trace) is None:
+        connection.send_error(
+            msg["id"], const.ERR_NOT_FOUND, "No startup trace was recorded"
+        )
+        return
+    connection.send_result(msg["id"], trace.as_chrome_trace())
+
+
+@callback
+@decorators.require_admin
+@decorators.websocket_command({vol.Required("type"): "connection_stats"})
+def handle_connection_stats(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle connection stats command."""
+    connection.send_result(
+        msg["id"],
+        [
+            {
+                "user_id": active.user.id,
+                "current": active is connection,
+                "subscriptions": len(active.subscriptions),
+                **active.stats.as_dict(),
+            }
+            for active in hass.data.get(const.DATA_ACTIVE_CONNECTIONS, ())
+        ],
+    )
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(
@@ -636,7 +683,17 @@ async def handle_render_template(
 
         connection.send_message(
             messages.event_message(
-                msg["id"], {"result": result, "listeners": info.listeners}
+                msg["id"],
+                {
+                    "result": result,
+                    "listeners": info.listeners,
+                    # Renders skipped since the state changes did not touch
+                    # anything the template reads
+                    "renders": {
+                        "performed": template_obj.renders,
+                        "skipped": template_obj.skipped_renders,
+                    },
+                },
             )
         )
 
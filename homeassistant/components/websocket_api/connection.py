@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Callable, Hashable
 from contextvars import ContextVar
+from dataclasses import asdict, dataclass
 from typing import TYPE_CHECKING, Any, Literal
 
 from aiohttp import web
@@ -30,6 +31,35 @@ type MessageHandler = Callable[[HomeAssistant, ActiveConnection, dict[str, Any]]
 type BinaryHandler = Callable[[HomeAssistant, ActiveConnection, bytes], None]
 
 
+@dataclass(slots=True)
+class ConnectionStats:
+    """Counters of the messages written to a connection.
+
+    A client that reads slower than messages are produced shows up as a
+    growing number of pending messages and time spent waiting for writes.
+    """
+
+    messages: int = 0
+    writes: int = 0
+    bytes_written: int = 0
+    pending: int = 0
+    peak_pending: int = 0
+    write_time: float = 0.0
+    max_write_time: float = 0.0
+
+    def record_write(self, size: int, elapsed: float) -> None:
+        """Record a write of size bytes that took elapsed seconds."""
+        self.writes += 1
+        self.bytes_written += size
+        self.write_time += elapsed
+        if elapsed > self.max_write_time:
+            self.max_write_time = elapsed
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters as a dict."""
+        return asdict(self)
+
+
 class ActiveConnection:
     """Handle an active websocket client connection."""
 
@@ -42,9 +72,12 @@ class ActiveConnection:
         "subscriptions",
         "last_id",
         "can_coalesce",
+        "encoding",
+        "compress_threshold",
         "supported_features",
         "handlers",
         "binary_handlers",
+        "stats",
     )
 
     def __init__(
@@ -64,11 +97,14 @@ class ActiveConnection:
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
         self.last_id = 0
         self.can_coalesce = False
+        self.encoding = const.ENCODING_JSON
+        self.compress_threshold = const.DEFAULT_COMPRESS_THRESHOLD
         self.supported_features: dict[str, float] = {}
         self.handlers: dict[str, tuple[MessageHandler, vol.Schema | Literal[False]]] = (
             self.hass.data[const.DOMAIN]
         )
         self.binary_handlers: list[BinaryHandler | None] = []
+        self.stats = ConnectionStats()
         current_connection.set(self)
 
     def __repr__(self) -> str:
@@ -56,5 +56,16 @@ SIGNAL_WEBSOCKET_DISCONNECTED: Final = "websocket_disconnected"
 
 # Data used to store the current connection list
 DATA_CONNECTIONS: Final = f"{DOMAIN}.connections"
+DATA_ACTIVE_CONNECTIONS: Final = f"{DOMAIN}.active_connections"
 
 FEATURE_COALESCE_MESSAGES = "coalesce_messages"
+
+# Message encodings a client can select in the auth message
+ENCODING_JSON: Final = "json"
+# Binary frames with zlib compressed JSON
+ENCODING_DEFLATE: Final = "deflate"
+
+# Messages smaller than this many bytes are not compressed
+DEFAULT_COMPRESS_THRESHOLD: Final = 0
+# Larger messages are compressed in the executor for the deflate encoding
+MAX_SYNC_DEFLATE_SIZE: Final = 5 * 2**10
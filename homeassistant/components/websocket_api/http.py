@@ -9,8 +9,10 @@ import datetime as dt
 from functools import partial
 import logging
 from typing import TYPE_CHECKING, Any, Final
+import zlib
 
 from aiohttp import WSMsgType, web
+from aiohttp.http_websocket import WebSocketWriter
 
 from homeassistant.components.http import KEY_HASS, HomeAssistantView
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
@@ -21,9 +23,13 @@ from homeassistant.util.async_ import create_eager_task
 from homeassistant.util.json import json_loads
 
 from .auth import AUTH_REQUIRED_MESSAGE, AuthPhase
+from .connection import ConnectionStats
 from .const import (
+    DATA_ACTIVE_CONNECTIONS,
     DATA_CONNECTIONS,
+    ENCODING_DEFLATE,
     MAX_PENDING_MSG,
+    MAX_SYNC_DEFLATE_SIZE,
     PENDING_MSG_MAX_FORCE_READY,
     PENDING_MSG_PEAK,
     PENDING_MSG_PEAK_TIME,
@@ -81,6 +87,7 @@ class WebSocketHandler:
         "_message_queue",
         "_ready_future",
         "_release_ready_queue_size",
+        "_stats",
     )
 
     def __init__(self, hass: HomeAssistant, request: web.Request) -> None:
@@ -104,6 +111,7 @@ class WebSocketHandler:
         self._message_queue: deque[bytes] = deque()
         self._ready_future: asyncio.Future[int] | None = None
         self._release_ready_queue_size: int = 0
+        self._stats = ConnectionStats()
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -132,6 +140,8 @@ class WebSocketHandler:
         logger = self._logger
         wsock = self._wsock
         loop = self._loop
+        loop_time = loop.time
+        stats = self._stats
         is_debug_log_enabled = partial(logger.isEnabledFor, logging.DEBUG)
         debug = logger.debug
         can_coalesce = self._connection and self._connection.can_coalesce
@@ -152,16 +162,22 @@ class WebSocketHandler:
 
                 if not can_coalesce or ready_message_count == 1:
                     message = message_queue.popleft()
+                    stats.pending = len(message_queue)
                     if is_debug_log_enabled():
                         debug("%s: Sending %s", self.description, message)
+                    start = loop_time()
                     await send_bytes_text(message)
+                    stats.record_write(len(message), loop_time() - start)
                     continue
 
                 coalesced_messages = b"".join((b"[", b",".join(message_queue), b"]"))
                 message_queue.clear()
+                stats.pending = 0
                 if is_debug_log_enabled():
                     debug("%s: Sending %s", self.description, coalesced_messages)
+                start = loop_time()
                 await send_bytes_text(coalesced_messages)
+                stats.record_write(len(coalesced_messages), loop_time() - start)
         except asyncio.CancelledError:
             debug("%s: Writer cancelled", self.description)
             raise
@@ -172,6 +188,56 @@ class WebSocketHandler:
             # Clean up the peak checker when we shut down the writer
             self._cancel_peak_checker()
 
+    def _get_send_message_bytes(
+        self, writer: WebSocketWriter, connection: ActiveConnection
+    ) -> Callable[[bytes], Coroutine[Any, Any, None]]:
+        """Return the function that writes messages in the encoding of the client.
+
+        With the deflate encoding, messages from the compress threshold of
+        the connection are sent as binary frames with zlib compressed JSON.
+        Otherwise, if permessage-deflate was negotiated, only messages from
+        the compress threshold are compressed.
+
+        The writer then only compresses the frames it is asked to compress
+        when they are sent.
+        """
+        negotiated_compress = writer.compress
+        threshold = connection.compress_threshold
+        send = writer.send
+        if connection.encoding == ENCODING_DEFLATE:
+            writer.compress = 0
+            hass = self._hass
+
+            async def _send_deflate_message_bytes(message: bytes) -> None:
+                """Write a message, compressing it with zlib from the threshold."""
+                if len(message) < threshold:
+                    await send(message, binary=False)
+                    return
+                if len(message) > MAX_SYNC_DEFLATE_SIZE:
+                    message = await hass.async_add_executor_job(
+                        zlib.compress, message, zlib.Z_BEST_SPEED
+                    )
+                else:
+                    message = zlib.compress(message, zlib.Z_BEST_SPEED)
+                await send(message, binary=True)
+
+            return _send_deflate_message_bytes
+
+        if not negotiated_compress or not threshold:
+            return partial(send, binary=False)
+
+        writer.compress = 0
+
+        async def _send_message_bytes(message: bytes) -> None:
+            """Write a message, compressing it from the threshold."""
+            await send(
+                message,
+                binary=False,
+                compress=negotiated_compress if len(message) >= threshold else None,
+            )
+
+        return _send_message_bytes
+
     @callback
     def _cancel_peak_checker(self) -> None:
         """Cancel the peak checker."""
@@ -200,7 +266,13 @@ class WebSocketHandler:
 
         message_queue = self._message_queue
         message_queue.append(message)
-        if (queue_size_after_add := len(message_queue)) >= MAX_PENDING_MSG:
+        queue_size_after_add = len(message_queue)
+        stats = self._stats
+        stats.messages += 1
+        stats.pending = queue_size_after_add
+        if queue_size_after_add > stats.peak_pending:
+            stats.peak_pending = queue_size_after_add
+        if queue_size_after_add >= MAX_PENDING_MSG:
             self._logger.error(
                 (
                     "%s: Client unable to keep up with pending messages. Reached %s pending"
@@ -360,8 +432,12 @@ class WebSocketHandler:
             # We only start the writer queue after the auth phase is completed
             # since there is no need to queue messages before the auth phase
             self._connection = connection
-            self._writer_task = create_eager_task(self._writer(send_bytes_text))
+            connection.stats = self._stats
+            self._writer_task = create_eager_task(
+                self._writer(self._get_send_message_bytes(writer, connection))
+            )
             hass.data[DATA_CONNECTIONS] = hass.data.get(DATA_CONNECTIONS, 0) + 1
+            hass.data.setdefault(DATA_ACTIVE_CONNECTIONS, set()).add(connection)
             async_dispatcher_send(hass, SIGNAL_WEBSOCKET_CONNECTED)
 
             self._authenticated = True
@@ -485,6 +561,7 @@ class WebSocketHandler:
 
                     if connection is not None:
                         hass.data[DATA_CONNECTIONS] -= 1
+                        hass.data[DATA_ACTIVE_CONNECTIONS].discard(connection)
                         self._connection = None
 
                     async_dispatcher_send(hass, SIGNAL_WEBSOCKET_DISCONNECTED)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from functools import lru_cache
 import logging
 from typing import Any, Final
@@ -15,7 +16,7 @@ from homeassistant.const import (
     COMPRESSED_STATE_LAST_UPDATED,
     COMPRESSED_STATE_STATE,
 )
-from homeassistant.core import CompressedState, Event, EventStateChangedData
+from homeassistant.core import CompressedState, Event, EventStateChangedData, State
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.json import (
     JSON_DUMP,
@@ -23,6 +24,7 @@ from homeassistant.helpers.json import (
     json_bytes,
 )
 from homeassistant.util.json import format_unserializable_data
+from homeassistant.util.read_only_dict import ReadOnlyDict
 
 from . import const
 
@@ -195,9 +197,22 @@ def _state_diff_event(
         "r": [entity_id,…]
     }
     """
-    if (new_state := event.data["new_state"]) is None:
-        return {ENTITY_EVENT_REMOVE: [event.data["entity_id"]]}
-    if (old_state := event.data["old_state"]) is None:
+    data = event.data
+    return _state_diff(data["entity_id"], data["old_state"], data["new_state"])
+
+
+def _state_diff(
+    entity_id: str, old_state: State | None, new_state: State | None
+) -> dict[
+    str,
+    list[str]
+    | dict[str, CompressedState]
+    | dict[str, dict[str, dict[str, str | list[str]]]],
+]:
+    """Return the minimal version of the change from old_state to new_state."""
+    if new_state is None:
+        return {ENTITY_EVENT_REMOVE: [entity_id]}
+    if old_state is None:
         return {ENTITY_EVENT_ADD: {new_state.entity_id: new_state.as_compressed_state}}
     additions: dict[str, Any] = {}
     diff: dict[str, dict[str, Any]] = {STATE_DIFF_ADDITIONS: additions}
@@ -235,6 +250,134 @@ def _state_diff_event(
     return {ENTITY_EVENT_CHANGE: {new_state.entity_id: diff}}
 
 
+def cached_filtered_state_diff_message(
+    message_id_as_bytes: bytes,
+    event: Event[EventStateChangedData],
+    attributes: frozenset[str],
+) -> bytes | None:
+    """Return an event message with only the allowed attributes.
+
+    Returns None if nothing the subscriber is interested in changed.
+    """
+    if (
+        partial := _partial_cached_filtered_state_diff_message(event, attributes)
+    ) is None:
+        return None
+    return b"".join((partial[:-1], b',"id":', message_id_as_bytes, b"}"))
+
+
+@lru_cache(maxsize=128)
+def _partial_cached_filtered_state_diff_message(
+    event: Event[EventStateChangedData], attributes: frozenset[str]
+) -> bytes | None:
+    """Cache and serialize the filtered event to json.
+
+    Subscribers that use the same attribute filter share the message.
+    """
+    if (diff := filter_state_diff_event(_state_diff_event(event), attributes)) is None:
+        return None
+    return (
+        _message_to_json_bytes_or_none({"type": "event", "event": diff})
+        or INVALID_JSON_PARTIAL_MESSAGE
+    )
+
+
+def filter_state_diff_event(
+    diff_event: dict[str, Any], attributes: frozenset[str]
+) -> dict[str, Any] | None:
+    """Remove the attributes that are not allowed from a state diff event.
+
+    Changes that only touch attributes that are not allowed, and the
+    last_updated and context that come with them, are dropped completely.
+    Returns None if nothing is left.
+    """
+    filtered: dict[str, Any] = {}
+    if removed := diff_event.get(ENTITY_EVENT_REMOVE):
+        filtered[ENTITY_EVENT_REMOVE] = removed
+    if added := diff_event.get(ENTITY_EVENT_ADD):
+        filtered[ENTITY_EVENT_ADD] = {
+            entity_id: filter_compressed_state(compressed_state, attributes)
+            for entity_id, compressed_state in added.items()
+        }
+    changed: dict[str, Any] = {}
+    for entity_id, diff in diff_event.get(ENTITY_EVENT_CHANGE, {}).items():
+        additions = dict(diff[STATE_DIFF_ADDITIONS])
+        if COMPRESSED_STATE_ATTRIBUTES in additions:
+            if allowed := {
+                key: value
+                for key, value in additions[COMPRESSED_STATE_ATTRIBUTES].items()
+                if key in attributes
+            }:
+                additions[COMPRESSED_STATE_ATTRIBUTES] = allowed
+            else:
+                del additions[COMPRESSED_STATE_ATTRIBUTES]
+        filtered_diff: dict[str, Any] = {STATE_DIFF_ADDITIONS: additions}
+        if STATE_DIFF_REMOVALS in diff and (
+            removed_attributes := [
+                key
+                for key in diff[STATE_DIFF_REMOVALS][COMPRESSED_STATE_ATTRIBUTES]
+                if key in attributes
+            ]
+        ):
+            filtered_diff[STATE_DIFF_REMOVALS] = {
+                COMPRESSED_STATE_ATTRIBUTES: removed_attributes
+            }
+        elif not (
+            COMPRESSED_STATE_STATE in additions
+            or COMPRESSED_STATE_ATTRIBUTES in additions
+            or COMPRESSED_STATE_LAST_CHANGED in additions
+        ):
+            continue
+        changed[entity_id] = filtered_diff
+    if changed:
+        filtered[ENTITY_EVENT_CHANGE] = changed
+    return filtered or None
+
+
+def filter_compressed_state(
+    compressed_state: CompressedState, attributes: frozenset[str]
+) -> CompressedState:
+    """Return a copy of a compressed state with only the allowed attributes."""
+    return {
+        **compressed_state,
+        COMPRESSED_STATE_ATTRIBUTES: ReadOnlyDict(
+            {
+                key: value
+                for key, value in compressed_state[COMPRESSED_STATE_ATTRIBUTES].items()
+                if key in attributes
+            }
+        ),
+    }
+
+
+def merged_state_diff_event(
+    changes: Mapping[str, tuple[State | None, State | None]],
+    attributes: frozenset[str] | None,
+) -> dict[str, Any] | None:
+    """Return one state diff event for the changes of many entities.
+
+    changes maps each entity_id to the state before the first change and
+    the state after the last change, so all the changes of an entity are
+    merged into a single diff. Returns None if nothing is left to send.
+    """
+    merged: dict[str, Any] = {}
+    for entity_id, (old_state, new_state) in changes.items():
+        if old_state is None and new_state is None:
+            # Added and removed again
+            continue
+        diff_event: dict[str, Any] = _state_diff(entity_id, old_state, new_state)
+        if attributes is not None:
+            if (filtered := filter_state_diff_event(diff_event, attributes)) is None:
+                continue
+            diff_event = filtered
+        for key, value in diff_event.items():
+            if key == ENTITY_EVENT_REMOVE:
+                merged.setdefault(key, []).extend(value)
+            else:
+                merged.setdefault(key, {}).update(value)
+    return merged or None
+
+
 def _message_to_json_bytes_or_none(message: dict[str, Any]) -> bytes | None:
     """Serialize a websocket message to json or return None."""
     try:
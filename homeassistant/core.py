@@ -12,13 +12,14 @@ from collections.abc import (
     Callable,
     Collection,
     Coroutine,
+    Generator,
     Iterable,
     KeysView,
     Mapping,
     ValuesView,
 )
 import concurrent.futures
-from contextlib import suppress
+from contextlib import contextmanager, suppress
 from dataclasses import dataclass
 import datetime
 import enum
@@ -44,6 +45,7 @@ from typing import (
     overload,
 )
 from urllib.parse import urlparse
+import weakref
 
 from typing_extensions import TypeVar
 import voluptuous as vol
@@ -109,6 +111,7 @@ from .util.executor import InterruptibleThreadPoolExecutor
 from .util.hass_dict import HassDict
 from .util.json import JsonObjectType
 from .util.read_only_dict import ReadOnlyDict
+from .util.startup_trace import StartupTrace
 from .util.timeout import TimeoutManager
 from .util.ulid import ulid_at_time, ulid_now
 from .util.unit_system import (
@@ -200,6 +203,13 @@ EVENTS_EXCLUDED_FROM_MATCH_ALL = {
     EVENT_STATE_REPORTED,
 }
 
+# Events that always carry an entity_id in their data
+# and can be routed by the EventBus entity_id and domain index
+EVENTS_KEYED_BY_ENTITY_ID: set[EventType[Any] | str] = {
+    EVENT_STATE_CHANGED,
+    EVENT_STATE_REPORTED,
+}
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -450,6 +460,8 @@ class HomeAssistant:
         self.import_executor = InterruptibleThreadPoolExecutor(
             max_workers=1, thread_name_prefix="ImportExecutor"
         )
+        # Timeline of the startup, set by bootstrap while starting up
+        self.startup_trace: StartupTrace | None = None
         self.loop_thread_id = getattr(
             self.loop, "_thread_ident", getattr(self.loop, "_thread_id")
         )
@@ -875,6 +887,8 @@ class HomeAssistant:
         self, target: Callable[[*_Ts], _T], *args: *_Ts
     ) -> asyncio.Future[_T]:
         """Add an executor job from within the event loop."""
+        if (trace := self.startup_trace) is not None and trace.active:
+            target = trace.wrap_job(target, "executor")
         task = self.loop.run_in_executor(None, target, *args)
 
         tracked = asyncio.current_task() in self._tasks
@@ -892,6 +906,8 @@ class HomeAssistant:
 
         The future returned from this method must be awaited in the event loop.
         """
+        if (trace := self.startup_trace) is not None and trace.active:
+            target = trace.wrap_job(target, "import_executor")
         return self.loop.run_in_executor(self.import_executor, target, *args)
 
     @overload
@@ -1446,7 +1462,14 @@ def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> N
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_debug",
+        "_domain_listeners",
+        "_entity_id_listeners",
+        "_hass",
+        "_listeners",
+        "_match_all_listeners",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
@@ -1455,6 +1478,15 @@ class EventBus:
         ] = defaultdict(list)
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
+        # Listeners for events in EVENTS_KEYED_BY_ENTITY_ID indexed
+        # by entity_id and domain so firing a state change only
+        # touches the listeners that asked for that entity or domain.
+        self._entity_id_listeners: dict[
+            EventType[Any] | str, defaultdict[str, list[_FilterableJobType[Any]]]
+        ] = {event_type: defaultdict(list) for event_type in EVENTS_KEYED_BY_ENTITY_ID}
+        self._domain_listeners: dict[
+            EventType[Any] | str, defaultdict[str, list[_FilterableJobType[Any]]]
+        ] = {event_type: defaultdict(list) for event_type in EVENTS_KEYED_BY_ENTITY_ID}
         self._hass = hass
         self._async_logging_changed()
         self.async_listen(EVENT_LOGGING_CHANGED, self._async_logging_changed)
@@ -1468,9 +1500,21 @@ class EventBus:
     def async_listeners(self) -> dict[EventType[Any] | str, int]:
         """Return dictionary with events and the number of listeners.
 
+        A listener registered for several entity_ids or domains
+        is counted once.
+
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        listeners = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for event_type in EVENTS_KEYED_BY_ENTITY_ID:
+            if targets := {
+                id(job.target)
+                for index in (self._entity_id_listeners, self._domain_listeners)
+                for jobs in index[event_type].values()
+                for job, _ in jobs
+            }:
+                listeners[event_type] = listeners.get(event_type, 0) + len(targets)
+        return listeners
 
     @property
     def listeners(self) -> dict[EventType[Any] | str, int]:
@@ -1536,6 +1580,19 @@ class EventBus:
             )
 
         listeners = self._listeners.get(event_type, EMPTY_LIST)
+        if event_type in EVENTS_KEYED_BY_ENTITY_ID and event_data is not None:
+            # Events fired by integrations may not carry an entity_id or
+            # carry one which is not a string, they are only sent to the
+            # listeners that are not keyed
+            if type(entity_id := event_data.get("entity_id")) is str:
+                if keyed_listeners := self._entity_id_listeners[event_type].get(
+                    entity_id
+                ):
+                    listeners = listeners + keyed_listeners
+                if (domain_index := self._domain_listeners[event_type]) and (
+                    keyed_listeners := domain_index.get(entity_id.partition(".")[0])
+                ):
+                    listeners = listeners + keyed_listeners
         if event_type not in EVENTS_EXCLUDED_FROM_MATCH_ALL:
             match_all_listeners = self._match_all_listeners
         else:
@@ -1640,6 +1697,78 @@ class EventBus:
             self._async_remove_listener, event_type, filterable_job
         )
 
+    @callback
+    def async_listen_entity_ids(
+        self,
+        event_type: EventType[_DataT] | str,
+        entity_ids: str | Iterable[str],
+        listener: Callable[[Event[_DataT]], Coroutine[Any, Any, None] | None],
+        event_filter: Callable[[_DataT], bool] | None = None,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type for specific entity_ids.
+
+        Only event types in EVENTS_KEYED_BY_ENTITY_ID are supported
+        and the entity_ids must be lower case.
+
+        The listener is only considered when the event is fired
+        for one of the entity_ids, which avoids running a filter
+        for every event of the type.
+
+        This method must be run in the event loop.
+        """
+        return self._async_listen_keyed(
+            self._entity_id_listeners, event_type, entity_ids, listener, event_filter
+        )
+
+    @callback
+    def async_listen_domains(
+        self,
+        event_type: EventType[_DataT] | str,
+        domains: str | Iterable[str],
+        listener: Callable[[Event[_DataT]], Coroutine[Any, Any, None] | None],
+        event_filter: Callable[[_DataT], bool] | None = None,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type for entities in specific domains.
+
+        Only event types in EVENTS_KEYED_BY_ENTITY_ID are supported
+        and the domains must be lower case.
+
+        This method must be run in the event loop.
+        """
+        return self._async_listen_keyed(
+            self._domain_listeners, event_type, domains, listener, event_filter
+        )
+
+    @callback
+    def _async_listen_keyed(
+        self,
+        index: dict[
+            EventType[Any] | str, defaultdict[str, list[_FilterableJobType[Any]]]
+        ],
+        event_type: EventType[_DataT] | str,
+        keys: str | Iterable[str],
+        listener: Callable[[Event[_DataT]], Coroutine[Any, Any, None] | None],
+        event_filter: Callable[[_DataT], bool] | None,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type by key."""
+        if event_type not in index:
+            raise HomeAssistantError(
+                f"Event {event_type} does not support listening by entity_id or domain"
+            )
+        if event_filter is not None and not is_callback_check_partial(event_filter):
+            raise HomeAssistantError(f"Event filter {event_filter} is not a callback")
+        keys = (keys,) if isinstance(keys, str) else tuple(keys)
+        filterable_job = (
+            HassJob(listener, f"listen {event_type} {keys}"),
+            event_filter,
+        )
+        keyed_listeners = index[event_type]
+        for key in keys:
+            keyed_listeners[key].append(filterable_job)
+        return functools.partial(
+            self._async_remove_keyed_listener, keyed_listeners, keys, filterable_job
+        )
+
     def listen_once(
         self,
         event_type: EventType[_DataT] | str,
@@ -1728,6 +1857,27 @@ class EventBus:
                 "Unable to remove unknown job listener %s", filterable_job
             )
 
+    @callback
+    def _async_remove_keyed_listener(
+        self,
+        keyed_listeners: defaultdict[str, list[_FilterableJobType[_DataT]]],
+        keys: tuple[str, ...],
+        filterable_job: _FilterableJobType[_DataT],
+    ) -> None:
+        """Remove a listener of a specific event_type by key.
+
+        This method must be run in the event loop.
+        """
+        for key in keys:
+            try:
+                keyed_listeners[key].remove(filterable_job)
+            except ValueError:
+                _LOGGER.exception(
+                    "Unable to remove unknown job listener %s", filterable_job
+                )
+            if not keyed_listeners[key]:
+                del keyed_listeners[key]
+
 
 class CompressedState(TypedDict):
     """Compressed dict of a state."""
@@ -2034,10 +2184,81 @@ class States(UserDict[str, State]):
         return self._domain_index[key].values()
 
 
+def _typed_value(value: Any) -> Any:
+    """Return a value paired with its type.
+
+    True, 1 and 1.0 are equal but serialize differently, the type is
+    part of the value so they are not mistaken for each other.
+    """
+    value_type = type(value)
+    if value_type is tuple or value_type is frozenset:
+        return (value_type, value_type(map(_typed_value, value)))
+    return (value_type, value)
+
+
+def _typed_items(attributes: Mapping[str, Any]) -> frozenset[tuple[str, Any]]:
+    """Return the items of attributes with the types of their values."""
+    return frozenset((key, _typed_value(value)) for key, value in attributes.items())
+
+
+class _AttributesInterner:
+    """Share identical state attributes between states.
+
+    Attributes are looked up by the hash of their items and held by weak
+    reference so they are released once no state uses them anymore.
+    Attributes are only shared when their values also have the same
+    types. Attributes with values that are not hashable are never shared.
+    """
+
+    __slots__ = ("_interned",)
+
+    def __init__(self) -> None:
+        """Initialize the interner."""
+        self._interned: dict[int, weakref.ref[ReadOnlyDict[str, Any]]] = {}
+
+    def intern(self, attributes: Mapping[str, Any]) -> Mapping[str, Any]:
+        """Return a shared ReadOnlyDict equal to attributes if possible."""
+        try:
+            typed_items = _typed_items(attributes)
+            key = hash(typed_items)
+        except TypeError:
+            return attributes
+        if (
+            (ref := self._interned.get(key)) is not None
+            and (interned := ref()) is not None
+            and _typed_items(interned) == typed_items
+        ):
+            return interned
+        if type(attributes) is not ReadOnlyDict:
+            attributes = ReadOnlyDict(attributes)
+        self._interned[key] = weakref.ref(
+            attributes, functools.partial(self._remove, key)
+        )
+        return attributes
+
+    def _remove(self, key: int, ref: weakref.ref[ReadOnlyDict[str, Any]]) -> None:
+        """Remove attributes that are no longer used by any state."""
+        if self._interned.get(key) is ref:
+            del self._interned[key]
+
+
+type _BatchedStateEventType = tuple[
+    EventType[Any], Mapping[str, Any], Context | None, float | None
+]
+
+
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
-    __slots__ = ("_states", "_states_data", "_reservations", "_bus", "_loop")
+    __slots__ = (
+        "_states",
+        "_states_data",
+        "_reservations",
+        "_bus",
+        "_loop",
+        "_batched_events",
+        "_attributes_interner",
+    )
 
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
@@ -2048,6 +2269,9 @@ class StateMachine:
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
+        # Events held back while a batch of states is being written
+        self._batched_events: list[_BatchedStateEventType] | None = None
+        self._attributes_interner: _AttributesInterner | None = None
 
     def entity_ids(self, domain_filter: str | None = None) -> list[str]:
         """List of entity ids that are being tracked."""
@@ -2165,6 +2389,11 @@ class StateMachine:
             "old_state": old_state,
             "new_state": None,
         }
+        if (batched_events := self._batched_events) is not None:
+            batched_events.append(
+                (EVENT_STATE_CHANGED, state_changed_data, context, None)
+            )
+            return True
         self._bus.async_fire_internal(
             EVENT_STATE_CHANGED,
             state_changed_data,
@@ -2311,14 +2540,19 @@ class StateMachine:
             old_last_reported = old_state.last_reported  # type: ignore[union-attr]
             old_state.last_reported = now  # type: ignore[union-attr]
             old_state.last_reported_timestamp = timestamp  # type: ignore[union-attr]
-            # Avoid creating an EventStateReportedData
-            self._bus.async_fire_internal(  # type: ignore[misc]
+            state_reported_data: EventStateReportedData = {
+                "entity_id": entity_id,
+                "old_last_reported": old_last_reported,
+                "new_state": old_state,
+            }
+            if (batched_events := self._batched_events) is not None:
+                batched_events.append(
+                    (EVENT_STATE_REPORTED, state_reported_data, context, timestamp)
+                )
+                return
+            self._bus.async_fire_internal(
                 EVENT_STATE_REPORTED,
-                {
-                    "entity_id": entity_id,
-                    "old_last_reported": old_last_reported,
-                    "new_state": old_state,
-                },
+                state_reported_data,
                 context=context,
                 time_fired=timestamp,
             )
@@ -2328,6 +2562,8 @@ class StateMachine:
             if TYPE_CHECKING:
                 assert old_state is not None
             attributes = old_state.attributes
+        elif attributes and (interner := self._attributes_interner) is not None:
+            attributes = interner.intern(attributes)
 
         # This is intentionally called with positional only arguments for performance
         # reasons
@@ -2351,6 +2587,11 @@ class StateMachine:
             "old_state": old_state,
             "new_state": state,
         }
+        if (batched_events := self._batched_events) is not None:
+            batched_events.append(
+                (EVENT_STATE_CHANGED, state_changed_data, context, timestamp)
+            )
+            return
         self._bus.async_fire_internal(
             EVENT_STATE_CHANGED,
             state_changed_data,
@@ -2358,6 +2599,77 @@ class StateMachine:
             time_fired=timestamp,
         )
 
+    @callback
+    def async_set_intern_attributes(self, enabled: bool) -> None:
+        """Enable or disable sharing identical attributes between states.
+
+        When enabled, states written with attributes equal to the attributes
+        of another state in memory share the same ReadOnlyDict instead of
+        each holding a copy. This trades some CPU time on every state write
+        for lower memory use on large installs.
+
+        This method must be run in the event loop.
+        """
+        if not enabled:
+            self._attributes_interner = None
+        elif self._attributes_interner is None:
+            self._attributes_interner = _AttributesInterner()
+
+    @callback
+    def async_set_many(
+        self,
+        states: Iterable[tuple[str, str, Mapping[str, Any] | None]],
+        force_update: bool = False,
+        context: Context | None = None,
+        timestamp: float | None = None,
+    ) -> None:
+        """Set the state of multiple entities at once.
+
+        states is an iterable of (entity_id, state, attributes) tuples.
+
+        All states share the same context and timestamp and are committed
+        to the state machine before any of the events are fired.
+
+        This method must be run in the event loop.
+        """
+        timestamp = timestamp or time.time()
+        if context is None:
+            context = Context(id=ulid_at_time(timestamp))
+        with self.async_batch_writes():
+            for entity_id, new_state, attributes in states:
+                self.async_set_internal(
+                    entity_id.lower(),
+                    str(new_state),
+                    attributes or {},
+                    force_update,
+                    context,
+                    None,
+                    timestamp,
+                )
+
+    @contextmanager
+    def async_batch_writes(self) -> Generator[None]:
+        """Batch the state writes made within the context.
+
+        States are committed to the state machine as they are written, while
+        the state_changed and state_reported events are held back and fired
+        in one pass when the outermost batch exits.
+
+        This method must be run in the event loop.
+        """
+        if self._batched_events is not None:
+            yield
+            return
+        batched_events: list[_BatchedStateEventType] = []
+        self._batched_events = batched_events
+        try:
+            yield
+        finally:
+            self._batched_events = None
+            fire = self._bus.async_fire_internal
+            for event_type, event_data, context, time_fired in batched_events:
+                fire(event_type, event_data, context=context, time_fired=time_fired)
+
 
 class SupportsResponse(enum.StrEnum):
     """Service call response configuration."""
@@ -533,15 +533,22 @@ class DeviceRegistryItems[_EntryTypeT: (DeviceEntry, DeletedDeviceEntry)](
     def __init__(self) -> None:
         """Initialize the container."""
         super().__init__()
-        self._connections: dict[tuple[str, str], _EntryTypeT] = {}
-        self._identifiers: dict[tuple[str, str], _EntryTypeT] = {}
+        self._connections: dict[tuple[str, str], str] = {}
+        self._identifiers: dict[tuple[str, str], str] = {}
 
     def _index_entry(self, key: str, entry: _EntryTypeT) -> None:
         """Index an entry."""
         for connection in entry.connections:
-            self._connections[connection] = entry
+            self._connections[connection] = key
         for identifier in entry.identifiers:
-            self._identifiers[identifier] = entry
+            self._identifiers[identifier] = key
+
+    def _index_stored(self, key: str, stored: dict[str, Any]) -> None:
+        """Index an entry from its stored data."""
+        for connection in stored["connections"]:
+            self._connections[tuple(connection)] = key
+        for identifier in stored["identifiers"]:
+            self._identifiers[tuple(identifier)] = key
 
     def _unindex_entry(
         self, key: str, replacement_entry: _EntryTypeT | None = None
@@ -562,12 +569,12 @@ class DeviceRegistryItems[_EntryTypeT: (DeviceEntry, DeletedDeviceEntry)](
         if identifiers:
             for identifier in identifiers:
                 if identifier in self._identifiers:
-                    return self._identifiers[identifier]
+                    return self.data[self._identifiers[identifier]]
         if not connections:
             return None
         for connection in _normalize_connections(connections):
             if connection in self._connections:
-                return self._connections[connection]
+                return self.data[self._connections[connection]]
         return None
 
 
@@ -598,6 +605,16 @@ class ActiveDeviceRegistryItems(DeviceRegistryItems[DeviceEntry]):
         for config_entry_id in entry.config_entries:
             self._config_entry_id_index[config_entry_id][key] = True
 
+    def _index_stored(self, key: str, stored: dict[str, Any]) -> None:
+        """Index an entry from its stored data."""
+        super()._index_stored(key, stored)
+        if (area_id := stored["area_id"]) is not None:
+            self._area_id_index[area_id][key] = True
+        for label in stored["labels"]:
+            self._labels_index[label][key] = True
+        for config_entry_id in stored["config_entries"]:
+            self._config_entry_id_index[config_entry_id][key] = True
+
     def _unindex_entry(
         self, key: str, replacement_entry: DeviceEntry | None = None
     ) -> None:
@@ -632,6 +649,59 @@ class ActiveDeviceRegistryItems(DeviceRegistryItems[DeviceEntry]):
         ]
 
 
+def _device_from_storage(device: dict[str, Any]) -> DeviceEntry:
+    """Build a device entry from its stored data."""
+    return DeviceEntry(
+        area_id=device["area_id"],
+        config_entries=set(device["config_entries"]),
+        configuration_url=device["configuration_url"],
+        # type ignores (if tuple arg was cast): likely https://github.com/python/mypy/issues/8625
+        connections={
+            tuple(conn)  # type: ignore[misc]
+            for conn in device["connections"]
+        },
+        created_at=datetime.fromisoformat(device["created_at"]),
+        disabled_by=(
+            DeviceEntryDisabler(device["disabled_by"])
+            if device["disabled_by"]
+            else None
+        ),
+        entry_type=(
+            DeviceEntryType(device["entry_type"]) if device["entry_type"] else None
+        ),
+        hw_version=device["hw_version"],
+        id=device["id"],
+        identifiers={
+            tuple(iden)  # type: ignore[misc]
+            for iden in device["identifiers"]
+        },
+        labels=set(device["labels"]),
+        manufacturer=device["manufacturer"],
+        model=device["model"],
+        model_id=device["model_id"],
+        modified_at=datetime.fromisoformat(device["modified_at"]),
+        name_by_user=device["name_by_user"],
+        name=device["name"],
+        primary_config_entry=device["primary_config_entry"],
+        serial_number=device["serial_number"],
+        sw_version=device["sw_version"],
+        via_device_id=device["via_device_id"],
+    )
+
+
+def _deleted_device_from_storage(device: dict[str, Any]) -> DeletedDeviceEntry:
+    """Build a deleted device entry from its stored data."""
+    return DeletedDeviceEntry(
+        config_entries=set(device["config_entries"]),
+        connections={tuple(conn) for conn in device["connections"]},
+        created_at=datetime.fromisoformat(device["created_at"]),
+        identifiers={tuple(iden) for iden in device["identifiers"]},
+        id=device["id"],
+        modified_at=datetime.fromisoformat(device["modified_at"]),
+        orphaned_timestamp=device["orphaned_timestamp"],
+    )
+
+
 class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
     """Class to hold a registry of devices."""
 
@@ -648,6 +718,7 @@ class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            journal=True,
         )
 
     @callback
@@ -1168,56 +1239,15 @@ class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
         deleted_devices: DeviceRegistryItems[DeletedDeviceEntry] = DeviceRegistryItems()
 
         if data is not None:
-            for device in data["devices"]:
-                devices[device["id"]] = DeviceEntry(
-                    area_id=device["area_id"],
-                    config_entries=set(device["config_entries"]),
-                    configuration_url=device["configuration_url"],
-                    # type ignores (if tuple arg was cast): likely https://github.com/python/mypy/issues/8625
-                    connections={
-                        tuple(conn)  # type: ignore[misc]
-                        for conn in device["connections"]
-                    },
-                    created_at=datetime.fromisoformat(device["created_at"]),
-                    disabled_by=(
-                        DeviceEntryDisabler(device["disabled_by"])
-                        if device["disabled_by"]
-                        else None
-                    ),
-                    entry_type=(
-                        DeviceEntryType(device["entry_type"])
-                        if device["entry_type"]
-                        else None
-                    ),
-                    hw_version=device["hw_version"],
-                    id=device["id"],
-                    identifiers={
-                        tuple(iden)  # type: ignore[misc]
-                        for iden in device["identifiers"]
-                    },
-                    labels=set(device["labels"]),
-                    manufacturer=device["manufacturer"],
-                    model=device["model"],
-                    model_id=device["model_id"],
-                    modified_at=datetime.fromisoformat(device["modified_at"]),
-                    name_by_user=device["name_by_user"],
-                    name=device["name"],
-                    primary_config_entry=device["primary_config_entry"],
-                    serial_number=device["serial_number"],
-                    sw_version=device["sw_version"],
-                    via_device_id=device["via_device_id"],
-                )
+            devices.load_stored(
+                {device["id"]: device for device in data["devices"]},
+                _device_from_storage,
+            )
             # Introduced in 0.111
-            for device in data["deleted_devices"]:
-                deleted_devices[device["id"]] = DeletedDeviceEntry(
-                    config_entries=set(device["config_entries"]),
-                    connections={tuple(conn) for conn in device["connections"]},
-                    created_at=datetime.fromisoformat(device["created_at"]),
-                    identifiers={tuple(iden) for iden in device["identifiers"]},
-                    id=device["id"],
-                    modified_at=datetime.fromisoformat(device["modified_at"]),
-                    orphaned_timestamp=device["orphaned_timestamp"],
-                )
+            deleted_devices.load_stored(
+                {device["id"]: device for device in data["deleted_devices"]},
+                _deleted_device_from_storage,
+            )
 
         self.devices = devices
         self.deleted_devices = deleted_devices
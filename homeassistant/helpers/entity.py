@@ -5,7 +5,8 @@ from __future__ import annotations
 from abc import ABCMeta
 import asyncio
 from collections import deque
-from collections.abc import Callable, Coroutine, Iterable, Mapping
+from collections.abc import Callable, Coroutine, Generator, Iterable, Mapping
+from contextlib import contextmanager
 import dataclasses
 from enum import Enum, IntFlag, auto
 import functools as ft
@@ -57,6 +58,7 @@ from homeassistant.exceptions import (
 from homeassistant.loader import async_suggest_report_issue, bind_hass
 from homeassistant.util import ensure_unique_string, slugify
 from homeassistant.util.frozen_dataclass_compat import FrozenOrThawed
+from homeassistant.util.hass_dict import HassKey
 
 from . import device_registry as dr, entity_registry as er, singleton
 from .device_registry import DeviceInfo, EventDeviceRegistryUpdatedData
@@ -75,6 +77,9 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 SLOW_UPDATE_WARNING = 10
 DATA_ENTITY_SOURCE = "entity_info"
+DATA_BATCHED_STATE_WRITES: HassKey[dict[str, Entity]] = HassKey(
+    "entity_batched_state_writes"
+)
 
 # Used when converting float states to string: limit precision according to machine
 # epsilon to make the string representation readable
@@ -100,6 +105,32 @@ def entity_sources(hass: HomeAssistant) -> dict[str, EntityInfo]:
     return {}
 
 
+@contextmanager
+def async_batch_write_ha_state(hass: HomeAssistant) -> Generator[None]:
+    """Batch the entity state writes made within the context.
+
+    An entity that writes its state more than once within the context
+    only has its state calculated and written once when the context exits.
+    The states are written as one batch so they are all committed to the
+    state machine before any state_changed event is fired.
+
+    Must be run in the event loop.
+    """
+    hass_data = hass.data
+    if DATA_BATCHED_STATE_WRITES in hass_data:
+        yield
+        return
+    batched_writes: dict[str, Entity] = {}
+    hass_data[DATA_BATCHED_STATE_WRITES] = batched_writes
+    try:
+        yield
+    finally:
+        del hass_data[DATA_BATCHED_STATE_WRITES]
+        with hass.states.async_batch_writes():
+            for entity in batched_writes.values():
+                entity._async_write_ha_state()  # noqa: SLF001
+
+
 def generate_entity_id(
     entity_id_format: str,
     name: str | None,
@@ -1112,6 +1143,11 @@ class Entity(
         hass = self.hass
         entity_id = self.entity_id
 
+        if (batched_writes := hass.data.get(DATA_BATCHED_STATE_WRITES)) is not None:
+            # The state is calculated and written once the batch is done
+            batched_writes[entity_id] = self
+            return
+
         if (entry := self.registry_entry) and entry.disabled_by:
             if not self._disabled_reported:
                 self._disabled_reported = True
@@ -73,6 +73,15 @@ PLATFORM_NOT_READY_BASE_WAIT_TIME = 30  # seconds
 
 _LOGGER = getLogger(__name__)
 
+type BatchServiceHandler = Callable[
+    [list[Entity], dict[str, Any]], Coroutine[Any, Any, Iterable[Entity] | None]
+]
+"""Call a service on entities of a platform at once.
+
+Receives the service data without the target fields. Returns the entities
+the service still has to be called on one by one.
+"""
+
 
 class AddEntitiesCallback(Protocol):
     """Protocol type for EntityPlatform.add_entities callback."""
@@ -152,6 +161,9 @@ class EntityPlatform:
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: CALLBACK_TYPE | None = None
         self._process_updates: asyncio.Lock | None = None
+        # Handlers which call a service on many entities at once,
+        # indexed by (domain, service)
+        self.batch_service_handlers: dict[tuple[str, str], BatchServiceHandler] = {}
 
         self.parallel_updates: asyncio.Semaphore | None = None
         self._update_in_sequence: bool = False
@@ -1017,6 +1029,24 @@ class EntityPlatform:
             supports_response,
         )
 
+    @callback
+    def async_register_batch_service_handler(
+        self, service: str, handler: BatchServiceHandler, domain: str | None = None
+    ) -> None:
+        """Register a handler to call a service on many entities at once.
+
+        When a service call targets more than one entity of this platform,
+        the handler is passed all of them instead of calling the service on
+        each entity. This allows an integration to send a single group or
+        multicast command. The domain defaults to the entity domain of the
+        platform.
+
+        Only services which call an entity method by name are batched, the
+        handler is passed the same service data as that method. The handler
+        runs under the parallel updates semaphore of the platform.
+        """
+        self.batch_service_handlers[(domain or self.domain, service)] = handler
+
     async def _async_update_entity_states(self) -> None:
         """Update the states of all the polling entities.
 
@@ -552,7 +552,7 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
     def __init__(self) -> None:
         """Initialize the container."""
         super().__init__()
-        self._entry_ids: dict[str, RegistryEntry] = {}
+        self._entry_ids: dict[str, str] = {}
         self._index: dict[tuple[str, str, str], str] = {}
         self._config_entry_id_index: RegistryIndexType = defaultdict(dict)
         self._device_id_index: RegistryIndexType = defaultdict(dict)
@@ -561,7 +561,7 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
 
     def _index_entry(self, key: str, entry: RegistryEntry) -> None:
         """Index an entry."""
-        self._entry_ids[entry.id] = entry
+        self._entry_ids[entry.id] = key
         self._index[(entry.domain, entry.platform, entry.unique_id)] = entry.entity_id
         # python has no ordered set, so we use a dict with True values
         # https://discuss.python.org/t/add-orderedset-to-stdlib/12730
@@ -574,6 +574,20 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
         for label in entry.labels:
             self._labels_index[label][key] = True
 
+    def _index_stored(self, key: str, stored: dict[str, Any]) -> None:
+        """Index an entry from its stored data."""
+        self._entry_ids[stored["id"]] = key
+        domain = split_entity_id(key)[0]
+        self._index[(domain, stored["platform"], stored["unique_id"])] = key
+        if (config_entry_id := stored["config_entry_id"]) is not None:
+            self._config_entry_id_index[config_entry_id][key] = True
+        if (device_id := stored["device_id"]) is not None:
+            self._device_id_index[device_id][key] = True
+        if (area_id := stored["area_id"]) is not None:
+            self._area_id_index[area_id][key] = True
+        for label in stored["labels"]:
+            self._labels_index[label][key] = True
+
     def _unindex_entry(
         self, key: str, replacement_entry: RegistryEntry | None = None
     ) -> None:
@@ -601,7 +615,9 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
 
     def get_entry(self, key: str) -> RegistryEntry | None:
         """Get entry from id."""
-        return self._entry_ids.get(key)
+        if (entity_id := self._entry_ids.get(key)) is None:
+            return None
+        return self.data[entity_id]
 
     def get_entries_for_device_id(
         self, device_id: str, include_disabled_entities: bool = False
@@ -634,6 +650,46 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
         return [data[key] for key in self._labels_index.get(label, ())]
 
 
+def _entry_from_storage(entity: dict[str, Any]) -> RegistryEntry:
+    """Build a registry entry from its stored data."""
+    return RegistryEntry(
+        aliases=set(entity["aliases"]),
+        area_id=entity["area_id"],
+        categories=entity["categories"],
+        capabilities=entity["capabilities"],
+        config_entry_id=entity["config_entry_id"],
+        created_at=datetime.fromisoformat(entity["created_at"]),
+        device_class=entity["device_class"],
+        device_id=entity["device_id"],
+        disabled_by=RegistryEntryDisabler(entity["disabled_by"])
+        if entity["disabled_by"]
+        else None,
+        entity_category=EntityCategory(entity["entity_category"])
+        if entity["entity_category"]
+        else None,
+        entity_id=entity["entity_id"],
+        hidden_by=RegistryEntryHider(entity["hidden_by"])
+        if entity["hidden_by"]
+        else None,
+        icon=entity["icon"],
+        id=entity["id"],
+        has_entity_name=entity["has_entity_name"],
+        labels=set(entity["labels"]),
+        modified_at=datetime.fromisoformat(entity["modified_at"]),
+        name=entity["name"],
+        options=entity["options"],
+        original_device_class=entity["original_device_class"],
+        original_icon=entity["original_icon"],
+        original_name=entity["original_name"],
+        platform=entity["platform"],
+        supported_features=entity["supported_features"],
+        translation_key=entity["translation_key"],
+        unique_id=entity["unique_id"],
+        previous_unique_id=entity["previous_unique_id"],
+        unit_of_measurement=entity["unit_of_measurement"],
+    )
+
+
 def _validate_item(
     hass: HomeAssistant,
     domain: str,
@@ -704,6 +760,7 @@ class EntityRegistry(BaseRegistry):
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            journal=True,
         )
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED,
@@ -1251,6 +1308,7 @@ class EntityRegistry(BaseRegistry):
 
         data = await self._store.async_load()
         entities = EntityRegistryItems()
+        stored_entities: dict[str, dict[str, Any]] = {}
         deleted_entities: dict[tuple[str, str, str], DeletedRegistryEntry] = {}
 
         if data is not None:
@@ -1280,42 +1338,7 @@ class EntityRegistry(BaseRegistry):
                     )
                     continue
 
-                entities[entity["entity_id"]] = RegistryEntry(
-                    aliases=set(entity["aliases"]),
-                    area_id=entity["area_id"],
-                    categories=entity["categories"],
-                    capabilities=entity["capabilities"],
-                    config_entry_id=entity["config_entry_id"],
-                    created_at=datetime.fromisoformat(entity["created_at"]),
-                    device_class=entity["device_class"],
-                    device_id=entity["device_id"],
-                    disabled_by=RegistryEntryDisabler(entity["disabled_by"])
-                    if entity["disabled_by"]
-                    else None,
-                    entity_category=EntityCategory(entity["entity_category"])
-                    if entity["entity_category"]
-                    else None,
-                    entity_id=entity["entity_id"],
-                    hidden_by=RegistryEntryHider(entity["hidden_by"])
-                    if entity["hidden_by"]
-                    else None,
-                    icon=entity["icon"],
-                    id=entity["id"],
-                    has_entity_name=entity["has_entity_name"],
-                    labels=set(entity["labels"]),
-                    modified_at=datetime.fromisoformat(entity["modified_at"]),
-                    name=entity["name"],
-                    options=entity["options"],
-                    original_device_class=entity["original_device_class"],
-                    original_icon=entity["original_icon"],
-                    original_name=entity["original_name"],
-                    platform=entity["platform"],
-                    supported_features=entity["supported_features"],
-                    translation_key=entity["translation_key"],
-                    unique_id=entity["unique_id"],
-                    previous_unique_id=entity["previous_unique_id"],
-                    unit_of_measurement=entity["unit_of_measurement"],
-                )
+                stored_entities[entity["entity_id"]] = entity
             for entity in data["deleted_entities"]:
                 try:
                     domain = split_entity_id(entity["entity_id"])[0]
@@ -1344,6 +1367,7 @@ class EntityRegistry(BaseRegistry):
                     unique_id=entity["unique_id"],
                 )
 
+        entities.load_stored(stored_entities, _entry_from_storage)
         self.deleted_entities = deleted_entities
         self.entities = entities
         self._entities_data = entities.data
@@ -107,14 +107,20 @@ class _KeyedEventTracker(Generic[_TypedDictT]):
         ],
         None,
     ]
-    filter_callable: Callable[
-        [
-            HomeAssistant,
-            dict[str, list[HassJob[[Event[_TypedDictT]], Any]]],
-            _TypedDictT,
-        ],
-        bool,
-    ]
+    filter_callable: (
+        Callable[
+            [
+                HomeAssistant,
+                dict[str, list[HassJob[[Event[_TypedDictT]], Any]]],
+                _TypedDictT,
+            ],
+            bool,
+        ]
+        | None
+    ) = None
+    # If set, each key is registered with the EventBus entity_id index
+    # instead of filtering every event of event_type
+    keyed_by_entity_id: bool = False
 
 
 @dataclass(slots=True, frozen=True)
@@ -123,6 +129,8 @@ class _KeyedEventData(Generic[_TypedDictT]):
 
     listener: CALLBACK_TYPE
     callbacks: defaultdict[str, list[HassJob[[Event[_TypedDictT]], Any]]]
+    key_listeners: dict[str, CALLBACK_TYPE] | None = None
+    dispatcher: Callable[[Event[_TypedDictT]], None] | None = None
 
 
 @dataclass(slots=True)
@@ -358,21 +366,11 @@ def _async_dispatch_entity_id_event(
             )
 
 
-@callback
-def _async_state_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[_StateEventDataT]], Any]]],
-    event_data: _StateEventDataT,
-) -> bool:
-    """Filter state changes by entity_id."""
-    return event_data["entity_id"] in callbacks
-
-
 _KEYED_TRACK_STATE_CHANGE = _KeyedEventTracker(
     key=_TRACK_STATE_CHANGE_DATA,
     event_type=EVENT_STATE_CHANGED,
     dispatcher_callable=_async_dispatch_entity_id_event_soon,
-    filter_callable=_async_state_filter,
+    keyed_by_entity_id=True,
 )
 
 
@@ -393,7 +391,7 @@ _KEYED_TRACK_STATE_REPORT = _KeyedEventTracker(
     key=_TRACK_STATE_REPORT_DATA,
     event_type=EVENT_STATE_REPORTED,
     dispatcher_callable=_async_dispatch_entity_id_event,
-    filter_callable=_async_state_filter,
+    keyed_by_entity_id=True,
 )
 
 
@@ -423,10 +421,13 @@ def _remove_listener(
     callbacks: dict[str, list[HassJob[[Event[_TypedDictT]], Any]]],
 ) -> None:
     """Remove listener."""
+    key_listeners = hass.data[tracker.key].key_listeners
     for key in keys:
         callbacks[key].remove(job)
         if not callbacks[key]:
             del callbacks[key]
+            if key_listeners is not None:
+                key_listeners.pop(key)()
 
     if not callbacks:
         hass.data.pop(tracker.key).listener()
@@ -455,17 +456,39 @@ def _async_track_event(
         callbacks = event_data.callbacks
     else:
         callbacks = defaultdict(list)
-        listener = hass.bus.async_listen(
-            tracker.event_type,
-            partial(tracker.dispatcher_callable, hass, callbacks),
-            event_filter=partial(tracker.filter_callable, hass, callbacks),
-        )
-        event_data = _KeyedEventData(listener, callbacks)
+        if tracker.keyed_by_entity_id:
+            event_data = _KeyedEventData(
+                _remove_empty_listener,
+                callbacks,
+                {},
+                partial(tracker.dispatcher_callable, hass, callbacks),
+            )
+        else:
+            assert tracker.filter_callable is not None
+            listener = hass.bus.async_listen(
+                tracker.event_type,
+                partial(tracker.dispatcher_callable, hass, callbacks),
+                event_filter=partial(tracker.filter_callable, hass, callbacks),
+            )
+            event_data = _KeyedEventData(listener, callbacks)
         hass_data[tracker_key] = event_data
 
     job = HassJob(action, f"track {tracker.event_type} event {keys}", job_type=job_type)
 
-    if isinstance(keys, str):
+    if (key_listeners := event_data.key_listeners) is not None:
+        # The EventBus routes the event by entity_id so the
+        # dispatcher only needs to be registered once per key
+        if isinstance(keys, str):
+            keys = (keys,)
+        dispatcher = event_data.dispatcher
+        assert dispatcher is not None
+        for key in keys:
+            if key not in callbacks:
+                key_listeners[key] = hass.bus.async_listen_entity_ids(
+                    tracker.event_type, key, dispatcher
+                )
+            callbacks[key].append(job)
+    elif isinstance(keys, str):
         # Almost all calls to this function use a single key
         # so we optimize for that case. We don't use setdefault
         # here because this function gets called ~20000 times
@@ -1131,6 +1154,15 @@ class TrackTemplateResultInfo:
             if not _event_triggers_rerender(event, info):
                 return False
 
+            if not _event_changes_template_dependencies(self.hass, event, template):
+                template.skipped_renders += 1
+                _LOGGER.debug(
+                    "Template update %s skipped, event changed nothing it reads: %s",
+                    template.template,
+                    event,
+                )
+                return False
+
             had_timer = self._rate_limit.async_has_timer(template)
 
             if self._rate_limit.async_schedule_action(
@@ -1960,6 +1992,30 @@ def _event_triggers_rerender(
     return bool(info.filter_lifecycle(entity_id))
 
 
+@callback
+def _event_changes_template_dependencies(
+    hass: HomeAssistant, event: Event[EventStateChangedData], template: Template
+) -> bool:
+    """Determine if an event changes anything a template reads from states."""
+    if (dependencies := template.async_dependencies()) is None:
+        return True
+
+    data = event.data
+    old_state = data["old_state"]
+    new_state = data["new_state"]
+    if old_state is None or new_state is None:
+        return True
+
+    # Events are dispatched after they are fired and a render reads the
+    # current state. If the entity was written again in the meantime,
+    # e.g. a template entity writing its own state, the render would not
+    # see new_state so the event cannot be skipped.
+    if hass.states.get(data["entity_id"]) is not new_state:
+        return True
+
+    return dependencies.state_changed(old_state, new_state)
+
+
 @callback
 def _rate_limit_for_event(
     event: Event[EventStateChangedData],
@@ -0,0 +1,155 @@
+"""Snapshot of the resolved integrations to speed up startup."""
+
+from __future__ import annotations
+
+import logging
+import os
+import pathlib
+import sysconfig
+from typing import TypedDict
+
+from homeassistant import loader, requirements
+from homeassistant.const import __version__
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+from . import singleton
+from .storage import Store
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_KEY = "core.integration_snapshot"
+STORAGE_VERSION = 1
+SAVE_DELAY = 60
+
+DATA_INTEGRATION_SNAPSHOT: HassKey[IntegrationSnapshotStore] = HassKey(
+    "integration_snapshot"
+)
+
+
+class Fingerprint(TypedDict):
+    """What a snapshot is valid for."""
+
+    ha_version: str
+    custom_components: dict[str, float]
+    packages: dict[str, float]
+
+
+class SnapshotData(TypedDict):
+    """Stored snapshot."""
+
+    fingerprint: Fingerprint
+    integrations: dict[str, loader.IntegrationSnapshot]
+    requirements: list[str]
+
+
+def _mtimes(paths: list[pathlib.Path]) -> dict[str, float]:
+    """Return the modification time of the paths that exist."""
+    mtimes: dict[str, float] = {}
+    for path in paths:
+        try:
+            mtimes[str(path)] = path.stat().st_mtime
+        except OSError:
+            continue
+    return mtimes
+
+
+def _get_fingerprint(config_dir: str) -> Fingerprint:
+    """Return the fingerprint of the current installation.
+
+    Installing or removing a package changes the modification time of
+    the directory it is installed in, and editing a custom integration
+    changes the modification time of its manifest.
+    """
+    custom_components = pathlib.Path(config_dir, "custom_components")
+    try:
+        manifests = [
+            entry / "manifest.json"
+            for entry in custom_components.iterdir()
+            if entry.is_dir()
+        ]
+    except OSError:
+        manifests = []
+    return {
+        "ha_version": __version__,
+        "custom_components": _mtimes([custom_components, *manifests]),
+        "packages": _mtimes(
+            [
+                pathlib.Path(path)
+                for path in (
+                    sysconfig.get_path("purelib"),
+                    sysconfig.get_path("platlib"),
+                    os.path.join(config_dir, "deps"),
+                )
+            ]
+        ),
+    }
+
+
+class IntegrationSnapshotStore:
+    """Load and save the snapshot of the resolved integrations."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the snapshot store."""
+        self.hass = hass
+        self._store = Store[SnapshotData](hass, STORAGE_VERSION, STORAGE_KEY)
+        self._fingerprint: Fingerprint | None = None
+        self._data: SnapshotData | None = None
+
+    async def async_load(self) -> bool:
+        """Restore the resolved integrations if the snapshot is still valid.
+
+        Returns True if the snapshot was restored.
+        """
+        hass = self.hass
+        self._fingerprint = await hass.async_add_executor_job(
+            _get_fingerprint, hass.config.config_dir
+        )
+        if (data := await self._store.async_load()) is None:
+            return False
+        if data["fingerprint"] != self._fingerprint:
+            _LOGGER.debug("Integration snapshot is outdated")
+            return False
+        self._data = data
+        custom = await loader.async_get_custom_components(hass)
+        restored = loader.async_restore_integrations_snapshot(
+            hass, data["integrations"], custom
+        )
+        requirements.async_mark_requirements_installed(hass, data["requirements"])
+        _LOGGER.debug("Restored %s integrations from snapshot", restored)
+        return True
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Save the snapshot if the resolved integrations changed."""
+        if self._fingerprint is None:
+            return
+        data: SnapshotData = {
+            "fingerprint": self._fingerprint,
+            "integrations": loader.async_get_integrations_snapshot(self.hass),
+            "requirements": sorted(
+                requirements.async_get_installed_requirements(self.hass)
+            ),
+        }
+        if data == self._data:
+            return
+        self._data = data
+        self._store.async_delay_save(lambda: data, SAVE_DELAY)
+
+
+@callback
+@singleton.singleton(DATA_INTEGRATION_SNAPSHOT)
+def async_get_snapshot_store(hass: HomeAssistant) -> IntegrationSnapshotStore:
+    """Return the integration snapshot store."""
+    return IntegrationSnapshotStore(hass)
+
+
+async def async_load(hass: HomeAssistant) -> bool:
+    """Restore the resolved integrations from the snapshot."""
+    return await async_get_snapshot_store(hass).async_load()
+
+
+@callback
+def async_schedule_save(hass: HomeAssistant) -> None:
+    """Save the resolved integrations to the snapshot."""
+    async_get_snapshot_store(hass).async_schedule_save()
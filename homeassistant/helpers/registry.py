@@ -4,8 +4,17 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from collections import UserDict, defaultdict
-from collections.abc import Mapping, Sequence, ValuesView
-from typing import TYPE_CHECKING, Any, Literal
+from collections.abc import (
+    Callable,
+    ItemsView,
+    Iterator,
+    KeysView,
+    Mapping,
+    Sequence,
+    ValuesView,
+)
+from itertools import count
+from typing import TYPE_CHECKING, Any, Literal, Self
 
 from homeassistant.core import CoreState, HomeAssistant, callback
 
@@ -17,16 +26,227 @@ SAVE_DELAY_LONG = 180
 
 type RegistryIndexType = defaultdict[str, dict[str, Literal[True]]]
 
+# Shared by all registry items so a new container also gets a new generation
+_GENERATIONS = count(1)
+
+
+class LazyRegistryData[_DataT](dict[str, _DataT]):
+    """Registry entries which are built from their stored data on first access.
+
+    Loading a large registry only has to index the stored data, an entry
+    is built when it is looked up. Iterating builds the remaining entries
+    and restores the order of the stored data.
+
+    The dict methods which would only see the built entries are overridden
+    to build the remaining entries first. If building an entry fails, the
+    stored data is kept so the data is unchanged.
+    """
+
+    __slots__ = ("_factory", "_order", "_stored")
+
+    def __init__(
+        self,
+        factory: Callable[[dict[str, Any]], _DataT],
+        stored: dict[str, dict[str, Any]],
+    ) -> None:
+        """Initialize the data."""
+        super().__init__()
+        self._factory = factory
+        self._stored = stored
+        self._order: dict[str, None] = dict.fromkeys(stored)
+
+    @property
+    def unbuilt(self) -> int:
+        """Return the number of entries which have not been built yet."""
+        return len(self._stored)
+
+    def __missing__(self, key: str) -> _DataT:
+        """Build an entry from its stored data."""
+        if (stored := self._stored.get(key)) is None:
+            raise KeyError(key)
+        entry = self._factory(stored)
+        del self._stored[key]
+        super().__setitem__(key, entry)
+        return entry
+
+    def _build_all(self) -> None:
+        """Build the remaining entries."""
+        if not (stored := self._stored):
+            return
+        factory = self._factory
+        built = dict(super().items())
+        entries: dict[str, _DataT] = {}
+        for key in self._order:
+            if key in stored:
+                entries[key] = factory(stored[key])
+            elif key in built:
+                entries[key] = built.pop(key)
+        # Entries added after loading
+        entries.update(built)
+        super().clear()
+        super().update(entries)
+        self._stored = {}
+        self._order.clear()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return an entry, building it if needed."""
+        if self._stored and key in self._stored:
+            return self[key]
+        return super().get(key, default)
+
+    def __contains__(self, key: object) -> bool:
+        """Return if there is an entry for the key."""
+        return super().__contains__(key) or key in self._stored
+
+    def __len__(self) -> int:
+        """Return the number of entries."""
+        return super().__len__() + len(self._stored)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate the keys."""
+        self._build_all()
+        return super().__iter__()
+
+    def __reversed__(self) -> Iterator[str]:
+        """Iterate the keys in reverse order."""
+        self._build_all()
+        return super().__reversed__()
+
+    def keys(self) -> KeysView[str]:  # type: ignore[override]
+        """Return the keys."""
+        self._build_all()
+        return super().keys()
+
+    def values(self) -> ValuesView[_DataT]:  # type: ignore[override]
+        """Return the entries."""
+        self._build_all()
+        return super().values()
+
+    def items(self) -> ItemsView[str, _DataT]:  # type: ignore[override]
+        """Return the keys and entries."""
+        self._build_all()
+        return super().items()
+
+    def __setitem__(self, key: str, entry: _DataT) -> None:
+        """Set an entry."""
+        if self._stored:
+            self._stored.pop(key, None)
+        super().__setitem__(key, entry)
+
+    def __delitem__(self, key: str) -> None:
+        """Remove an entry."""
+        self._order.pop(key, None)
+        if self._stored.pop(key, None) is None:
+            super().__delitem__(key)
+
+    def __eq__(self, other: object) -> bool:
+        """Return if the entries are equal to other."""
+        self._build_all()
+        if isinstance(other, LazyRegistryData):
+            other._build_all()  # noqa: SLF001
+        return super().__eq__(other)
+
+    def __ne__(self, other: object) -> bool:
+        """Return if the entries are not equal to other."""
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        """Return the representation of the entries."""
+        self._build_all()
+        return super().__repr__()
+
+    def __or__(self, other: dict[str, _DataT]) -> dict[str, _DataT]:  # type: ignore[override]
+        """Return a dict of the entries updated with other."""
+        return self.copy() | other
+
+    def __ror__(self, other: dict[str, _DataT]) -> dict[str, _DataT]:  # type: ignore[override]
+        """Return other updated with the entries."""
+        return other | self.copy()
+
+    def __ior__(self, other: dict[str, _DataT]) -> Self:  # type: ignore[override]
+        """Update the entries with other."""
+        self.update(other)
+        return self
+
+    def copy(self) -> dict[str, _DataT]:
+        """Return a dict of the entries."""
+        return dict(self.items())
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        """Update the entries."""
+        for key, entry in dict(*args, **kwargs).items():
+            self[key] = entry
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        """Return an entry, setting it to default if there is none."""
+        if key in self:
+            return self[key]
+        self[key] = default
+        return default
+
+    def pop(self, key: str, *args: Any) -> Any:
+        """Remove an entry and return it."""
+        if key in self._stored:
+            self[key]  # noqa: B018
+        self._order.pop(key, None)
+        return super().pop(key, *args)
+
+    def popitem(self) -> tuple[str, _DataT]:
+        """Remove the last entry and return it."""
+        self._build_all()
+        return super().popitem()
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._stored = {}
+        self._order.clear()
+        super().clear()
+
 
 class BaseRegistryItems[_DataT](UserDict[str, _DataT], ABC):
-    """Base class for registry items."""
+    """Base class for registry items.
+
+    The generation increases every time an item is added, replaced or
+    removed, it can be compared to find out if anything derived from the
+    items is out of date.
+    """
 
     data: dict[str, _DataT]
 
+    def __init__(self) -> None:
+        """Initialize the container."""
+        super().__init__()
+        self.generation = next(_GENERATIONS)
+
     def values(self) -> ValuesView[_DataT]:
         """Return the underlying values to avoid __iter__ overhead."""
         return self.data.values()
 
+    def load_stored(
+        self,
+        stored: dict[str, dict[str, Any]],
+        factory: Callable[[dict[str, Any]], _DataT],
+    ) -> None:
+        """Load entries from their stored data.
+
+        The indexes are built right away, the entries are built by the
+        factory when they are first accessed. Must be called before any
+        entries are added.
+        """
+        self.data = LazyRegistryData(factory, stored)
+        self.generation = next(_GENERATIONS)
+        for key, stored_entry in stored.items():
+            self._index_stored(key, stored_entry)
+
+    def _index_stored(self, key: str, stored: dict[str, Any]) -> None:
+        """Index an entry from its stored data.
+
+        Containers should override this to avoid building the entry.
+        """
+        self._index_entry(key, self.data[key])
+
     @abstractmethod
     def _index_entry(self, key: str, entry: _DataT) -> None:
         """Index an entry."""
@@ -42,6 +262,7 @@ class BaseRegistryItems[_DataT](UserDict[str, _DataT], ABC):
             self._unindex_entry(key, entry)
         data[key] = entry
         self._index_entry(key, entry)
+        self.generation = next(_GENERATIONS)
 
     def _unindex_entry_value(
         self, key: str, value: str, index: RegistryIndexType
@@ -61,6 +282,7 @@ class BaseRegistryItems[_DataT](UserDict[str, _DataT], ABC):
         """Remove an item."""
         self._unindex_entry(key)
         super().__delitem__(key)
+        self.generation = next(_GENERATIONS)
 
 
 class BaseRegistry[_StoreDataT: Mapping[str, Any] | Sequence[Any]](ABC):
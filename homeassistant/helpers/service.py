@@ -67,6 +67,7 @@ from .typing import ConfigType, TemplateVarsType, VolSchemaType
 
 if TYPE_CHECKING:
     from .entity import Entity
+    from .entity_platform import BatchServiceHandler, EntityPlatform
 
 CONF_SERVICE_ENTITY_ID = "entity_id"
 
@@ -78,6 +79,7 @@ SERVICE_DESCRIPTION_CACHE: HassKey[dict[tuple[str, str], dict[str, Any] | None]]
 ALL_SERVICE_DESCRIPTIONS_CACHE: HassKey[
     tuple[set[tuple[str, str]], dict[str, dict[str, Any]]]
 ] = HassKey("all_service_descriptions_cache")
+TARGET_INDEX: HassKey[TargetIndex] = HassKey("service_target_index")
 
 
 @cache
@@ -304,6 +306,155 @@ class SelectedEntities:
         )
 
 
+class TargetIndex:
+    """Index of what the area, device, floor and label targets resolve to.
+
+    Targets are resolved from the registries on first use and kept until
+    the area, device or entity registry items change, so resolving a target
+    again only costs the size of the result. The generation of the items is
+    checked when a target is resolved, so a target resolved while the
+    registry updated events are dispatched is not out of date.
+    """
+
+    __slots__ = (
+        "_area_devices",
+        "_area_entities",
+        "_device_entities",
+        "_floor_areas",
+        "_generation",
+        "_hass",
+        "_label_targets",
+    )
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index."""
+        self._hass = hass
+        self._floor_areas: dict[str, frozenset[str]] = {}
+        self._area_devices: dict[str, frozenset[str]] = {}
+        self._area_entities: dict[str, frozenset[str]] = {}
+        self._device_entities: dict[str, tuple[frozenset[str], frozenset[str]]] = {}
+        self._label_targets: dict[
+            str, tuple[frozenset[str], frozenset[str], frozenset[str]]
+        ] = {}
+        self._generation = 0
+
+    @callback
+    def async_validate(self) -> None:
+        """Drop the resolved targets if the registry items have changed.
+
+        The generations of all registry items come from one counter, so
+        the highest generation changes when any of the items change or are
+        replaced.
+        """
+        hass = self._hass
+        generation = max(
+            area_registry.async_get(hass).areas.generation,
+            device_registry.async_get(hass).devices.generation,
+            entity_registry.async_get(hass).entities.generation,
+        )
+        if generation == self._generation:
+            return
+        self._generation = generation
+        self._floor_areas.clear()
+        self._area_devices.clear()
+        self._area_entities.clear()
+        self._device_entities.clear()
+        self._label_targets.clear()
+
+    @callback
+    def async_floor_areas(self, floor_id: str) -> frozenset[str]:
+        """Return the areas on a floor."""
+        if (area_ids := self._floor_areas.get(floor_id)) is None:
+            areas = area_registry.async_get(self._hass).areas
+            area_ids = self._floor_areas[floor_id] = frozenset(
+                area_entry.id for area_entry in areas.get_areas_for_floor(floor_id)
+            )
+        return area_ids
+
+    @callback
+    def async_area_devices(self, area_id: str) -> frozenset[str]:
+        """Return the devices in an area."""
+        if (device_ids := self._area_devices.get(area_id)) is None:
+            devices = device_registry.async_get(self._hass).devices
+            device_ids = self._area_devices[area_id] = frozenset(
+                device_entry.id
+                for device_entry in devices.get_devices_for_area_id(area_id)
+            )
+        return device_ids
+
+    @callback
+    def async_area_entities(self, area_id: str) -> frozenset[str]:
+        """Return the entities which have their area set to an area."""
+        if (entity_ids := self._area_entities.get(area_id)) is None:
+            entities = entity_registry.async_get(self._hass).entities
+            entity_ids = self._area_entities[area_id] = frozenset(
+                entry.entity_id
+                for entry in entities.get_entries_for_area_id(area_id)
+                # Do not add entities which are hidden or which are config
+                # or diagnostic entities.
+                if entry.entity_category is None and entry.hidden_by is None
+            )
+        return entity_ids
+
+    @callback
+    def async_device_entities(
+        self, device_id: str
+    ) -> tuple[frozenset[str], frozenset[str]]:
+        """Return the entities of a device.
+
+        The first set only has the entities without an area of their own,
+        the second set has all entities of the device.
+        """
+        if (device_entities := self._device_entities.get(device_id)) is None:
+            entities = entity_registry.async_get(self._hass).entities
+            entries = [
+                entry
+                for entry in entities.get_entries_for_device_id(device_id)
+                # Do not add entities which are hidden or which are config
+                # or diagnostic entities.
+                if entry.entity_category is None and entry.hidden_by is None
+            ]
+            device_entities = self._device_entities[device_id] = (
+                frozenset(entry.entity_id for entry in entries if not entry.area_id),
+                frozenset(entry.entity_id for entry in entries),
+            )
+        return device_entities
+
+    @callback
+    def async_label_targets(
+        self, label_id: str
+    ) -> tuple[frozenset[str], frozenset[str], frozenset[str]]:
+        """Return the entities, devices and areas with a label."""
+        if (label_targets := self._label_targets.get(label_id)) is None:
+            entities = entity_registry.async_get(self._hass).entities
+            devices = device_registry.async_get(self._hass).devices
+            areas = area_registry.async_get(self._hass).areas
+            label_targets = self._label_targets[label_id] = (
+                frozenset(
+                    entry.entity_id
+                    for entry in entities.get_entries_for_label(label_id)
+                    if entry.entity_category is None and entry.hidden_by is None
+                ),
+                frozenset(
+                    device_entry.id
+                    for device_entry in devices.get_devices_for_label(label_id)
+                ),
+                frozenset(
+                    area_entry.id for area_entry in areas.get_areas_for_label(label_id)
+                ),
+            )
+        return label_targets
+
+
+@callback
+def async_get_target_index(hass: HomeAssistant) -> TargetIndex:
+    """Return the target index, dropping targets resolved before a registry change."""
+    if (index := hass.data.get(TARGET_INDEX)) is None:
+        index = hass.data[TARGET_INDEX] = TargetIndex(hass)
+    index.async_validate()
+    return index
+
+
 @bind_hass
 def call_from_config(
     hass: HomeAssistant,
@@ -529,7 +680,7 @@ def async_extract_referenced_entity_ids(  # noqa: C901
     ):
         return selected
 
-    entities = entity_registry.async_get(hass).entities
+    index = async_get_target_index(hass)
     dev_reg = device_registry.async_get(hass)
     area_reg = area_registry.async_get(hass)
 
@@ -553,71 +704,41 @@ def async_extract_referenced_entity_ids(  # noqa: C901
             if label_id not in label_reg.labels:
                 selected.missing_labels.add(label_id)
 
-            for entity_entry in entities.get_entries_for_label(label_id):
-                if (
-                    entity_entry.entity_category is None
-                    and entity_entry.hidden_by is None
-                ):
-                    selected.indirectly_referenced.add(entity_entry.entity_id)
-
-            for device_entry in dev_reg.devices.get_devices_for_label(label_id):
-                selected.referenced_devices.add(device_entry.id)
-
-            for area_entry in area_reg.areas.get_areas_for_label(label_id):
-                selected.referenced_areas.add(area_entry.id)
+            label_entities, label_devices, label_areas = index.async_label_targets(
+                label_id
+            )
+            selected.indirectly_referenced.update(label_entities)
+            selected.referenced_devices.update(label_devices)
+            selected.referenced_areas.update(label_areas)
 
     # Find areas for targeted floors
-    if selector.floor_ids:
-        selected.referenced_areas.update(
-            area_entry.id
-            for floor_id in selector.floor_ids
-            for area_entry in area_reg.areas.get_areas_for_floor(floor_id)
-        )
+    for floor_id in selector.floor_ids:
+        selected.referenced_areas.update(index.async_floor_areas(floor_id))
 
     # Find devices for targeted areas
     selected.referenced_devices.update(selector.device_ids)
 
     selected.referenced_areas.update(selector.area_ids)
-    if selected.referenced_areas:
-        for area_id in selected.referenced_areas:
-            selected.referenced_devices.update(
-                device_entry.id
-                for device_entry in dev_reg.devices.get_devices_for_area_id(area_id)
-            )
+    for area_id in selected.referenced_areas:
+        selected.referenced_devices.update(index.async_area_devices(area_id))
 
     if not selected.referenced_areas and not selected.referenced_devices:
         return selected
 
     # Add indirectly referenced by area
-    selected.indirectly_referenced.update(
-        entry.entity_id
-        for area_id in selected.referenced_areas
+    for area_id in selected.referenced_areas:
         # The entity's area matches a targeted area
-        for entry in entities.get_entries_for_area_id(area_id)
-        # Do not add entities which are hidden or which are config
-        # or diagnostic entities.
-        if entry.entity_category is None and entry.hidden_by is None
-    )
+        selected.indirectly_referenced.update(index.async_area_entities(area_id))
     # Add indirectly referenced by device
-    selected.indirectly_referenced.update(
-        entry.entity_id
-        for device_id in selected.referenced_devices
-        for entry in entities.get_entries_for_device_id(device_id)
-        # Do not add entities which are hidden or which are config
-        # or diagnostic entities.
-        if (
-            entry.entity_category is None
-            and entry.hidden_by is None
-            and (
-                # The entity's device matches a device referenced
-                # by an area and the entity
-                # has no explicitly set area
-                not entry.area_id
-                # The entity's device matches a targeted device
-                or device_id in selector.device_ids
-            )
-        )
-    )
+    for device_id in selected.referenced_devices:
+        without_area, all_entities = index.async_device_entities(device_id)
+        if device_id in selector.device_ids:
+            # The entity's device matches a targeted device
+            selected.indirectly_referenced.update(all_entities)
+        else:
+            # The entity's device matches a device referenced by an
+            # area and the entity has no explicitly set area
+            selected.indirectly_referenced.update(without_area)
     return selected
 
 
@@ -1006,27 +1127,61 @@ async def entity_service_call(
             await entity.async_update_ha_state(True)
         return {entity.entity_id: single_response} if return_response else None
 
+    batches: list[list[Entity]] = []
+    batch_calls: list[Coroutine[Any, Any, list[Entity]]] = []
+    if not return_response and isinstance(data, dict):
+        # Services with a handler function may process the data per entity,
+        # only services which call an entity method are batched
+        entities, handler_batches = _async_split_batches(entities, call)
+        batches = [batch for _, batch in handler_batches]
+        batch_calls = [
+            _async_handle_batch_call(handler, batch, data, call.context)
+            for handler, batch in handler_batches
+        ]
+
     # Use asyncio.gather here to ensure the returned results
     # are in the same order as the entities list
-    results: list[ServiceResponse | BaseException] = await asyncio.gather(
+    results: list[Any] = await asyncio.gather(
         *[
             entity.async_request_call(
                 _handle_entity_call(hass, entity, func, data, call.context)
             )
             for entity in entities
         ],
+        *batch_calls,
         return_exceptions=True,
     )
+    entity_results: list[ServiceResponse | BaseException] = results[: len(entities)]
+
+    batched, unhandled, batch_errors = _async_collect_batch_results(
+        batches, results[len(entities) :]
+    )
+    if unhandled:
+        # Fall back to calling the entities the platforms did not handle
+        entity_results.extend(
+            await asyncio.gather(
+                *[
+                    entity.async_request_call(
+                        _handle_entity_call(hass, entity, func, data, call.context)
+                    )
+                    for entity in unhandled
+                ],
+                return_exceptions=True,
+            )
+        )
+        entities = [*entities, *unhandled]
 
     response_data: EntityServiceResponse = {}
-    for entity, result in zip(entities, results, strict=False):
+    for entity, result in zip(entities, entity_results, strict=False):
         if isinstance(result, BaseException):
             raise result from None
         response_data[entity.entity_id] = result
+    if batch_errors:
+        raise batch_errors[0] from None
 
     tasks: list[asyncio.Task[None]] = []
 
-    for entity in entities:
+    for entity in (*entities, *batched):
         if not entity.should_poll:
             continue
 
@@ -1044,6 +1199,80 @@ async def entity_service_call(
     return response_data if return_response and response_data else None
 
 
+@callback
+def _async_split_batches(
+    entities: list[Entity], call: ServiceCall
+) -> tuple[list[Entity], list[tuple[BatchServiceHandler, list[Entity]]]]:
+    """Split the entities of platforms with a batch service handler.
+
+    Returns the entities the service has to be called on one by one and
+    the batch handler and entities of each platform with a batch handler.
+    """
+    key = (call.domain, call.service)
+    remaining: list[Entity] = []
+    batches: dict[EntityPlatform, list[Entity]] = {}
+    for entity in entities:
+        if (
+            platform := entity.platform
+        ) is not None and key in platform.batch_service_handlers:
+            batches.setdefault(platform, []).append(entity)
+        else:
+            remaining.append(entity)
+
+    handler_batches: list[tuple[BatchServiceHandler, list[Entity]]] = []
+    for platform, batch in batches.items():
+        if len(batch) == 1:
+            # A single entity is called directly
+            remaining.extend(batch)
+        else:
+            handler_batches.append((platform.batch_service_handlers[key], batch))
+    return remaining, handler_batches
+
+
+@callback
+def _async_collect_batch_results(
+    batches: list[list[Entity]], results: list[list[Entity] | BaseException]
+) -> tuple[list[Entity], list[Entity], list[BaseException]]:
+    """Collect the results of the batch service handlers.
+
+    Returns the entities handled by the batch handlers, the entities they
+    did not handle and the exceptions raised by them.
+    """
+    errors: list[BaseException] = []
+    batched: list[Entity] = []
+    unhandled: list[Entity] = []
+    for batch, result in zip(batches, results, strict=True):
+        if isinstance(result, BaseException):
+            errors.append(result)
+            continue
+        unhandled_batch = set(result)
+        batched.extend(entity for entity in batch if entity not in unhandled_batch)
+        unhandled.extend(result)
+    return batched, unhandled, errors
+
+
+async def _async_handle_batch_call(
+    handler: BatchServiceHandler,
+    batch: list[Entity],
+    data: dict[str, Any],
+    context: Context,
+) -> list[Entity]:
+    """Pass a batch of entities of a platform to its batch service handler.
+
+    The entities of a platform share the parallel updates semaphore of the
+    platform, so the batch is passed through the request call of its
+    first entity.
+
+    Returns the entities the handler did not handle, in the batch order.
+    """
+    for entity in batch:
+        entity.async_set_context(context)
+    if not (result := await batch[0].async_request_call(handler(batch, data))):
+        return []
+    unhandled = set(result)
+    return [entity for entity in batch if entity in unhandled]
+
+
 async def _handle_entity_call(
     hass: HomeAssistant,
     entity: Entity,
@@ -1086,9 +1315,9 @@ async def _handle_entity_call(
 
 async def _async_admin_handler(
     hass: HomeAssistant,
-    service_job: HassJob[[ServiceCall], Awaitable[None] | None],
+    service_job: HassJob[[ServiceCall], Awaitable[ServiceResponse] | None],
     call: ServiceCall,
-) -> None:
+) -> ServiceResponse:
     """Run an admin service."""
     if call.context.user_id:
         user = await hass.auth.async_get_user(call.context.user_id)
@@ -1097,9 +1326,9 @@ async def _async_admin_handler(
         if not user.is_admin:
             raise Unauthorized(context=call.context)
 
-    result = hass.async_run_hass_job(service_job, call)
-    if result is not None:
-        await result
+    if (result := hass.async_run_hass_job(service_job, call)) is None:
+        return None
+    return cast(ServiceResponse, await result)
 
 
 @bind_hass
@@ -1108,8 +1337,9 @@ def async_register_admin_service(
     hass: HomeAssistant,
     domain: str,
     service: str,
-    service_func: Callable[[ServiceCall], Awaitable[None] | None],
+    service_func: Callable[[ServiceCall], Awaitable[ServiceResponse] | None],
     schema: VolSchemaType = vol.Schema({}, extra=vol.PREVENT_EXTRA),
+    supports_response: SupportsResponse = SupportsResponse.NONE,
 ) -> None:
     """Register a service that requires admin access."""
     hass.services.async_register(
@@ -1121,6 +1351,7 @@ def async_register_admin_service(
             HassJob(service_func, f"admin service {domain}.{service}"),
         ),
         schema,
+        supports_response,
     )
 
 
@@ -6,6 +6,7 @@ import asyncio
 from collections.abc import Callable, Iterable, Mapping, Sequence
 from contextlib import suppress
 from copy import deepcopy
+from dataclasses import dataclass, field
 from functools import cached_property
 import inspect
 from json import JSONDecodeError, JSONEncoder
@@ -33,6 +34,7 @@ from homeassistant.util import json as json_util
 import homeassistant.util.dt as dt_util
 from homeassistant.util.file import WriteError
 from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.ulid import ulid_now
 
 from . import json as json_helper
 
@@ -48,6 +50,12 @@ STORAGE_MANAGER: HassKey[_StoreManager] = HassKey("storage_manager")
 
 MANAGER_CLEANUP_DELAY = 60
 
+JOURNAL_SUFFIX = ".journal"
+# The journal is compacted into the main file once it is larger than
+# this share of the main file, but not before it reaches the minimum size
+JOURNAL_COMPACT_RATIO = 0.25
+JOURNAL_COMPACT_MIN_SIZE = 64 * 1024
+
 
 @bind_hass
 async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
@@ -226,6 +234,80 @@ class _StoreManager:
             self._files = set(os.listdir(self._storage_path))
 
 
+@dataclass(slots=True)
+class StoreJournalStats:
+    """Counters of the writes of a store in journal mode."""
+
+    journal_writes: int = 0
+    journal_bytes: int = 0
+    compactions: int = 0
+    compaction_bytes: int = 0
+
+    @property
+    def write_amplification(self) -> float:
+        """Return the bytes written per byte of changed data."""
+        if not self.journal_bytes:
+            return 0.0
+        return (self.journal_bytes + self.compaction_bytes) / self.journal_bytes
+
+
+@dataclass(slots=True)
+class _JournalState:
+    """What the main file and the journal of a store contain.
+
+    Items are tracked by the id key of the dicts in the top level lists of
+    the data. The item objects are kept so unchanged items, like the cached
+    storage fragments of registry entries, are recognized by identity.
+    """
+
+    version: int
+    minor_version: int
+    items: dict[str, dict[str, Any]] = field(default_factory=dict)
+    keys: dict[str, dict[int, str]] = field(default_factory=dict)
+    other: dict[str, Any] = field(default_factory=dict)
+
+
+def _decode_journal_item(item: Any) -> Any:
+    """Return a journal item as decoded JSON."""
+    if isinstance(item, json_helper.json_fragment):
+        return json_util.json_loads(json_helper.json_bytes(item))
+    return item
+
+
+def _journal_state(
+    data: dict[str, Any], previous: _JournalState | None
+) -> _JournalState | None:
+    """Return the journal state of data.
+
+    Returns None if the data can't be journaled.
+    """
+    stored = data["data"]
+    if not isinstance(stored, dict):
+        return None
+    state = _JournalState(data["version"], data["minor_version"])
+    for name, value in stored.items():
+        if not isinstance(value, list):
+            state.other[name] = value
+            continue
+        known_keys = previous.keys.get(name, {}) if previous else {}
+        items: dict[str, Any] = {}
+        keys: dict[int, str] = {}
+        for item in value:
+            if (key := known_keys.get(id(item))) is None:
+                decoded = _decode_journal_item(item)
+                if not isinstance(decoded, dict) or not isinstance(
+                    key := decoded.get("id"), str
+                ):
+                    return None
+            if key in items:
+                return None
+            items[key] = item
+            keys[id(item)] = key
+        state.items[name] = items
+        state.keys[name] = keys
+    return state
+
+
 @bind_hass
 class Store[_T: Mapping[str, Any] | Sequence[Any]]:
     """Class to help storing data."""
@@ -241,8 +323,16 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
         read_only: bool = False,
+        journal: bool = False,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        With journal set, saving appends the items that changed to a journal
+        next to the main file instead of rewriting it. This only applies to
+        data with lists of dicts that are identified by their id key, like
+        the registries. The journal is compacted into the main file once it
+        grows too large and replayed when the data is loaded.
+        """
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -258,12 +348,23 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         self._read_only = read_only
         self._next_write_time = 0.0
         self._manager = get_internal_store_manager(hass)
+        self._journal = journal
+        self._journal_state: _JournalState | None = None
+        self._journal_generation: str | None = None
+        self._journal_size = 0
+        self._main_size = 0
+        self.journal_stats = StoreJournalStats()
 
     @cached_property
     def path(self):
         """Return the config path."""
         return self.hass.config.path(STORAGE_DIR, self.key)
 
+    @cached_property
+    def journal_path(self) -> str:
+        """Return the path of the journal."""
+        return f"{self.path}{JOURNAL_SUFFIX}"
+
     def make_read_only(self) -> None:
         """Make the store read-only.
 
@@ -325,6 +426,10 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             exists, data = cache
             if not exists:
                 return None
+            if self._journal:
+                data = await self.hass.async_add_executor_job(
+                    self._replay_journal, data
+                )
         else:
             try:
                 data = await self.hass.async_add_executor_job(
@@ -387,6 +492,11 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             if data == {}:
                 return None
 
+            if self._journal:
+                data = await self.hass.async_add_executor_job(
+                    self._replay_journal, data
+                )
+
         # Add minor_version if not set
         if "minor_version" not in data:
             data["minor_version"] = 1
@@ -551,6 +661,14 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         if "data_func" in data:
             data["data"] = data.pop("data_func")()
 
+        if self._journal:
+            if self._append_journal(data):
+                return
+            # Journal records are only replayed on top of the main file
+            # of the same generation, so a journal left behind by a crash
+            # before it was removed is not replayed on top of newer data
+            data["journal_generation"] = ulid_now()
+
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
         json_helper.save_json(
             path,
@@ -559,6 +677,143 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             encoder=self._encoder,
             atomic_writes=self._atomic_writes,
         )
+        if self._journal:
+            self._compact_journal(path, data)
+
+    def _append_journal(self, data: dict) -> bool:
+        """Append the items that changed since the last write to the journal.
+
+        Returns False if the main file has to be written instead.
+        """
+        if (previous := self._journal_state) is None or (
+            previous.version,
+            previous.minor_version,
+        ) != (data["version"], data["minor_version"]):
+            return False
+        if (state := _journal_state(data, previous)) is None or (
+            state.other != previous.other or state.items.keys() != previous.items.keys()
+        ):
+            return False
+        updated: dict[str, dict[str, Any]] = {}
+        removed: dict[str, list[str]] = {}
+        for name, items in state.items.items():
+            previous_items = previous.items[name]
+            for key, item in items.items():
+                if (previous_item := previous_items.get(key)) is item:
+                    continue
+                if previous_item is not None and _decode_journal_item(
+                    previous_item
+                ) == _decode_journal_item(item):
+                    continue
+                updated.setdefault(name, {})[key] = item
+            if removed_keys := [key for key in previous_items if key not in items]:
+                removed[name] = removed_keys
+        if not updated and not removed:
+            self._journal_state = state
+            return True
+        record = json_helper.json_bytes(
+            {
+                "version": state.version,
+                "minor_version": state.minor_version,
+                "generation": self._journal_generation,
+                "updated": updated,
+                "removed": removed,
+            }
+        )
+        if self._journal_size + len(record) > max(
+            JOURNAL_COMPACT_MIN_SIZE, self._main_size * JOURNAL_COMPACT_RATIO
+        ):
+            return False
+        _LOGGER.debug("Writing journal record for %s", self.key)
+        fd = os.open(
+            self.journal_path,
+            os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+            0o600 if self._private else 0o644,
+        )
+        with os.fdopen(fd, "ab") as fdesc:
+            fdesc.write(record + b"\n")
+            if self._atomic_writes:
+                fdesc.flush()
+                os.fsync(fdesc.fileno())
+        self._journal_state = state
+        self._journal_size += len(record) + 1
+        stats = self.journal_stats
+        stats.journal_writes += 1
+        stats.journal_bytes += len(record) + 1
+        return True
+
+    def _compact_journal(self, path: str, data: dict) -> None:
+        """Remove the journal after the main file was written."""
+        with suppress(FileNotFoundError):
+            os.unlink(self.journal_path)
+        self._journal_state = _journal_state(data, self._journal_state)
+        self._journal_generation = data["journal_generation"]
+        self._journal_size = 0
+        self._main_size = os.path.getsize(path)
+        stats = self.journal_stats
+        stats.compactions += 1
+        stats.compaction_bytes += self._main_size
+        _LOGGER.debug(
+            "Compacted journal of %s; %s journal writes, write amplification %.2f",
+            self.key,
+            stats.journal_writes,
+            stats.write_amplification,
+        )
+
+    def _replay_journal(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Apply the records of the journal to the data of the main file."""
+        try:
+            with open(self.journal_path, "rb") as fdesc:
+                journal = fdesc.read()
+        except FileNotFoundError:
+            return data
+        stored = data["data"]
+        generation = data.get("journal_generation")
+        collections: dict[str, dict[str, Any]] = {}
+        replayed = 0
+        stale = 0
+        for line in journal.splitlines():
+            try:
+                record: dict[str, Any] = json_util.json_loads_object(line)
+            except ValueError:
+                # The last record is incomplete if writing it was interrupted
+                _LOGGER.warning("Ignoring incomplete journal record of %s", self.key)
+                break
+            if record.get("generation") != generation:
+                # Written before the main file was last written
+                stale += 1
+                continue
+            if (record["version"], record["minor_version"]) != (
+                data["version"],
+                data.get("minor_version", 1),
+            ):
+                _LOGGER.warning(
+                    "Ignoring journal of %s with version %s.%s",
+                    self.key,
+                    record["version"],
+                    record["minor_version"],
+                )
+                break
+            for name in (*record["updated"], *record["removed"]):
+                if name not in collections:
+                    collections[name] = {
+                        item["id"]: item for item in stored.get(name, [])
+                    }
+            for name, items in record["updated"].items():
+                collections[name].update(items)
+            for name, keys in record["removed"].items():
+                for key in keys:
+                    collections[name].pop(key, None)
+            replayed += 1
+        for name, items in collections.items():
+            stored[name] = list(items.values())
+        _LOGGER.debug(
+            "Replayed %s journal records of %s, ignored %s older records",
+            replayed,
+            self.key,
+            stale,
+        )
+        return data
 
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
@@ -572,3 +827,8 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+        if self._journal:
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(os.unlink, self.journal_path)
+            self._journal_state = None
+            self._journal_generation = None
@@ -9,12 +9,15 @@ import collections.abc
 from collections.abc import Callable, Generator, Iterable
 from contextlib import AbstractContextManager
 from contextvars import ContextVar
+from dataclasses import dataclass
 from datetime import date, datetime, time, timedelta
 from functools import cache, cached_property, lru_cache, partial, wraps
 import json
 import logging
+import marshal
 import math
 from operator import contains
+import os
 import pathlib
 import random
 import re
@@ -38,15 +41,19 @@ import voluptuous as vol
 
 from homeassistant.const import (
     ATTR_ENTITY_ID,
+    ATTR_FRIENDLY_NAME,
     ATTR_LATITUDE,
     ATTR_LONGITUDE,
     ATTR_PERSONS,
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
     EVENT_HOMEASSISTANT_START,
+    EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     UnitOfLength,
+    __version__ as HA_VERSION,
 )
 from homeassistant.core import (
     Context,
@@ -66,6 +73,7 @@ from homeassistant.util import (
     slugify as slugify_util,
 )
 from homeassistant.util.async_ import run_callback_threadsafe
+from homeassistant.util.file import WriteError, write_utf8_file
 from homeassistant.util.hass_dict import HassKey
 from homeassistant.util.json import JSON_DECODE_EXCEPTIONS, json_loads
 from homeassistant.util.read_only_dict import ReadOnlyDict
@@ -98,6 +106,15 @@ _ENVIRONMENT_STRICT: HassKey[TemplateEnvironment] = HassKey(
     "template.environment_strict"
 )
 _HASS_LOADER = "template.hass_loader"
+_BYTECODE_CACHE = "template.bytecode_cache"
+BYTECODE_CACHE_FILE = "template.bytecode_cache"
+# Templates rendered once, e.g. from the developer tools, must not make
+# the bytecode cache grow without bound
+BYTECODE_CACHE_MAX_ENTRIES = 2048
+
+# Bump when a change to TemplateEnvironment alters the code it compiles
+# so bytecode persisted by an older environment is discarded.
+TEMPLATE_ENVIRONMENT_VERSION = 1
 
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
 _IS_NUMERIC = re.compile(r"^[+-]?(?!0\d)\d*(?:\.\d*)?$")
@@ -476,6 +493,220 @@ class RenderInfo:
             self.filter = _false
 
 
+# State object fields a template can read without the state object
+# escaping into code that could read anything else.
+_STATE_FIELDS: dict[str, tuple[frozenset[str], frozenset[str]]] = {
+    "state": (frozenset({"state"}), frozenset()),
+    "last_changed": (frozenset({"last_changed"}), frozenset()),
+    "last_reported": (frozenset({"last_reported"}), frozenset()),
+    "last_updated": (frozenset({"last_updated"}), frozenset()),
+    "entity_id": (frozenset(), frozenset()),
+    "domain": (frozenset(), frozenset()),
+    "object_id": (frozenset(), frozenset()),
+    "name": (frozenset(), frozenset({ATTR_FRIENDLY_NAME})),
+    "state_with_unit": (
+        frozenset({"state"}),
+        frozenset({ATTR_UNIT_OF_MEASUREMENT}),
+    ),
+}
+# Functions, filters and tests that only read the state of an entity
+_STATE_READERS = {"states", "is_state", "has_value"}
+# Functions, filters and tests that read a single attribute of an entity,
+# the attribute name is their second argument
+_ATTRIBUTE_READERS = {"state_attr", "is_state_attr"}
+# Filters and tests that apply another filter or test given by name
+_APPLYING_FILTERS = {"map", "reject", "select"}
+# Names that hand out state objects or read states in ways that are not
+# analyzed, the variable "this" is a live state object in template entities
+_UNANALYZED_NAMES = {
+    "closest",
+    "distance",
+    "expand",
+    "state_translated",
+    "states",
+    "this",
+}
+
+
+@dataclass(slots=True, frozen=True)
+class TemplateDependencies:
+    """State fields and attributes a template reads from the states it uses."""
+
+    fields: frozenset[str]
+    attributes: frozenset[str]
+
+    def state_changed(self, old_state: State, new_state: State) -> bool:
+        """Return if the template reads something that differs between states."""
+        for field in self.fields:
+            if getattr(old_state, field) != getattr(new_state, field):
+                return True
+        old_attributes = old_state.attributes
+        new_attributes = new_state.attributes
+        return any(
+            old_attributes.get(attribute) != new_attributes.get(attribute)
+            for attribute in self.attributes
+        )
+
+
+class _UnanalyzedTemplateError(Exception):
+    """The template reads states in a way that is not analyzed."""
+
+
+class _DependencyCollector:
+    """Collect the state fields and attributes a template AST reads."""
+
+    def __init__(self) -> None:
+        """Initialize the collector."""
+        self.fields: set[str] = set()
+        self.attributes: set[str] = set()
+
+    def visit(self, node: jinja2.nodes.Node) -> None:
+        """Visit a node and its children."""
+        if isinstance(
+            node,
+            (
+                jinja2.nodes.Import,
+                jinja2.nodes.FromImport,
+                jinja2.nodes.Include,
+                jinja2.nodes.Extends,
+            ),
+        ):
+            # Imported macros may read anything
+            raise _UnanalyzedTemplateError
+        if isinstance(node, (jinja2.nodes.Getattr, jinja2.nodes.Getitem)):
+            if self._visit_state_field(node):
+                return
+        elif isinstance(node, jinja2.nodes.Call):
+            if isinstance(name := node.node, jinja2.nodes.Name) and self._visit_reader(
+                name.name, node, node.args, 0
+            ):
+                return
+        elif isinstance(node, (jinja2.nodes.Filter, jinja2.nodes.Test)):
+            # The filtered or tested value is the first argument of the reader
+            if self._visit_reader(node.name, node, node.args, 1) or (
+                node.name in _APPLYING_FILTERS
+                and node.args
+                and isinstance(applied := node.args[0], jinja2.nodes.Const)
+                and isinstance(applied.value, str)
+                and self._visit_reader(applied.value, node, node.args[1:], 1)
+            ):
+                if node.node is not None:
+                    self.visit(node.node)
+                return
+            if node.name in _UNANALYZED_NAMES or (
+                node.name in _APPLYING_FILTERS
+                and node.args
+                and isinstance(applied := node.args[0], jinja2.nodes.Const)
+                and applied.value in _UNANALYZED_NAMES
+            ):
+                raise _UnanalyzedTemplateError
+        elif isinstance(node, jinja2.nodes.Name) and node.name in _UNANALYZED_NAMES:
+            raise _UnanalyzedTemplateError
+        for child in node.iter_child_nodes():
+            self.visit(child)
+
+    def _visit_reader(
+        self,
+        name: str,
+        node: jinja2.nodes.Call | jinja2.nodes.Filter | jinja2.nodes.Test,
+        args: list[jinja2.nodes.Expr],
+        implicit_args: int,
+    ) -> bool:
+        """Collect what a state reading call, filter or test reads."""
+        if name not in _STATE_READERS and name not in _ATTRIBUTE_READERS:
+            return False
+        if node.dyn_args is not None or node.dyn_kwargs is not None:
+            raise _UnanalyzedTemplateError
+        if name in _ATTRIBUTE_READERS:
+            if (
+                len(args) + implicit_args < 2
+                or not isinstance(
+                    attribute := args[1 - implicit_args], jinja2.nodes.Const
+                )
+                or not isinstance(attribute.value, str)
+            ):
+                raise _UnanalyzedTemplateError
+            self.attributes.add(attribute.value)
+        else:
+            self.fields.add("state")
+            # states(entity_id, rounded, with_unit) may append the unit
+            if name == "states" and (len(args) + implicit_args > 2 or node.kwargs):
+                self.attributes.add(ATTR_UNIT_OF_MEASUREMENT)
+        for arg in node.args:
+            self.visit(arg)
+        for kwarg in node.kwargs:
+            self.visit(kwarg)
+        return True
+
+    def _visit_state_field(
+        self, node: jinja2.nodes.Getattr | jinja2.nodes.Getitem
+    ) -> bool:
+        """Collect a field read from a state object looked up from states."""
+        if (key := _node_key(node)) == "attributes":
+            return False
+        if (
+            isinstance(owner := node.node, (jinja2.nodes.Getattr, jinja2.nodes.Getitem))
+            and _node_key(owner) == "attributes"
+            and self._visit_state_object(owner.node)
+        ):
+            if key is None or (
+                # Jinja prefers methods like attributes.get over items
+                isinstance(node, jinja2.nodes.Getattr) and hasattr(ReadOnlyDict, key)
+            ):
+                raise _UnanalyzedTemplateError
+            self.attributes.add(key)
+            return True
+        if key not in _STATE_FIELDS or not self._visit_state_object(owner):
+            return False
+        fields, attributes = _STATE_FIELDS[key]
+        self.fields.update(fields)
+        self.attributes.update(attributes)
+        return True
+
+    def _visit_state_object(self, node: jinja2.nodes.Node) -> bool:
+        """Visit an expression if it looks up a single state from states."""
+        if not isinstance(node, (jinja2.nodes.Getattr, jinja2.nodes.Getitem)):
+            return False
+        owner = node.node
+        if isinstance(owner, jinja2.nodes.Name) and owner.name == "states":
+            # states['light.kitchen']
+            key = _node_key(node)
+            return key is not None and "." in key
+        if not (
+            isinstance(owner, (jinja2.nodes.Getattr, jinja2.nodes.Getitem))
+            and isinstance(domains := owner.node, jinja2.nodes.Name)
+            and domains.name == "states"
+            and _node_key(owner) is not None
+        ):
+            return False
+        # states.light.kitchen or states.light[object_id]
+        if isinstance(node, jinja2.nodes.Getitem) and _node_key(node) is None:
+            self.visit(node.arg)
+        return True
+
+
+def _node_key(node: jinja2.nodes.Getattr | jinja2.nodes.Getitem) -> str | None:
+    """Return the constant attribute or item a node looks up."""
+    if isinstance(node, jinja2.nodes.Getattr):
+        return node.attr
+    if isinstance(arg := node.arg, jinja2.nodes.Const) and isinstance(arg.value, str):
+        return arg.value
+    return None
+
+
+@lru_cache(maxsize=EVAL_CACHE_SIZE)
+def _template_dependencies(template: str) -> TemplateDependencies | None:
+    """Analyze which state fields and attributes a template reads."""
+    collector = _DependencyCollector()
+    try:
+        collector.visit(_NO_HASS_ENV.parse(template))
+    except (jinja2.TemplateSyntaxError, _UnanalyzedTemplateError):
+        return None
+    return TemplateDependencies(
+        frozenset(collector.fields), frozenset(collector.attributes)
+    )
+
+
 class Template:
     """Class to hold a template and manage caching and rendering."""
 
@@ -492,6 +723,7 @@ class Template:
         "_log_fn",
         "_hash_cache",
         "_renders",
+        "skipped_renders",
     )
 
     def __init__(self, template: str, hass: HomeAssistant | None = None) -> None:
@@ -510,6 +742,20 @@ class Template:
         self._log_fn: Callable[[int, str], None] | None = None
         self._hash_cache: int = hash(self.template)
         self._renders: int = 0
+        self.skipped_renders: int = 0
+
+    def async_dependencies(self) -> TemplateDependencies | None:
+        """Return what the template reads from the states it uses.
+
+        Returns None if the template reads states in a way that can not
+        be analyzed ahead of rendering.
+        """
+        return _template_dependencies(self.template)
+
+    @property
+    def renders(self) -> int:
+        """Return the number of times the template was rendered."""
+        return self._renders
 
     @property
     def _env(self) -> TemplateEnvironment:
@@ -833,7 +1079,10 @@ class Template:
 
     def __repr__(self) -> str:
         """Representation of Template."""
-        return f"Template<template=({self.template}) renders={self._renders}>"
+        return (
+            f"Template<template=({self.template}) renders={self._renders}"
+            f" skipped_renders={self.skipped_renders}>"
+        )
 
 
 @cache
@@ -2744,6 +2993,143 @@ class HassLoader(jinja2.BaseLoader):
         return self._sources[template], template, lambda: cur_reload == self._reload
 
 
+@singleton(_BYTECODE_CACHE)
+def _get_bytecode_cache(hass: HomeAssistant) -> TemplateBytecodeCache:
+    return TemplateBytecodeCache(hass.config.path(".storage", BYTECODE_CACHE_FILE))
+
+
+class TemplateBytecodeCache(jinja2.BytecodeCache):
+    """A bytecode cache for compiled templates that is persisted to disk.
+
+    Only the bytecode used since the cache was loaded is written back.
+    The file is rewritten whenever the templates in use differ from the
+    persisted ones, so templates that have been removed are dropped on
+    the next save. At most BYTECODE_CACHE_MAX_ENTRIES templates are kept,
+    the least recently used ones are dropped first.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize an empty bytecode cache."""
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._loaded: dict[str, bytes] = {}
+        self._used: LRU[str, bytes] = LRU(BYTECODE_CACHE_MAX_ENTRIES)
+        self._saved: set[str] = set()
+        self._dirty = False
+
+    @staticmethod
+    def version() -> str:
+        """Return the version the persisted bytecode must match."""
+        return f"{TEMPLATE_ENVIRONMENT_VERSION}-{HA_VERSION}-{jinja2.__version__}"
+
+    def get_bucket(
+        self,
+        environment: jinja2.Environment,
+        name: str,
+        filename: str | None,
+        source: str,
+    ) -> jinja2.bccache.Bucket:
+        """Return the bucket for a template compiled by environment.
+
+        The environments differ in the filters and tests they allow at
+        compile time, so each keeps its own bytecode.
+        """
+        key = self.get_cache_key(name, filename)
+        if isinstance(environment, TemplateEnvironment):
+            key = f"{environment.bytecode_flavour}-{key}"
+        bucket = jinja2.bccache.Bucket(
+            environment, key, self.get_source_checksum(source)
+        )
+        self.load_bytecode(bucket)
+        return bucket
+
+    def load_bytecode(self, bucket: jinja2.bccache.Bucket) -> None:
+        """Load the bytecode for a bucket if it is cached."""
+        key = bucket.key
+        if (data := self._used.get(key)) is None and (
+            data := self._loaded.get(key)
+        ) is None:
+            return
+        # The bucket resets itself if the magic header or the
+        # source checksum does not match.
+        bucket.bytecode_from_string(data)
+        if bucket.code is None:
+            return
+        self.hits += 1
+        if key not in self._used:
+            self._used[key] = data
+
+    def dump_bytecode(self, bucket: jinja2.bccache.Bucket) -> None:
+        """Store the bytecode of a freshly compiled bucket."""
+        self.misses += 1
+        self._used[bucket.key] = bucket.bytecode_to_string()
+        self._dirty = True
+
+    def clear(self) -> None:
+        """Clear the cache."""
+        self._loaded.clear()
+        self._used.clear()
+        self._dirty = True
+
+    def load(self) -> None:
+        """Load the persisted bytecode.
+
+        Must be run in the executor.
+        """
+        try:
+            with open(self.path, "rb") as fdesc:
+                version, entries = marshal.load(fdesc)
+        except FileNotFoundError:
+            return
+        except (OSError, EOFError, ValueError, TypeError) as err:
+            _LOGGER.debug("Discarding template bytecode cache %s: %s", self.path, err)
+            return
+        if version != self.version() or not isinstance(entries, dict):
+            _LOGGER.debug("Discarding outdated template bytecode cache")
+            return
+        self._loaded = entries
+        self._saved = set(entries)
+
+    def save(self) -> None:
+        """Persist the bytecode of the templates used since the last load.
+
+        Must be run in the executor.
+        """
+        if not self._dirty and set(self._used.keys()) == self._saved:
+            return
+        self._dirty = False
+        used = dict(self._used.items())
+        data = marshal.dumps((self.version(), used))
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            write_utf8_file(self.path, data, private=True, mode="wb")
+        except (OSError, WriteError):
+            self._dirty = True
+            return
+        self._saved = set(used)
+        _LOGGER.debug(
+            "Saved %s compiled templates (%s cache hits, %s cache misses)",
+            len(used),
+            self.hits,
+            self.misses,
+        )
+
+
+async def async_load_bytecode_cache(hass: HomeAssistant) -> None:
+    """Load the persisted template bytecode and save it when it changes."""
+    bytecode_cache = _get_bytecode_cache(hass)
+    await hass.async_add_executor_job(bytecode_cache.load)
+
+    async def _async_save(_: Any) -> None:
+        await hass.async_add_executor_job(bytecode_cache.save)
+
+    # Most templates are compiled while integrations are set up, save
+    # once started and catch the stragglers on the final write.
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, _async_save)
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_FINAL_WRITE, _async_save)
+
+
 class TemplateEnvironment(ImmutableSandboxedEnvironment):
     """The Home Assistant template environment."""
 
@@ -2757,6 +3143,9 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
+        self.bytecode_flavour = ("limited" if limited else "full") + (
+            "-strict" if strict else ""
+        )
         self.template_cache: weakref.WeakValueDictionary[
             str | jinja2.nodes.Template, CodeType | None
         ] = weakref.WeakValueDictionary()
@@ -2859,6 +3248,7 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
 
         # This environment has access to hass, attach its loader to enable imports.
         self.loader = _get_hass_loader(hass)
+        self.bytecode_cache = _get_bytecode_cache(hass)
 
         # We mark these as a context functions to ensure they get
         # evaluated fresh with every execution, rather than executed
@@ -3110,7 +3500,15 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
-        compiled = super().compile(source)
+        if (bytecode_cache := self.bytecode_cache) is not None and isinstance(
+            source, str
+        ):
+            bucket = bytecode_cache.get_bucket(self, source, None, source)
+            if (compiled := bucket.code) is None:
+                compiled = bucket.code = super().compile(source)
+                bytecode_cache.set_bucket(bucket)
+        else:
+            compiled = super().compile(source)
         self.template_cache[source] = compiled
         return compiled
 
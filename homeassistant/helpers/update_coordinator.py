@@ -4,14 +4,19 @@ from __future__ import annotations
 
 from abc import abstractmethod
 import asyncio
+from bisect import bisect_left
 from collections.abc import Awaitable, Callable, Coroutine, Generator
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from functools import cached_property
+from itertools import count
 import logging
+import math
 from random import randint
 from time import monotonic
-from typing import Any, Generic, Protocol
+from typing import Any, Final, Generic, Protocol
 import urllib.error
+from weakref import WeakKeyDictionary
 
 import aiohttp
 import requests
@@ -25,13 +30,25 @@ from homeassistant.exceptions import (
     ConfigEntryError,
     ConfigEntryNotReady,
 )
+from homeassistant.util.async_ import gather_with_limited_concurrency
 from homeassistant.util.dt import utcnow
+from homeassistant.util.hass_dict import HassKey
 
 from . import entity, event
 from .debounce import Debouncer
 
 REQUEST_REFRESH_DEFAULT_COOLDOWN = 10
 REQUEST_REFRESH_DEFAULT_IMMEDIATE = True
+# How many coordinators of a pool are refreshed at the same time when
+# handling the refreshes requested within a cooldown
+POOL_REFRESH_CONCURRENCY = 2
+
+# Upper bounds in seconds of the buckets of the refresh latency histogram
+REFRESH_LATENCY_BUCKETS: Final = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+DATA_COORDINATOR_POOLS: HassKey[dict[str, CoordinatorPool]] = HassKey(
+    "update_coordinator_pools"
+)
 
 _DataT = TypeVar("_DataT", default=dict[str, Any])
 _DataUpdateCoordinatorT = TypeVar(
@@ -45,6 +62,163 @@ class UpdateFailed(Exception):
     """Raised when an update has failed."""
 
 
+@dataclass(slots=True)
+class RefreshStats:
+    """Latency and failure histograms of the refreshes of a coordinator."""
+
+    latency: list[int] = field(
+        default_factory=lambda: [0] * (len(REFRESH_LATENCY_BUCKETS) + 1)
+    )
+    """Number of refreshes per bucket of REFRESH_LATENCY_BUCKETS, the last
+    bucket counts the refreshes which took longer than all buckets."""
+    failures: dict[str, int] = field(default_factory=dict)
+    """Number of failed refreshes per exception type."""
+    refreshes: int = 0
+
+    def record(self, duration: float, error: Exception | None) -> None:
+        """Record a refresh."""
+        self.refreshes += 1
+        self.latency[bisect_left(REFRESH_LATENCY_BUCKETS, duration)] += 1
+        if error is not None:
+            name = type(error).__name__
+            self.failures[name] = self.failures.get(name, 0) + 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histograms as a dictionary."""
+        return {
+            "refreshes": self.refreshes,
+            "latency": {
+                **{
+                    str(bound): count
+                    for bound, count in zip(
+                        REFRESH_LATENCY_BUCKETS, self.latency, strict=False
+                    )
+                },
+                "+Inf": self.latency[-1],
+            },
+            "failures": dict(self.failures),
+        }
+
+
+class CoordinatorPool:
+    """Coordinators which poll the same account or host.
+
+    The scheduled refreshes of the coordinators are spread evenly over
+    their update interval on a shared grid instead of running whenever
+    each coordinator happened to start, which avoids bursts of requests.
+    Refreshes requested by any of the coordinators are debounced
+    together, so the requests made within the cooldown are handled by a
+    single wave of refreshes, of which only a few run at the same time.
+    """
+
+    def __init__(self, hass: HomeAssistant, pool_id: str) -> None:
+        """Initialize the pool."""
+        self.hass = hass
+        self.pool_id = pool_id
+        # Coordinators which are garbage collected without being shut down
+        # drop out of the pool
+        self._coordinators: WeakKeyDictionary[DataUpdateCoordinator[Any], str] = (
+            WeakKeyDictionary()
+        )
+        self._requested: WeakKeyDictionary[DataUpdateCoordinator[Any], None] = (
+            WeakKeyDictionary()
+        )
+        self._member_ids = count(1)
+        self._debounced_refresh = Debouncer(
+            hass,
+            logging.getLogger(__name__),
+            cooldown=REQUEST_REFRESH_DEFAULT_COOLDOWN,
+            immediate=REQUEST_REFRESH_DEFAULT_IMMEDIATE,
+            function=self._async_refresh_requested,
+        )
+
+    @property
+    def coordinators(self) -> list[DataUpdateCoordinator[Any]]:
+        """Return the coordinators in the pool."""
+        return list(self._coordinators)
+
+    @callback
+    def async_add(self, coordinator: DataUpdateCoordinator[Any]) -> None:
+        """Add a coordinator to the pool."""
+        self._coordinators[coordinator] = f"{coordinator.name}_{next(self._member_ids)}"
+
+    @callback
+    def async_remove(self, coordinator: DataUpdateCoordinator[Any]) -> None:
+        """Remove a coordinator from the pool."""
+        self._coordinators.pop(coordinator, None)
+        self._requested.pop(coordinator, None)
+        if not self._coordinators:
+            self._debounced_refresh.async_shutdown()
+            pools = self.hass.data[DATA_COORDINATOR_POOLS]
+            if pools.get(self.pool_id) is self:
+                del pools[self.pool_id]
+
+    @callback
+    def async_next_refresh(
+        self, coordinator: DataUpdateCoordinator[Any], now: float, interval: float
+    ) -> float:
+        """Return the loop time of the next scheduled refresh of a coordinator.
+
+        Coordinators with the same update interval get evenly spaced slots
+        on a grid of the interval. The next refresh is the first slot at
+        least half an interval away.
+        """
+        update_interval = coordinator.update_interval
+        same_interval = [
+            member
+            for member in self._coordinators
+            if member.update_interval == update_interval
+        ]
+        offset = 0.0
+        if coordinator in same_interval:
+            offset = interval * same_interval.index(coordinator) / len(same_interval)
+        slot = math.floor((now + interval / 2 - offset) / interval) + 1
+        return slot * interval + offset
+
+    async def async_request_refresh(
+        self, coordinator: DataUpdateCoordinator[Any]
+    ) -> None:
+        """Request a refresh of a coordinator."""
+        self._requested[coordinator] = None
+        await self._debounced_refresh.async_call()
+
+    @callback
+    def async_cancel_request(self, coordinator: DataUpdateCoordinator[Any]) -> None:
+        """Cancel the requested refresh of a coordinator."""
+        self._requested.pop(coordinator, None)
+
+    async def _async_refresh_requested(self) -> None:
+        """Refresh the coordinators which requested a refresh."""
+        requested = list(self._requested)
+        self._requested.clear()
+        if requested:
+            await gather_with_limited_concurrency(
+                POOL_REFRESH_CONCURRENCY,
+                *(coordinator.async_refresh() for coordinator in requested),
+            )
+
+    @callback
+    def async_stats(self) -> dict[str, dict[str, Any]]:
+        """Return the refresh stats of the coordinators by their member id.
+
+        The member id is unique within the pool since several coordinators
+        may share a name.
+        """
+        return {
+            member_id: {"name": coordinator.name, **coordinator.refresh_stats.as_dict()}
+            for coordinator, member_id in self._coordinators.items()
+        }
+
+
+@callback
+def async_get_coordinator_pool(hass: HomeAssistant, pool_id: str) -> CoordinatorPool:
+    """Return the coordinator pool with the given id."""
+    pools = hass.data.setdefault(DATA_COORDINATOR_POOLS, {})
+    if (pool := pools.get(pool_id)) is None:
+        pool = pools[pool_id] = CoordinatorPool(hass, pool_id)
+    return pool
+
+
 class BaseDataUpdateCoordinatorProtocol(Protocol):
     """Base protocol type for DataUpdateCoordinator."""
 
@@ -61,6 +235,14 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     Setting :attr:`always_update` to ``False`` will cause coordinator to only
     callback listeners when data has changed. This requires that the data
     implements ``__eq__`` or uses a python object that already does.
+
+    Coordinators that poll the same account or host can pass the same
+    ``pool_id`` to share a :class:`CoordinatorPool`.
+
+    Setting :attr:`batch_writes` to ``True`` will cause the state writes of
+    the listeners to be written as one batch after all listeners have been
+    updated. The states written by the listeners are not available from the
+    state machine until then.
     """
 
     def __init__(
@@ -74,6 +256,8 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         setup_method: Callable[[], Awaitable[None]] | None = None,
         request_refresh_debouncer: Debouncer[Coroutine[Any, Any, None]] | None = None,
         always_update: bool = True,
+        pool_id: str | None = None,
+        batch_writes: bool = False,
     ) -> None:
         """Initialize global data updater."""
         self.hass = hass
@@ -86,6 +270,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         self._shutdown_requested = False
         self.config_entry = config_entries.current_entry.get()
         self.always_update = always_update
+        self.batch_writes = batch_writes
 
         # It's None before the first successful update.
         # Components should call async_config_entry_first_refresh
@@ -106,6 +291,17 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         self._request_refresh_task: asyncio.TimerHandle | None = None
         self.last_update_success = True
         self.last_exception: Exception | None = None
+        self.refresh_stats: RefreshStats = RefreshStats()
+
+        self.pool: CoordinatorPool | None = None
+        if pool_id is not None:
+            self.pool = async_get_coordinator_pool(hass, pool_id)
+            self.pool.async_add(self)
+        # A coordinator with its own debouncer keeps debouncing its requests
+        # itself instead of with the rest of the pool
+        self._pool_requests = (
+            self.pool is not None and request_refresh_debouncer is None
+        )
 
         if request_refresh_debouncer is None:
             request_refresh_debouncer = Debouncer(
@@ -164,8 +360,13 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     @callback
     def async_update_listeners(self) -> None:
         """Update all registered listeners."""
-        for update_callback, _ in list(self._listeners.values()):
-            update_callback()
+        if not self.batch_writes:
+            for update_callback, _ in list(self._listeners.values()):
+                update_callback()
+            return
+        with entity.async_batch_write_ha_state(self.hass):
+            for update_callback, _ in list(self._listeners.values()):
+                update_callback()
 
     async def async_shutdown(self) -> None:
         """Cancel any scheduled call, and ignore new runs."""
@@ -173,12 +374,16 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         self._async_unsub_refresh()
         self._async_unsub_shutdown()
         self._debounced_refresh.async_shutdown()
+        if self.pool is not None:
+            self.pool.async_remove(self)
 
     @callback
     def _unschedule_refresh(self) -> None:
         """Unschedule any pending refresh since there is no longer any listeners."""
         self._async_unsub_refresh()
         self._debounced_refresh.async_cancel()
+        if self.pool is not None:
+            self.pool.async_cancel_request(self)
 
     def async_contexts(self) -> Generator[Any]:
         """Return all registered contexts."""
@@ -228,9 +433,14 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         hass = self.hass
         loop = hass.loop
 
-        next_refresh = (
-            int(loop.time()) + self._microsecond + self._update_interval_seconds
-        )
+        if self.pool is not None:
+            next_refresh = self._microsecond + self.pool.async_next_refresh(
+                self, loop.time(), self._update_interval_seconds
+            )
+        else:
+            next_refresh = (
+                int(loop.time()) + self._microsecond + self._update_interval_seconds
+            )
         self._unsub_refresh = loop.call_at(
             next_refresh, self.__wrap_handle_refresh_interval
         ).cancel
@@ -260,8 +470,13 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     async def async_request_refresh(self) -> None:
         """Request a refresh.
 
-        Refresh will wait a bit to see if it can batch them.
+        Refresh will wait a bit to see if it can batch them. Requests of
+        coordinators in a pool are batched with the rest of the pool, unless
+        the coordinator was given its own request refresh debouncer.
         """
+        if self.pool is not None and self._pool_requests:
+            await self.pool.async_request_refresh(self)
+            return
         await self._debounced_refresh.async_call()
 
     async def _async_update_data(self) -> _DataT:
@@ -339,13 +554,16 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         """Refresh data."""
         self._async_unsub_refresh()
         self._debounced_refresh.async_cancel()
+        if self.pool is not None:
+            self.pool.async_cancel_request(self)
 
         if self._shutdown_requested or scheduled and self.hass.is_stopping:
             return
 
-        if log_timing := self.logger.isEnabledFor(logging.DEBUG):
-            start = monotonic()
-
+        log_timing = self.logger.isEnabledFor(logging.DEBUG)
+        start = monotonic()
+        succeeded = False
+        error: Exception | None = None
         auth_failed = False
         previous_update_success = self.last_update_success
         previous_data = self.data
@@ -354,21 +572,21 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
             self.data = await self._async_update_data()
 
         except (TimeoutError, requests.exceptions.Timeout) as err:
-            self.last_exception = err
+            self.last_exception = error = err
             if self.last_update_success:
                 if log_failures:
                     self.logger.error("Timeout fetching %s data", self.name)
                 self.last_update_success = False
 
         except (aiohttp.ClientError, requests.exceptions.RequestException) as err:
-            self.last_exception = err
+            self.last_exception = error = err
             if self.last_update_success:
                 if log_failures:
                     self.logger.error("Error requesting %s data: %s", self.name, err)
                 self.last_update_success = False
 
         except urllib.error.URLError as err:
-            self.last_exception = err
+            self.last_exception = error = err
             if self.last_update_success:
                 if log_failures:
                     if err.reason == "timed out":
@@ -380,14 +598,14 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
                 self.last_update_success = False
 
         except UpdateFailed as err:
-            self.last_exception = err
+            self.last_exception = error = err
             if self.last_update_success:
                 if log_failures:
                     self.logger.error("Error fetching %s data: %s", self.name, err)
                 self.last_update_success = False
 
         except ConfigEntryError as err:
-            self.last_exception = err
+            self.last_exception = error = err
             if self.last_update_success:
                 if log_failures:
                     self.logger.error(
@@ -401,7 +619,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
 
         except ConfigEntryAuthFailed as err:
             auth_failed = True
-            self.last_exception = err
+            self.last_exception = error = err
             if self.last_update_success:
                 if log_failures:
                     self.logger.error(
@@ -416,25 +634,30 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
             if self.config_entry:
                 self.config_entry.async_start_reauth(self.hass)
         except NotImplementedError as err:
-            self.last_exception = err
+            self.last_exception = error = err
             raise
 
         except Exception as err:
-            self.last_exception = err
+            self.last_exception = error = err
             self.last_update_success = False
             self.logger.exception("Unexpected error fetching %s data", self.name)
 
         else:
+            succeeded = True
             if not self.last_update_success:
                 self.last_update_success = True
                 self.logger.info("Fetching %s data recovered", self.name)
 
         finally:
+            duration = monotonic() - start
+            # Cancelled refreshes are not recorded
+            if succeeded or error is not None:
+                self.refresh_stats.record(duration, error)
             if log_timing:
                 self.logger.debug(
                     "Finished fetching %s data in %.3f seconds (success: %s)",
                     self.name,
-                    monotonic() - start,  # pylint: disable=possibly-used-before-assignment
+                    duration,
                     self.last_update_success,
                 )
             if not auth_failed and self._listeners and not self.hass.is_stopping:
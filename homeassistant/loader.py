@@ -7,7 +7,7 @@ documentation as possible to keep it understandable.
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Container, Iterable
 from contextlib import suppress
 from dataclasses import dataclass
 import functools as ft
@@ -262,6 +262,14 @@ class Manifest(TypedDict, total=False):
     single_config_entry: bool
 
 
+class IntegrationSnapshot(TypedDict):
+    """Resolved built-in integration that can be restored without I/O."""
+
+    manifest: Manifest
+    top_level_files: list[str]
+    all_dependencies: list[str] | None
+
+
 def async_setup(hass: HomeAssistant) -> None:
     """Set up the necessary data structures."""
     _async_mount_config_dir(hass)
@@ -1064,7 +1072,7 @@ class Integration:
         domain = self.domain
         try:
             cache[domain] = cast(
-                ComponentProtocol, importlib.import_module(self.pkg_path)
+                ComponentProtocol, _import_module(self.hass, self.pkg_path)
             )
         except ImportError:
             raise
@@ -1293,13 +1301,21 @@ class Integration:
         This method must be thread-safe as it's called from the executor
         and the event loop.
         """
-        return importlib.import_module(f"{self.pkg_path}.{platform_name}")
+        return _import_module(self.hass, f"{self.pkg_path}.{platform_name}")
 
     def __repr__(self) -> str:
         """Text representation of class."""
         return f"<Integration {self.domain}: {self.pkg_path}>"
 
 
+def _import_module(hass: HomeAssistant, name: str) -> ModuleType:
+    """Import a module and record it in the startup trace."""
+    if (trace := hass.startup_trace) is None:
+        return importlib.import_module(name)
+    with trace.span(name, "import"):
+        return importlib.import_module(name)
+
+
 def _version_blocked(
     integration_version: AwesomeVersion,
     blocked_integration: BlockedIntegration,
@@ -1427,6 +1443,176 @@ async def async_get_integrations(
     return results
 
 
+@callback
+def async_get_integrations_snapshot(
+    hass: HomeAssistant,
+) -> dict[str, IntegrationSnapshot]:
+    """Return a snapshot of the resolved built-in integrations.
+
+    Only integrations whose dependencies resolved successfully include
+    their dependencies in the snapshot.
+    """
+    return {
+        domain: {
+            "manifest": int_or_fut.manifest,
+            "top_level_files": sorted(int_or_fut._top_level_files),  # noqa: SLF001
+            "all_dependencies": (
+                sorted(int_or_fut._all_dependencies)  # noqa: SLF001
+                if int_or_fut._all_dependencies_resolved  # noqa: SLF001
+                and int_or_fut._all_dependencies is not None  # noqa: SLF001
+                else None
+            ),
+        }
+        for domain, int_or_fut in hass.data[DATA_INTEGRATIONS].items()
+        # Integration is never subclassed, so we can check for type
+        if type(int_or_fut) is Integration and int_or_fut.is_built_in
+    }
+
+
+@callback
+def async_restore_integrations_snapshot(
+    hass: HomeAssistant,
+    snapshot: dict[str, IntegrationSnapshot],
+    custom_domains: Container[str],
+) -> int:
+    """Restore built-in integrations from a snapshot.
+
+    Domains that are overridden by a custom integration or are already
+    loaded are not restored. Dependencies are only restored when none of
+    them are overridden by a custom integration.
+
+    Returns the number of restored integrations.
+    """
+    from . import components  # pylint: disable=import-outside-toplevel
+
+    cache = hass.data[DATA_INTEGRATIONS]
+    root = pathlib.Path(components.__path__[0])
+    restored = 0
+    for domain, resolved in snapshot.items():
+        if domain in custom_domains or domain in cache:
+            continue
+        integration = Integration(
+            hass,
+            f"{components.__name__}.{domain}",
+            root / domain,
+            resolved["manifest"],
+            set(resolved["top_level_files"]),
+        )
+        if (all_dependencies := resolved["all_dependencies"]) is not None and not any(
+            dep in custom_domains for dep in all_dependencies
+        ):
+            integration._all_dependencies = set(all_dependencies)  # noqa: SLF001
+            integration._all_dependencies_resolved = True  # noqa: SLF001
+        cache[domain] = integration
+        restored += 1
+    return restored
+
+
+async def async_import_integrations(
+    hass: HomeAssistant,
+    integrations: Iterable[Integration],
+    platforms: dict[str, set[str]] | None = None,
+    installed_requirements: Container[str] = (),
+) -> dict[str, float]:
+    """Import integrations and their platforms ahead of setup.
+
+    The integrations are imported one at a time in the import executor in
+    the order they are passed, with dependencies moved ahead of the
+    integrations that need them, so setup later finds their modules in
+    sys.modules. Import jobs queued by setup in the meantime only wait for
+    the import of one integration.
+
+    platforms maps a domain to the names of the platforms to import in
+    addition to the ones that are always preloaded.
+
+    Integrations that are not imported in the executor, are already
+    imported or have requirements that are not in installed_requirements
+    are skipped. Import errors are only logged at debug level since the
+    integrations are imported again when they are set up.
+
+    Returns the time it took to import each module.
+    """
+    pending = {
+        integration.domain: integration
+        for integration in integrations
+        if integration.import_executor
+        and all(req in installed_requirements for req in integration.requirements)
+        and integration.domain not in integration._cache  # noqa: SLF001
+        and integration.pkg_path not in sys.modules
+    }
+    platforms = platforms or {}
+    timings: dict[str, float] = {}
+    for integration in _dependencies_first(pending):
+        timings.update(
+            await hass.async_add_import_executor_job(
+                _import_integration_modules,
+                integration,
+                platforms.get(integration.domain, ()),
+            )
+        )
+    return timings
+
+
+def _dependencies_first(integrations: dict[str, Integration]) -> list[Integration]:
+    """Order integrations so they come after the integrations they depend on.
+
+    Integrations that depend on each other are kept in their original order.
+    """
+    ordered: dict[str, Integration] = {}
+    visiting: set[str] = set()
+
+    def _add(integration: Integration) -> None:
+        if (domain := integration.domain) in ordered or domain in visiting:
+            return
+        visiting.add(domain)
+        for dep in (
+            integration.all_dependencies
+            if integration.all_dependencies_resolved
+            else integration.dependencies
+        ):
+            if dep_integration := integrations.get(dep):
+                _add(dep_integration)
+        ordered[domain] = integration
+
+    for integration in integrations.values():
+        _add(integration)
+    return list(ordered.values())
+
+
+def _import_integration_modules(
+    integration: Integration, platform_names: Iterable[str]
+) -> dict[str, float]:
+    """Import the component and platforms of an integration.
+
+    The modules are only imported, the integration caches are filled when
+    they are set up.
+
+    Returns the time it took to import each module.
+    """
+    hass = integration.hass
+    timings: dict[str, float] = {}
+    module_names = [integration.pkg_path]
+    module_names.extend(
+        f"{integration.pkg_path}.{platform_name}"
+        for platform_name in integration.platforms_exists(
+            {*integration._platforms_to_preload, *platform_names}  # noqa: SLF001
+        )
+    )
+    for module_name in module_names:
+        start = time.perf_counter()
+        try:
+            _import_module(hass, module_name)
+        except Exception as ex:  # noqa: BLE001
+            _LOGGER.debug(
+                "Failed to import %s ahead of setup", module_name, exc_info=ex
+            )
+            if module_name == integration.pkg_path:
+                break
+            continue
+        timings[module_name] = time.perf_counter() - start
+    return timings
+
+
 class LoaderError(Exception):
     """Loader base error."""
 
@@ -85,6 +85,20 @@ def async_clear_install_history(hass: HomeAssistant) -> None:
     _async_get_manager(hass).install_failure_history.clear()
 
 
+@callback
+def async_get_installed_requirements(hass: HomeAssistant) -> set[str]:
+    """Return the requirements that are known to be installed."""
+    return set(_async_get_manager(hass).is_installed_cache)
+
+
+@callback
+def async_mark_requirements_installed(
+    hass: HomeAssistant, requirements: Iterable[str]
+) -> None:
+    """Mark requirements as installed without checking the environment."""
+    _async_get_manager(hass).is_installed_cache.update(requirements)
+
+
 def pip_kwargs(config_dir: str | None) -> dict[str, Any]:
     """Return keyword arguments for PIP install."""
     is_docker = pkg_util.is_docker_env()
@@ -9,7 +9,9 @@ from collections.abc import Callable
 from contextlib import suppress
 import json
 import logging
+from tempfile import TemporaryDirectory
 from timeit import default_timer as timer
+import zlib
 
 from homeassistant import core
 from homeassistant.const import EVENT_STATE_CHANGED
@@ -225,6 +227,79 @@ async def state_changed_event_filter_helper(hass):
     return timer() - start
 
 
+async def _state_changed_dispatch_by_listener_count(hass, keyed):
+    """Fire 100k state changed events per listener count and report the cost.
+
+    Only one of the listeners is for the entity the events are fired for.
+    """
+    count = 0
+    entity_id = "light.kitchen"
+    events_to_fire = 10**5
+
+    @core.callback
+    def listener(*args):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    def _entity_filter(listen_entity_id):
+        @core.callback
+        def event_filter(event_data):
+            """Filter event."""
+            return event_data["entity_id"] == listen_entity_id
+
+        return event_filter
+
+    event_data = {
+        "entity_id": f"{entity_id}0",
+        "old_state": core.State(entity_id, "off"),
+        "new_state": core.State(entity_id, "on"),
+    }
+    listener_count = 0
+    total = 0.0
+
+    for target_count in (1, 10, 100, 1000, 4000):
+        for idx in range(listener_count, target_count):
+            if keyed:
+                hass.bus.async_listen_entity_ids(
+                    EVENT_STATE_CHANGED, f"{entity_id}{idx}", listener
+                )
+            else:
+                hass.bus.async_listen(
+                    EVENT_STATE_CHANGED,
+                    listener,
+                    event_filter=_entity_filter(f"{entity_id}{idx}"),
+                )
+        listener_count = target_count
+        count = 0
+
+        start = timer()
+
+        for _ in range(events_to_fire):
+            hass.bus.async_fire(EVENT_STATE_CHANGED, event_data)
+
+        await hass.async_block_till_done()
+
+        runtime = timer() - start
+        assert count == events_to_fire
+        print(f"  {listener_count} listeners: {runtime}s")
+        total += runtime
+
+    return total
+
+
+@benchmark
+async def state_changed_keyed_dispatch(hass):
+    """Fire 100k state changed events with entity_id keyed listeners."""
+    return await _state_changed_dispatch_by_listener_count(hass, True)
+
+
+@benchmark
+async def state_changed_filtered_dispatch(hass):
+    """Fire 100k state changed events with event filter listeners."""
+    return await _state_changed_dispatch_by_listener_count(hass, False)
+
+
 @benchmark
 async def filtering_entity_id(hass):
     """Run a 100k state changes through entity filter."""
@@ -312,6 +387,379 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def websocket_get_states_encoding(hass):
+    """Encode the get_states response of 5000 entities for the websocket."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.websocket_api.messages import construct_result_message
+
+    states = []
+    for idx in range(5000):
+        if idx % 5:
+            attributes = {
+                "unit_of_measurement": "W",
+                "device_class": "power",
+                "state_class": "measurement",
+                "friendly_name": f"Sensor {idx}",
+            }
+        else:
+            attributes = {
+                "supported_color_modes": ["brightness", "color_temp", "hs"],
+                "color_mode": "hs",
+                "brightness": idx % 255,
+                "hs_color": [idx % 360, 50.0],
+                "min_mireds": 153,
+                "max_mireds": 500,
+                "friendly_name": f"Light {idx}",
+                "supported_features": 40,
+            }
+        states.append(core.State(f"sensor.entity_{idx}", str(idx), attributes))
+
+    start = timer()
+    message = construct_result_message(
+        1, b"".join((b"[", b",".join(state.as_dict_json for state in states), b"]"))
+    )
+    json_time = timer() - start
+
+    start = timer()
+    # permessage-deflate as negotiated by aiohttp
+    compressobj = zlib.compressobj(zlib.Z_BEST_SPEED, zlib.DEFLATED, -zlib.MAX_WBITS)
+    permessage_deflate = compressobj.compress(message) + compressobj.flush(
+        zlib.Z_SYNC_FLUSH
+    )
+    permessage_deflate_time = timer() - start
+
+    start = timer()
+    # The deflate encoding of the websocket API
+    deflate = zlib.compress(message, zlib.Z_BEST_SPEED)
+    deflate_time = timer() - start
+
+    print(f"json: {len(message)} bytes in {json_time * 1000:.1f} ms")
+    print(
+        f"permessage-deflate: {len(permessage_deflate)} bytes "
+        f"in {permessage_deflate_time * 1000:.1f} ms"
+    )
+    print(f"deflate: {len(deflate)} bytes in {deflate_time * 1000:.1f} ms")
+    return json_time + deflate_time
+
+
+def _recorder_write_states(bulk):
+    """Write 100k states of 1000 entities to SQLite in batches of 1000."""
+    # pylint: disable=import-outside-toplevel
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from homeassistant.components.recorder.bulk_writer import BulkWriter
+    from homeassistant.components.recorder.db_schema import (
+        Base,
+        StateAttributes,
+        States,
+        StatesMeta,
+    )
+
+    # pylint: enable=import-outside-toplevel
+    entity_count = 1000
+    states_to_write = 10**5
+
+    with TemporaryDirectory() as db_dir:
+        engine = create_engine(f"sqlite:///{db_dir}/db")
+        Base.metadata.create_all(engine)
+        bulk_writer = BulkWriter()
+        states_meta: dict[str, StatesMeta] = {}
+        old_states: dict[str, States] = {}
+
+        start = timer()
+
+        with Session(engine, expire_on_commit=False) as session:
+            for batch_start in range(0, states_to_write, entity_count):
+                pending: list[Base] = []
+                for idx in range(batch_start, batch_start + entity_count):
+                    entity_id = f"sensor.benchmark_{idx % entity_count}"
+                    db_state = States(state=str(idx), last_updated_ts=idx)
+                    if (meta := states_meta.get(entity_id)) is None:
+                        meta = states_meta[entity_id] = StatesMeta(entity_id=entity_id)
+                        pending.append(meta)
+                    db_state.states_meta_rel = meta
+                    # Every ten states share the same attributes
+                    if not idx % 10:
+                        attributes = StateAttributes(
+                            shared_attrs=f'{{"reading":{idx}}}', hash=idx
+                        )
+                        pending.append(attributes)
+                    db_state.state_attributes = attributes
+                    if (old_state := old_states.get(entity_id)) is not None:
+                        db_state.old_state_id = old_state.state_id
+                    old_states[entity_id] = db_state
+                    pending.append(db_state)
+                if bulk:
+                    for obj in pending:
+                        bulk_writer.add(obj)
+                    bulk_writer.write(session)
+                else:
+                    session.add_all(pending)
+                session.commit()
+                bulk_writer.clear()
+
+        runtime = timer() - start
+        engine.dispose()
+        return runtime
+
+
+@benchmark
+async def recorder_bulk_write(hass):
+    """Write 100k states with the recorder bulk writer."""
+    return await hass.async_add_executor_job(_recorder_write_states, True)
+
+
+@benchmark
+async def recorder_orm_write(hass):
+    """Write 100k states with the recorder ORM session."""
+    return await hass.async_add_executor_job(_recorder_write_states, False)
+
+
+def _recorder_state_attributes_churn():
+    """Resolve the attributes of 100k state changes of 1000 entities."""
+    # pylint: disable=import-outside-toplevel
+    from types import SimpleNamespace
+
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from homeassistant.components.recorder.db_schema import Base, StateAttributes
+    from homeassistant.components.recorder.table_managers.state_attributes import (
+        StateAttributesManager,
+    )
+
+    # pylint: enable=import-outside-toplevel
+    state_changes = 10**5
+
+    def shared_attrs_for_change(idx):
+        """Return the attributes of a state change like a typical install."""
+        entity = idx % 1000
+        if entity < 700:
+            # Sensors, their attributes never change
+            return (
+                f'{{"unit_of_measurement":"W","friendly_name":"Sensor {entity}",'
+                '"device_class":"power","state_class":"measurement"}'
+            )
+        if entity < 900:
+            # Lights, a few brightness levels are used over and over
+            return (
+                f'{{"friendly_name":"Light {entity}","brightness":'
+                f'{(idx // 1000) % 8 * 32},"color_mode":"brightness"}}'
+            )
+        if entity < 950:
+            # Media players, the position changes on every update
+            return (
+                f'{{"friendly_name":"Player {entity}","media_position":{idx},'
+                '"media_title":"Song"}'
+            )
+        # Weather, a large forecast that changes every 20 updates
+        return (
+            f'{{"friendly_name":"Weather {entity}","forecast":"'
+            + str(idx // 20000) * 4000
+            + '"}'
+        )
+
+    with TemporaryDirectory() as db_dir:
+        engine = create_engine(f"sqlite:///{db_dir}/db")
+        Base.metadata.create_all(engine)
+        manager = StateAttributesManager(SimpleNamespace(max_bind_vars=998))
+
+        start = timer()
+
+        with Session(engine, expire_on_commit=False) as session:
+            for idx in range(state_changes):
+                shared_attrs = shared_attrs_for_change(idx)
+                if not (
+                    manager.get_pending(shared_attrs)
+                    or manager.get_from_cache(shared_attrs)
+                ):
+                    shared_attrs_bytes = shared_attrs.encode()
+                    hash_ = StateAttributes.hash_shared_attrs_bytes(shared_attrs_bytes)
+                    if not manager.get(shared_attrs, hash_, session):
+                        attributes = StateAttributes(
+                            shared_attrs=shared_attrs, hash=hash_
+                        )
+                        manager.add_pending(attributes)
+                        session.add(attributes)
+                if not idx % 1000:
+                    session.commit()
+                    manager.post_commit_pending()
+
+        runtime = timer() - start
+        engine.dispose()
+
+    stats = manager.stats
+    print(
+        f"{stats.hits} of {stats.hits + stats.misses} lookups from the cache "
+        f"({stats.hit_rate:.1%}), {stats.db_lookups} database lookups, "
+        f"{stats.evictions} evictions, "
+        f"{manager.cached_bytes / 1024 / 1024:.2f} MiB cached"
+    )
+    return runtime
+
+
+@benchmark
+async def recorder_state_attributes_cache(hass):
+    """Resolve attributes ids of 100k state changes with the recorder cache."""
+    return await hass.async_add_executor_job(_recorder_state_attributes_churn)
+
+
+def _write_registries(config_dir, entity_count):
+    """Write device and entity registries like a large install has."""
+    # pylint: disable=import-outside-toplevel
+    from pathlib import Path
+
+    from homeassistant.helpers import device_registry as dr, entity_registry as er
+    from homeassistant.helpers.json import save_json
+    from homeassistant.helpers.storage import STORAGE_DIR
+
+    # pylint: enable=import-outside-toplevel
+    storage_dir = Path(config_dir, STORAGE_DIR)
+    storage_dir.mkdir()
+    devices = [
+        dr.DeviceEntry(
+            config_entries={f"entry_{idx % 100}"},
+            connections={("mac", f"00:00:00:00:{idx // 256:02x}:{idx % 256:02x}")},
+            identifiers={("bench", f"device_{idx}")},
+            labels={f"label_{idx % 10}"},
+            manufacturer="Bench",
+            model="Sensor",
+            name=f"Device {idx}",
+        )
+        for idx in range(entity_count // 10)
+    ]
+    entities = [
+        er.RegistryEntry(
+            entity_id=f"sensor.bench_{idx}",
+            unique_id=f"bench_{idx}",
+            platform="bench",
+            config_entry_id=f"entry_{idx % 100}",
+            device_id=devices[idx // 10].id,
+            capabilities={"state_class": "measurement"},
+            has_entity_name=True,
+            original_name=f"Sensor {idx}",
+            unit_of_measurement="W",
+        )
+        for idx in range(entity_count)
+    ]
+    for key, major, minor, data in (
+        (
+            dr.STORAGE_KEY,
+            dr.STORAGE_VERSION_MAJOR,
+            dr.STORAGE_VERSION_MINOR,
+            {
+                "devices": [entry.as_storage_fragment for entry in devices],
+                "deleted_devices": [],
+            },
+        ),
+        (
+            er.STORAGE_KEY,
+            er.STORAGE_VERSION_MAJOR,
+            er.STORAGE_VERSION_MINOR,
+            {
+                "entities": [entry.as_storage_fragment for entry in entities],
+                "deleted_entities": [],
+            },
+        ),
+    ):
+        save_json(
+            str(storage_dir / key),
+            {"version": major, "minor_version": minor, "key": key, "data": data},
+        )
+
+
+@benchmark
+async def registry_load(hass):
+    """Load the device and entity registries of an install with 20k entities."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import device_registry as dr, entity_registry as er
+
+    entity_count = 20000
+
+    with TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        await hass.async_add_executor_job(_write_registries, config_dir, entity_count)
+
+        start = timer()
+        device_registry = dr.DeviceRegistry(hass)
+        await device_registry.async_load()
+        entity_registry = er.EntityRegistry(hass)
+        await entity_registry.async_load()
+        runtime = timer() - start
+
+        # Setting up the integrations looks up the entries of their entities
+        lookup_start = timer()
+        for idx in range(0, entity_count, 10):
+            assert entity_registry.async_get_entity_id(
+                "sensor", "bench", f"bench_{idx}"
+            )
+            assert entity_registry.async_get(f"sensor.bench_{idx}")
+        lookup_runtime = timer() - lookup_start
+
+        build_start = timer()
+        assert len(list(entity_registry.entities.values())) == entity_count
+        assert len(list(device_registry.devices.values())) == entity_count // 10
+        build_runtime = timer() - build_start
+
+    print(
+        f"Looked up {entity_count // 10} entities in {lookup_runtime:.3f}s, "
+        f"built the remaining entries in {build_runtime:.3f}s"
+    )
+    return runtime
+
+
+@benchmark
+async def service_target_floor(hass):
+    """Resolve a floor with 300 lights 10k times with 20k entities registered."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import (
+        area_registry as ar,
+        device_registry as dr,
+        entity_registry as er,
+        floor_registry as fr,
+        label_registry as lr,
+        service,
+    )
+
+    entity_count = 20000
+    floor_light_count = 300
+
+    with TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        for load in (
+            ar.async_load,
+            dr.async_load,
+            er.async_load,
+            fr.async_load,
+            lr.async_load,
+        ):
+            await load(hass)
+        area_registry = ar.async_get(hass)
+        entity_registry = er.async_get(hass)
+        floor = fr.async_get(hass).async_create("Ground floor")
+        floor_areas = [
+            area_registry.async_create(f"Ground {idx}", floor_id=floor.floor_id)
+            for idx in range(30)
+        ]
+        other_areas = [area_registry.async_create(f"Room {idx}") for idx in range(270)]
+        for idx in range(entity_count):
+            entry = entity_registry.async_get_or_create("light", "bench", str(idx))
+            if idx < floor_light_count:
+                area = floor_areas[idx % len(floor_areas)]
+            else:
+                area = other_areas[idx % len(other_areas)]
+            entity_registry.async_update_entity(entry.entity_id, area_id=area.id)
+
+        call = core.ServiceCall("light", "turn_on", {"floor_id": floor.floor_id})
+        start = timer()
+        for _ in range(10**4):
+            selected = service.async_extract_referenced_entity_ids(hass, call)
+            assert len(selected.indirectly_referenced) == floor_light_count
+        return timer() - start
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
@@ -709,10 +709,19 @@ def async_pause_setup(hass: core.HomeAssistant, phase: SetupPhases) -> Generator
     try:
         yield
     finally:
-        time_taken = time.monotonic() - started
+        finished = time.monotonic()
+        time_taken = finished - started
         integration, group = running
         # Add negative time for the time we waited
         _setup_times(hass)[integration][group][phase] = -time_taken
+        if (trace := hass.startup_trace) is not None:
+            trace.add_async(
+                f"{integration} {phase}",
+                "wait",
+                started,
+                finished,
+                {"integration": integration, "group": group, "phase": phase},
+            )
         _LOGGER.debug(
             "Adding wait for %s for %s (%s) of %.2f",
             phase,
@@ -770,8 +779,17 @@ def async_start_setup(
     try:
         yield
     finally:
-        time_taken = time.monotonic() - started
+        finished = time.monotonic()
+        time_taken = finished - started
         del setup_started[current]
+        if (trace := hass.startup_trace) is not None:
+            trace.add_async(
+                integration if group is None else f"{integration} ({group})",
+                "setup",
+                started,
+                finished,
+                {"integration": integration, "group": group, "phase": phase},
+            )
         group_setup_times = _setup_times(hass)[integration][group]
         # We may see the phase multiple times if there are multiple
         # platforms, but we only care about the longest time.
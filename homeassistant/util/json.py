@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import logging
+import mmap
+import os
 from os import PathLike
 from typing import Any
 
@@ -25,6 +27,10 @@ type JsonObjectType = dict[str, JsonValueType]
 JSON_ENCODE_EXCEPTIONS = (TypeError, ValueError)
 JSON_DECODE_EXCEPTIONS = (orjson.JSONDecodeError,)
 
+# Files at least this large are parsed from a memory map instead of
+# being read into a bytes object first
+MMAP_MIN_SIZE = 256 * 1024
+
 
 class SerializationError(HomeAssistantError):
     """Error serializing the data to JSON."""
@@ -72,7 +78,13 @@ def load_json(
     """
     try:
         with open(filename, mode="rb") as fdesc:
-            return orjson.loads(fdesc.read())  # type: ignore[no-any-return]
+            if os.fstat(fdesc.fileno()).st_size < MMAP_MIN_SIZE:
+                return orjson.loads(fdesc.read())  # type: ignore[no-any-return]
+            with (
+                mmap.mmap(fdesc.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+                memoryview(mapped) as view,
+            ):
+                return orjson.loads(view)  # type: ignore[no-any-return]
     except FileNotFoundError:
         # This is not a fatal error
         _LOGGER.debug("JSON file not found: %s", filename)
@@ -0,0 +1,177 @@
+"""Capture a timeline of the startup.
+
+The timeline is exported in the Chrome trace event format which can be
+opened with chrome://tracing or https://ui.perfetto.dev.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from dataclasses import dataclass
+import functools
+import itertools
+import threading
+import time
+from typing import Any
+
+# Traces are limited to avoid unbounded memory growth when startup hangs
+MAX_SPANS = 100_000
+
+
+@dataclass(slots=True)
+class TraceSpan:
+    """A span of time on the timeline."""
+
+    name: str
+    category: str
+    start: float
+    duration: float
+    thread_id: int | None
+    """Thread the span ran on, None for spans awaited in the event loop."""
+    thread_cpu: float | None
+    args: dict[str, Any] | None
+
+
+def _job_name(target: Callable[..., Any]) -> str:
+    """Return a readable name for an executor job."""
+    while isinstance(target, functools.partial):
+        target = target.func
+    if module := getattr(target, "__module__", None):
+        return f"{module}.{getattr(target, '__qualname__', repr(target))}"
+    return getattr(target, "__qualname__", repr(target))
+
+
+class StartupTrace:
+    """Collect the spans that make up the startup.
+
+    Spans can be added from any thread. Spans of synchronous code record
+    the CPU time of the thread they ran on. Spans that are awaited in the
+    event loop only record wall time since other tasks run interleaved.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the trace."""
+        self.active = True
+        self._origin = time.monotonic()
+        self._spans: list[TraceSpan] = []
+        self._thread_names: dict[int, str] = {}
+
+    @property
+    def spans(self) -> list[TraceSpan]:
+        """Return the recorded spans."""
+        return self._spans
+
+    def stop(self) -> None:
+        """Stop recording new spans."""
+        self.active = False
+
+    def add_async(
+        self,
+        name: str,
+        category: str,
+        start: float,
+        end: float,
+        args: dict[str, Any] | None = None,
+    ) -> None:
+        """Add a span that was awaited in the event loop.
+
+        start and end are time.monotonic() values.
+        """
+        self._add(TraceSpan(name, category, start, end - start, None, None, args))
+
+    @contextmanager
+    def span(
+        self, name: str, category: str, args: dict[str, Any] | None = None
+    ) -> Generator[None]:
+        """Record synchronous code running in the current thread."""
+        if not self.active:
+            yield
+            return
+        start = time.monotonic()
+        cpu_start = time.thread_time()
+        try:
+            yield
+        finally:
+            thread_id = threading.get_ident()
+            if thread_id not in self._thread_names:
+                self._thread_names[thread_id] = threading.current_thread().name
+            self._add(
+                TraceSpan(
+                    name,
+                    category,
+                    start,
+                    time.monotonic() - start,
+                    thread_id,
+                    time.thread_time() - cpu_start,
+                    args,
+                )
+            )
+
+    def wrap_job[**_P, _R](
+        self, target: Callable[_P, _R], category: str
+    ) -> Callable[_P, _R]:
+        """Wrap an executor job so it is recorded when it runs."""
+        name = _job_name(target)
+
+        @functools.wraps(target)
+        def _traced_job(*args: _P.args, **kwargs: _P.kwargs) -> _R:
+            with self.span(name, category):
+                return target(*args, **kwargs)
+
+        return _traced_job
+
+    def _add(self, span: TraceSpan) -> None:
+        """Add a span, list.append is thread-safe."""
+        if self.active and len(self._spans) < MAX_SPANS:
+            self._spans.append(span)
+
+    def as_chrome_trace(self) -> dict[str, Any]:
+        """Return the trace in the Chrome trace event format.
+
+        Spans awaited in the event loop overlap each other so they are
+        exported as async events which are drawn on their own tracks.
+        Timestamps are microseconds since the trace started.
+        """
+        origin = self._origin
+        events: list[dict[str, Any]] = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": 1,
+                "tid": thread_id,
+                "args": {"name": thread_name},
+            }
+            for thread_id, thread_name in self._thread_names.items()
+        ]
+        async_ids = itertools.count(1)
+        for span in self._spans:
+            event: dict[str, Any] = {
+                "name": span.name,
+                "cat": span.category,
+                "pid": 1,
+                "ts": round((span.start - origin) * 1_000_000, 1),
+                "args": span.args or {},
+            }
+            if span.thread_id is None:
+                async_id = next(async_ids)
+                events.append({**event, "ph": "b", "id": async_id, "tid": 0})
+                events.append(
+                    {
+                        **event,
+                        "ph": "e",
+                        "id": async_id,
+                        "tid": 0,
+                        "ts": round(
+                            (span.start + span.duration - origin) * 1_000_000, 1
+                        ),
+                    }
+                )
+                continue
+            event["ph"] = "X"
+            event["tid"] = span.thread_id
+            event["dur"] = round(span.duration * 1_000_000, 1)
+            if span.thread_cpu is not None:
+                event["tdur"] = round(span.thread_cpu * 1_000_000, 1)
+            events.append(event)
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
@@ -9,7 +9,7 @@ import pytest
 
 from homeassistant.components import history
 from homeassistant.components.history import websocket_api
-from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder import Recorder, history as recorder_history
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE, STATE_OFF, STATE_ON
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.event import async_track_state_change_event
@@ -173,6 +173,112 @@ async def test_history_during_period(
     assert sensor_test_history[2]["a"] == {"any": "attr"}
 
 
+async def test_history_during_period_chunked(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period with chunked responses."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    for state in ("on", "off", "off", "on", "off"):
+        hass.states.async_set("sensor.one", state, attributes={"any": state})
+        hass.states.async_set("sensor.two", state)
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    query = {
+        "type": "history/history_during_period",
+        "start_time": now.isoformat(),
+        "entity_ids": ["sensor.one", "sensor.two"],
+        "significant_changes_only": False,
+        "minimal_response": True,
+    }
+    client = await hass_ws_client()
+    await client.send_json_auto_id(query)
+    response = await client.receive_json()
+    assert response["success"]
+    expected = response["result"]
+    assert len(expected["sensor.one"]) == 4
+
+    original_stream = recorder_history.stream_significant_states
+
+    def _stream_significant_states(*args):
+        return original_stream(*args, chunk_size=2)
+
+    with patch.object(
+        recorder_history, "stream_significant_states", _stream_significant_states
+    ):
+        await client.send_json_auto_id({**query, "chunked": True})
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["result"] is None
+
+        streamed: dict[str, list] = {}
+        events = 0
+        while not (response := await client.receive_json())["event"].get("done"):
+            events += 1
+            for entity_id, states in response["event"]["states"].items():
+                streamed.setdefault(entity_id, []).extend(states)
+
+    assert events > 2
+    assert streamed == expected
+
+    # Queries without any results still end with done
+    await client.send_json_auto_id(
+        {**query, "start_time": (now + timedelta(days=1)).isoformat(), "chunked": True}
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    response = await client.receive_json()
+    assert response["event"] == {"done": True}
+
+
+async def test_history_during_period_max_points(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period with max_points."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    for value in range(100):
+        hass.states.async_set("sensor.power", str(value % 7))
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json_auto_id(
+        {
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.power"],
+            "significant_changes_only": False,
+            "minimal_response": True,
+            "max_points": 10,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    states = response["result"]["sensor.power"]
+    assert len(states) <= 10
+    assert {state["s"] for state in states} >= {"0", "6"}
+
+    await client.send_json_auto_id(
+        {
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.power"],
+            "chunked": True,
+            "max_points": 10,
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_max_points"
+
+
 async def test_history_during_period_impossible_conditions(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
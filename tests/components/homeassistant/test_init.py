@@ -14,6 +14,7 @@ from homeassistant.components.homeassistant import (
     ATTR_ENTRY_ID,
     ATTR_SAFE_MODE,
     SERVICE_CHECK_CONFIG,
+    SERVICE_DUMP_STARTUP_TRACE,
     SERVICE_HOMEASSISTANT_RESTART,
     SERVICE_HOMEASSISTANT_STOP,
     SERVICE_RELOAD_ALL,
@@ -38,6 +39,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError, Unauthorized
 from homeassistant.helpers import entity, entity_registry as er
 from homeassistant.setup import async_setup_component
+from homeassistant.util.startup_trace import StartupTrace
 
 from tests.common import (
     MockConfigEntry,
@@ -635,6 +637,35 @@ async def test_reload_custom_templates(hass: HomeAssistant) -> None:
         assert mock_load_custom_templates.called
 
 
+async def test_dump_startup_trace(hass: HomeAssistant) -> None:
+    """Test we can call dump_startup_trace."""
+    await async_setup_component(hass, "homeassistant", {})
+
+    with pytest.raises(HomeAssistantError) as exc_info:
+        await hass.services.async_call(
+            "homeassistant",
+            SERVICE_DUMP_STARTUP_TRACE,
+            blocking=True,
+            return_response=True,
+        )
+    assert exc_info.value.translation_key == "no_startup_trace"
+
+    hass.startup_trace = StartupTrace()
+    with hass.startup_trace.span("homeassistant.components.demo", "import"):
+        pass
+    response = await hass.services.async_call(
+        "homeassistant",
+        SERVICE_DUMP_STARTUP_TRACE,
+        blocking=True,
+        return_response=True,
+    )
+    assert response["displayTimeUnit"] == "ms"
+    assert [event["name"] for event in response["traceEvents"]] == [
+        "thread_name",
+        "homeassistant.components.demo",
+    ]
+
+
 async def test_reload_all(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -7,12 +7,14 @@ from typing import Any
 from unittest.mock import ANY, patch
 
 from freezegun import freeze_time
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant import core
 from homeassistant.components import logbook, recorder
 from homeassistant.components.automation import ATTR_SOURCE, EVENT_AUTOMATION_TRIGGERED
 from homeassistant.components.logbook import websocket_api
+from homeassistant.components.logbook.queries import statement_for_request
 from homeassistant.components.recorder import Recorder
 from homeassistant.components.recorder.util import get_instance
 from homeassistant.components.script import EVENT_SCRIPT_STARTED
@@ -31,6 +33,7 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_START,
     STATE_OFF,
     STATE_ON,
+    STATE_UNKNOWN,
 )
 from homeassistant.core import Event, HomeAssistant, State, callback
 from homeassistant.helpers import device_registry as dr, entity_registry as er
@@ -298,6 +301,126 @@ async def test_get_events(
     assert isinstance(results[0]["when"], float)
 
 
+async def test_get_events_pages(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    hass_read_only_access_token: str,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test logbook get_events_page pages with a cursor."""
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await async_recorder_block_till_done(hass)
+    for entity_id in ("light.origin", "light.one", "light.two", "light.caused"):
+        hass.states.async_set(entity_id, STATE_UNKNOWN)
+    await async_wait_recording_done(hass)
+    now = dt_util.utcnow()
+
+    context = core.Context(
+        id="01GTDGKBCH00GW0X276W5TEDDD",
+        user_id="b400facee45711eaa9308bfd3d19e474",
+    )
+    freezer.tick(1)
+    hass.states.async_set("light.origin", STATE_ON, context=context)
+    for idx in range(5):
+        freezer.tick(1)
+        # Several events with the same time
+        for entity_id in ("light.one", "light.two"):
+            hass.states.async_set(entity_id, STATE_ON if idx % 2 else STATE_OFF)
+    freezer.tick(1)
+    hass.states.async_set("light.caused", STATE_ON, context=context)
+    await async_wait_recording_done(hass)
+    freezer.tick(1)
+
+    client = await hass_ws_client()
+    await client.send_json_auto_id(
+        {"type": "logbook/get_events", "start_time": now.isoformat()}
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    all_events = response["result"]
+    assert len(all_events) == 12
+    assert all_events[-1]["context_entity_id"] == "light.origin"
+
+    events = []
+    cursor = last_cursor = None
+    pages = 0
+    with patch(
+        "homeassistant.components.logbook.processor.statement_for_request",
+        wraps=statement_for_request,
+    ) as statement_mock:
+        while True:
+            await client.send_json_auto_id(
+                {
+                    "type": "logbook/get_events_page",
+                    "start_time": now.isoformat(),
+                    "limit": 3,
+                }
+                | ({"cursor": cursor} if cursor else {})
+            )
+            response = await client.receive_json()
+            assert response["success"]
+            pages += 1
+            assert len(response["result"]["events"]) <= 3
+            events.extend(response["result"]["events"])
+            if not (cursor := response["result"]["cursor"]):
+                break
+            last_cursor = cursor
+
+    assert pages == 4
+    assert events == all_events
+    # Later pages only query from their cursor
+    start_days = [call.args[0] for call in statement_mock.mock_calls]
+    assert start_days[0] == now
+    assert all(
+        start_day > earlier
+        for earlier, start_day in zip(start_days, start_days[1:], strict=False)
+    )
+
+    # The contexts seen by a user are not linked for other users
+    other_client = await hass_ws_client(hass, hass_read_only_access_token)
+    await other_client.send_json_auto_id(
+        {
+            "type": "logbook/get_events_page",
+            "start_time": now.isoformat(),
+            "limit": 3,
+            "cursor": last_cursor,
+        }
+    )
+    response = await other_client.receive_json()
+    assert response["success"]
+    assert response["result"]["events"][-1]["entity_id"] == "light.caused"
+    assert "context_entity_id" not in response["result"]["events"][-1]
+
+    await client.send_json_auto_id(
+        {
+            "type": "logbook/get_events_page",
+            "start_time": now.isoformat(),
+            "limit": 3,
+            "cursor": "invalid",
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_cursor"
+
+    await client.send_json_auto_id(
+        {
+            "type": "logbook/get_events_page",
+            "start_time": (now + timedelta(days=1)).isoformat(),
+            "limit": 3,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {"events": [], "cursor": None}
+
+
 async def test_get_events_entities_filtered_away(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
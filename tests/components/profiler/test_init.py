@@ -20,10 +20,12 @@ from homeassistant.components.profiler import (
     SERVICE_DUMP_LOG_OBJECTS,
     SERVICE_LOG_CURRENT_TASKS,
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
+    SERVICE_LOG_STATE_MEMORY,
     SERVICE_LOG_THREAD_FRAMES,
     SERVICE_LRU_STATS,
     SERVICE_MEMORY,
     SERVICE_SET_ASYNCIO_DEBUG,
+    SERVICE_SET_STATE_ATTRIBUTE_SHARING,
     SERVICE_START,
     SERVICE_START_LOG_OBJECT_SOURCES,
     SERVICE_START_LOG_OBJECTS,
@@ -446,3 +448,93 @@ async def test_set_asyncio_debug(
 
     assert await hass.config_entries.async_unload(entry.entry_id)
     await hass.async_block_till_done()
+
+
+async def test_log_state_memory(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test logging the memory used by states."""
+
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.services.has_service(DOMAIN, SERVICE_LOG_STATE_MEMORY)
+
+    hass.states.async_set("light.kitchen", "on", {"brightness": 255})
+    hass.states.async_set("light.bowl", "off")
+    hass.states.async_set("sensor.temperature", "21.5", {"unit": "°C"})
+
+    await hass.services.async_call(DOMAIN, SERVICE_LOG_STATE_MEMORY, blocking=True)
+
+    assert "State memory for domain light: 2 states using" in caplog.text
+    assert "State memory for domain sensor: 1 states using" in caplog.text
+    assert "State memory total: 3 states using" in caplog.text
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_set_state_attribute_sharing(hass: HomeAssistant) -> None:
+    """Test enabling and disabling sharing attributes between states."""
+
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.services.has_service(DOMAIN, SERVICE_SET_STATE_ATTRIBUTE_SHARING)
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_SET_STATE_ATTRIBUTE_SHARING, {}, blocking=True
+    )
+    hass.states.async_set("light.kitchen", "on", {"color_mode": "onoff"})
+    hass.states.async_set("light.bowl", "on", {"color_mode": "onoff"})
+    assert (
+        hass.states.get("light.kitchen").attributes
+        is hass.states.get("light.bowl").attributes
+    )
+
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SET_STATE_ATTRIBUTE_SHARING,
+        {CONF_ENABLED: False},
+        blocking=True,
+    )
+    hass.states.async_set("light.lamp", "on", {"color_mode": "onoff"})
+    assert (
+        hass.states.get("light.lamp").attributes
+        is not hass.states.get("light.bowl").attributes
+    )
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_state_attribute_sharing_disabled_on_unload(
+    hass: HomeAssistant,
+) -> None:
+    """Test sharing attributes between states is disabled on unload."""
+
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_SET_STATE_ATTRIBUTE_SHARING, {}, blocking=True
+    )
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+    hass.states.async_set("light.kitchen", "on", {"color_mode": "onoff"})
+    hass.states.async_set("light.bowl", "on", {"color_mode": "onoff"})
+    assert (
+        hass.states.get("light.kitchen").attributes
+        is not hass.states.get("light.bowl").attributes
+    )
@@ -0,0 +1,81 @@
+"""Test state attributes table manager."""
+
+import sys
+from unittest.mock import Mock, patch
+
+from homeassistant.components.recorder.db_schema import StateAttributes
+from homeassistant.components.recorder.table_managers import state_attributes
+from homeassistant.components.recorder.table_managers.state_attributes import (
+    CACHE_BYTES_PER_ENTRY,
+    CACHE_ENTRY_OVERHEAD,
+    StateAttributesManager,
+)
+
+
+def _entry_bytes(shared_attrs: str) -> int:
+    """Return the memory accounted for a cached shared_attrs."""
+    return sys.getsizeof(shared_attrs) + CACHE_ENTRY_OVERHEAD
+
+
+def _add(manager: StateAttributesManager, shared_attrs: str, attributes_id: int):
+    """Add committed attributes to the cache."""
+    manager.add_pending(
+        StateAttributes(shared_attrs=shared_attrs, attributes_id=attributes_id)
+    )
+    manager.post_commit_pending()
+
+
+def test_cache_is_bounded_by_memory() -> None:
+    """Test the cache evicts by memory use instead of the number of entries."""
+    small = [f'{{"reading":{idx}}}' for idx in range(10)]
+    forecast = '{"forecast":"' + "x" * 600 + '"}'
+    max_bytes = sum(_entry_bytes(shared_attrs) for shared_attrs in small)
+    with patch.object(state_attributes, "CACHE_SIZE_BYTES", max_bytes):
+        manager = StateAttributesManager(Mock())
+
+    for idx, shared_attrs in enumerate(small):
+        _add(manager, shared_attrs, idx)
+    assert manager.cached_bytes == max_bytes
+    assert all(
+        manager.get_from_cache(shared_attrs) is not None for shared_attrs in small
+    )
+    assert manager.stats.hits == 10
+    assert manager.stats.evictions == 0
+
+    # The large attributes push out as many small ones as needed
+    _add(manager, forecast, 100)
+    assert manager.get_from_cache(forecast) == 100
+    assert manager.cached_bytes <= max_bytes
+    evicted = [
+        shared_attrs for shared_attrs in small if shared_attrs not in manager._id_map
+    ]
+    assert len(evicted) == manager.stats.evictions
+    assert len(evicted) > 1
+    # The least recently used are evicted first
+    assert evicted == small[: len(evicted)]
+
+    assert manager.get_from_cache("missing") is None
+    assert manager.stats.misses == 1
+    assert manager.stats.hit_rate == 11 / 12
+
+    manager.evict_purged({100})
+    assert manager.get_from_cache(forecast) is None
+    assert manager.cached_bytes == sum(
+        _entry_bytes(shared_attrs) for shared_attrs in small[len(evicted) :]
+    )
+
+    manager.reset()
+    assert manager.cached_bytes == 0
+
+
+def test_adjust_lru_size() -> None:
+    """Test the memory limit follows the requested number of entries."""
+    manager = StateAttributesManager(Mock())
+    max_bytes = manager.max_bytes
+
+    manager.adjust_lru_size(10)
+    assert manager.max_bytes == max_bytes
+
+    manager.adjust_lru_size(max_bytes)
+    assert manager.max_bytes == max_bytes * CACHE_BYTES_PER_ENTRY
+    assert manager._id_map.get_size() == manager.max_bytes // CACHE_ENTRY_OVERHEAD
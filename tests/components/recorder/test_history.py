@@ -592,6 +592,120 @@ async def test_get_significant_states_minimal_response(
     )
 
 
+@pytest.mark.parametrize("chunk_size", [1, 2, 5, 1000])
+@pytest.mark.parametrize("minimal_response", [False, True])
+async def test_stream_significant_states(
+    hass: HomeAssistant, chunk_size: int, minimal_response: bool
+) -> None:
+    """Test streamed significant states match get_significant_states.
+
+    The states of an entity may be split over several chunks, but
+    concatenating the chunks must give the same result.
+    """
+    zero, four, states = record_states(hass)
+    await async_wait_recording_done(hass)
+    entity_ids = list(states)
+
+    hist = history.get_significant_states(
+        hass,
+        zero,
+        four,
+        entity_ids,
+        minimal_response=minimal_response,
+        compressed_state_format=True,
+    )
+    chunks = list(
+        history.stream_significant_states(
+            hass,
+            zero,
+            four,
+            entity_ids,
+            minimal_response=minimal_response,
+            compressed_state_format=True,
+            chunk_size=chunk_size,
+        )
+    )
+    streamed: dict[str, list] = {}
+    for chunk in chunks:
+        assert sum(len(entity_states) for entity_states in chunk.values()) <= chunk_size
+        for entity_id, entity_states in chunk.items():
+            streamed.setdefault(entity_id, []).extend(entity_states)
+
+    assert streamed == hist
+    if chunk_size == 1:
+        assert len(chunks) > len(hist)
+
+
+@pytest.mark.parametrize("minimal_response", [False, True])
+async def test_get_significant_states_max_points(
+    hass: HomeAssistant, minimal_response: bool
+) -> None:
+    """Test states are downsampled keeping the peaks with max_points."""
+    start = dt_util.utcnow()
+    values = [str(idx % 10) for idx in range(200)]
+    values[57] = "100"
+    values[123] = "-100"
+    values[150] = "unavailable"
+    for value in values:
+        hass.states.async_set("sensor.power", value)
+    hass.states.async_set("sensor.other", "1")
+    await async_wait_recording_done(hass)
+
+    hist = history.get_significant_states(
+        hass,
+        start,
+        entity_ids=["sensor.power", "sensor.other"],
+        significant_changes_only=False,
+        minimal_response=minimal_response,
+        compressed_state_format=True,
+        max_points=20,
+    )
+    states = [state["s"] for state in hist["sensor.power"]]
+    assert len(states) <= 20
+    assert states[0] == values[0]
+    assert states[-1] == values[-1]
+    assert "100" in states
+    assert "-100" in states
+    assert "unavailable" in states
+    assert [state["s"] for state in hist["sensor.other"]] == ["1"]
+
+    hist = history.get_significant_states(
+        hass,
+        start,
+        entity_ids=["sensor.power"],
+        significant_changes_only=False,
+        minimal_response=minimal_response,
+        compressed_state_format=True,
+        max_points=1000,
+    )
+    assert [state["s"] for state in hist["sensor.power"]] == values
+
+
+async def test_get_significant_states_max_points_not_numeric(
+    hass: HomeAssistant,
+) -> None:
+    """Test states that are not numbers are downsampled with max_points."""
+    start = dt_util.utcnow()
+    values = [("on", "off", "unavailable")[idx % 3] for idx in range(200)]
+    for value in values:
+        hass.states.async_set("switch.test", value)
+    await async_wait_recording_done(hass)
+
+    hist = history.get_significant_states(
+        hass,
+        start,
+        entity_ids=["switch.test"],
+        significant_changes_only=False,
+        compressed_state_format=True,
+        max_points=20,
+    )
+    states = [state["s"] for state in hist["switch.test"]]
+    assert len(states) <= 20
+    assert states[0] == values[0]
+    assert states[-1] == values[-1]
+    assert set(states) == {"on", "off", "unavailable"}
+
+
 @pytest.mark.parametrize("time_zone", ["Europe/Berlin", "US/Hawaii", "UTC"])
 async def test_get_significant_states_with_initial(
     time_zone, hass: HomeAssistant
@@ -13,6 +13,7 @@ from unittest.mock import MagicMock, Mock, patch
 
 from freezegun.api import FrozenDateTimeFactory
 import pytest
+from sqlalchemy import text
 from sqlalchemy.exc import DatabaseError, OperationalError, SQLAlchemyError
 from sqlalchemy.pool import QueuePool
 
@@ -115,9 +116,9 @@ def setup_recorder(recorder_mock: Recorder) -> None:
 
 @pytest.fixture
 def small_cache_size() -> Generator[None]:
-    """Patch the default cache size to 8."""
+    """Patch the default cache size to 8 entries or 1 KiB."""
     with (
-        patch.object(state_attributes_table_manager, "CACHE_SIZE", 8),
+        patch.object(state_attributes_table_manager, "CACHE_SIZE_BYTES", 1024),
         patch.object(states_meta_table_manager, "CACHE_SIZE", 8),
     ):
         yield
@@ -134,6 +135,7 @@ def _default_recorder(hass):
         uri="sqlite://",
         db_max_retries=10,
         db_retry_wait=3,
+        db_readers=2,
         entity_filter=CONFIG_SCHEMA({DOMAIN: {}}),
         exclude_event_types=set(),
     )
@@ -409,6 +411,13 @@ async def test_saving_state_with_exception(
             "flush",
             side_effect=_throw_if_state_in_session,
         ),
+        patch.object(
+            get_instance(hass)._bulk_writer,
+            "write",
+            side_effect=OperationalError(
+                "insert the state", "fake params", "forced to fail"
+            ),
+        ),
     ):
         hass.states.async_set(entity_id, "fail", attributes)
         await async_wait_recording_done(hass)
@@ -452,6 +461,13 @@ async def test_saving_state_with_sqlalchemy_exception(
             "flush",
             side_effect=_throw_if_state_in_session,
         ),
+        patch.object(
+            get_instance(hass)._bulk_writer,
+            "write",
+            side_effect=SQLAlchemyError(
+                "insert the state", "fake params", "forced to fail"
+            ),
+        ),
     ):
         hass.states.async_set(entity_id, "fail", attributes)
         await async_wait_recording_done(hass)
@@ -1469,6 +1485,136 @@ async def test_saving_sets_old_state(hass: HomeAssistant, setup_recorder: None)
         assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
 
 
+@pytest.mark.parametrize("bulk", [True, False])
+async def test_saving_with_and_without_bulk_writer(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    bulk: bool,
+) -> None:
+    """Test the bulk writer and the session write the same rows."""
+    instance = await async_setup_recorder_instance(hass)
+    await async_wait_recording_done(hass)
+    assert instance._bulk_writer is not None
+    if not bulk:
+        instance._bulk_writer = None
+
+    hass.states.async_set("test.one", "s1", {"shared": True})
+    hass.states.async_set("test.two", "s2", {"shared": True})
+    hass.states.async_set("test.one", "s3", {"shared": False})
+    hass.bus.async_fire("bulk_event", {"data": 1})
+    hass.bus.async_fire("bulk_event", {"data": 1})
+    await async_wait_recording_done(hass)
+    hass.states.async_set("test.one", "s4", {"shared": True})
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                StatesMeta.entity_id,
+                States.state_id,
+                States.old_state_id,
+                States.state,
+                StateAttributes.shared_attrs,
+            )
+            .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .outerjoin(
+                StateAttributes, States.attributes_id == StateAttributes.attributes_id
+            )
+        )
+        assert len(states) == 4
+        states_by_state = {state.state: state for state in states}
+        assert states_by_state["s1"].entity_id == "test.one"
+        assert states_by_state["s2"].entity_id == "test.two"
+        assert states_by_state["s3"].entity_id == "test.one"
+        assert states_by_state["s4"].entity_id == "test.one"
+        assert states_by_state["s1"].old_state_id is None
+        assert states_by_state["s2"].old_state_id is None
+        assert states_by_state["s3"].old_state_id == states_by_state["s1"].state_id
+        assert states_by_state["s4"].old_state_id == states_by_state["s3"].state_id
+        assert states_by_state["s1"].shared_attrs == '{"shared":true}'
+        assert states_by_state["s3"].shared_attrs == '{"shared":false}'
+        assert session.query(StatesMeta).count() == 2
+        assert session.query(StateAttributes).count() == 2
+
+        events = list(
+            session.query(EventTypes.event_type, EventData.shared_data)
+            .select_from(Events)
+            .outerjoin(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .outerjoin(EventData, Events.data_id == EventData.data_id)
+            .filter(EventTypes.event_type == "bulk_event")
+        )
+        assert events == [("bulk_event", '{"data":1}'), ("bulk_event", '{"data":1}')]
+        assert (
+            session.query(EventData)
+            .filter(EventData.shared_data == '{"data":1}')
+            .count()
+            == 1
+        )
+
+
+@pytest.mark.parametrize("persistent_database", [True])
+async def test_read_only_connections(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+) -> None:
+    """Test reads on the reader threads use read only connections.
+
+    On-disk database because read only connections need a WAL mode database.
+    """
+    instance = await async_setup_recorder_instance(hass)
+    assert instance.read_engine is not None
+    hass.states.async_set("test.one", "s1", {})
+    await async_wait_recording_done(hass)
+
+    def _read_states() -> int:
+        with session_scope(hass=hass, read_only=True) as session:
+            assert session.get_bind() is instance.read_engine
+            return session.query(States).count()
+
+    def _write_states() -> None:
+        with session_scope(hass=hass, read_only=True) as session:
+            session.execute(text("DELETE FROM states"))
+
+    assert await instance.async_add_read_executor_job(_read_states) == 1
+    with pytest.raises(OperationalError, match="readonly database"):
+        await instance.async_add_read_executor_job(_write_states)
+    await async_wait_recording_done(hass)
+    assert await instance.async_add_read_executor_job(_read_states) == 1
+
+    # Other threads, including ones started after the reader threads,
+    # do not get read only connections
+    def _get_bind() -> Any:
+        with session_scope(hass=hass, read_only=True) as session:
+            return session.get_bind()
+
+    assert await hass.async_add_executor_job(_get_bind) is instance.engine
+    thread_bind: list[Any] = []
+    thread = threading.Thread(target=lambda: thread_bind.append(_get_bind()))
+    thread.start()
+    thread.join()
+    assert thread_bind == [instance.engine]
+
+
+@pytest.mark.parametrize(
+    ("persistent_database", "config"),
+    [(False, {}), (True, {recorder.CONF_DB_READERS: 0})],
+)
+async def test_read_only_connections_not_used(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    config: dict[str, Any],
+) -> None:
+    """Test reads use the database executor without read only connections."""
+    instance = await async_setup_recorder_instance(hass, config)
+    assert instance.read_engine is None
+
+    def _get_bind() -> Any:
+        with session_scope(hass=hass, read_only=True) as session:
+            return session.get_bind()
+
+    assert await instance.async_add_read_executor_job(_get_bind) is instance.engine
+
+
 async def test_saving_state_with_serializable_data(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture, setup_recorder: None
 ) -> None:
@@ -2509,7 +2655,10 @@ async def test_lru_increases_with_many_entities(
     await async_wait_recording_done(hass)
 
     instance = get_instance(hass)
-    assert instance.state_attributes_manager._id_map.get_size() == mock_entity_count * 2
+    assert (
+        instance.state_attributes_manager.max_bytes
+        == mock_entity_count * 2 * state_attributes_table_manager.CACHE_BYTES_PER_ENTRY
+    )
     assert instance.states_meta_manager._id_map.get_size() == mock_entity_count * 2
 
 
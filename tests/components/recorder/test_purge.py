@@ -4,7 +4,7 @@ from collections.abc import Generator
 from datetime import datetime, timedelta
 import json
 import sqlite3
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 from freezegun import freeze_time
 import pytest
@@ -110,6 +110,107 @@ async def test_purge_big_database(hass: HomeAssistant, recorder_mock: Recorder)
             assert state_attributes.count() == 1
 
 
+async def test_purge_stops_when_time_budget_is_spent(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test purge stops starting new batches once the time budget is spent."""
+    for _ in range(12):
+        await _add_test_states(hass, wait_recording_done=False)
+    await async_wait_recording_done(hass)
+
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    with (
+        patch.object(recorder_mock, "max_bind_vars", 8),
+        patch.object(recorder_mock.database_engine, "max_bind_vars", 8),
+        patch("homeassistant.components.recorder.purge.PURGE_TIME_BUDGET", 0),
+    ):
+        finished = purge_old_data(recorder_mock, purge_before, repack=False)
+        assert not finished
+
+        with session_scope(hass=hass) as session:
+            assert session.query(States).count() == 64
+
+    while not purge_old_data(recorder_mock, purge_before, repack=False):
+        pass
+
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 24
+
+
+async def test_purge_progress(hass: HomeAssistant, recorder_mock: Recorder) -> None:
+    """Test the progress of a purge is tracked until it has finished."""
+    for _ in range(12):
+        await _add_test_states(hass, wait_recording_done=False)
+    await async_wait_recording_done(hass)
+    assert recorder_mock.purge_progress is None
+
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    with (
+        patch.object(recorder_mock, "max_bind_vars", 24),
+        patch.object(recorder_mock.database_engine, "max_bind_vars", 24),
+    ):
+        finished = purge_old_data(
+            recorder_mock,
+            purge_before,
+            states_batch_size=1,
+            events_batch_size=1,
+            repack=False,
+        )
+        assert not finished
+
+    progress = recorder_mock.purge_progress
+    assert progress is not None
+    assert progress.purge_before == purge_before
+    assert progress.rows_purged == 24
+    assert progress.estimated_rows >= 48
+    assert progress.rows_remaining == progress.estimated_rows - 24
+    assert progress.as_dict() == {
+        "purge_before": purge_before.isoformat(),
+        "rows_purged": 24,
+        "rows_remaining": progress.rows_remaining,
+        "eta": ANY,
+    }
+
+    assert not purge_old_data(
+        recorder_mock,
+        purge_before,
+        states_batch_size=1,
+        events_batch_size=1,
+        repack=False,
+    )
+    assert recorder_mock.purge_progress is progress
+    assert progress.rows_purged == 48
+
+    PurgeTask(purge_before, repack=False, apply_filter=False).run(recorder_mock)
+    assert recorder_mock.purge_progress is None
+
+
+async def test_purge_progress_cleared_on_error(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test the progress of a purge is not reported after the purge failed."""
+    await _add_test_states(hass)
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    assert not purge_old_data(
+        recorder_mock,
+        purge_before,
+        states_batch_size=1,
+        events_batch_size=1,
+        repack=False,
+    )
+    assert recorder_mock.purge_progress is not None
+
+    with (
+        patch(
+            "homeassistant.components.recorder.purge.purge_old_data",
+            side_effect=DatabaseError("statement", {}, Exception("failed")),
+        ),
+        pytest.raises(DatabaseError),
+    ):
+        PurgeTask(purge_before, repack=False, apply_filter=False).run(recorder_mock)
+    assert recorder_mock.purge_progress is None
+
+
 async def test_purge_old_states(hass: HomeAssistant, recorder_mock: Recorder) -> None:
     """Test deleting old states."""
     await _add_test_states(hass)
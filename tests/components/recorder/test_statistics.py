@@ -8,8 +8,13 @@ import pytest
 from sqlalchemy import select
 
 from homeassistant.components import recorder
-from homeassistant.components.recorder import Recorder, history, statistics
-from homeassistant.components.recorder.db_schema import StatisticsShortTerm
+from homeassistant.components.recorder import Recorder, history, migration, statistics
+from homeassistant.components.recorder.db_schema import (
+    SCHEMA_VERSION,
+    StatisticsDaily,
+    StatisticsMonthly,
+    StatisticsShortTerm,
+)
 from homeassistant.components.recorder.models import (
     datetime_to_timestamp_or_none,
     process_timestamp,
@@ -1844,6 +1849,145 @@ async def test_monthly_statistics_sum(
     assert stats == {}
 
 
+def _assert_statistics_approx_equal(
+    stats: dict[str, list[dict[str, Any]]],
+    expected: dict[str, list[dict[str, Any]]],
+) -> None:
+    """Assert statistics are equal, allowing for rounding of the means."""
+    assert stats.keys() == expected.keys()
+    for statistic_id, rows in stats.items():
+        assert len(rows) == len(expected[statistic_id])
+        for row, expected_row in zip(rows, expected[statistic_id], strict=True):
+            assert row == pytest.approx(expected_row)
+
+
+@pytest.mark.parametrize("timezone", ["America/Regina", "Europe/Vienna", "UTC"])
+@pytest.mark.freeze_time("2022-12-01 00:00:00+00:00")
+async def test_statistics_rollups_match_reduced_statistics(
+    hass: HomeAssistant,
+    setup_recorder: None,
+    timezone: str,
+) -> None:
+    """Test day, week and month statistics from the rollups match the reducers."""
+    await hass.config.async_set_time_zone(timezone)
+    await async_wait_recording_done(hass)
+    instance = recorder.get_instance(hass)
+    assert instance.statistics_rollups_active
+
+    start = dt_util.as_utc(dt_util.parse_datetime("2022-09-20 05:00:00"))
+    external_statistics = []
+    total = 0.0
+    for hour in range(24 * 60):
+        value = float((hour * 7) % 23 - 5)
+        total += value / 10
+        external_statistics.append(
+            {
+                "start": start + timedelta(hours=hour),
+                "last_reset": None,
+                # Leave out some means to check the daily means are weighted
+                "mean": None if hour % 13 == 0 else value,
+                "min": value - 1,
+                "max": value + 3,
+                "state": value,
+                "sum": total,
+            }
+        )
+    external_metadata = {
+        "has_mean": True,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(hass, external_metadata, external_statistics)
+    await async_wait_recording_done(hass)
+
+    reducers = {
+        "day": (statistics._reduce_statistics_per_day, StatisticsDaily),
+        "week": (statistics._reduce_statistics_per_week, StatisticsDaily),
+        "month": (statistics._reduce_statistics_per_month, StatisticsMonthly),
+    }
+    types = {"last_reset", "max", "mean", "min", "state", "sum"}
+
+    def _assert_rollups_match_reducers(rollups_used: bool) -> None:
+        hourly_stats = statistics_during_period(hass, start, period="hour")
+        for period, (reduce, rollup_table) in reducers.items():
+            with patch.object(
+                statistics,
+                "_sorted_statistics_to_dict",
+                wraps=statistics._sorted_statistics_to_dict,
+            ) as sorted_statistics_to_dict:
+                stats = statistics_during_period(hass, start, period=period)
+            assert (sorted_statistics_to_dict.call_args[0][5] is rollup_table) is (
+                rollups_used
+            )
+            expected = reduce(hourly_stats, types)
+            _assert_statistics_approx_equal(stats, expected)
+            # Statistics with bounds that are not aligned with the periods
+            # and only some types match reducing the hourly statistics
+            for start_offset, end_offset in (
+                (timedelta(days=9, hours=7, minutes=30), timedelta(days=40, hours=3)),
+                (timedelta(days=31, hours=23), timedelta(days=32, hours=1)),
+                (timedelta(days=2, hours=1), None),
+            ):
+                kwargs = {
+                    "hass": hass,
+                    "start_time": start + start_offset,
+                    "end_time": end_offset and start + end_offset,
+                    "statistic_ids": {"test:total_energy_import"},
+                    "period": period,
+                    "units": None,
+                    "types": {"change", "mean", "sum"},
+                }
+                stats = statistics.statistics_during_period(**kwargs)
+                with patch.object(instance, "statistics_rollups_active", False):
+                    expected = statistics.statistics_during_period(**kwargs)
+                _assert_statistics_approx_equal(stats, expected)
+
+    await instance.async_add_executor_job(_assert_rollups_match_reducers, True)
+
+    # Adjusting the sum updates the rollups
+    instance.async_adjust_statistics(
+        "test:total_energy_import", start + timedelta(days=25, hours=7), 1000, "kWh"
+    )
+    await async_wait_recording_done(hass)
+    await instance.async_add_executor_job(_assert_rollups_match_reducers, True)
+
+    # The rollups migration computes the rollups again
+    with session_scope(hass=hass) as session:
+        statistics.clear_statistics_rollups(session)
+    instance.statistics_rollups_active = False
+    migrator = migration.StatisticsRollupsMigration(SCHEMA_VERSION, {})
+    with session_scope(hass=hass) as session:
+        assert migrator.needs_migrate(instance, session)
+    while not await instance.async_add_executor_job(migrator.migrate_data, instance):
+        pass
+    migrator.migration_done(instance, None)
+    assert instance.statistics_rollups_active
+    await instance.async_add_executor_job(_assert_rollups_match_reducers, True)
+
+    # Rollups computed for another time zone are not used
+    await hass.config.async_set_time_zone("Asia/Kolkata")
+    await instance.async_add_executor_job(_assert_rollups_match_reducers, False)
+    migrator = migration.StatisticsRollupsMigration(
+        SCHEMA_VERSION, {migrator.migration_id: migrator.migration_version}
+    )
+    with session_scope(hass=hass) as session:
+        assert migrator.needs_migrate(instance, session)
+        # Checking if the migration is needed does not remove the rollups
+        assert session.query(StatisticsDaily).count() > 0
+
+    # The migration computes the rollups for the new time zone
+    instance.statistics_rollups_active = False
+    while not await instance.async_add_executor_job(migrator.migrate_data, instance):
+        pass
+    migrator.migration_done(instance, None)
+    with session_scope(hass=hass) as session:
+        assert not migrator.needs_migrate(instance, session)
+    await instance.async_add_executor_job(_assert_rollups_match_reducers, True)
+
+
 def test_cache_key_for_generate_statistics_during_period_stmt() -> None:
     """Test cache key for _generate_statistics_during_period_stmt."""
     stmt = _generate_statistics_during_period_stmt(
@@ -6,8 +6,10 @@ import pytest
 
 from homeassistant.components.recorder import Recorder, get_instance
 from homeassistant.components.recorder.const import SupportedDialect
+from homeassistant.components.recorder.purge import PurgeProgress
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
 
 from .common import async_wait_recording_done
 
@@ -38,6 +40,45 @@ async def test_recorder_system_health(
     }
 
 
+async def test_recorder_system_health_purge_progress(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test recorder system health shows the progress of a running purge."""
+    assert await async_setup_component(hass, "system_health", {})
+    await async_wait_recording_done(hass)
+    instance = get_instance(hass)
+    progress = PurgeProgress(dt_util.utcnow(), 1000)
+    instance.purge_progress = progress
+    info = await get_system_health_info(hass, "recorder")
+    assert info["purge_progress"] == "1000 rows left"
+
+    progress.rows_purged = 500
+    progress.started -= 600
+    info = await get_system_health_info(hass, "recorder")
+    assert info["purge_progress"] == "500 rows left, about 10 minutes remaining"
+
+    instance.purge_progress = None
+    info = await get_system_health_info(hass, "recorder")
+    assert "purge_progress" not in info
+
+
+async def test_recorder_system_health_attributes_cache(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test recorder system health shows the state attributes cache use."""
+    assert await async_setup_component(hass, "system_health", {})
+    await async_wait_recording_done(hass)
+    info = await get_system_health_info(hass, "recorder")
+    assert "attributes_cache" not in info
+
+    hass.states.async_set("sensor.test", "1", {"unit_of_measurement": "W"})
+    await async_wait_recording_done(hass)
+    hass.states.async_set("sensor.test", "2", {"unit_of_measurement": "W"})
+    await async_wait_recording_done(hass)
+    info = await get_system_health_info(hass, "recorder")
+    assert info["attributes_cache"] == "0.00 MiB, 50.0% hit rate"
+
+
 @pytest.mark.parametrize(
     "db_engine", [SupportedDialect.MYSQL, SupportedDialect.POSTGRESQL]
 )
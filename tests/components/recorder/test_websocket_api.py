@@ -1,17 +1,24 @@
 """The tests for sensor recorder platform."""
 
+import asyncio
+from collections.abc import Generator
 import datetime
 from datetime import timedelta
 from statistics import fmean
 import sys
-from unittest.mock import ANY, patch
+import threading
+from typing import Any
+from unittest.mock import ANY, Mock, patch
 
 from freezegun import freeze_time
 from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant.components import recorder
-from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder import (
+    Recorder,
+    websocket_api as recorder_websocket_api,
+)
 from homeassistant.components.recorder.db_schema import Statistics, StatisticsShortTerm
 from homeassistant.components.recorder.statistics import (
     async_add_external_statistics,
@@ -24,10 +31,12 @@ from homeassistant.components.recorder.statistics import (
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.components.recorder.websocket_api import UNIT_SCHEMA
 from homeassistant.components.sensor import UNIT_CONVERTERS
+from homeassistant.components.websocket_api.connection import ConnectionStats
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import recorder as recorder_helper
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
+from homeassistant.util.json import json_loads
 from homeassistant.util.unit_system import METRIC_SYSTEM, US_CUSTOMARY_SYSTEM
 
 from .common import (
@@ -2476,6 +2485,7 @@ async def test_recorder_info(
         "max_backlog": 65000,
         "migration_in_progress": False,
         "migration_is_live": False,
+        "purge_progress": None,
         "recording": True,
         "thread_running": True,
     }
@@ -3635,3 +3645,221 @@ async def test_import_statistics_with_last_reset(
             },
         ]
     }
+
+
+@pytest.mark.parametrize(
+    ("source", "statistic_id"),
+    [
+        ("test", "test:total_energy_import"),
+        ("recorder", "sensor.total_energy_import"),
+    ],
+)
+async def test_import_and_export_statistics_columns(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    source: str,
+    statistic_id: str,
+) -> None:
+    """Test importing and exporting statistics as columns."""
+    client = await hass_ws_client()
+
+    zero = dt_util.utcnow()
+    period1 = zero.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+    starts = [(period1 + timedelta(hours=hour)).timestamp() for hour in range(5)]
+    imported_metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": source,
+        "statistic_id": statistic_id,
+        "unit_of_measurement": "kWh",
+    }
+
+    await client.send_json_auto_id(
+        {
+            "type": "recorder/import_statistics_columns",
+            "metadata": imported_metadata,
+            "columns": {
+                "start": starts,
+                "state": [0, 1, 2, 3, 4],
+                "sum": [2, 3, 4, 5, 6],
+            },
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    await async_wait_recording_done(hass)
+
+    # Update the last two hours and add two more hours
+    await client.send_json_auto_id(
+        {
+            "type": "recorder/import_statistics_columns",
+            "metadata": imported_metadata,
+            "columns": {
+                "start": starts[3:] + [starts[4] + 3600, starts[4] + 7200],
+                "state": [10, 11, 12, 13],
+                "sum": [20, 21, 22, 23],
+            },
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    await async_wait_recording_done(hass)
+
+    with patch(
+        "homeassistant.components.recorder.statistics.STATISTICS_EXPORT_CHUNK_SIZE", 4
+    ):
+        await client.send_json_auto_id(
+            {
+                "type": "recorder/export_statistics",
+                "start_time": zero.isoformat(),
+                "statistic_ids": [statistic_id],
+                "types": ["state", "sum"],
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        chunks = []
+        while not (event := (await client.receive_json())["event"]).get("done"):
+            chunks.append(event)
+
+    all_starts = [*starts, starts[4] + 3600, starts[4] + 7200]
+    assert chunks == [
+        {
+            "statistic_id": statistic_id,
+            "columns": {
+                "start": all_starts[:4],
+                "state": [0.0, 1.0, 2.0, 10.0],
+                "sum": [2.0, 3.0, 4.0, 20.0],
+            },
+        },
+        {
+            "statistic_id": statistic_id,
+            "columns": {
+                "start": all_starts[4:],
+                "state": [11.0, 12.0, 13.0],
+                "sum": [21.0, 22.0, 23.0],
+            },
+        },
+    ]
+
+    response = await hass.services.async_call(
+        "recorder",
+        "export_statistics",
+        {
+            "statistic_ids": [statistic_id],
+            "start_time": zero,
+            "end_time": period1 + timedelta(hours=2),
+            "types": ["sum"],
+        },
+        blocking=True,
+        return_response=True,
+    )
+    assert response == {
+        "statistics": {
+            statistic_id: {"start": all_starts[:2], "sum": [2.0, 3.0]},
+        }
+    }
+
+
+async def test_export_statistics_slow_client(hass: HomeAssistant) -> None:
+    """Test the export waits for a slow client before fetching more rows."""
+    fetched: list[int] = []
+
+    def _export_statistics_columns(*args: Any) -> Generator[tuple[str, dict]]:
+        for chunk in range(3):
+            fetched.append(chunk)
+            yield "sensor.test", {"start": [chunk]}
+
+    stats = ConnectionStats()
+    sent: list[bytes] = []
+
+    def _send_message(message: bytes) -> None:
+        sent.append(message)
+        stats.pending += 1
+
+    connection = Mock(stats=stats, send_message=_send_message)
+    cancel = threading.Event()
+    with (
+        patch.object(recorder_websocket_api, "EXPORT_MAX_PENDING_MESSAGES", 1),
+        patch.object(
+            recorder_websocket_api,
+            "export_statistics_columns",
+            _export_statistics_columns,
+        ),
+    ):
+        export = hass.async_add_executor_job(
+            recorder_websocket_api._ws_export_statistics,
+            hass,
+            connection,
+            1,
+            cancel,
+            dt_util.utcnow(),
+            None,
+            {"sensor.test"},
+            "hour",
+            {"sum"},
+        )
+        await asyncio.sleep(0.2)
+        # The client has not read any chunk yet
+        assert fetched == [0, 1]
+        assert len(sent) == 2
+
+        stats.pending = 0
+        await export
+
+    assert fetched == [0, 1, 2]
+    assert len(sent) == 4
+    assert json_loads(sent[-1])["event"] == {"done": True}
+
+
+async def test_import_statistics_columns_invalid(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Test importing invalid statistics columns."""
+    client = await hass_ws_client()
+    period1 = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    imported_metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+
+    for columns, error in (
+        (
+            {"start": [period1.timestamp()], "sum": [1, 2]},
+            "All columns must have the same length",
+        ),
+        (
+            {"start": [period1.timestamp() + 60], "sum": [1]},
+            "Invalid timestamp: timestamps must be from the top of the hour"
+            " (minutes and seconds = 0)",
+        ),
+    ):
+        await client.send_json_auto_id(
+            {
+                "type": "recorder/import_statistics_columns",
+                "metadata": imported_metadata,
+                "columns": columns,
+            }
+        )
+        response = await client.receive_json()
+        assert not response["success"]
+        assert response["error"]["message"] == error
+
+    await client.send_json_auto_id(
+        {
+            "type": "recorder/import_statistics_columns",
+            "metadata": imported_metadata | {"source": "other"},
+            "columns": {"start": [period1.timestamp()], "sum": [1]},
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["message"] == "Invalid source"
@@ -0,0 +1,69 @@
+"""Test the websocket state broadcaster."""
+
+from unittest.mock import Mock
+
+from homeassistant.components.websocket_api.broadcast import async_get_state_broadcaster
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import HomeAssistant
+
+from tests.common import MockUser
+
+
+def _mock_connection(user: MockUser) -> Mock:
+    """Return a connection that records the messages sent to it."""
+    sent: list[bytes] = []
+    return Mock(user=user, send_message=sent.append, sent=sent)
+
+
+async def test_broadcast_shares_messages(
+    hass: HomeAssistant, hass_admin_user: MockUser
+) -> None:
+    """Test connections subscribed with the same id are sent the same bytes."""
+    listeners_before = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+    broadcaster = async_get_state_broadcaster(hass)
+    connections = [_mock_connection(hass_admin_user) for _ in range(3)]
+    unsubs = [
+        broadcaster.async_subscribe(connection, 7, set(), set(), None)
+        for connection in connections[:2]
+    ]
+    unsubs.append(broadcaster.async_subscribe(connections[2], 8, set(), set(), None))
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == listeners_before + 1
+
+    hass.states.async_set("light.kitchen", "on")
+    await hass.async_block_till_done()
+
+    first, second, third = (connection.sent for connection in connections)
+    assert len(first) == len(second) == len(third) == 1
+    assert first[0] is second[0]
+    assert first[0].endswith(b',"id":7}')
+    assert third[0].endswith(b',"id":8}')
+
+    for unsub in unsubs:
+        unsub()
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == listeners_before
+
+
+async def test_broadcast_filters(
+    hass: HomeAssistant, hass_admin_user: MockUser, hass_read_only_user: MockUser
+) -> None:
+    """Test each subscription only gets the changes it asked for."""
+    broadcaster = async_get_state_broadcaster(hass)
+    by_domain = _mock_connection(hass_admin_user)
+    by_attribute = _mock_connection(hass_admin_user)
+    not_permitted = _mock_connection(hass_read_only_user)
+    hass_read_only_user.mock_policy({"entities": {"entity_ids": {"light.hall": True}}})
+    broadcaster.async_subscribe(by_domain, 1, {"sensor.power"}, {"switch"}, None)
+    broadcaster.async_subscribe(by_attribute, 1, set(), set(), frozenset({"level"}))
+    broadcaster.async_subscribe(not_permitted, 1, set(), set(), None)
+
+    hass.states.async_set("light.kitchen", "on", {"level": 1})
+    hass.states.async_set("light.kitchen", "on", {"level": 1, "other": 2})
+    hass.states.async_set("switch.fan", "on")
+    hass.states.async_set("sensor.power", "10")
+    await hass.async_block_till_done()
+
+    assert [b'"switch.fan"' in message for message in by_domain.sent] == [True, False]
+    assert b'"sensor.power"' in by_domain.sent[1]
+    assert len(by_attribute.sent) == 3
+    assert all(b'"other"' not in message for message in by_attribute.sent)
+    assert not_permitted.sent == []
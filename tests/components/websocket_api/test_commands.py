@@ -28,6 +28,7 @@ from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component
 from homeassistant.util.json import json_loads
+from homeassistant.util.startup_trace import StartupTrace
 
 from tests.common import (
     MockConfigEntry,
@@ -1262,6 +1263,106 @@ async def test_subscribe_unsubscribe_entities_specific_entities(
     }
 
 
+async def test_subscribe_entities_domains_and_attributes(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test subscribe entities limited to domains and attributes."""
+    hass.states.async_set("light.kitchen", "off", {"brightness": 0, "color": "red"})
+    hass.states.async_set("switch.fan", "off", {"power": 5})
+    hass.states.async_set("sensor.power", "10", {"unit_of_measurement": "W"})
+
+    await websocket_client.send_json(
+        {
+            "id": 7,
+            "type": "subscribe_entities",
+            "entity_ids": ["sensor.power"],
+            "domains": ["light"],
+            "attributes": ["brightness"],
+        }
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {
+            "light.kitchen": {"a": {"brightness": 0}, "c": ANY, "lc": ANY, "s": "off"},
+            "sensor.power": {"a": {}, "c": ANY, "lc": ANY, "s": "10"},
+        }
+    }
+
+    # Changes of other entities and of attributes that are not
+    # subscribed to are not sent
+    hass.states.async_set("switch.fan", "on", {"power": 5})
+    hass.states.async_set("light.kitchen", "off", {"brightness": 0, "color": "blue"})
+    hass.states.async_set("light.kitchen", "on", {"brightness": 10, "color": "blue"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "c": {
+            "light.kitchen": {
+                "+": {"a": {"brightness": 10}, "c": ANY, "lc": ANY, "s": "on"}
+            }
+        }
+    }
+
+
+async def test_subscribe_entities_coalesce(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test changes made within the coalesce window are sent as one message."""
+    hass.states.async_set("light.kitchen", "off", {"brightness": 0})
+    hass.states.async_set("light.hallway", "off")
+
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "coalesce_ms": 10}
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert set(msg["event"]["a"]) == {"light.kitchen", "light.hallway"}
+
+    hass.states.async_set("light.kitchen", "on", {"brightness": 10})
+    hass.states.async_set("light.kitchen", "on", {"brightness": 20})
+    hass.states.async_remove("light.hallway")
+    hass.states.async_set("light.porch", "on")
+    hass.states.async_remove("light.porch")
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "c": {
+            "light.kitchen": {
+                "+": {"a": {"brightness": 20}, "c": ANY, "lc": ANY, "s": "on"}
+            }
+        },
+        "r": ["light.hallway"],
+    }
+
+    # Pending changes are dropped on unsubscribe
+    hass.states.async_set("light.kitchen", "off")
+    await websocket_client.send_json(
+        {"id": 8, "type": "unsubscribe_events", "subscription": 7}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 8
+    assert msg["success"]
+    await asyncio.sleep(0.05)
+    hass.states.async_set("light.kitchen", "on")
+    await websocket_client.send_json({"id": 9, "type": "ping"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 9
+
+
 async def test_render_template_renders_template(
     hass: HomeAssistant, websocket_client
 ) -> None:
@@ -1287,6 +1388,7 @@ async def test_render_template_renders_template(
     event = msg["event"]
     assert event == {
         "result": "State is: on",
+        "renders": ANY,
         "listeners": {
             "all": False,
             "domains": [],
@@ -1302,6 +1404,7 @@ async def test_render_template_renders_template(
     event = msg["event"]
     assert event == {
         "result": "State is: off",
+        "renders": ANY,
         "listeners": {
             "all": False,
             "domains": [],
@@ -1336,6 +1439,7 @@ async def test_render_template_with_timeout_and_variables(
     event = msg["event"]
     assert event == {
         "result": "hello",
+        "renders": ANY,
         "listeners": {
             "all": False,
             "domains": [],
@@ -1345,6 +1449,38 @@ async def test_render_template_with_timeout_and_variables(
     }
 
 
+async def test_render_template_skipped_renders(
+    hass: HomeAssistant, websocket_client
+) -> None:
+    """Test the performed and skipped renders are reported."""
+    hass.states.async_set("light.test", "on", {"brightness": 100})
+
+    await websocket_client.send_json(
+        {
+            "id": 5,
+            "type": "render_template",
+            "template": "State is: {{ states('light.test') }}",
+            "report_errors": True,
+        }
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    renders = msg["event"]["renders"]
+    assert renders["skipped"] == 0
+
+    # The template does not read the attributes
+    hass.states.async_set("light.test", "on", {"brightness": 50})
+    await hass.async_block_till_done()
+    hass.states.async_set("light.test", "off", {"brightness": 50})
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["result"] == "State is: off"
+    assert msg["event"]["renders"]["performed"] > renders["performed"]
+    assert msg["event"]["renders"]["skipped"] == 1
+
+
 async def test_render_template_manual_entity_ids_no_longer_needed(
     hass: HomeAssistant, websocket_client
 ) -> None:
@@ -1370,6 +1506,7 @@ async def test_render_template_manual_entity_ids_no_longer_needed(
     event = msg["event"]
     assert event == {
         "result": "State is: on",
+        "renders": ANY,
         "listeners": {
             "all": False,
             "domains": [],
@@ -1385,6 +1522,7 @@ async def test_render_template_manual_entity_ids_no_longer_needed(
     event = msg["event"]
     assert event == {
         "result": "State is: off",
+        "renders": ANY,
         "listeners": {
             "all": False,
             "domains": [],
@@ -1443,7 +1581,11 @@ EVENT_UNDEFINED_FILTER = {
                 {"type": "event", "event": EVENT_UNDEFINED_VAR_WARN},
                 {
                     "type": "event",
-                    "event": {"result": "", "listeners": EMPTY_LISTENERS},
+                    "event": {
+                        "result": "",
+                        "listeners": EMPTY_LISTENERS,
+                        "renders": ANY,
+                    },
                 },
             ],
         ),
@@ -1516,7 +1658,11 @@ async def test_render_template_with_error(
                 {"type": "event", "event": EVENT_UNDEFINED_VAR_WARN},
                 {
                     "type": "event",
-                    "event": {"result": "", "listeners": EMPTY_LISTENERS},
+                    "event": {
+                        "result": "",
+                        "listeners": EMPTY_LISTENERS,
+                        "renders": ANY,
+                    },
                 },
             ],
         ),
@@ -1747,6 +1893,7 @@ async def test_render_template_strict_with_timeout_and_error_2(
                     "type": "event",
                     "event": {
                         "result": 3.0,
+                        "renders": ANY,
                         "listeners": EMPTY_LISTENERS | {"entities": ["sensor.foo"]},
                     },
                 },
@@ -1814,6 +1961,7 @@ async def test_render_template_error_in_template_code(
                     "type": "event",
                     "event": {
                         "result": 3.0,
+                        "renders": ANY,
                         "listeners": EMPTY_LISTENERS | {"entities": ["sensor.foo"]},
                     },
                 },
@@ -1899,6 +2047,7 @@ async def test_render_template_with_delayed_error(
     event = msg["event"]
     assert event == {
         "result": "on",
+        "renders": ANY,
         "listeners": {
             "all": False,
             "domains": [],
@@ -1969,6 +2118,7 @@ async def test_render_template_with_delayed_error_2(
     event = msg["event"]
     assert event == {
         "result": "on",
+        "renders": ANY,
         "listeners": {
             "all": False,
             "domains": [],
@@ -2515,6 +2665,69 @@ async def test_integration_setup_info(
     ]
 
 
+async def test_integration_startup_trace(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test fetching the startup trace."""
+    await websocket_client.send_json({"id": 7, "type": "integration/startup_trace"})
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_NOT_FOUND
+
+    hass.startup_trace = StartupTrace()
+    hass.startup_trace.add_async("august", "setup", 1.0, 2.0)
+    await websocket_client.send_json({"id": 8, "type": "integration/startup_trace"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert [event["ph"] for event in msg["result"]["traceEvents"]] == ["b", "e"]
+
+    hass_admin_user.groups = []
+    await websocket_client.send_json({"id": 9, "type": "integration/startup_trace"})
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
+async def test_connection_stats(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test fetching the write statistics of the connections."""
+    await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["type"] == "event"
+
+    await websocket_client.send_json({"id": 8, "type": "connection_stats"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"] == [
+        {
+            "user_id": hass_admin_user.id,
+            "current": True,
+            "subscriptions": 2,
+            "messages": 2,
+            "writes": ANY,
+            "bytes_written": ANY,
+            "pending": ANY,
+            "peak_pending": ANY,
+            "write_time": ANY,
+            "max_write_time": ANY,
+        }
+    ]
+    assert msg["result"][0]["bytes_written"] > 0
+
+    hass_admin_user.groups = []
+    await websocket_client.send_json({"id": 9, "type": "connection_stats"})
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
 @pytest.mark.parametrize(
     ("key", "config"),
     [
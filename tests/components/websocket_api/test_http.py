@@ -4,8 +4,10 @@ import asyncio
 from datetime import timedelta
 from typing import Any, cast
 from unittest.mock import patch
+import zlib
 
 from aiohttp import WSMsgType, WSServerHandshakeError, web
+from aiohttp.http_websocket import WebSocketWriter
 import pytest
 
 from homeassistant.components.websocket_api import (
@@ -16,10 +18,16 @@ from homeassistant.components.websocket_api import (
 )
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.setup import async_setup_component
 from homeassistant.util.dt import utcnow
+from homeassistant.util.json import json_loads
 
 from tests.common import async_fire_time_changed
-from tests.typing import MockHAClientWebSocket, WebSocketGenerator
+from tests.typing import (
+    ClientSessionGenerator,
+    MockHAClientWebSocket,
+    WebSocketGenerator,
+)
 
 
 @pytest.fixture
@@ -505,3 +513,82 @@ async def test_binary_message(
     assert "Received binary message for non-existing handler 0" in caplog.text
     assert "Received binary message for non-existing handler 3" in caplog.text
     assert "Received binary message for non-existing handler 10" in caplog.text
+
+
+async def test_deflate_encoding(
+    hass: HomeAssistant,
+    hass_client_no_auth: ClientSessionGenerator,
+    hass_access_token: str,
+) -> None:
+    """Test messages over the compress threshold are sent as zlib compressed JSON."""
+    assert await async_setup_component(hass, "websocket_api", {})
+    hass.states.async_set("sensor.large", "on", {"data": "x" * 10000})
+    client = await hass_client_no_auth()
+    ws = await client.ws_connect(const.URL)
+    assert (await ws.receive_json())["type"] == "auth_required"
+    await ws.send_json(
+        {
+            "type": "auth",
+            "access_token": hass_access_token,
+            "encoding": const.ENCODING_DEFLATE,
+            "compress_threshold": 200,
+        }
+    )
+    assert (await ws.receive_json())["type"] == "auth_ok"
+
+    await ws.send_json({"id": 5, "type": "ping"})
+    msg = await ws.receive()
+    assert msg.type is WSMsgType.TEXT
+    assert json_loads(msg.data) == {"id": 5, "type": "pong"}
+
+    await ws.send_json({"id": 6, "type": "get_states"})
+    msg = await ws.receive()
+    assert msg.type is WSMsgType.BINARY
+    assert len(msg.data) < 1000
+    result = json_loads(zlib.decompress(msg.data))
+    assert result["id"] == 6
+    assert result["result"][0]["attributes"] == {"data": "x" * 10000}
+    await ws.close()
+
+
+async def test_compress_threshold(
+    hass: HomeAssistant,
+    hass_client_no_auth: ClientSessionGenerator,
+    hass_access_token: str,
+) -> None:
+    """Test small messages are not compressed with permessage-deflate."""
+    assert await async_setup_component(hass, "websocket_api", {})
+    hass.states.async_set("sensor.large", "on", {"data": "x" * 1000})
+    writes: list[int] = []
+    original_send = WebSocketWriter.send
+
+    async def _record_send(
+        writer: WebSocketWriter, message: bytes, binary: bool = False, **kwargs: Any
+    ) -> None:
+        if not writer.use_mask:
+            # Only record what the server writes
+            writes.append(kwargs.get("compress") or writer.compress)
+        await original_send(writer, message, binary, **kwargs)
+
+    with patch.object(WebSocketWriter, "send", _record_send):
+        client = await hass_client_no_auth()
+        ws = await client.ws_connect(const.URL, compress=15)
+        assert (await ws.receive_json())["type"] == "auth_required"
+        await ws.send_json(
+            {
+                "type": "auth",
+                "access_token": hass_access_token,
+                "compress_threshold": 200,
+            }
+        )
+        assert (await ws.receive_json())["type"] == "auth_ok"
+        writes.clear()
+
+        await ws.send_json({"id": 5, "type": "ping"})
+        assert (await ws.receive_json())["type"] == "pong"
+        await ws.send_json({"id": 6, "type": "get_states"})
+        msg = await ws.receive_json()
+        assert msg["result"][0]["attributes"] == {"data": "x" * 1000}
+        await ws.close()
+
+    assert writes[:2] == [0, 15]
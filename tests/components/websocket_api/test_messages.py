@@ -1,11 +1,16 @@
 """Test Websocket API messages module."""
 
+from unittest.mock import ANY
+
 import pytest
 
 from homeassistant.components.websocket_api.messages import (
     _partial_cached_event_message as lru_event_cache,
     _state_diff_event,
     cached_event_message,
+    cached_filtered_state_diff_message,
+    filter_state_diff_event,
+    merged_state_diff_event,
     message_to_json_bytes,
 )
 from homeassistant.const import EVENT_STATE_CHANGED
@@ -281,6 +286,125 @@ async def test_state_diff_event(hass: HomeAssistant) -> None:
     }
 
 
+async def test_filter_state_diff_event(hass: HomeAssistant) -> None:
+    """Test attributes that are not allowed are removed from the diff."""
+    state_change_events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    allowed = frozenset({"brightness"})
+    hass.states.async_set("light.window", "on", {"brightness": 1, "color": "red"})
+    await hass.async_block_till_done()
+    assert filter_state_diff_event(
+        _state_diff_event(state_change_events[-1]), allowed
+    ) == {
+        "a": {
+            "light.window": {
+                "s": "on",
+                "a": {"brightness": 1},
+                "c": ANY,
+                "lc": ANY,
+            }
+        }
+    }
+
+    hass.states.async_set("light.window", "on", {"brightness": 2, "color": "blue"})
+    await hass.async_block_till_done()
+    new_state: State = state_change_events[-1].data["new_state"]
+    assert filter_state_diff_event(
+        _state_diff_event(state_change_events[-1]), allowed
+    ) == {
+        "c": {
+            "light.window": {
+                "+": {
+                    "a": {"brightness": 2},
+                    "c": ANY,
+                    "lu": new_state.last_updated_timestamp,
+                }
+            }
+        }
+    }
+
+    # Only attributes that are not allowed changed
+    hass.states.async_set("light.window", "on", {"brightness": 2, "color": "green"})
+    await hass.async_block_till_done()
+    event = state_change_events[-1]
+    assert filter_state_diff_event(_state_diff_event(event), allowed) is None
+    assert cached_filtered_state_diff_message(b"1", event, allowed) is None
+
+    hass.states.async_set("light.window", "on", {"color": "green"})
+    await hass.async_block_till_done()
+    event = state_change_events[-1]
+    assert filter_state_diff_event(_state_diff_event(event), allowed) == {
+        "c": {
+            "light.window": {
+                "+": {
+                    "c": ANY,
+                    "lu": event.data["new_state"].last_updated_timestamp,
+                },
+                "-": {"a": ["brightness"]},
+            }
+        }
+    }
+    assert cached_filtered_state_diff_message(b"1", event, allowed).endswith(
+        b',"id":1}'
+    )
+
+    hass.states.async_remove("light.window")
+    await hass.async_block_till_done()
+    assert filter_state_diff_event(
+        _state_diff_event(state_change_events[-1]), allowed
+    ) == {"r": ["light.window"]}
+
+
+async def test_merged_state_diff_event(hass: HomeAssistant) -> None:
+    """Test the changes of many entities are merged into one diff."""
+    state_change_events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    hass.states.async_set("light.window", "off", {"brightness": 0, "color": "red"})
+    hass.states.async_set("light.door", "off")
+    await hass.async_block_till_done()
+    first_window_state = hass.states.get("light.window")
+    door_state = hass.states.get("light.door")
+
+    hass.states.async_set("light.window", "on", {"brightness": 10, "color": "red"})
+    hass.states.async_set("light.window", "on", {"brightness": 20, "color": "blue"})
+    hass.states.async_remove("light.door")
+    hass.states.async_set("light.new", "on")
+    await hass.async_block_till_done()
+    last_window_state = hass.states.get("light.window")
+    new_state = hass.states.get("light.new")
+
+    changes = {
+        "light.window": (first_window_state, last_window_state),
+        "light.door": (door_state, None),
+        "light.new": (None, new_state),
+        "light.gone": (None, None),
+    }
+    assert merged_state_diff_event(changes, None) == {
+        "a": {"light.new": new_state.as_compressed_state},
+        "c": {
+            "light.window": {
+                "+": {
+                    "s": "on",
+                    "a": {"brightness": 20, "color": "blue"},
+                    "c": ANY,
+                    "lc": last_window_state.last_changed_timestamp,
+                }
+            }
+        },
+        "r": ["light.door"],
+    }
+    assert merged_state_diff_event(changes, frozenset({"brightness"}))["c"] == {
+        "light.window": {
+            "+": {
+                "s": "on",
+                "a": {"brightness": 20},
+                "c": ANY,
+                "lc": last_window_state.last_changed_timestamp,
+            }
+        }
+    }
+    assert len(state_change_events) == 6
+    assert merged_state_diff_event({"light.gone": (None, None)}, None) is None
+
+
 async def test_message_to_json_bytes(caplog: pytest.LogCaptureFixture) -> None:
     """Test we can serialize websocket messages."""
 
@@ -20,6 +20,7 @@ from homeassistant.const import (
     ATTR_ATTRIBUTION,
     ATTR_DEVICE_CLASS,
     ATTR_FRIENDLY_NAME,
+    EVENT_STATE_CHANGED,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     EntityCategory,
@@ -42,6 +43,7 @@ from tests.common import (
     MockEntityPlatform,
     MockModule,
     MockPlatform,
+    async_capture_events,
     mock_integration,
     mock_registry,
 )
@@ -2641,3 +2643,38 @@ async def test_async_write_ha_state_thread_safety_always(
     ):
         await hass.async_add_executor_job(ent2.async_write_ha_state)
     assert not hass.states.get(ent2.entity_id)
+
+
+async def test_async_batch_write_ha_state(hass: HomeAssistant) -> None:
+    """Test entity state writes are batched."""
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    ent1 = entity.Entity()
+    ent1.entity_id = "test.one"
+    ent1.hass = hass
+    ent2 = entity.Entity()
+    ent2.entity_id = "test.two"
+    ent2.hass = hass
+
+    with entity.async_batch_write_ha_state(hass):
+        ent1._attr_state = "before"
+        ent1.async_write_ha_state()
+        ent2._attr_state = "before"
+        ent2.async_write_ha_state()
+        ent1.async_write_ha_state()
+        assert hass.states.get("test.one") is None
+
+        with entity.async_batch_write_ha_state(hass):
+            ent2.async_write_ha_state()
+        assert hass.states.get("test.two") is None
+
+        # The state is calculated when the batch exits
+        ent1._attr_state = "after"
+
+    assert hass.states.get("test.one").state == "after"
+    assert hass.states.get("test.two").state == "before"
+    await hass.async_block_till_done()
+    assert [event.data["entity_id"] for event in events] == ["test.one", "test.two"]
+
+    ent1._attr_state = "unbatched"
+    ent1.async_write_ha_state()
+    assert hass.states.get("test.one").state == "unbatched"
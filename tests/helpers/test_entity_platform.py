@@ -8,6 +8,7 @@ from typing import Any
 from unittest.mock import ANY, AsyncMock, Mock, patch
 
 import pytest
+from pytest_unordered import unordered
 
 from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, PERCENTAGE, EntityCategory
 from homeassistant.core import (
@@ -1564,6 +1565,112 @@ async def test_platforms_sharing_services(hass: HomeAssistant) -> None:
     assert entity2 in entities
 
 
+async def test_batch_service_handler(hass: HomeAssistant) -> None:
+    """Test a batch handler is passed all targeted entities of its platform."""
+    called: list[MockEntity] = []
+
+    class HelloEntity(MockEntity):
+        """Mock entity with a hello method."""
+
+        async def async_hello(self, some: str) -> None:
+            called.append(self)
+
+    entity_platform = MockEntityPlatform(
+        hass, domain="mock_integration", platform_name="mock_platform", platform=None
+    )
+    entity1 = HelloEntity(entity_id="mock_integration.entity_1")
+    entity2 = HelloEntity(entity_id="mock_integration.entity_2")
+    entity3 = HelloEntity(entity_id="mock_integration.entity_3")
+    await entity_platform.async_add_entities([entity1, entity2, entity3])
+    other_platform = MockEntityPlatform(
+        hass, domain="mock_integration", platform_name="mock_platform", platform=None
+    )
+    other_entity = HelloEntity(entity_id="mock_integration.other")
+    await other_platform.async_add_entities([other_entity])
+
+    batches: list[tuple[list[MockEntity], dict[str, Any]]] = []
+
+    async def handle_batch(
+        entities: list[MockEntity], data: dict[str, Any]
+    ) -> list[MockEntity]:
+        batches.append((entities, data))
+        # The platform can not handle the last entities in its group command
+        return [entity3, entity2]
+
+    entity_platform.async_register_entity_service("hello", {"some": str}, "async_hello")
+    entity_platform.async_register_batch_service_handler(
+        "hello", handle_batch, domain="mock_platform"
+    )
+
+    await hass.services.async_call(
+        "mock_platform", "hello", {"entity_id": "all", "some": "data"}, blocking=True
+    )
+    assert batches == [([entity1, entity2, entity3], {"some": "data"})]
+    # The unhandled entities are called in the order of the batch
+    assert called == [other_entity, entity2, entity3]
+
+    # A single entity is called directly
+    batches.clear()
+    called.clear()
+    await hass.services.async_call(
+        "mock_platform",
+        "hello",
+        {"entity_id": entity1.entity_id, "some": "data"},
+        blocking=True,
+    )
+    assert batches == []
+    assert called == [entity1]
+
+    # A failing batch does not prevent calling the other entities
+    async def fail_batch(
+        entities: list[MockEntity], data: dict[str, Any]
+    ) -> list[MockEntity]:
+        raise HomeAssistantError("Group command failed")
+
+    entity_platform.async_register_batch_service_handler(
+        "hello", fail_batch, domain="mock_platform"
+    )
+    called.clear()
+    with pytest.raises(HomeAssistantError, match="Group command failed"):
+        await hass.services.async_call(
+            "mock_platform",
+            "hello",
+            {"entity_id": "all", "some": "data"},
+            blocking=True,
+        )
+    assert called == [other_entity]
+
+
+async def test_batch_service_handler_function_service(hass: HomeAssistant) -> None:
+    """Test services with a handler function are not batched."""
+    entity_platform = MockEntityPlatform(
+        hass, domain="mock_integration", platform_name="mock_platform", platform=None
+    )
+    entity1 = MockEntity(entity_id="mock_integration.entity_1")
+    entity2 = MockEntity(entity_id="mock_integration.entity_2")
+    await entity_platform.async_add_entities([entity1, entity2])
+
+    called: list[MockEntity] = []
+    handle_batch = AsyncMock()
+
+    @callback
+    def handle_service(entity: MockEntity, call: ServiceCall) -> None:
+        called.append(entity)
+
+    entity_platform.async_register_entity_service(
+        "hello", {"some": str}, handle_service
+    )
+    entity_platform.async_register_batch_service_handler(
+        "hello", handle_batch, domain="mock_platform"
+    )
+
+    await hass.services.async_call(
+        "mock_platform", "hello", {"entity_id": "all", "some": "data"}, blocking=True
+    )
+    assert called == unordered([entity1, entity2])
+    handle_batch.assert_not_called()
+
+
 async def test_register_entity_service_response_data(hass: HomeAssistant) -> None:
     """Test an entity service that does supports response data."""
 
@@ -19,6 +19,7 @@ from homeassistant.const import (
 from homeassistant.core import CoreState, HomeAssistant, callback
 from homeassistant.exceptions import MaxLengthExceeded
 from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.registry import LazyRegistryData
 from homeassistant.util.dt import utc_from_timestamp
 
 from tests.common import (
@@ -355,6 +356,41 @@ async def test_loading_saving_data(
     assert new_entry2.unit_of_measurement == "initial-unit_of_measurement"
 
 
+async def test_entries_built_on_access(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry
+) -> None:
+    """Test loaded entries are indexed without building them."""
+    mock_config = MockConfigEntry(domain="light")
+    entry1 = entity_registry.async_get_or_create(
+        "light", "hue", "1234", config_entry=mock_config, device_id="mock-dev-id"
+    )
+    entry2 = entity_registry.async_get_or_create("light", "hue", "5678")
+    entry3 = entity_registry.async_get_or_create("light", "hue", "ABCD")
+
+    registry2 = er.EntityRegistry(hass)
+    await flush_store(entity_registry._store)
+    await registry2.async_load()
+    data = registry2.entities.data
+    assert isinstance(data, LazyRegistryData)
+    assert data.unbuilt == 3
+    assert len(registry2.entities) == 3
+    assert entry2.entity_id in registry2.entities
+
+    assert registry2.async_get_entity_id("light", "hue", "5678") == entry2.entity_id
+    assert registry2.entities.get_device_ids() == {"mock-dev-id"}
+    assert data.unbuilt == 3
+
+    assert registry2.async_get(entry3.id) == entry3
+    assert registry2.entities.get_entries_for_config_entry_id(mock_config.entry_id) == [
+        entry1
+    ]
+    assert data.unbuilt == 1
+
+    # Iterating builds the remaining entries in the stored order
+    assert list(registry2.entities.values()) == [entry1, entry2, entry3]
+    assert data.unbuilt == 0
+
+
 def test_generate_entity_considers_registered_entities(
     entity_registry: er.EntityRegistry,
 ) -> None:
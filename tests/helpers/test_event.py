@@ -1756,6 +1756,54 @@ async def test_track_template_result_super_template_2_initially_false(
     info3.async_remove()
 
 
+async def test_track_template_result_skips_unrelated_changes(
+    hass: HomeAssistant,
+) -> None:
+    """Test templates are not re-rendered for changes to states they do not read."""
+    hass.states.async_set("light.kitchen", "on", {"brightness": 100, "color": "red"})
+    analyzed = Template(
+        "{{ states('light.kitchen') }} {{ state_attr('light.kitchen', 'brightness') }}",
+        hass,
+    )
+    unanalyzed = Template("{{ states.light.kitchen.attributes | tojson }}", hass)
+    runs = []
+
+    @ha.callback
+    def run_callback(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs.extend(update.result for update in updates)
+
+    async_track_template_result(
+        hass,
+        [TrackTemplate(analyzed, None), TrackTemplate(unanalyzed, None)],
+        run_callback,
+    )
+    await hass.async_block_till_done()
+
+    hass.states.async_set("light.kitchen", "on", {"brightness": 100, "color": "blue"})
+    await hass.async_block_till_done()
+    assert analyzed.skipped_renders == 1
+    assert unanalyzed.skipped_renders == 0
+    assert runs == [{"brightness": 100, "color": "blue"}]
+
+    runs.clear()
+    hass.states.async_set("light.kitchen", "on", {"brightness": 50, "color": "blue"})
+    await hass.async_block_till_done()
+    assert analyzed.skipped_renders == 1
+    assert runs == ["on 50", {"brightness": 50, "color": "blue"}]
+
+    # An unrelated change is not skipped if the entity was written again
+    # before the event was dispatched, the render reads the newer state
+    runs.clear()
+    hass.states.async_set("light.kitchen", "on", {"brightness": 50, "color": "red"})
+    hass.states.async_set("light.kitchen", "on", {"brightness": 75, "color": "red"})
+    await hass.async_block_till_done()
+    assert analyzed.skipped_renders == 1
+    assert runs[0] == "on 75"
+
+
 async def test_track_template_result_complex(hass: HomeAssistant) -> None:
     """Test tracking template."""
     specific_runs = []
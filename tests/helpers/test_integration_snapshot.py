@@ -0,0 +1,176 @@
+"""Test the integration snapshot helper."""
+
+import os
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+
+from homeassistant import loader, requirements
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import integration_snapshot
+from homeassistant.helpers.integration_snapshot import (
+    SAVE_DELAY,
+    STORAGE_KEY,
+    STORAGE_VERSION,
+    _get_fingerprint,
+)
+
+from tests.common import async_fire_time_changed
+
+FINGERPRINT = {
+    "ha_version": "2024.1.0",
+    "custom_components": {},
+    "packages": {"/site-packages": 1.0},
+}
+
+
+@pytest.fixture(autouse=True)
+def mock_fingerprint() -> dict[str, Any]:
+    """Mock the fingerprint of the installation."""
+    fingerprint = {**FINGERPRINT}
+    with patch(
+        "homeassistant.helpers.integration_snapshot._get_fingerprint",
+        return_value=fingerprint,
+    ):
+        yield fingerprint
+
+
+def _snapshot_data(fingerprint: dict[str, Any]) -> dict[str, Any]:
+    """Return stored snapshot data."""
+    return {
+        "version": STORAGE_VERSION,
+        "minor_version": 1,
+        "key": STORAGE_KEY,
+        "data": {
+            "fingerprint": fingerprint,
+            "integrations": {
+                "snapshot_base": {
+                    "manifest": {
+                        "domain": "snapshot_base",
+                        "name": "Snapshot base",
+                        "requirements": ["snapshot-lib==1.0"],
+                    },
+                    "top_level_files": ["__init__.py", "sensor.py"],
+                    "all_dependencies": [],
+                },
+                "snapshot_child": {
+                    "manifest": {
+                        "domain": "snapshot_child",
+                        "name": "Snapshot child",
+                        "dependencies": ["snapshot_base"],
+                    },
+                    "top_level_files": ["__init__.py"],
+                    "all_dependencies": ["snapshot_base"],
+                },
+            },
+            "requirements": ["snapshot-lib==1.0"],
+        },
+    }
+
+
+async def test_save_snapshot(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the resolved integrations are saved."""
+    assert await integration_snapshot.async_load(hass) is False
+    integration = await loader.async_get_integration(hass, "hue")
+    assert await integration.resolve_dependencies()
+
+    integration_snapshot.async_schedule_save(hass)
+    freezer.tick(SAVE_DELAY)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    data = hass_storage[STORAGE_KEY]["data"]
+    assert data["fingerprint"] == FINGERPRINT
+    resolved = data["integrations"]["hue"]
+    assert resolved["manifest"]["domain"] == "hue"
+    assert "config_flow.py" in resolved["top_level_files"]
+    assert resolved["all_dependencies"] == sorted(integration.all_dependencies)
+
+    # Nothing is written again when nothing changed
+    del hass_storage[STORAGE_KEY]
+    integration_snapshot.async_schedule_save(hass)
+    freezer.tick(SAVE_DELAY)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert STORAGE_KEY not in hass_storage
+
+
+async def test_restore_snapshot(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test integrations are restored without loading manifests."""
+    hass_storage[STORAGE_KEY] = _snapshot_data(FINGERPRINT)
+
+    with patch("homeassistant.loader._resolve_integrations_from_root") as mock_resolve:
+        assert await integration_snapshot.async_load(hass) is True
+        child = await loader.async_get_integration(hass, "snapshot_child")
+        base = await loader.async_get_integration(hass, "snapshot_base")
+
+    assert not mock_resolve.called
+    assert child.is_built_in
+    assert child.pkg_path == "homeassistant.components.snapshot_child"
+    assert child.all_dependencies == {"snapshot_base"}
+    assert base.all_dependencies == set()
+    assert base.platforms_exists(["sensor", "light"]) == ["sensor"]
+    assert "snapshot-lib==1.0" in requirements.async_get_installed_requirements(hass)
+
+
+async def test_outdated_snapshot(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test a snapshot of another installation is not restored."""
+    hass_storage[STORAGE_KEY] = _snapshot_data(
+        {**FINGERPRINT, "packages": {"/site-packages": 2.0}}
+    )
+
+    assert await integration_snapshot.async_load(hass) is False
+    with pytest.raises(loader.IntegrationNotFound):
+        await loader.async_get_integration(hass, "snapshot_base")
+    assert "snapshot-lib==1.0" not in requirements.async_get_installed_requirements(
+        hass
+    )
+
+
+async def test_custom_integrations_are_not_restored(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test integrations overridden by a custom integration are not restored."""
+    hass_storage[STORAGE_KEY] = _snapshot_data(FINGERPRINT)
+    custom = loader.Integration(
+        hass,
+        "custom_components.snapshot_base",
+        None,
+        {"domain": "snapshot_base", "name": "Custom base", "version": "1.0"},
+    )
+
+    with patch(
+        "homeassistant.loader.async_get_custom_components",
+        return_value={"snapshot_base": custom},
+    ):
+        assert await integration_snapshot.async_load(hass) is True
+
+    cache = hass.data[loader.DATA_INTEGRATIONS]
+    assert "snapshot_base" not in cache
+    child = cache["snapshot_child"]
+    # The dependencies of the custom integration may differ
+    assert not child.all_dependencies_resolved
+
+
+def test_fingerprint_tracks_custom_integrations(tmp_path: Path) -> None:
+    """Test the fingerprint changes when a custom integration changes."""
+    manifest = tmp_path / "custom_components" / "custom" / "manifest.json"
+    manifest.parent.mkdir(parents=True)
+    manifest.write_text("{}")
+    fingerprint = _get_fingerprint(str(tmp_path))
+    assert str(manifest) in fingerprint["custom_components"]
+    assert fingerprint == _get_fingerprint(str(tmp_path))
+
+    os.utime(manifest, (1, 1))
+    assert fingerprint != _get_fingerprint(str(tmp_path))
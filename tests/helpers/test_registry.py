@@ -7,7 +7,12 @@ import pytest
 
 from homeassistant.core import CoreState, HomeAssistant
 from homeassistant.helpers import storage
-from homeassistant.helpers.registry import SAVE_DELAY, SAVE_DELAY_LONG, BaseRegistry
+from homeassistant.helpers.registry import (
+    SAVE_DELAY,
+    SAVE_DELAY_LONG,
+    BaseRegistry,
+    LazyRegistryData,
+)
 
 from tests.common import async_fire_time_changed
 
@@ -69,3 +74,102 @@ async def test_async_schedule_save(
     async_fire_time_changed(hass)
     await hass.async_block_till_done()
     assert registry.save_calls == 2
+
+
+def test_lazy_registry_data() -> None:
+    """Test entries are built on first access in the stored order."""
+    built: list[str] = []
+
+    def _factory(stored: dict[str, Any]) -> str:
+        built.append(stored["id"])
+        return stored["id"].upper()
+
+    data = LazyRegistryData(
+        _factory, {key: {"id": key} for key in ("a", "b", "c", "d", "e")}
+    )
+    assert len(data) == 5
+    assert "c" in data
+    assert "z" not in data
+    assert built == []
+
+    assert data["c"] == "C"
+    assert data.get("a") == "A"
+    assert data.get("z") is None
+    with pytest.raises(KeyError):
+        data["z"]  # noqa: B018
+    data["b"] = "replaced"
+    data["f"] = "F"
+    del data["d"]
+    assert built == ["c", "a"]
+    assert data.unbuilt == 1
+
+    assert list(data.items()) == [
+        ("a", "A"),
+        ("b", "replaced"),
+        ("c", "C"),
+        ("e", "E"),
+        ("f", "F"),
+    ]
+    assert built == ["c", "a", "e"]
+    assert data.unbuilt == 0
+
+
+def test_lazy_registry_data_factory_error() -> None:
+    """Test the stored data is kept when building an entry fails."""
+
+    def _factory(stored: dict[str, Any]) -> str:
+        if stored["id"] == "b":
+            raise ValueError("Invalid entry")
+        return stored["id"].upper()
+
+    data = LazyRegistryData(_factory, {key: {"id": key} for key in ("a", "b", "c")})
+    assert data["a"] == "A"
+    with pytest.raises(ValueError):
+        data["b"]  # noqa: B018
+    with pytest.raises(ValueError):
+        data.values()
+    assert len(data) == 3
+    assert data.unbuilt == 2
+    assert "b" in data
+    assert "c" in data
+    assert data["c"] == "C"
+    assert data.unbuilt == 1
+
+
+def test_lazy_registry_data_dict_methods() -> None:
+    """Test dict methods see the entries which are not built yet."""
+
+    def _data() -> LazyRegistryData[str]:
+        return LazyRegistryData(
+            lambda stored: stored["id"].upper(),
+            {key: {"id": key} for key in ("a", "b", "c")},
+        )
+
+    expected = {"a": "A", "b": "B", "c": "C"}
+    assert _data() == expected
+    assert expected == _data()
+    assert _data() == _data()
+    assert _data() != {"a": "A"}
+    assert _data().copy() == expected
+    assert type(_data().copy()) is dict
+    assert dict(_data()) == expected
+    unpacked = {**_data()}
+    assert unpacked == expected
+    assert _data() | {"d": "D"} == {**expected, "d": "D"}
+    assert {"d": "D"} | _data() == {"d": "D", **expected}
+    assert repr(_data()) == repr(expected)
+    assert list(reversed(_data())) == ["c", "b", "a"]
+
+    data = _data()
+    data |= {"b": "replaced"}
+    data.update({"d": "D"}, e="E")
+    assert data.setdefault("a", "unused") == "A"
+    assert data.setdefault("f", "F") == "F"
+    assert data.pop("c") == "C"
+    assert data.pop("c", None) is None
+    assert data == {"a": "A", "b": "replaced", "d": "D", "e": "E", "f": "F"}
+    assert data.popitem() == ("f", "F")
+    data.clear()
+    assert data == {}
+    assert len(data) == 0
+    assert data.unbuilt == 0
@@ -29,10 +29,13 @@ from homeassistant.const import (
 )
 from homeassistant.core import (
     Context,
+    Event,
     HassJob,
     HomeAssistant,
     ServiceCall,
+    ServiceResponse,
     SupportsResponse,
+    callback,
 )
 from homeassistant.helpers import (
     area_registry as ar,
@@ -787,6 +790,48 @@ async def test_extract_entity_ids_from_labels(hass: HomeAssistant) -> None:
     )
 
 
+async def test_extract_entity_ids_after_registry_update(
+    hass: HomeAssistant,
+    area_registry: ar.AreaRegistry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test resolved targets are updated when the registries change."""
+    kitchen = area_registry.async_create("Kitchen")
+    hall = area_registry.async_create("Hall")
+    entry = entity_registry.async_get_or_create("light", "hue", "1234")
+    entity_registry.async_update_entity(entry.entity_id, area_id=kitchen.id)
+    kitchen_call = ServiceCall("light", "turn_on", {"area_id": kitchen.id})
+    hall_call = ServiceCall("light", "turn_on", {"area_id": hall.id})
+    resolved_in_listener: list[set[str]] = []
+
+    @callback
+    def _resolve_hall(event: Event) -> None:
+        selected = service.async_extract_referenced_entity_ids(hass, hall_call)
+        resolved_in_listener.append(selected.indirectly_referenced)
+
+    # Listeners registered before the targets are first resolved
+    # do not get stale targets while the update is dispatched
+    hass.bus.async_listen(er.EVENT_ENTITY_REGISTRY_UPDATED, _resolve_hall)
+
+    assert await service.async_extract_entity_ids(hass, kitchen_call) == {
+        entry.entity_id
+    }
+    assert await service.async_extract_entity_ids(hass, hall_call) == set()
+
+    await hass.async_block_till_done()
+    resolved_in_listener.clear()
+    entity_registry.async_update_entity(entry.entity_id, area_id=hall.id)
+    await hass.async_block_till_done()
+    assert resolved_in_listener == [{entry.entity_id}]
+    assert await service.async_extract_entity_ids(hass, kitchen_call) == set()
+    assert await service.async_extract_entity_ids(hass, hall_call) == {entry.entity_id}
+
+    entity_registry.async_update_entity(
+        entry.entity_id, hidden_by=er.RegistryEntryHider.USER
+    )
+    assert await service.async_extract_entity_ids(hass, hall_call) == set()
+
+
 async def test_async_get_all_descriptions(hass: HomeAssistant) -> None:
     """Test async_get_all_descriptions."""
     group_config = {DOMAIN_GROUP: {}}
@@ -1619,6 +1664,38 @@ async def test_register_admin_service(
     assert calls[0].context.user_id == hass_admin_user.id
 
 
+async def test_register_admin_service_with_response(
+    hass: HomeAssistant, hass_read_only_user: MockUser, hass_admin_user: MockUser
+) -> None:
+    """Test the register admin service with a response."""
+
+    async def mock_service(call: ServiceCall) -> ServiceResponse:
+        return {"user_id": call.context.user_id}
+
+    service.async_register_admin_service(
+        hass, "test", "test", mock_service, supports_response=SupportsResponse.ONLY
+    )
+
+    with pytest.raises(exceptions.Unauthorized):
+        await hass.services.async_call(
+            "test",
+            "test",
+            {},
+            blocking=True,
+            context=Context(user_id=hass_read_only_user.id),
+            return_response=True,
+        )
+
+    assert await hass.services.async_call(
+        "test",
+        "test",
+        {},
+        blocking=True,
+        context=Context(user_id=hass_admin_user.id),
+        return_response=True,
+    ) == {"user_id": hass_admin_user.id}
+
+
 async def test_domain_control_not_async(hass: HomeAssistant, mock_entities) -> None:
     """Test domain verification in a service call with an unknown user."""
     calls = []
@@ -20,7 +20,7 @@ from homeassistant.const import (
 from homeassistant.core import DOMAIN as HOMEASSISTANT_DOMAIN, CoreState, HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import issue_registry as ir, storage
-from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.json import json_bytes, json_fragment
 from homeassistant.util import dt as dt_util
 from homeassistant.util.color import RGBColor
 
@@ -1180,3 +1180,161 @@ async def test_storage_concurrent_load(hass: HomeAssistant) -> None:
         )
         for load in loads:
             assert load == "data"
+
+
+async def test_journal(tmpdir: py.path.local, caplog: pytest.LogCaptureFixture) -> None:
+    """Test changed items are appended to a journal that is replayed on load."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        item_a = json_fragment(json_bytes({"id": "a", "name": "A"}))
+        item_b = json_fragment(json_bytes({"id": "b", "name": "B"}))
+        item_c = json_fragment(json_bytes({"id": "c", "name": "C"}))
+
+        # The first write is a full write
+        await store.async_save({"items": [item_a, item_b], "other": 1})
+        assert not os.path.exists(store.journal_path)
+        main_file = await hass.async_add_executor_job(_read_file, store.path)
+
+        # Unchanged items are not written again
+        await store.async_save({"items": [item_a, item_b], "other": 1})
+        assert not os.path.exists(store.journal_path)
+
+        item_b = json_fragment(json_bytes({"id": "b", "name": "B2"}))
+        await store.async_save({"items": [item_b, item_c], "other": 1})
+        # Replacing an item with an equal one is not a change
+        await store.async_save(
+            {
+                "items": [json_fragment(json_bytes({"id": "b", "name": "B2"})), item_c],
+                "other": 1,
+            }
+        )
+        assert await hass.async_add_executor_job(_read_file, store.path) == main_file
+        journal = await hass.async_add_executor_job(_read_file, store.journal_path)
+        assert json.loads(journal) == {
+            "version": MOCK_VERSION,
+            "minor_version": 1,
+            "generation": json.loads(main_file)["journal_generation"],
+            "updated": {
+                "items": {"b": {"id": "b", "name": "B2"}, "c": {"id": "c", "name": "C"}}
+            },
+            "removed": {"items": ["a"]},
+        }
+        assert store.journal_stats.journal_writes == 1
+        assert store.journal_stats.compactions == 1
+        assert store.journal_stats.write_amplification > 1
+
+        # An interrupted write leaves an incomplete record
+        await hass.async_add_executor_job(
+            _append_file, store.journal_path, b'{"version":1,"minor'
+        )
+        loaded = await storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal=True
+        ).async_load()
+        assert loaded == {
+            "items": [{"id": "b", "name": "B2"}, {"id": "c", "name": "C"}],
+            "other": 1,
+        }
+        assert "Ignoring incomplete journal record of storage-test" in caplog.text
+
+        # Other changes are written to the main file
+        await store.async_save({"items": [item_b, item_c], "other": 2})
+        assert not os.path.exists(store.journal_path)
+        assert store.journal_stats.compactions == 2
+        loaded = await storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal=True
+        ).async_load()
+        assert loaded == {
+            "items": [{"id": "b", "name": "B2"}, {"id": "c", "name": "C"}],
+            "other": 2,
+        }
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_compaction(tmpdir: py.path.local) -> None:
+    """Test the journal is compacted into the main file when it grows too large."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        await store.async_save({"items": [{"id": "a", "value": 0}]})
+
+        with patch.object(storage, "JOURNAL_COMPACT_MIN_SIZE", 150):
+            await store.async_save({"items": [{"id": "a", "value": 1}]})
+            assert os.path.exists(store.journal_path)
+            await store.async_save({"items": [{"id": "a", "value": 2}]})
+            assert not os.path.exists(store.journal_path)
+
+        assert store.journal_stats.journal_writes == 1
+        assert store.journal_stats.compactions == 2
+        assert await storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal=True
+        ).async_load() == {"items": [{"id": "a", "value": 2}]}
+
+        # Items without an id are always written to the main file
+        await store.async_save({"items": [{"value": 3}]})
+        await store.async_save({"items": [{"value": 4}]})
+        assert not os.path.exists(store.journal_path)
+        assert store.journal_stats.journal_writes == 1
+        assert store.journal_stats.compactions == 4
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_older_than_main_file(tmpdir: py.path.local) -> None:
+    """Test a journal that was not removed after writing the main file is ignored."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        await store.async_save(
+            {"items": [{"id": "a", "name": "A"}, {"id": "x", "name": "X"}]}
+        )
+        # Journaled: x is renamed and a is removed
+        await store.async_save({"items": [{"id": "x", "name": "A"}]})
+        assert os.path.exists(store.journal_path)
+
+        # Crash after the main file is written, before the journal is removed
+        with patch.object(storage.Store, "_compact_journal"):
+            await store.async_save(
+                {
+                    "items": [{"id": "a", "name": "A"}, {"id": "x", "name": "B"}],
+                    "other": 1,
+                }
+            )
+        assert os.path.exists(store.journal_path)
+
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store.async_load() == {
+            "items": [{"id": "a", "name": "A"}, {"id": "x", "name": "B"}],
+            "other": 1,
+        }
+
+        # The next write replaces the journal and is replayed
+        await store.async_save(
+            {"items": [{"id": "a", "name": "A"}, {"id": "x", "name": "B"}]}
+        )
+        await store.async_save(
+            {"items": [{"id": "a", "name": "A"}, {"id": "x", "name": "C"}]}
+        )
+        assert await storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal=True
+        ).async_load() == {
+            "items": [{"id": "a", "name": "A"}, {"id": "x", "name": "C"}]
+        }
+
+        await hass.async_stop(force=True)
+
+
+def _read_file(path: str) -> bytes:
+    """Read a file."""
+    with open(path, "rb") as fdesc:
+        return fdesc.read()
+
+
+def _append_file(path: str, data: bytes) -> None:
+    """Append to a file."""
+    with open(path, "ab") as fdesc:
+        fdesc.write(data)
@@ -7,6 +7,7 @@ from datetime import datetime, timedelta
 import json
 import logging
 import math
+from pathlib import Path
 import random
 from types import MappingProxyType
 from typing import Any
@@ -21,6 +22,7 @@ from homeassistant import config_entries
 from homeassistant.components import group
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_HOMEASSISTANT_STARTED,
     STATE_ON,
     STATE_UNAVAILABLE,
     UnitOfLength,
@@ -31,7 +33,7 @@ from homeassistant.const import (
     UnitOfTemperature,
     UnitOfVolume,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, State
 from homeassistant.exceptions import TemplateError
 from homeassistant.helpers import (
     area_registry as ar,
@@ -157,7 +159,10 @@ def test_template_equality() -> None:
     assert hash(template_one) == hash(template_one_1)
     assert hash(template_one) != hash(template_two)
 
-    assert str(template_one_1) == "Template<template=({{ template_one }}) renders=0>"
+    assert (
+        str(template_one_1)
+        == "Template<template=({{ template_one }}) renders=0 skipped_renders=0>"
+    )
 
     with pytest.raises(TypeError):
         template.Template(["{{ template_one }}"])
@@ -5169,6 +5174,174 @@ async def test_cache_garbage_collection() -> None:
     assert not template._NO_HASS_ENV.template_cache.get(template_string)
 
 
+async def test_bytecode_cache(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test compiled templates are persisted and reused."""
+    hass.config.config_dir = str(tmp_path)
+    await template.async_load_bytecode_cache(hass)
+    bytecode_cache = template._get_bytecode_cache(hass)
+
+    tpl = template.Template("{{ 1 + 2 }}", hass)
+    assert tpl.async_render() == 3
+    assert (bytecode_cache.hits, bytecode_cache.misses) == (0, 1)
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+    path = tmp_path / ".storage" / template.BYTECODE_CACHE_FILE
+    assert path.exists()
+
+    restored = template.TemplateBytecodeCache(str(path))
+    await hass.async_add_executor_job(restored.load)
+    env = template.TemplateEnvironment(hass)
+    env.bytecode_cache = restored
+    code = env.compile("{{ 1 + 2 }}")
+    assert (restored.hits, restored.misses) == (1, 0)
+    assert env.template_class.from_code(env, code, env.globals, None).render() == "3"
+
+    env.compile("{{ 2 + 2 }}")
+    assert (restored.hits, restored.misses) == (1, 1)
+
+    # Bytecode persisted by another environment version is not used
+    with patch.object(template, "TEMPLATE_ENVIRONMENT_VERSION", 2):
+        outdated = template.TemplateBytecodeCache(str(path))
+        await hass.async_add_executor_job(outdated.load)
+    env.bytecode_cache = outdated
+    env.compile("{{ 1 + 2 }}")
+    assert (outdated.hits, outdated.misses) == (0, 1)
+
+
+async def test_bytecode_cache_flavours(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test environments do not share bytecode and unused bytecode is dropped."""
+    path = tmp_path / template.BYTECODE_CACHE_FILE
+    bytecode_cache = template.TemplateBytecodeCache(str(path))
+    full_env = template.TemplateEnvironment(hass)
+    limited_env = template.TemplateEnvironment(hass, limited=True)
+    for env in (full_env, limited_env):
+        env.bytecode_cache = bytecode_cache
+
+    full_env.compile("{{ 1 + 2 }}")
+    full_env.compile("{{ 2 + 2 }}")
+    limited_env.compile("{{ 1 + 2 }}")
+    assert (bytecode_cache.hits, bytecode_cache.misses) == (0, 3)
+    await hass.async_add_executor_job(bytecode_cache.save)
+
+    restored = template.TemplateBytecodeCache(str(path))
+    await hass.async_add_executor_job(restored.load)
+    full_env.bytecode_cache = restored
+    full_env.compile("{{ 1 + 2 }}")
+    assert (restored.hits, restored.misses) == (1, 0)
+
+    # Templates that were not used again are dropped without any new compile
+    await hass.async_add_executor_job(restored.save)
+    trimmed = template.TemplateBytecodeCache(str(path))
+    await hass.async_add_executor_job(trimmed.load)
+    limited_env.bytecode_cache = trimmed
+    limited_env.compile("{{ 1 + 2 }}")
+    full_env.bytecode_cache = trimmed
+    full_env.compile("{{ 2 + 2 }}")
+    assert (trimmed.hits, trimmed.misses) == (0, 2)
+
+
+async def test_bytecode_cache_max_entries(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test the bytecode cache only keeps the recently used templates."""
+    path = tmp_path / template.BYTECODE_CACHE_FILE
+    with patch.object(template, "BYTECODE_CACHE_MAX_ENTRIES", 2):
+        bytecode_cache = template.TemplateBytecodeCache(str(path))
+    env = template.TemplateEnvironment(hass)
+    env.bytecode_cache = bytecode_cache
+
+    env.compile("{{ 1 + 2 }}")
+    env.compile("{{ 2 + 2 }}")
+    env.compile("{{ 1 + 2 }}")
+    env.compile("{{ 3 + 2 }}")
+    assert (bytecode_cache.hits, bytecode_cache.misses) == (1, 3)
+    await hass.async_add_executor_job(bytecode_cache.save)
+
+    restored = template.TemplateBytecodeCache(str(path))
+    await hass.async_add_executor_job(restored.load)
+    env.bytecode_cache = restored
+    env.compile("{{ 1 + 2 }}")
+    env.compile("{{ 3 + 2 }}")
+    env.compile("{{ 2 + 2 }}")
+    assert (restored.hits, restored.misses) == (2, 1)
+
+
+@pytest.mark.parametrize(
+    ("template_string", "fields", "attributes"),
+    [
+        ("{{ 1 + 1 }}", set(), set()),
+        ("{{ states('sensor.a') }}", {"state"}, set()),
+        (
+            "{{ states('sensor.a', with_unit=True) }}",
+            {"state"},
+            {"unit_of_measurement"},
+        ),
+        ("{{ 'sensor.a' | states }}", {"state"}, set()),
+        ("{{ is_state('light.a', 'on') }}", {"state"}, set()),
+        ("{{ 'light.a' is has_value }}", {"state"}, set()),
+        ("{{ state_attr('light.a', 'brightness') }}", set(), {"brightness"}),
+        ("{{ 'light.a' | state_attr('brightness') }}", set(), {"brightness"}),
+        ("{{ is_state_attr('light.a', 'color', 'red') }}", set(), {"color"}),
+        ("{{ states.light.a.state }}", {"state"}, set()),
+        ("{{ states['light.a'].last_changed }}", {"last_changed"}, set()),
+        ("{{ states.light[name].name }}", set(), {"friendly_name"}),
+        ("{{ states.light.a.attributes.brightness }}", set(), {"brightness"}),
+        ("{{ states.light.a.attributes['color'] }}", set(), {"color"}),
+        ("{{ ['light.a'] | select('is_state', 'on') | list }}", {"state"}, set()),
+        ("{{ ['light.a'] | map('state_attr', 'color') | list }}", set(), {"color"}),
+    ],
+)
+def test_dependencies(
+    template_string: str, fields: set[str], attributes: set[str]
+) -> None:
+    """Test analyzing what a template reads from states."""
+    dependencies = template.Template(template_string).async_dependencies()
+    assert dependencies == template.TemplateDependencies(
+        frozenset(fields), frozenset(attributes)
+    )
+
+
+@pytest.mark.parametrize(
+    "template_string",
+    [
+        "{{ states.light.a }}",
+        "{{ states[name].state }}",
+        "{{ states.light.a.attributes }}",
+        "{{ states.light.a.attributes.get('brightness') }}",
+        "{{ states.light.a.context.id }}",
+        "{{ state_attr('light.a', name) }}",
+        "{{ states.light | count }}",
+        "{% for state in states %}{{ state.state }}{% endfor %}",
+        "{{ expand('group.a') | map(attribute='state') | list }}",
+        "{{ ['group.a'] | map('expand') | list }}",
+        "{{ closest('zone.home', 'device_tracker.a') }}",
+        "{{ this.state }}",
+        "{% from 'macros.jinja' import macro %}{{ macro() }}",
+        "{{ states(*args) }}",
+        "{{ states('sensor.a'",
+    ],
+)
+def test_dependencies_unanalyzed(template_string: str) -> None:
+    """Test templates that read states in ways that are not analyzed."""
+    assert template.Template(template_string).async_dependencies() is None
+
+
+def test_dependencies_state_changed() -> None:
+    """Test comparing states against the dependencies of a template."""
+    dependencies = template.TemplateDependencies(
+        frozenset({"state"}), frozenset({"brightness"})
+    )
+    old_state = State("light.a", "on", {"brightness": 100, "color": "red"})
+    assert not dependencies.state_changed(
+        old_state, State("light.a", "on", {"brightness": 100, "color": "blue"})
+    )
+    assert dependencies.state_changed(
+        old_state, State("light.a", "on", {"brightness": 50, "color": "red"})
+    )
+    assert dependencies.state_changed(
+        old_state, State("light.a", "off", {"brightness": 100, "color": "red"})
+    )
+
+
 def test_is_template_string() -> None:
     """Test is template string."""
     assert template.is_template_string("{{ x }}") is True
@@ -1,6 +1,8 @@
 """Tests for the update coordinator."""
 
+import asyncio
 from datetime import datetime, timedelta
+import gc
 import logging
 from unittest.mock import AsyncMock, Mock, patch
 import urllib.error
@@ -18,7 +20,8 @@ from homeassistant.exceptions import (
     ConfigEntryError,
     ConfigEntryNotReady,
 )
-from homeassistant.helpers import update_coordinator
+from homeassistant.helpers import entity, update_coordinator
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.util.dt import utcnow
 
 from tests.common import MockConfigEntry, async_fire_time_changed
@@ -57,7 +60,10 @@ KNOWN_ERRORS: list[tuple[Exception, type[Exception], str]] = [
 
 
 def get_crd(
-    hass: HomeAssistant, update_interval: timedelta | None
+    hass: HomeAssistant,
+    update_interval: timedelta | None,
+    pool_id: str | None = None,
+    name: str = "test",
 ) -> update_coordinator.DataUpdateCoordinator[int]:
     """Make coordinator mocks."""
     calls = 0
@@ -70,9 +76,10 @@ def get_crd(
     return update_coordinator.DataUpdateCoordinator[int](
         hass,
         _LOGGER,
-        name="test",
+        name=name,
         update_method=refresh,
         update_interval=update_interval,
+        pool_id=pool_id,
     )
 
 
@@ -795,3 +802,201 @@ async def test_timestamp_date_update_coordinator(hass: HomeAssistant) -> None:
     unsub()
     await crd.async_refresh()
     assert len(last_update_success_times) == 1
+
+
+async def test_refresh_stats(
+    crd: update_coordinator.DataUpdateCoordinator[int],
+) -> None:
+    """Test the latency and failures of the refreshes are recorded."""
+    await crd.async_refresh()
+    crd.update_method = AsyncMock(side_effect=update_coordinator.UpdateFailed)
+    await crd.async_refresh()
+    await crd.async_refresh()
+
+    stats = crd.refresh_stats.as_dict()
+    assert stats["refreshes"] == 3
+    assert sum(stats["latency"].values()) == 3
+    assert list(stats["latency"])[-1] == "+Inf"
+    assert stats["failures"] == {"UpdateFailed": 2}
+
+
+async def test_pool_request_refresh(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test refreshes requested by coordinators of a pool are coalesced."""
+    crd1, crd2, crd3 = (
+        get_crd(hass, DEFAULT_UPDATE_INTERVAL, "account", name)
+        for name in ("lights", "sensors", "switches")
+    )
+
+    await crd1.async_request_refresh()
+    assert crd1.data == 1
+
+    # Requests within the cooldown are handled together
+    await crd2.async_request_refresh()
+    await crd3.async_request_refresh()
+    await crd3.async_request_refresh()
+    assert crd2.data is None
+    assert crd3.data is None
+
+    freezer.tick(timedelta(seconds=update_coordinator.REQUEST_REFRESH_DEFAULT_COOLDOWN))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert crd1.data == 1
+    assert crd2.data == 1
+    assert crd3.data == 1
+
+    pool = crd1.pool
+    assert pool is not None
+    stats = pool.async_stats()
+    assert len(stats) == 3
+    assert [member["name"] for member in stats.values()] == [
+        "lights",
+        "sensors",
+        "switches",
+    ]
+    assert [member["refreshes"] for member in stats.values()] == [1, 1, 1]
+    for crd in (crd1, crd2, crd3):
+        await crd.async_shutdown()
+    assert pool.coordinators == []
+    assert "account" not in hass.data[update_coordinator.DATA_COORDINATOR_POOLS]
+
+
+async def test_pool_request_refresh_concurrency(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test only a few of the requested refreshes of a pool run at the same time."""
+    crds = [get_crd(hass, DEFAULT_UPDATE_INTERVAL, "account") for _ in range(5)]
+    running = 0
+    max_running = 0
+
+    async def refresh() -> int:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0)
+        running -= 1
+        return 1
+
+    for crd in crds:
+        crd.update_method = refresh
+    # The first request starts the cooldown
+    await crds[0].async_request_refresh()
+    for crd in crds:
+        await crd.async_request_refresh()
+
+    freezer.tick(timedelta(seconds=update_coordinator.REQUEST_REFRESH_DEFAULT_COOLDOWN))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert all(crd.data == 1 for crd in crds)
+    assert max_running == update_coordinator.POOL_REFRESH_CONCURRENCY
+
+    for crd in crds:
+        await crd.async_shutdown()
+
+
+async def test_pool_refresh_slots(hass: HomeAssistant) -> None:
+    """Test the scheduled refreshes of a pool are spread over the interval."""
+    crds = [get_crd(hass, DEFAULT_UPDATE_INTERVAL, "account") for _ in range(4)]
+    crds[3].update_interval = timedelta(seconds=30)
+    pool = crds[0].pool
+    assert pool is not None
+
+    assert [pool.async_next_refresh(crd, 100.0, 10.0) for crd in crds[:3]] == [
+        110.0,
+        pytest.approx(113.333, abs=0.001),
+        pytest.approx(106.667, abs=0.001),
+    ]
+    assert pool.async_next_refresh(crds[3], 100.0, 30.0) == 120.0
+    # Refreshes are at least half an interval away
+    assert pool.async_next_refresh(crds[0], 104.0, 10.0) == 110.0
+    assert pool.async_next_refresh(crds[0], 106.0, 10.0) == 120.0
+
+
+async def test_pool_stats_same_name(hass: HomeAssistant) -> None:
+    """Test coordinators of a pool with the same name have their own stats."""
+    crd1 = get_crd(hass, DEFAULT_UPDATE_INTERVAL, "account")
+    crd2 = get_crd(hass, DEFAULT_UPDATE_INTERVAL, "account")
+    await crd1.async_refresh()
+
+    pool = crd1.pool
+    assert pool is not None
+    stats = pool.async_stats()
+    assert len(stats) == 2
+    assert [member["refreshes"] for member in stats.values()] == [1, 0]
+    await crd1.async_shutdown()
+    await crd2.async_shutdown()
+
+
+async def test_pool_own_debouncer(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test a pooled coordinator with its own debouncer uses it."""
+    crd1 = get_crd(hass, DEFAULT_UPDATE_INTERVAL, "account")
+    crd1.update_method = AsyncMock(return_value=1)
+    crd2 = update_coordinator.DataUpdateCoordinator[int](
+        hass,
+        _LOGGER,
+        name="own debouncer",
+        update_method=AsyncMock(return_value=2),
+        request_refresh_debouncer=Debouncer(
+            hass, _LOGGER, cooldown=0.5, immediate=False
+        ),
+        pool_id="account",
+    )
+
+    await crd1.async_request_refresh()
+    await crd2.async_request_refresh()
+    assert crd1.data == 1
+    assert crd2.data is None
+
+    freezer.tick(timedelta(seconds=0.5))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert crd2.data == 2
+    # The request of the coordinator did not join the pool
+    assert crd1.update_method.call_count == 1
+
+    await crd1.async_shutdown()
+    await crd2.async_shutdown()
+
+
+async def test_pool_coordinator_garbage_collected(hass: HomeAssistant) -> None:
+    """Test a coordinator which is not shut down drops out of its pool."""
+    crd1 = get_crd(hass, DEFAULT_UPDATE_INTERVAL, "account")
+    crd2 = get_crd(hass, DEFAULT_UPDATE_INTERVAL, "account")
+    pool = crd1.pool
+    assert pool is not None
+    assert pool.coordinators == [crd1, crd2]
+
+    del crd2
+    gc.collect()
+    assert pool.coordinators == [crd1]
+    await crd1.async_shutdown()
+
+
+@pytest.mark.parametrize("batch_writes", [False, True])
+async def test_update_listeners_batch_writes(
+    hass: HomeAssistant, batch_writes: bool
+) -> None:
+    """Test the state writes of the listeners are only batched when enabled."""
+    crd = get_crd(hass, DEFAULT_UPDATE_INTERVAL)
+    crd.batch_writes = batch_writes
+    ent = entity.Entity()
+    ent.entity_id = "test.one"
+    ent.hass = hass
+    written: list[str | None] = []
+
+    @callback
+    def update() -> None:
+        ent._attr_state = "updated"
+        ent.async_write_ha_state()
+        written.append(
+            state.state if (state := hass.states.get(ent.entity_id)) else None
+        )
+
+    unsub = crd.async_add_listener(update)
+    crd.async_update_listeners()
+    assert written == [None if batch_writes else "updated"]
+    assert hass.states.get(ent.entity_id).state == "updated"
+    unsub()
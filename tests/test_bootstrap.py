@@ -299,6 +299,27 @@ async def test_setup_after_deps_in_stage_1_ignored(hass: HomeAssistant) -> None:
     assert order == ["cloud", "an_after_dep", "normal_integration"]
 
 
+@pytest.mark.parametrize("load_registries", [False])
+async def test_integrations_imported_in_stage_order(hass: HomeAssistant) -> None:
+    """Test integrations are imported ahead of setup in the order of the stages."""
+    # This test relies on this
+    assert "debugpy" in bootstrap.DEBUGGER_INTEGRATIONS
+    assert "cloud" in bootstrap.STAGE_1_INTEGRATIONS
+    for domain in ("a_stage_2", "cloud", "debugpy"):
+        mock_integration(hass, MockModule(domain=domain))
+
+    with patch(
+        "homeassistant.loader.async_import_integrations", return_value={}
+    ) as mock_import:
+        await bootstrap._async_set_up_integrations(
+            hass, {"a_stage_2": {}, "cloud": {}, "debugpy": {}}
+        )
+
+    domains = [integration.domain for integration in mock_import.call_args[0][1]]
+    assert domains.index("debugpy") < domains.index("cloud")
+    assert domains.index("cloud") < domains.index("a_stage_2")
+
+
 @pytest.mark.parametrize("load_registries", [False])
 async def test_setup_after_deps_manifests_are_loaded_even_if_not_setup(
     hass: HomeAssistant,
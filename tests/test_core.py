@@ -65,6 +65,7 @@ from homeassistant.setup import async_setup_component
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
 from homeassistant.util.read_only_dict import ReadOnlyDict
+from homeassistant.util.startup_trace import StartupTrace
 from homeassistant.util.unit_system import METRIC_SYSTEM
 
 from .common import (
@@ -624,6 +625,24 @@ async def test_async_add_executor_job(hass: HomeAssistant) -> None:
     await task
 
 
+async def test_async_add_executor_job_startup_trace(hass: HomeAssistant) -> None:
+    """Test executor jobs are recorded in the startup trace while it is active."""
+    hass.startup_trace = StartupTrace()
+
+    def job(value: int) -> int:
+        return value
+
+    assert await hass.async_add_executor_job(job, 1) == 1
+    assert await hass.async_add_import_executor_job(job, 2) == 2
+    hass.startup_trace.stop()
+    assert await hass.async_add_executor_job(job, 3) == 3
+
+    assert [
+        (span.name.rsplit(".", 1)[-1], span.category)
+        for span in hass.startup_trace.spans
+    ] == [("job", "executor"), ("job", "import_executor")]
+
+
 async def test_stage_shutdown(hass: HomeAssistant) -> None:
     """Simulate a shutdown, test calling stuff."""
     test_stop = async_capture_events(hass, EVENT_HOMEASSISTANT_STOP)
@@ -1169,6 +1188,135 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_listen_entity_ids(hass: HomeAssistant) -> None:
+    """Test we can listen for events by entity_id."""
+    calls = []
+    old_count = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    unsub = hass.bus.async_listen_entity_ids(
+        EVENT_STATE_CHANGED, ["light.kitchen", "light.bowl"], listener
+    )
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == old_count + 1
+
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("light.other", "on")
+    hass.states.async_set("switch.kitchen", "on")
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in calls] == [
+        "light.kitchen",
+        "light.bowl",
+    ]
+
+    unsub()
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == old_count
+
+    hass.states.async_set("light.kitchen", "off")
+    await hass.async_block_till_done()
+
+    assert len(calls) == 2
+
+
+async def test_eventbus_listen_domains(hass: HomeAssistant) -> None:
+    """Test we can listen for events by domain with a filter."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    @ha.callback
+    def mock_filter(event_data):
+        """Mock filter."""
+        return event_data["new_state"].state == "on"
+
+    unsub = hass.bus.async_listen_domains(
+        EVENT_STATE_CHANGED, "light", listener, event_filter=mock_filter
+    )
+
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.bowl", "off")
+    hass.states.async_set("switch.kitchen", "on")
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in calls] == ["light.kitchen"]
+
+    unsub()
+
+    hass.states.async_set("light.bowl", "on")
+    await hass.async_block_till_done()
+
+    assert len(calls) == 1
+
+
+async def test_eventbus_keyed_event_without_entity_id(hass: HomeAssistant) -> None:
+    """Test a keyed event fired without an entity_id only reaches unkeyed listeners."""
+    unkeyed_calls = async_capture_events(hass, EVENT_STATE_CHANGED)
+    keyed_calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        keyed_calls.append(event)
+
+    unsub = hass.bus.async_listen_domains(EVENT_STATE_CHANGED, "light", listener)
+    hass.bus.async_fire(EVENT_STATE_CHANGED, {"some": "data"})
+    await hass.async_block_till_done()
+
+    assert len(unkeyed_calls) == 1
+    assert keyed_calls == []
+    unsub()
+
+
+@pytest.mark.parametrize("entity_id", [["light.kitchen"], 1, None])
+async def test_eventbus_keyed_event_invalid_entity_id(
+    hass: HomeAssistant, entity_id: Any
+) -> None:
+    """Test a keyed event with an entity_id which is not a string is not keyed."""
+    unkeyed_calls = async_capture_events(hass, EVENT_STATE_CHANGED)
+    keyed_calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        keyed_calls.append(event)
+
+    unsub_entity = hass.bus.async_listen_entity_ids(
+        EVENT_STATE_CHANGED, "light.kitchen", listener
+    )
+    unsub_domain = hass.bus.async_listen_domains(EVENT_STATE_CHANGED, "light", listener)
+    hass.bus.async_fire(EVENT_STATE_CHANGED, {"entity_id": entity_id})
+    await hass.async_block_till_done()
+
+    assert len(unkeyed_calls) == 1
+    assert keyed_calls == []
+    unsub_entity()
+    unsub_domain()
+
+
+async def test_eventbus_listen_keyed_unsupported_event(hass: HomeAssistant) -> None:
+    """Test listening by key is only possible for events keyed by entity_id."""
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+
+    with pytest.raises(HomeAssistantError, match="does not support listening"):
+        hass.bus.async_listen_entity_ids("test", "light.kitchen", listener)
+
+    with pytest.raises(HomeAssistantError, match="is not a callback"):
+        hass.bus.async_listen_domains(
+            EVENT_STATE_CHANGED, "light", listener, event_filter=lambda data: True
+        )
+
+
 async def test_eventbus_run_immediately_callback(hass: HomeAssistant) -> None:
     """Test we can call events immediately with a callback."""
     calls = []
@@ -1564,6 +1712,127 @@ async def test_statemachine_avoids_updating_attributes(hass: HomeAssistant) -> N
     assert isinstance(new_state.attributes, ReadOnlyDict)
 
 
+async def test_statemachine_set_many(hass: HomeAssistant) -> None:
+    """Test setting multiple states at once."""
+    hass.states.async_set("light.bowl", "off")
+    seen_states: list[tuple[str | None, str | None]] = []
+
+    @ha.callback
+    def listener(event: ha.Event[ha.EventStateChangedData]) -> None:
+        """Record the states visible when the event is fired."""
+        seen_states.append(
+            (
+                hass.states.get("light.bowl").state,
+                getattr(hass.states.get("light.kitchen"), "state", None),
+            )
+        )
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, listener)
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    context = ha.Context()
+
+    hass.states.async_set_many(
+        [
+            ("light.Bowl", "on", {"brightness": 100}),
+            ("light.kitchen", "on", None),
+        ],
+        context=context,
+    )
+    # All states are committed before the first event is fired
+    assert seen_states == [("on", "on"), ("on", "on")]
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in events] == [
+        "light.bowl",
+        "light.kitchen",
+    ]
+    assert events[0].data["old_state"].state == "off"
+    assert events[0].data["new_state"].attributes == {"brightness": 100}
+    assert events[1].data["old_state"] is None
+    assert all(event.context is context for event in events)
+    assert (
+        hass.states.get("light.bowl").last_updated
+        == hass.states.get("light.kitchen").last_updated
+    )
+
+
+async def test_statemachine_batch_writes(hass: HomeAssistant) -> None:
+    """Test events are held back until the outermost batch exits."""
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("light.kitchen", "on")
+    changed_events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    reported_events: list[ha.Event[ha.EventStateReportedData]] = []
+
+    @ha.callback
+    def reported_listener(event: ha.Event[ha.EventStateReportedData]) -> None:
+        """Record the state reported event."""
+        reported_events.append(event)
+
+    hass.bus.async_listen_entity_ids(
+        EVENT_STATE_REPORTED, "light.kitchen", reported_listener
+    )
+
+    with hass.states.async_batch_writes():
+        hass.states.async_set("light.bowl", "off")
+        with hass.states.async_batch_writes():
+            hass.states.async_set("light.kitchen", "on")
+            hass.states.async_remove("light.kitchen")
+        assert hass.states.get("light.bowl").state == "off"
+        assert hass.states.get("light.kitchen") is None
+        assert not changed_events
+        assert not reported_events
+
+    assert len(changed_events) == 2
+    assert changed_events[0].data["new_state"].state == "off"
+    assert changed_events[1].data["new_state"] is None
+    assert len(reported_events) == 1
+    assert reported_events[0].data["entity_id"] == "light.kitchen"
+
+
+async def test_statemachine_intern_attributes(hass: HomeAssistant) -> None:
+    """Test identical attributes are shared between states when enabled."""
+    hass.states.async_set("light.one", "on", {"color_mode": "onoff"})
+    hass.states.async_set("light.two", "on", {"color_mode": "onoff"})
+    assert hass.states.get("light.one").attributes is not (
+        hass.states.get("light.two").attributes
+    )
+
+    hass.states.async_set_intern_attributes(True)
+    hass.states.async_set("light.one", "off", {"color_mode": "brightness"})
+    hass.states.async_set("light.two", "off", {"color_mode": "brightness"})
+    hass.states.async_set("light.three", "off", {"color_mode": "onoff"})
+    hass.states.async_set("light.four", "off", {"options": ["a", "b"]})
+    hass.states.async_set("light.five", "off", {"options": ["a", "b"]})
+
+    shared = hass.states.get("light.one").attributes
+    assert hass.states.get("light.two").attributes is shared
+    assert hass.states.get("light.three").attributes is not shared
+    assert isinstance(shared, ReadOnlyDict)
+    # Attributes with unhashable values are not shared
+    assert hass.states.get("light.four").attributes is not (
+        hass.states.get("light.five").attributes
+    )
+
+    # Equal values of another type are not shared
+    hass.states.async_set("sensor.one", "1", {"value": True, "items": (1,)})
+    hass.states.async_set("sensor.two", "1", {"value": 1, "items": (1,)})
+    hass.states.async_set("sensor.three", "1", {"value": 1, "items": (1.0,)})
+    assert hass.states.get("sensor.two").attributes["value"] is not True
+    assert hass.states.get("sensor.three").attributes["items"] == (1.0,)
+    assert type(hass.states.get("sensor.three").attributes["items"][0]) is float
+    assert b'"value":1,' in hass.states.get("sensor.two").as_dict_json
+
+    hass.states.async_set_intern_attributes(False)
+    hass.states.async_set("light.two", "on", {"color_mode": "onoff"})
+    hass.states.async_set("light.one", "on", {"color_mode": "onoff"})
+    assert hass.states.get("light.two").attributes is not (
+        hass.states.get("light.three").attributes
+    )
+    assert hass.states.get("light.one").attributes is not (
+        hass.states.get("light.two").attributes
+    )
+
+
 def test_service_call_repr() -> None:
     """Test ServiceCall repr."""
     call = ha.ServiceCall("homeassistant", "start")
@@ -1987,3 +1987,112 @@ async def test_manifest_json_fragment_round_trip(hass: HomeAssistant) -> None:
         json_loads(json_dumps(integration.manifest_json_fragment))
         == integration.manifest
     )
+
+
+async def test_async_import_integrations(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test importing integrations ahead of setup in dependency order."""
+
+    def _integration(
+        name: str, dependencies: list[str], requirements: list[str] | None = None
+    ) -> loader.Integration:
+        return loader.Integration(
+            hass,
+            f"homeassistant.components.{name}",
+            None,
+            {
+                "name": name,
+                "domain": name,
+                "dependencies": dependencies,
+                "requirements": requirements or [],
+                "import_executor": True,
+            },
+        )
+
+    child = _integration("import_child", ["import_base"])
+    base = _integration("import_base", [])
+    broken = _integration("import_broken", [])
+    with_requirements = _integration("import_requirements", [], ["some-package"])
+    installed = _integration("import_installed", [], ["installed-package"])
+    loop_only = _integration("import_loop", [])
+    loop_only.manifest["import_executor"] = False
+    imported: list[str] = []
+    import_threads: set[str] = set()
+
+    def import_module(name: str) -> Any:
+        import_threads.add(threading.current_thread().name)
+        if name.startswith(broken.pkg_path) or name.endswith(".light"):
+            raise ValueError(name)
+        imported.append(name)
+        return MagicMock(__file__=f"{name}.py")
+
+    def platforms_exists(platforms: list[str]) -> list[str]:
+        return [platform for platform in platforms if platform in {"sensor", "light"}]
+
+    with (
+        patch("homeassistant.loader.importlib.import_module", import_module),
+        patch.object(base, "platforms_exists", platforms_exists),
+        patch.object(child, "platforms_exists", platforms_exists),
+        patch.object(broken, "platforms_exists", platforms_exists),
+        patch.object(installed, "platforms_exists", platforms_exists),
+    ):
+        import_times = await loader.async_import_integrations(
+            hass,
+            [installed, child, base, broken, with_requirements, loop_only],
+            {"import_base": {"sensor"}, "import_child": {"light"}},
+            {"installed-package"},
+        )
+
+    # The order is kept, except that the dependency is imported first and
+    # integrations with requirements that are not installed are skipped
+    assert imported == [
+        installed.pkg_path,
+        base.pkg_path,
+        f"{base.pkg_path}.sensor",
+        child.pkg_path,
+    ]
+    assert set(import_times) == set(imported)
+    assert all(import_time >= 0 for import_time in import_times.values())
+    # Only the import executor is used
+    assert import_threads == {"ImportExecutor_0"}
+    # Modules are only imported, setup fills the caches
+    assert base.domain not in hass.data[loader.DATA_COMPONENTS]
+    assert "import_child.light" not in child._missing_platforms_cache
+    # Import errors are retried during setup and only logged at debug level
+    assert "ERROR" not in caplog.text
+
+
+async def test_async_import_integrations_dependency_cycle(
+    hass: HomeAssistant,
+) -> None:
+    """Test integrations that depend on each other are still imported."""
+    integrations = [
+        loader.Integration(
+            hass,
+            f"homeassistant.components.{name}",
+            None,
+            {
+                "name": name,
+                "domain": name,
+                "dependencies": [dependency],
+                "requirements": [],
+                "import_executor": True,
+            },
+        )
+        for name, dependency in (("cycle_a", "cycle_b"), ("cycle_b", "cycle_a"))
+    ]
+
+    with (
+        patch(
+            "homeassistant.loader.importlib.import_module",
+            return_value=MagicMock(__file__="__init__.py"),
+        ),
+        patch.object(loader.Integration, "platforms_exists", return_value=[]),
+    ):
+        import_times = await loader.async_import_integrations(hass, integrations)
+
+    assert set(import_times) == {
+        "homeassistant.components.cycle_a",
+        "homeassistant.components.cycle_b",
+    }
@@ -23,6 +23,7 @@ from homeassistant.helpers.dispatcher import (
     async_dispatcher_send,
 )
 from homeassistant.helpers.issue_registry import IssueRegistry
+from homeassistant.util.startup_trace import StartupTrace
 
 from .common import (
     MockConfigEntry,
@@ -769,6 +770,34 @@ async def test_async_start_setup_running(hass: HomeAssistant) -> None:
         assert not setup_started
 
 
+async def test_async_start_setup_startup_trace(hass: HomeAssistant) -> None:
+    """Test setup phases and waits are recorded in the startup trace."""
+    hass.set_state(CoreState.not_running)
+    hass.startup_trace = StartupTrace()
+
+    with (
+        setup.async_start_setup(
+            hass, integration="august", group="entry_id", phase=setup.SetupPhases.SETUP
+        ),
+        setup.async_pause_setup(hass, setup.SetupPhases.WAIT_IMPORT_PLATFORMS),
+    ):
+        pass
+
+    wait, phase = hass.startup_trace.spans
+    assert wait.name == "august wait_import_platforms"
+    assert wait.category == "wait"
+    assert phase.name == "august (entry_id)"
+    assert phase.category == "setup"
+    assert phase.args == {
+        "integration": "august",
+        "group": "entry_id",
+        "phase": setup.SetupPhases.SETUP,
+    }
+    assert phase.thread_id is None
+    assert phase.start <= wait.start
+    assert phase.duration >= wait.duration
+
+
 async def test_async_start_setup_config_entry(
     hass: HomeAssistant, freezer: FrozenDateTimeFactory
 ) -> None:
@@ -2,6 +2,7 @@
 
 from pathlib import Path
 import re
+from unittest.mock import patch
 
 import orjson
 import pytest
@@ -97,6 +98,19 @@ def test_load_json_array_data(tmp_path: Path) -> None:
         load_json_object(fname)
 
 
+def test_load_json_memory_mapped(tmp_path: Path) -> None:
+    """Test large JSON files are parsed from a memory map."""
+    fname = tmp_path / "test5.json"
+    with open(fname, "w", encoding="utf8") as handle:
+        handle.write('{"a": 1, "B": "two"}')
+
+    with patch("homeassistant.util.json.MMAP_MIN_SIZE", 1):
+        assert load_json(fname) == {"a": 1, "B": "two"}
+        fname.write_text(TEST_BAD_SERIALIED)
+        with pytest.raises(HomeAssistantError, match=re.escape(str(fname))):
+            load_json(fname)
+
+
 def test_json_loads_array() -> None:
     """Test json_loads_array validates result."""
     assert json_loads_array('[{"c":1.2}]') == [{"c": 1.2}]
@@ -0,0 +1,96 @@
+"""Test the startup trace util."""
+
+from functools import partial
+import threading
+import time
+
+import pytest
+
+from homeassistant.util.startup_trace import MAX_SPANS, StartupTrace
+
+
+def _work(value: int) -> int:
+    """Do some work."""
+    return value * 2
+
+
+def test_span_records_thread_and_cpu_time() -> None:
+    """Test synchronous spans are recorded on their thread."""
+    trace = StartupTrace()
+
+    def _run_in_thread() -> None:
+        with trace.span("homeassistant.components.demo", "import", {"a": 1}):
+            pass
+
+    thread = threading.Thread(target=_run_in_thread, name="ImportExecutor_0")
+    thread.start()
+    thread.join()
+
+    chrome_trace = trace.as_chrome_trace()
+    assert chrome_trace["displayTimeUnit"] == "ms"
+    metadata, event = chrome_trace["traceEvents"]
+    assert metadata == {
+        "name": "thread_name",
+        "ph": "M",
+        "pid": 1,
+        "tid": thread.ident,
+        "args": {"name": "ImportExecutor_0"},
+    }
+    assert event["name"] == "homeassistant.components.demo"
+    assert event["cat"] == "import"
+    assert event["ph"] == "X"
+    assert event["tid"] == thread.ident
+    assert event["args"] == {"a": 1}
+    assert event["ts"] >= 0
+    assert event["dur"] >= 0
+    assert event["tdur"] >= 0
+
+
+def test_wrap_job() -> None:
+    """Test wrapped executor jobs are recorded under the name of the target."""
+    trace = StartupTrace()
+
+    assert trace.wrap_job(partial(_work, 2), "executor")() == 4
+    assert trace.wrap_job(_work, "executor")(3) == 6
+
+    assert [(span.name, span.category) for span in trace.spans] == [
+        (f"{__name__}._work", "executor"),
+        (f"{__name__}._work", "executor"),
+    ]
+
+
+def test_async_spans() -> None:
+    """Test spans awaited in the event loop are exported as async events."""
+    trace = StartupTrace()
+    start = time.monotonic()
+    trace.add_async("august", "setup", start, start + 0.5, {"phase": "setup"})
+
+    begin, end = trace.as_chrome_trace()["traceEvents"]
+    assert begin["ph"] == "b"
+    assert end["ph"] == "e"
+    assert begin["id"] == end["id"]
+    assert begin["name"] == end["name"] == "august"
+    assert begin["args"] == {"phase": "setup"}
+    assert end["ts"] - begin["ts"] == pytest.approx(500_000, abs=1)
+    assert "tdur" not in begin
+
+
+def test_stop() -> None:
+    """Test nothing is recorded after the trace is stopped."""
+    trace = StartupTrace()
+    trace.stop()
+
+    with trace.span("late", "import"):
+        pass
+    trace.add_async("late", "setup", 0, 1)
+
+    assert trace.spans == []
+
+
+def test_max_spans() -> None:
+    """Test the number of spans is limited."""
+    trace = StartupTrace()
+    for _ in range(MAX_SPANS + 1):
+        trace.add_async("august", "setup", 0, 1)
+
+    assert len(trace.spans) == MAX_SPANS